@@ -0,0 +1,70 @@
+"""Base class for bots that play the game."""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Type, TypeVar
+
+from src.config.settings import Settings
+from src.engine.input_handler import InputAction
+from src.models.direction import Direction
+from src.models.game_state import GameState
+
+# Input action that turns the snake in each direction
+DIRECTION_ACTIONS: Dict[Direction, InputAction] = {
+    Direction.UP: InputAction.MOVE_UP,
+    Direction.DOWN: InputAction.MOVE_DOWN,
+    Direction.LEFT: InputAction.MOVE_LEFT,
+    Direction.RIGHT: InputAction.MOVE_RIGHT,
+}
+
+
+AutopilotT = TypeVar("AutopilotT", bound="Autopilot")
+
+
+class Autopilot(ABC):
+    """A bot that steers the snake.
+
+    Subclasses implement ``choose``. An autopilot is handed to
+    ``GameLoop``, which asks it for an input action before every tick,
+    and it can also be called directly as a spectator policy.
+    """
+
+    @classmethod
+    def from_settings(cls: Type[AutopilotT], settings: Settings) -> AutopilotT:
+        """Create the autopilot configured for the game's settings.
+
+        Args:
+            settings: Game settings.
+
+        Returns:
+            A new autopilot; the default ignores the settings.
+        """
+        return cls()
+
+    @abstractmethod
+    def choose(self, state: GameState) -> Optional[Direction]:
+        """Pick the direction for the next tick.
+
+        Args:
+            state: Current game state.
+
+        Returns:
+            Direction to move in, or None to keep the current direction.
+        """
+
+    def next_action(self, state: GameState) -> Optional[InputAction]:
+        """Pick the input action for the next tick.
+
+        Args:
+            state: Current game state.
+
+        Returns:
+            Move action, or None to keep the current direction.
+        """
+        direction = self.choose(state)
+        if direction is None or direction == state.snake.direction:
+            return None
+        return DIRECTION_ACTIONS[direction]
+
+    def __call__(self, state: GameState) -> Optional[Direction]:
+        """Pick the next direction (so the bot can be used as a policy)."""
+        return self.choose(state)
@@ -0,0 +1,242 @@
+"""Autopilot that follows the shortest path to the food."""
+
+from typing import List, Optional, Tuple
+
+from src.bots.base import Autopilot
+from src.bots.safety import SafetyAnalyzer
+from src.models.direction import Direction
+from src.models.game_state import GameState
+from src.models.snake_body import SnakeBody
+
+# Search order of the moves; indices are stored in the first-move table
+MOVES: Tuple[Direction, ...] = tuple(Direction.all())
+
+
+class BFSAutopilot(Autopilot):
+    """Moves along a shortest path from the head to the food.
+
+    The board is searched breadth-first as a flat array of cells
+    (``y * width + x``). All search buffers are allocated once per
+    board size and reused on every tick. Instead of clearing them, each
+    search bumps a stamp and a cell counts as set only if its stamp
+    matches, so a search never touches cells it does not reach.
+
+    Snake segments are obstacles only until they move away: the segment
+    ``i`` places from the head leaves its cell after ``len - i`` ticks,
+    so the search may enter the cell once the path is at least that long.
+    Every segment's cell holds a serial number, counting up from the
+    tail, so when the snake has only advanced since the last call just
+    the new head cell is written: cells behind the tail hold serials
+    lower than the tail's and count as free without being cleared.
+
+    If the food cannot be reached, the bot heads for the move with the
+    most reachable cells, to survive until a path opens up. A path whose
+    first move leaves less room than the snake needs is a trap, and the
+    roomiest move is taken instead.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the autopilot with no buffers yet."""
+        self._size: Optional[Tuple[int, int]] = None
+        self._stamp = 0
+        # Per cell: neighbour cells and the move that reaches each one
+        self._neighbours: List[Tuple[Tuple[int, int], ...]] = []
+        # Per cell: stamp of the last search that reached it, its
+        # distance from the head and the first move of the path to it
+        self._seen: List[int] = []
+        self._distance: List[int] = []
+        self._first_move: List[int] = []
+        # Per cell: serial of the last segment laid there; serials grow
+        # by one per head position, so a body's serials are consecutive
+        self._serial: List[int] = []
+        self._next_serial = 1
+        self._body: Optional[SnakeBody] = None
+        self._queue: List[int] = []
+        # Per first move: cells reached by the last search
+        self._reached: List[int] = [0] * len(MOVES)
+        self._safety = SafetyAnalyzer()
+
+    def choose(self, state: GameState) -> Optional[Direction]:
+        """Pick the first move of a shortest path to the food.
+
+        Args:
+            state: Current game state.
+
+        Returns:
+            Direction to move in, or None if every move dies.
+        """
+        width = state.width
+        if self._size != (width, state.height):
+            self._allocate(width, state.height)
+        self._stamp += 1
+        stamp = self._stamp
+
+        # A segment with serial s blocks its cell while s >= tail serial,
+        # and leaves it after s - base ticks: the tail (pairs behind the
+        # head) leaves after its duplicates have moved on
+        body = state.snake.body
+        self._mark_body(body, width)
+        serial = self._serial
+        tail_serial = self._next_serial - (len(body) - body.padding)
+        base = tail_serial - body.padding - 1
+
+        head = state.snake.head
+        start = head.y * width + head.x
+        food = state.food.position
+        target = food.y * width + food.x
+
+        seen = self._seen
+        distance = self._distance
+        first_move = self._first_move
+        neighbours = self._neighbours
+        queue = self._queue
+        seen[start] = stamp
+        distance[start] = 0
+        reached = self._reached
+        for move in range(len(MOVES)):
+            reached[move] = 0
+        read = 0
+        write = 0
+
+        # Seed the queue with the safe moves from the head
+        reverse = MOVES.index(state.snake.direction.opposite)
+        bar = max(1 + base, tail_serial - 1)
+        for cell, move in neighbours[start]:
+            if move == reverse:
+                continue
+            if serial[cell] > bar:
+                continue
+            seen[cell] = stamp
+            distance[cell] = 1
+            first_move[cell] = move
+            queue[write] = cell
+            write += 1
+
+        while read < write:
+            cell = queue[read]
+            read += 1
+            if cell == target:
+                return self._avoid_trap(state, MOVES[first_move[cell]])
+            step = distance[cell] + 1
+            move = first_move[cell]
+            reached[move] += 1
+            # Cells whose segment is still there when the path arrives
+            bar = max(step + base, tail_serial - 1)
+            for neighbour, _ in neighbours[cell]:
+                if seen[neighbour] == stamp:
+                    continue
+                if serial[neighbour] > bar:
+                    continue
+                seen[neighbour] = stamp
+                distance[neighbour] = step
+                first_move[neighbour] = move
+                queue[write] = neighbour
+                write += 1
+
+        return self._roomiest_move(state)
+
+    def _avoid_trap(self, state: GameState, move: Direction) -> Direction:
+        """Swap a move that traps the snake for the roomiest one.
+
+        Args:
+            state: Current game state.
+            move: First move of the path to the food.
+
+        Returns:
+            The move itself if it leaves room for the whole snake,
+            otherwise the move with the most reachable cells.
+        """
+        # Room for every segment plus the one grown on eating
+        needed = len(state.snake.body) + 1
+        safety = self._safety
+        best_area = safety.reachable_area(state, move, limit=needed)
+        if best_area >= needed:
+            return move
+        best = move
+        for other in MOVES:
+            if other is not move:
+                area = safety.reachable_area(state, other, limit=needed)
+                if area > best_area:
+                    best, best_area = other, area
+        return best
+
+    def _roomiest_move(self, state: GameState) -> Optional[Direction]:
+        """Pick the move leading to the most reachable cells.
+
+        Uses the cell counts of the search that just failed to find the
+        food, preferring the current direction on ties.
+
+        Args:
+            state: Current game state.
+
+        Returns:
+            Direction to move in, or None if every move dies at once.
+        """
+        reached = self._reached
+        current = MOVES.index(state.snake.direction)
+        best = current
+        for move in range(len(MOVES)):
+            if reached[move] > reached[best]:
+                best = move
+        return MOVES[best] if reached[best] > 0 else None
+
+    def _mark_body(self, body: SnakeBody, width: int) -> None:
+        """Give the body's cells consecutive serials, tail to head.
+
+        Segments off the board (a new snake may start partly outside a
+        small board) use up their serial without marking any cell.
+
+        Args:
+            body: Snake body.
+            width: Board width in cells.
+        """
+        previous = self._body
+        if previous is body:
+            return
+        serial = self._serial
+        height = len(serial) // width
+        if previous is not None and body.follows(previous):
+            head = body.head
+            if 0 <= head.x < width and 0 <= head.y < height:
+                serial[head.y * width + head.x] = self._next_serial
+            self._next_serial += 1
+        else:
+            # Duplicated tail segments are not in coordinates
+            coordinates = body.coordinates()
+            next_serial = self._next_serial
+            for i in range(0, len(coordinates), 2):
+                x, y = coordinates[i], coordinates[i + 1]
+                if 0 <= x < width and 0 <= y < height:
+                    serial[y * width + x] = next_serial
+                next_serial += 1
+            self._next_serial = next_serial
+        self._body = body
+
+    def _allocate(self, width: int, height: int) -> None:
+        """Allocate the search buffers for a board size.
+
+        Args:
+            width: Board width in cells.
+            height: Board height in cells.
+        """
+        area = width * height
+        self._size = (width, height)
+        self._seen = [0] * area
+        self._distance = [0] * area
+        self._first_move = [0] * area
+        self._serial = [0] * area
+        self._next_serial = 1
+        self._body = None
+        self._queue = [0] * area
+        self._stamp = 0
+
+        self._neighbours = []
+        for cell in range(area):
+            y, x = divmod(cell, width)
+            cells = []
+            for index, move in enumerate(MOVES):
+                delta = move.delta
+                nx, ny = x + delta.x, y + delta.y
+                if 0 <= nx < width and 0 <= ny < height:
+                    cells.append((ny * width + nx, index))
+            self._neighbours.append(tuple(cells))
@@ -0,0 +1,379 @@
+"""Shared BFS distance fields from the food and from the snake head.
+
+Fields are computed with NumPy, one whole-board wave per step, and the
+food field is then kept up to date cell by cell as the snake moves.
+Requires the optional ``numpy`` dependency.
+
+Used by the planner to measure how far its leaves are from the food.
+"""
+
+import heapq
+from array import array
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+import numpy as np
+from src.models.game_state import GameState
+from src.models.move_table import move_table
+from src.models.position import Position
+from src.models.snake_body import SnakeBody
+
+# Distance of cells that cannot be reached
+UNREACHABLE = -1
+
+
+class DistanceFields:
+    """Distances from the food and from the head to every cell.
+
+    Snake segments are obstacles. A field is indexed ``[y, x]`` and
+    holds the number of moves to reach the cell, or ``UNREACHABLE``;
+    any number of bots can share one instance and query it in O(1).
+
+    ``update`` brings the fields to a new state. When the snake has
+    only moved a step since the last update, the food field is repaired
+    locally: a freed tail cell lowers distances outward from it, and
+    the new head cell raises only the distances that ran through it.
+    A full recompute happens only when the food respawns or the state
+    is unrelated. The head field moves with the head, so it is
+    recomputed, lazily, on the first query after each update.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """Allocate the fields for a board size.
+
+        Args:
+            width: Board width in cells.
+            height: Board height in cells.
+        """
+        self.width = width
+        self.height = height
+        area = width * height
+        table = move_table(width, height)
+        self._neighbours = table.neighbour_cells
+        self._cell = table.cell
+        # Flat per-cell data; the fields are NumPy views of Python
+        # arrays so local repairs can index them cheaply
+        self._blocked = bytearray(area)
+        self._food_cells = array("i", [UNREACHABLE]) * area
+        self._head_cells = array("i", [UNREACHABLE]) * area
+        self._food_field = np.frombuffer(self._food_cells, dtype=np.int32)
+        self._head_field = np.frombuffer(self._head_cells, dtype=np.int32)
+        # Padded wave buffers for the vectorized search
+        shape = (height + 2, width + 2)
+        self._free = np.zeros(shape, dtype=bool)
+        self._seen = np.zeros(shape, dtype=bool)
+        self._frontier = np.zeros(shape, dtype=bool)
+        self._wave = np.zeros(shape, dtype=bool)
+        self._distances = np.full(shape, UNREACHABLE, dtype=np.int32)
+
+        self._body: Optional[SnakeBody] = None
+        self._food = UNREACHABLE
+        self._head = UNREACHABLE
+        self._head_stale = True
+        # Work done on the food field so far: full recomputes and cells
+        # repaired locally
+        self.full_updates = 0
+        self.repaired_cells = 0
+
+    @property
+    def food_field(self) -> np.ndarray:
+        """Get the distance from the food to every cell, as ``[y, x]``."""
+        return self._food_field.reshape(self.height, self.width)
+
+    @property
+    def food_distances(self) -> "array[int]":
+        """Get the food field as a flat array indexed by ``y * width + x``.
+
+        Cheaper than the NumPy view for looking up one cell at a time.
+        """
+        return self._food_cells
+
+    @property
+    def head_field(self) -> np.ndarray:
+        """Get the distance from the head to every cell, as ``[y, x]``."""
+        self._refresh_head()
+        return self._head_field.reshape(self.height, self.width)
+
+    def food_distance(self, position: Position) -> int:
+        """Get the number of moves between the food and a cell.
+
+        Args:
+            position: Cell on the board.
+
+        Returns:
+            Distance, or ``UNREACHABLE``.
+        """
+        return self._food_cells[position.y * self.width + position.x]
+
+    def head_distance(self, position: Position) -> int:
+        """Get the number of moves between the head and a cell.
+
+        Args:
+            position: Cell on the board.
+
+        Returns:
+            Distance, or ``UNREACHABLE``.
+        """
+        self._refresh_head()
+        return self._head_cells[position.y * self.width + position.x]
+
+    def update(self, state: GameState) -> None:
+        """Bring the fields to a game state.
+
+        Args:
+            state: Current game state on this board size.
+
+        Raises:
+            ValueError: If the state is on another board size.
+        """
+        if (state.width, state.height) != (self.width, self.height):
+            raise ValueError(
+                f"Fields are for a {self.width}x{self.height} board, "
+                f"not {state.width}x{state.height}"
+            )
+        body = state.snake.body
+        food = state.food.position
+        food_cell = food.y * self.width + food.x
+        previous = self._body
+        if previous is body and food_cell == self._food:
+            return
+
+        self._head_stale = True
+        self._head = self._cell(body.head)
+        if previous is not None and body.follows(previous):
+            freed, taken = self._step_occupancy(previous, body)
+            if food_cell == self._food:
+                if freed >= 0:
+                    self._unblock(freed)
+                if taken >= 0:
+                    self._block(taken)
+            else:
+                self._fill_food(food_cell)
+        else:
+            self._set_occupancy(body)
+            self._fill_food(food_cell)
+        self._body = body
+
+    def _step_occupancy(self, previous: SnakeBody, body: SnakeBody) -> Tuple[int, int]:
+        """Mark the cells a one-step move freed and took.
+
+        Segments off the board (a new snake may start partly outside a
+        small board, and a dead head may be in the wall) are ignored.
+
+        Args:
+            previous: Body at the last update.
+            body: Body one step later.
+
+        Returns:
+            Freed cell and the new head cell, each -1 if none.
+        """
+        taken = self._cell(body.head)
+        freed = -1
+        # The old tail leaves unless a duplicate of it stays behind
+        if previous.padding == 0 and previous.tail not in body:
+            freed = self._cell(previous.tail)
+            if freed >= 0:
+                self._blocked[freed] = 0
+        if taken >= 0:
+            self._blocked[taken] = 1
+        return freed, taken
+
+    def _set_occupancy(self, body: SnakeBody) -> None:
+        """Mark every segment on the board as blocked.
+
+        Args:
+            body: Snake body.
+        """
+        blocked = self._blocked
+        blocked[:] = bytes(len(blocked))
+        pairs = np.frombuffer(body.coordinates(), dtype=np.intc)
+        xs, ys = pairs[0::2], pairs[1::2]
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        cells = ys[inside] * self.width + xs[inside]
+        view = np.frombuffer(blocked, dtype=np.uint8)
+        view[cells] = 1
+
+    def _fill_food(self, cell: int) -> None:
+        """Recompute the food field for food on a cell.
+
+        Args:
+            cell: Food cell.
+        """
+        self.full_updates += 1
+        self._food = cell
+        self._search(cell, self._food_cells)
+
+    def _refresh_head(self) -> None:
+        """Recompute the head field if the head has moved since."""
+        if self._head_stale:
+            if self._head >= 0:
+                self._search(self._head, self._head_cells)
+            else:
+                # A head in the wall reaches nothing
+                self._head_field.fill(UNREACHABLE)
+            self._head_stale = False
+
+    def _search(self, source: int, cells: "array[int]") -> None:
+        """Fill a field by breadth-first waves over the whole board.
+
+        Every wave is a pass over the whole board, so the waves cost
+        O(area) per step of distance. That is cheap on open boards,
+        where no cell is more than ``width + height`` steps away, but a
+        body winding the free cells into one long corridor would make
+        it quadratic in the area. After ``width + height`` waves the rest of the
+        field is therefore filled by a plain queue-based search, which
+        visits each remaining cell once.
+
+        Args:
+            source: Cell the distances are measured from; it may be
+                blocked itself (the head is).
+            cells: Flat field to overwrite.
+        """
+        height, width = self.height, self.width
+        free = self._free
+        seen = self._seen
+        frontier = self._frontier
+        wave = self._wave
+        distances = self._distances
+        inner = (slice(1, -1), slice(1, -1))
+
+        blocked = np.frombuffer(self._blocked, dtype=np.uint8)
+        np.equal(blocked.reshape(height, width), 0, out=free[inner])
+        seen.fill(False)
+        frontier.fill(False)
+        distances.fill(UNREACHABLE)
+        y, x = divmod(source, width)
+        frontier[y + 1, x + 1] = True
+        seen[y + 1, x + 1] = True
+        distances[y + 1, x + 1] = 0
+
+        unfinished: Optional[np.ndarray] = None
+        step = 0
+        while step < width + height:
+            step += 1
+            wave.fill(False)
+            core = wave[inner]
+            np.logical_or(frontier[:-2, 1:-1], frontier[2:, 1:-1], out=core)
+            np.logical_or(core, frontier[1:-1, :-2], out=core)
+            np.logical_or(core, frontier[1:-1, 2:], out=core)
+            np.logical_and(wave, free, out=wave)
+            np.greater(wave, seen, out=wave)
+            if not wave.any():
+                break
+            np.logical_or(seen, wave, out=seen)
+            distances[wave] = step
+            frontier, wave = wave, frontier
+        else:
+            # Out of waves with cells still to reach
+            unfinished = np.flatnonzero(frontier[inner])
+        np.frombuffer(cells, dtype=np.int32)[:] = distances[inner].ravel()
+        if unfinished is not None:
+            self._finish_search(cells, unfinished)
+
+    def _finish_search(self, cells: "array[int]", frontier: np.ndarray) -> None:
+        """Continue a search from its last wave with a queue.
+
+        Args:
+            cells: Flat field filled up to the last wave.
+            frontier: Flat indices of the cells of the last wave.
+        """
+        blocked = self._blocked
+        neighbours = self._neighbours
+        queue: Deque[int] = deque(frontier.tolist())
+        while queue:
+            current = queue.popleft()
+            step = cells[current] + 1
+            for other in neighbours(current):
+                if other >= 0 and not blocked[other] and cells[other] < 0:
+                    cells[other] = step
+                    queue.append(other)
+
+    def _unblock(self, cell: int) -> None:
+        """Lower food distances around a cell that became free.
+
+        Args:
+            cell: Freed cell.
+        """
+        dist = self._food_cells
+        blocked = self._blocked
+        neighbours = self._neighbours
+        best = UNREACHABLE
+        for other in neighbours(cell):
+            if other >= 0 and not blocked[other] and dist[other] >= 0:
+                if best < 0 or dist[other] + 1 < best:
+                    best = dist[other] + 1
+        if best < 0:
+            return
+        dist[cell] = best
+        queue: Deque[int] = deque([cell])
+        repaired = 1
+        while queue:
+            current = queue.popleft()
+            step = dist[current] + 1
+            for other in neighbours(current):
+                if other < 0 or blocked[other]:
+                    continue
+                if dist[other] < 0 or dist[other] > step:
+                    dist[other] = step
+                    queue.append(other)
+                    repaired += 1
+        self.repaired_cells += repaired
+
+    def _block(self, cell: int) -> None:
+        """Raise food distances that ran through a newly blocked cell.
+
+        Cells whose every shortest path passed through the cell lose
+        their distance; they are then refilled from the unaffected cells
+        around them, nearest first.
+
+        Args:
+            cell: Newly blocked cell.
+        """
+        dist = self._food_cells
+        if dist[cell] < 0:
+            return
+        blocked = self._blocked
+        neighbours = self._neighbours
+
+        # Find the cells left without a shortest path, nearest first
+        affected: List[int] = [cell]
+        lost = {cell}
+        queue: Deque[int] = deque([cell])
+        while queue:
+            current = queue.popleft()
+            child_distance = dist[current] + 1
+            for other in neighbours(current):
+                if other < 0 or other in lost or blocked[other]:
+                    continue
+                if dist[other] != child_distance:
+                    continue
+                if any(
+                    parent >= 0
+                    and parent not in lost
+                    and not blocked[parent]
+                    and dist[parent] == child_distance - 1
+                    for parent in neighbours(other)
+                ):
+                    continue
+                lost.add(other)
+                affected.append(other)
+                queue.append(other)
+        for lost_cell in affected:
+            dist[lost_cell] = UNREACHABLE
+
+        # Refill from the unaffected cells around them, nearest first
+        heap: List[Tuple[int, int]] = []
+        for lost_cell in affected[1:]:
+            for other in neighbours(lost_cell):
+                if other >= 0 and other not in lost and dist[other] >= 0:
+                    heap.append((dist[other] + 1, lost_cell))
+        heapq.heapify(heap)
+        while heap:
+            distance, lost_cell = heapq.heappop(heap)
+            if dist[lost_cell] >= 0:
+                continue
+            dist[lost_cell] = distance
+            for other in neighbours(lost_cell):
+                if other in lost and other != cell and dist[other] < 0:
+                    heapq.heappush(heap, (distance + 1, other))
+        self.repaired_cells += len(affected)
@@ -0,0 +1,39 @@
+"""Creating autopilots by name, as configured in Settings."""
+
+from typing import Optional
+
+from src.bots.base import Autopilot
+from src.bots.bfs import BFSAutopilot
+from src.bots.hamiltonian import HamiltonianAutopilot
+from src.bots.mcts import MCTSAutopilot
+from src.bots.planner import PlannerAutopilot
+from src.config.settings import DEFAULT_SETTINGS, Settings
+
+# Autopilot class for each Settings.AUTOPILOT name
+AUTOPILOTS = {
+    "bfs": BFSAutopilot,
+    "hamiltonian": HamiltonianAutopilot,
+    "mcts": MCTSAutopilot,
+    "planner": PlannerAutopilot,
+}
+
+
+def create_autopilot(name: str, settings: Optional[Settings] = None) -> Autopilot:
+    """Create an autopilot from its settings name.
+
+    Args:
+        name: One of the keys of ``AUTOPILOTS``.
+        settings: Game settings the autopilot is configured from
+            (defaults to ``DEFAULT_SETTINGS``).
+
+    Returns:
+        A new autopilot.
+
+    Raises:
+        ValueError: If no autopilot has that name.
+    """
+    try:
+        autopilot = AUTOPILOTS[name]
+    except KeyError:
+        raise ValueError(f"Unknown autopilot: {name}") from None
+    return autopilot.from_settings(settings or DEFAULT_SETTINGS)
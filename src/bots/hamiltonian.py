@@ -0,0 +1,280 @@
+"""Autopilot that follows a Hamiltonian cycle with safe shortcuts."""
+
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from src.bots.base import Autopilot
+from src.config.settings import Settings
+from src.models.direction import Direction
+from src.models.game_state import GameState
+from src.models.position import Position
+from src.models.snake_body import SnakeBody
+from src.storage.table_cache import cached_table, default_cache_dir
+
+# Shortcuts are only taken while the snake fills less than this share
+# of the board; beyond it the bot just follows the cycle
+SHORTCUT_MAX_FILL = 0.5
+
+# Free cycle cells kept between the head and the tail after a shortcut,
+# on top of the cells duplicated tail segments still hold
+SHORTCUT_MARGIN = 2
+
+# Cycle tables already loaded by cache directory and board size, shared
+# by all autopilots in the process
+_cycles: Dict[Tuple[Path, int, int], "array[int]"] = {}
+
+
+def has_cycle(width: int, height: int) -> bool:
+    """Check if a board has a Hamiltonian cycle.
+
+    Args:
+        width: Board width in cells.
+        height: Board height in cells.
+
+    Returns:
+        True if both sides are at least 2 and one of them is even.
+    """
+    return width >= 2 and height >= 2 and not (width % 2 and height % 2)
+
+
+def build_cycle(width: int, height: int) -> "array[int]":
+    """Compute a Hamiltonian cycle through every cell of a board.
+
+    The cycle runs along the top row, snakes back and forth over the
+    other rows (leaving the first column free) and returns up the first
+    column. Such a cycle exists only if a side is even.
+
+    Args:
+        width: Board width in cells.
+        height: Board height in cells.
+
+    Returns:
+        Position of every cell (``y * width + x``) along the cycle.
+
+    Raises:
+        ValueError: If the board has no Hamiltonian cycle.
+    """
+    if not has_cycle(width, height):
+        raise ValueError(f"A {width}x{height} board has no Hamiltonian cycle")
+
+    # Walk with rows of even count; transpose boards with an odd row count
+    transpose = height % 2 == 1
+    columns, rows = (height, width) if transpose else (width, height)
+    path: List[Tuple[int, int]] = [(x, 0) for x in range(columns)]
+    for y in range(1, rows):
+        xs = range(columns - 1, 0, -1) if y % 2 else range(1, columns)
+        path.extend((x, y) for x in xs)
+    path.extend((0, y) for y in range(rows - 1, 0, -1))
+
+    order = array("i", bytes(4 * width * height))
+    for index, (x, y) in enumerate(path):
+        if transpose:
+            x, y = y, x
+        order[y * width + x] = index
+    return order
+
+
+def is_cycle(order: "array[int]", width: int, height: int) -> bool:
+    """Check that a table describes a Hamiltonian cycle of a board.
+
+    Args:
+        order: Position of every cell along the cycle.
+        width: Board width in cells.
+        height: Board height in cells.
+
+    Returns:
+        True if every cell appears once and consecutive cells, the last
+        and the first included, are neighbours.
+    """
+    area = width * height
+    if len(order) != area:
+        return False
+    cells = array("i", [-1]) * area
+    for cell, index in enumerate(order):
+        if not 0 <= index < area or cells[index] >= 0:
+            return False
+        cells[index] = cell
+    previous = cells[-1]
+    for cell in cells:
+        step = abs(cell - previous)
+        # Cells one apart must also be on the same row
+        if step != width and (step != 1 or min(cell, previous) % width == width - 1):
+            return False
+        previous = cell
+    return True
+
+
+def load_cycle(
+    width: int, height: int, cache_dir: Optional[Union[str, Path]] = None
+) -> "array[int]":
+    """Get the cycle table of a board size, from memory or disk if cached.
+
+    A cached file that does not hold a cycle of the board, e.g. a stale
+    or damaged one, is rebuilt.
+
+    Args:
+        width: Board width in cells.
+        height: Board height in cells.
+        cache_dir: Directory of cached tables; ``default_cache_dir()``
+            if not given.
+
+    Returns:
+        Position of every cell along the cycle.
+
+    Raises:
+        ValueError: If the board has no Hamiltonian cycle.
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    key = (cache_dir, width, height)
+    cycle = _cycles.get(key)
+    if cycle is None:
+        cycle = cached_table(
+            cache_dir / f"hamiltonian_{width}x{height}.bin",
+            width * height,
+            lambda: build_cycle(width, height),
+            lambda table: is_cycle(table, width, height),
+        )
+        _cycles[key] = cycle
+    return cycle
+
+
+class HamiltonianAutopilot(Autopilot):
+    """Follows a fixed cycle through every cell, cutting corners early on.
+
+    Following the cycle can never hit the body, so the snake can fill
+    the whole board. While the snake is short it may jump ahead along
+    the cycle towards the food, as long as the jump lands before its
+    tail with room to grow. Every decision is a few table lookups.
+
+    Cycle tables are computed once per board size and cached on disk.
+    Boards with both sides odd have no cycle: ``from_settings`` rejects
+    them before a game starts, and ``choose`` raises ValueError.
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None) -> None:
+        """Initialize the autopilot.
+
+        Args:
+            cache_dir: Directory of cached cycle tables;
+                ``default_cache_dir()`` if not given.
+        """
+        self.cache_dir = cache_dir
+        self._size: Optional[Tuple[int, int]] = None
+        self._order: "array[int]" = array("i")
+        self._positions: List[Position] = []
+        self._neighbours: List[Tuple[Tuple[int, Direction], ...]] = []
+        # Ticks the body has been following the cycle order
+        self._ordered_ticks = 0
+        self._last_body: Optional[SnakeBody] = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "HamiltonianAutopilot":
+        """Create the autopilot for the game's board.
+
+        Args:
+            settings: Game settings.
+
+        Returns:
+            A new autopilot.
+
+        Raises:
+            ValueError: If the configured board has no Hamiltonian cycle.
+        """
+        if not has_cycle(settings.GRID_WIDTH, settings.GRID_HEIGHT):
+            raise ValueError(
+                f"The hamiltonian autopilot needs a board with an even side, "
+                f"not {settings.GRID_WIDTH}x{settings.GRID_HEIGHT}"
+            )
+        return cls()
+
+    def choose(self, state: GameState) -> Optional[Direction]:
+        """Pick the next move along the cycle, or a safe shortcut.
+
+        Args:
+            state: Current game state.
+
+        Returns:
+            Direction to move in, or None if every move dies.
+
+        Raises:
+            ValueError: If the board has no Hamiltonian cycle.
+        """
+        width = state.width
+        if self._size != (width, state.height):
+            self._prepare(width, state.height)
+        order = self._order
+        area = len(order)
+        positions = self._positions
+
+        snake = state.snake
+        body = snake.body
+        length = len(body)
+        head = snake.head
+        tail = body.tail
+        head_order = order[head.y * width + head.x]
+        tail_order = order[tail.y * width + tail.x]
+        food = state.food.position
+        food_gap = (order[food.y * width + food.x] - head_order) % area
+
+        # The body follows the cycle once every segment has been laid by
+        # this bot; a new game or a body from elsewhere starts over
+        last = self._last_body
+        if last is not None and body.follows(last):
+            self._ordered_ticks += 1
+        else:
+            self._ordered_ticks = 0
+        self._last_body = body
+        ordered = self._ordered_ticks >= length
+
+        # Cells held by duplicated tail segments stay occupied longer
+        tail_pad = body.padding
+        tail_moves = length > 1 and tail_pad == 0
+        tail_gap = (tail_order - head_order) % area
+        shortcut_limit = -1
+        if ordered and length < area * SHORTCUT_MAX_FILL:
+            shortcut_limit = min(food_gap, tail_gap - SHORTCUT_MARGIN - tail_pad)
+
+        best: Optional[Direction] = None
+        best_gap = -1
+        fallback: Optional[Direction] = None
+        fallback_gap = -1
+        for cell, direction in self._neighbours[head.y * width + head.x]:
+            position = positions[cell]
+            if position in body and not (position == tail and tail_moves):
+                continue
+            gap = (order[cell] - head_order) % area
+            if gap == 1 or gap <= shortcut_limit:
+                if gap > best_gap:
+                    best, best_gap = direction, gap
+            elif gap > fallback_gap:
+                fallback, fallback_gap = direction, gap
+        if best is not None:
+            return best
+        # Only while the body is not on the cycle yet
+        return fallback
+
+    def _prepare(self, width: int, height: int) -> None:
+        """Load the cycle and build the lookup tables for a board size.
+
+        Args:
+            width: Board width in cells.
+            height: Board height in cells.
+        """
+        self._order = load_cycle(width, height, self.cache_dir)
+        self._size = (width, height)
+        self._positions = [
+            Position(x=x, y=y) for y in range(height) for x in range(width)
+        ]
+        self._neighbours = []
+        for y in range(height):
+            for x in range(width):
+                cells = []
+                for direction in Direction.all():
+                    delta = direction.delta
+                    nx, ny = x + delta.x, y + delta.y
+                    if 0 <= nx < width and 0 <= ny < height:
+                        cells.append((ny * width + nx, direction))
+                self._neighbours.append(tuple(cells))
+        self._last_body = None
+        self._ordered_ticks = 0
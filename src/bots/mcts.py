@@ -0,0 +1,262 @@
+"""Autopilot that picks moves by Monte Carlo tree search."""
+
+import math
+import random
+import time
+from typing import Dict, List, Optional
+
+from src.bots.base import Autopilot
+from src.bots.simulation import Simulation
+from src.config.settings import Settings
+from src.models.direction import Direction
+from src.models.game_state import GameState
+from src.models.move_table import MOVES
+
+# Seconds of search per tick unless configured
+DEFAULT_TIME_BUDGET = 0.005
+
+# Weight of exploring rarely visited moves against exploiting good ones
+DEFAULT_EXPLORATION = 0.7
+
+# Moves played out past the tree in each rollout
+DEFAULT_ROLLOUT_DEPTH = 30
+
+# Chance that a rollout move heads for the food rather than a random
+# safe direction
+ROLLOUT_GREED = 0.75
+
+
+class _Node:
+    """Search statistics of one move sequence from the root."""
+
+    __slots__ = (
+        "move",
+        "parent",
+        "children",
+        "untried",
+        "visits",
+        "value",
+        "head",
+        "food",
+        "length",
+    )
+
+    def __init__(
+        self,
+        move: int,
+        parent: Optional["_Node"],
+        untried: List[int],
+        simulation: Simulation,
+    ) -> None:
+        """Create a node for the position a simulation is in.
+
+        Args:
+            move: Move that led here from the parent (-1 at the root).
+            parent: Parent node, or None at the root.
+            untried: Safe moves not expanded yet.
+            simulation: Simulation at this node's position.
+        """
+        self.move = move
+        self.parent = parent
+        self.children: Dict[int, "_Node"] = {}
+        self.untried = untried
+        self.visits = 0
+        self.value = 0.0
+        # Identifies the position, to reuse the node on the next tick
+        self.head = simulation.head
+        self.food = simulation.food
+        self.length = simulation.length
+
+
+class MCTSAutopilot(Autopilot):
+    """Searches a tree of moves with random playouts under a time budget.
+
+    Each iteration walks down the tree by UCT, adds one move, plays
+    random (mostly food-seeking) moves until the rollout depth or death,
+    and backs up the result: nothing for dying, otherwise half for
+    surviving and up to half for food eaten.
+    All of it runs on one ``Simulation`` that is stepped forward and
+    undone back to the root, so an iteration builds no game states.
+
+    With ``reuse_tree`` the subtree of the chosen move becomes the next
+    root, as long as the game reached the position the tree expected
+    (same head, length and food). Rollouts draw from a generator seeded
+    by ``seed``; with ``max_iterations`` and no time budget the bot is
+    fully deterministic.
+    """
+
+    def __init__(
+        self,
+        time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+        exploration: float = DEFAULT_EXPLORATION,
+        rollout_depth: int = DEFAULT_ROLLOUT_DEPTH,
+        seed: Optional[int] = None,
+        reuse_tree: bool = True,
+        max_iterations: Optional[int] = None,
+    ) -> None:
+        """Initialize the autopilot.
+
+        Args:
+            time_budget: Seconds of search per tick (None for no limit;
+                then ``max_iterations`` must be set).
+            exploration: UCT exploration weight.
+            rollout_depth: Moves played past the tree in each rollout.
+            seed: Seed of the rollout and food-spawn generator.
+            reuse_tree: Keep the chosen move's subtree for the next tick.
+            max_iterations: Most iterations per tick (None for no limit).
+
+        Raises:
+            ValueError: If neither a time budget nor an iteration limit
+                is given.
+        """
+        if time_budget is None and max_iterations is None:
+            raise ValueError("MCTS needs a time budget or an iteration limit")
+        self.time_budget = time_budget
+        self.exploration = exploration
+        self.rollout_depth = rollout_depth
+        self.reuse_tree = reuse_tree
+        self.max_iterations = max_iterations
+        self._rng = random.Random(seed)
+        self._root: Optional[_Node] = None
+        # Iterations run for the last decision
+        self.iterations = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "MCTSAutopilot":
+        """Create a bot that searches for its share of each tick.
+
+        Args:
+            settings: Game settings.
+
+        Returns:
+            A bot budgeted ``settings.BOT_TIME_FRACTION`` of
+            ``1 / settings.FPS`` seconds per tick.
+        """
+        return cls(time_budget=settings.BOT_TIME_FRACTION / settings.FPS)
+
+    def choose(self, state: GameState) -> Optional[Direction]:
+        """Search from the current state and pick the most visited move.
+
+        Args:
+            state: Current game state.
+
+        Returns:
+            Direction to move in, or None if every move dies.
+        """
+        deadline = None
+        if self.time_budget is not None:
+            deadline = time.perf_counter() + self.time_budget
+        simulation = Simulation.from_state(state, self._rng)
+        root = self._reuse_root(simulation)
+        if not root.untried and not root.children:
+            self._root = None
+            return None
+
+        iterations = 0
+        limit = self.max_iterations
+        while limit is None or iterations < limit:
+            self._iterate(root, simulation)
+            iterations += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        self.iterations = iterations
+
+        best = max(root.children.values(), key=lambda child: child.visits)
+        if self.reuse_tree:
+            best.parent = None
+            self._root = best
+        return MOVES[best.move]
+
+    def _reuse_root(self, simulation: Simulation) -> _Node:
+        """Get the kept subtree if it matches the position, else a new root.
+
+        Args:
+            simulation: Simulation at the current state.
+
+        Returns:
+            Root node for this tick's search.
+        """
+        root = self._root
+        self._root = None
+        if (
+            root is not None
+            and root.head == simulation.head
+            and root.food == simulation.food
+            and root.length == simulation.length
+        ):
+            return root
+        return _Node(-1, None, simulation.safe_moves(), simulation)
+
+    def _iterate(self, root: _Node, simulation: Simulation) -> None:
+        """Run one selection, expansion, rollout and backup.
+
+        Args:
+            root: Root of the tree.
+            simulation: Simulation at the root; left there on return.
+        """
+        node = root
+        exploration = self.exploration
+
+        # Select by UCT down to a node with moves left to try. Food in
+        # the tree respawns at random, so a move that was safe when its
+        # node was added can die in a later iteration
+        while not node.untried and node.children and simulation.alive:
+            log_visits = math.log(node.visits)
+            node = max(
+                node.children.values(),
+                key=lambda child: child.value / child.visits
+                + exploration * math.sqrt(log_visits / child.visits),
+            )
+            simulation.step(node.move)
+
+        # Expand one untried move
+        if node.untried and simulation.alive:
+            untried = node.untried
+            move = untried.pop(self._rng.randrange(len(untried)))
+            simulation.step(move)
+            child = _Node(move, node, simulation.safe_moves(), simulation)
+            node.children[move] = child
+            node = child
+
+        reward = self._rollout(simulation)
+        while node is not None:
+            node.visits += 1
+            node.value += reward
+            node = node.parent
+        for _ in range(simulation.depth):
+            simulation.undo()
+
+    def _rollout(self, simulation: Simulation) -> float:
+        """Play random moves from the current position and score them.
+
+        Args:
+            simulation: Simulation created at the root; its moves are
+                left for the caller to undo.
+
+        Returns:
+            Reward in [0, 1]: 0 if the snake dies, otherwise 0.5 plus up
+            to 0.5 for food eaten since the root.
+        """
+        rng = self._rng
+        width = simulation.width
+        neighbours = simulation.neighbours
+        for _ in range(self.rollout_depth):
+            moves = simulation.safe_moves()
+            if not moves:
+                return 0.0
+            move = moves[0]
+            if len(moves) > 1:
+                move = rng.choice(moves)
+                food = simulation.food
+                if food >= 0 and rng.random() < ROLLOUT_GREED:
+                    fy, fx = divmod(food, width)
+                    best = None
+                    targets = neighbours(simulation.head)
+                    for candidate in moves:
+                        y, x = divmod(targets[candidate], width)
+                        distance = abs(x - fx) + abs(y - fy)
+                        if best is None or distance < best:
+                            best, move = distance, candidate
+            simulation.step(move)
+
+        return 0.5 + 0.5 * (1.0 - 0.5**simulation.eaten)
@@ -0,0 +1,324 @@
+"""Autopilot that plans moves by iterative deepening under a time budget."""
+
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from src.bots.base import Autopilot
+from src.bots.safety import SafetyAnalyzer
+from src.bots.simulation import NO_FOOD, Simulation
+from src.config.settings import Settings
+from src.models.direction import Direction
+from src.models.game_state import GameState
+from src.models.move_table import MOVES, MoveTable, move_table
+
+try:
+    from src.bots.distance_field import DistanceFields
+except ImportError:
+    # Without numpy, distances to the food are measured straight
+    DistanceFields = None  # type: ignore[assignment,misc]
+
+# Deepest search, even with time to spare
+MAX_DEPTH = 32
+
+# Value of eating the food, lowered by the ply it is eaten at; far more
+# than any distance on the board
+FOOD_VALUE = 1000.0
+
+# Value of dying, raised by the ply of death so that later deaths rank
+# above sooner ones
+DEATH_VALUE = -1_000_000.0
+
+# Nodes searched between clock checks
+CLOCK_INTERVAL = 128
+
+# Transposition table entry: searched depth, value and best move
+_Entry = Tuple[int, float, int]
+
+
+class _OutOfTime(Exception):
+    """Raised inside the search when the tick's budget runs out."""
+
+
+class PlannerAutopilot(Autopilot):
+    """Searches ever deeper until its share of the tick is used up.
+
+    Every iteration is a full search of all move sequences up to its
+    depth, on a ``Simulation`` that is stepped and undone in place.
+    Where the next food will spawn is unknown, so the search plans up
+    to the current food and then only for survival: leaves score eating
+    it, sooner above later, then closeness to it. Dying scores lowest,
+    later deaths above sooner ones. The move of
+    the deepest finished iteration is played, so a decision is always
+    ready when the budget runs out.
+
+    Closeness is the number of moves around the body, looked up in
+    ``DistanceFields`` that are brought up to date once per decision,
+    when numpy is installed. Cells the fields cannot reach, such as
+    ones the body only vacates during the search, and games without
+    numpy fall back to ``Position.distance_to``.
+
+    Positions reached by different move orders are searched once per
+    depth thanks to a transposition table keyed by the simulation's
+    Zobrist key. Its best moves are tried first in the next iteration,
+    then moves that get closer to the food.
+    Moves that leave less room than the snake needs are only searched
+    if nothing else survives.
+
+    The budget is ``time_fraction`` of the tick interval ``1 / fps``,
+    so a faster game gets a shorter search rather than a late move.
+    """
+
+    def __init__(
+        self,
+        fps: float = 5,
+        time_fraction: float = 0.5,
+        max_depth: int = MAX_DEPTH,
+    ) -> None:
+        """Initialize the planner.
+
+        Args:
+            fps: Ticks per second of the game being played.
+            time_fraction: Share of each tick the search may use.
+            max_depth: Deepest search.
+        """
+        self.fps = fps
+        self.time_fraction = time_fraction
+        self.max_depth = max_depth
+        self._safety = SafetyAnalyzer()
+        self._table: Dict[Tuple[int, int, int, int, int, int], _Entry] = {}
+        # Cell lookup of the board being searched, set by every decision
+        self._moves: MoveTable = move_table(1, 1)
+        # Distances from the food around the body, if numpy is there
+        self._fields: Optional["DistanceFields"] = None
+        self._food_distances: Optional["array[int]"] = None
+        self._nodes = 0
+        self._deadline = 0.0
+        # Depth of the deepest finished iteration of the last decision
+        self.depth = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "PlannerAutopilot":
+        """Create a planner budgeted for the game's speed.
+
+        Args:
+            settings: Game settings.
+
+        Returns:
+            A planner for ``settings.FPS`` and
+            ``settings.BOT_TIME_FRACTION``.
+        """
+        return cls(fps=settings.FPS, time_fraction=settings.BOT_TIME_FRACTION)
+
+    @property
+    def time_budget(self) -> float:
+        """Get the seconds of search per tick."""
+        return self.time_fraction / self.fps
+
+    def choose(self, state: GameState) -> Optional[Direction]:
+        """Search as deep as the budget allows and pick the best move.
+
+        Args:
+            state: Current game state.
+
+        Returns:
+            Direction to move in, or None if every move dies.
+        """
+        self._deadline = time.perf_counter() + self.time_budget
+        self._nodes = 0
+        self._table.clear()
+        self._moves = move_table(state.width, state.height)
+        self._food_distances = self._update_fields(state)
+        simulation = Simulation.from_state(state, respawn=False)
+
+        moves = self._roomy_moves(state, simulation.safe_moves())
+        if not moves:
+            self.depth = 0
+            return None
+
+        best = self._order(simulation, moves, -1)[0]
+        self.depth = 0
+        for depth in range(1, self.max_depth + 1):
+            try:
+                best = self._search_root(simulation, moves, depth, best)
+            except _OutOfTime:
+                break
+            self.depth = depth
+        return MOVES[best]
+
+    def _roomy_moves(self, state: GameState, moves: List[int]) -> List[int]:
+        """Drop moves into areas too small for the snake, if others exist.
+
+        Args:
+            state: Current game state.
+            moves: Safe moves.
+
+        Returns:
+            The safe moves that leave room for the whole snake, or all
+            of them if none does.
+        """
+        needed = len(state.snake) + 1
+        roomy = [
+            move
+            for move in moves
+            if self._safety.reachable_area(state, MOVES[move], limit=needed) >= needed
+        ]
+        return roomy or moves
+
+    def _search_root(
+        self, simulation: Simulation, moves: List[int], depth: int, previous: int
+    ) -> int:
+        """Run one iteration and get its best move.
+
+        Args:
+            simulation: Simulation at the current state.
+            moves: Root moves to consider.
+            depth: Moves to look ahead.
+            previous: Best move of the last iteration, searched first.
+
+        Returns:
+            Best root move.
+
+        Raises:
+            _OutOfTime: If the budget runs out before the iteration ends.
+        """
+        best_move = previous
+        best_value = DEATH_VALUE * 2
+        for move in self._order(simulation, moves, previous):
+            ate_at = 1 if simulation.step(move) else -1
+            try:
+                value = self._search(simulation, depth - 1, 1, ate_at)
+            finally:
+                simulation.undo()
+            if value > best_value:
+                best_move, best_value = move, value
+        return best_move
+
+    def _search(
+        self, simulation: Simulation, depth: int, ply: int, ate_at: int
+    ) -> float:
+        """Get the best value reachable within a number of moves.
+
+        Args:
+            simulation: Simulation at the position to search.
+            depth: Moves left to look ahead.
+            ply: Moves made since the root.
+            ate_at: Ply the food was eaten at, or -1 if not yet.
+
+        Returns:
+            Value of the best move sequence.
+
+        Raises:
+            _OutOfTime: If the budget runs out.
+        """
+        self._nodes += 1
+        if self._nodes % CLOCK_INTERVAL == 0 and time.perf_counter() >= self._deadline:
+            raise _OutOfTime
+        if not simulation.alive:
+            return DEATH_VALUE + ply
+        if depth == 0:
+            return self._evaluate(simulation, ate_at)
+
+        key = (
+            simulation.key,
+            simulation.head,
+            simulation.food,
+            simulation.pending,
+            simulation.direction,
+            ate_at,
+        )
+        entry = self._table.get(key)
+        if entry is not None and entry[0] >= depth:
+            return entry[1]
+
+        moves = simulation.safe_moves()
+        if not moves:
+            return DEATH_VALUE + ply
+
+        best_move = moves[0]
+        best_value = DEATH_VALUE * 2
+        for move in self._order(simulation, moves, entry[2] if entry else -1):
+            ate = simulation.step(move)
+            try:
+                value = self._search(
+                    simulation, depth - 1, ply + 1, ply + 1 if ate else ate_at
+                )
+            finally:
+                simulation.undo()
+            if value > best_value:
+                best_move, best_value = move, value
+        self._table[key] = (depth, best_value, best_move)
+        return best_value
+
+    def _evaluate(self, simulation: Simulation, ate_at: int) -> float:
+        """Score a live position at the end of a search.
+
+        Args:
+            simulation: Simulation at the position.
+            ate_at: Ply the food was eaten at, or -1 if not yet.
+
+        Returns:
+            ``FOOD_VALUE`` less the ply of eating, or minus the distance
+            to the food if it was not eaten.
+        """
+        if ate_at >= 0:
+            return FOOD_VALUE - ate_at
+        return -self._food_distance(simulation.head, simulation.food)
+
+    def _food_distance(self, cell: int, food: int) -> int:
+        """Get the number of moves from a cell to the food.
+
+        Args:
+            cell: Cell on the board.
+            food: Food cell of the current state.
+
+        Returns:
+            Distance around the body at the root, or the straight
+            distance where that is not known.
+        """
+        distances = self._food_distances
+        if distances is not None and distances[cell] >= 0:
+            return distances[cell]
+        position = self._moves.position
+        return position(cell).distance_to(position(food))
+
+    def _update_fields(self, state: GameState) -> Optional["array[int]"]:
+        """Bring the distance fields to the current state.
+
+        Args:
+            state: Current game state.
+
+        Returns:
+            Distance from the food to every cell, or None without numpy.
+        """
+        if DistanceFields is None:
+            return None
+        fields = self._fields
+        size = (state.width, state.height)
+        if fields is None or (fields.width, fields.height) != size:
+            fields = self._fields = DistanceFields(state.width, state.height)
+        fields.update(state)
+        return fields.food_distances
+
+    def _order(self, simulation: Simulation, moves: List[int], first: int) -> List[int]:
+        """Sort moves so the most promising are searched first.
+
+        Args:
+            simulation: Simulation at the position.
+            moves: Moves to sort.
+            first: Move to put first (the best one found before), or -1.
+
+        Returns:
+            ``first`` if present, then the others by distance to the food.
+        """
+        food = simulation.food
+        if food == NO_FOOD:
+            return sorted(moves, key=lambda move: move != first)
+        targets = simulation.neighbours(simulation.head)
+        return sorted(
+            moves,
+            key=lambda move: (
+                move != first,
+                self._food_distance(targets[move], food),
+            ),
+        )
@@ -0,0 +1,211 @@
+"""Bitboard flood fill for judging how much room a move leaves.
+
+A bitboard is a Python int with one bit per cell. Cell ``(x, y)`` is bit
+``y * (width + 1) + x``: every row has one spare bit at its end, so
+shifting the board one column sideways can never wrap a cell into the
+neighbouring row. Growing a region by one step in all four directions
+is then four shifts and masks over the whole board at once.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from src.models.direction import Direction
+from src.models.game_state import GameState
+from src.models.position import Position
+from src.models.snake_body import SnakeBody
+
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:  # pragma: no cover - Python 3.9
+
+    def _popcount(value: int) -> int:
+        return bin(value).count("1")
+
+
+class SafetyAnalyzer:
+    """Measures the area the snake can still reach after each move.
+
+    The fill is timed: a body segment blocks its cell only until the
+    tick it moves away (later still if the snake has just eaten), so
+    regions that open up as the tail retreats count as reachable. A move
+    whose area is smaller than the snake is likely a trap.
+
+    Occupancy is kept between calls. When the snake has only advanced
+    since the last call, it is updated with two bit operations instead
+    of being rebuilt from the whole body.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the analyzer with no board yet."""
+        self._size: Optional[Tuple[int, int]] = None
+        self._stride = 0
+        self._board = 0
+        self._body: Optional[SnakeBody] = None
+        self._occupied = 0
+
+    def move_areas(
+        self, state: GameState, limit: Optional[int] = None
+    ) -> Dict[Direction, int]:
+        """Measure the reachable area after every move.
+
+        Args:
+            state: Current game state.
+            limit: Stop counting once an area reaches this many cells.
+
+        Returns:
+            Reachable cell count per direction; 0 for moves that reverse
+            or die at once.
+        """
+        return {
+            direction: self.reachable_area(state, direction, limit)
+            for direction in Direction.all()
+        }
+
+    def reachable_area(
+        self, state: GameState, direction: Direction, limit: Optional[int] = None
+    ) -> int:
+        """Count the cells the head can reach after one move.
+
+        Args:
+            state: Current game state.
+            direction: Move to evaluate.
+            limit: Stop counting once the area reaches this many cells.
+
+        Returns:
+            Number of reachable cells, including the one moved into;
+            0 if the move reverses or dies at once.
+        """
+        snake = state.snake
+        if snake.direction.is_opposite(direction):
+            return 0
+        start = snake.head + direction.delta
+        if not start.is_in_bounds(state.width, state.height):
+            return 0
+
+        occupied = self.occupancy(state)
+        body = snake.body
+        length = len(body)
+        padding = body.padding
+        # Eating holds the tail in place for one more tick
+        eats = 1 if start == state.food.position else 0
+        bit = self._bit
+        board = self._board
+        stride = self._stride
+
+        def release(tick: int) -> int:
+            """Get the cell the body leaves on a tick (0 if none yet)."""
+            moved = tick - eats
+            if moved <= padding or moved >= length:
+                return 0
+            return bit(body[length - moved])
+
+        # Last tick on which the body leaves a cell
+        last_tick = length - 1 + eats
+        tick = 1
+        free = (board & ~occupied) | release(tick)
+        reached = bit(start)
+        if not reached & free:
+            return 0
+
+        while limit is None or _popcount(reached) < limit:
+            tick += 1
+            free |= release(tick)
+            around = (
+                reached
+                | (reached << 1)
+                | (reached >> 1)
+                | (reached << stride)
+                | (reached >> stride)
+            ) & board
+            grown = around & free
+            if grown != reached:
+                reached = grown
+                continue
+
+            # Stalled: the snake survives in the region for about as many
+            # ticks as it has cells, so skip ahead to a cell next to the
+            # region that the body leaves by then, if any
+            walls = around & ~free
+            deadline = min(last_tick, 1 + _popcount(reached))
+            while True:
+                tick += 1
+                if tick > deadline:
+                    return _popcount(reached)
+                cell = release(tick)
+                free |= cell
+                if cell & walls:
+                    break
+            reached |= walls & free
+
+        return _popcount(reached)
+
+    def occupancy(self, state: GameState) -> int:
+        """Get the bitboard of cells covered by the snake.
+
+        Args:
+            state: Current game state.
+
+        Returns:
+            Bitboard with the body cells set.
+        """
+        if self._size != (state.width, state.height):
+            self._prepare(state.width, state.height)
+            self._body = None
+
+        body = state.snake.body
+        previous = self._body
+        if previous is body:
+            return self._occupied
+        if previous is not None and body.follows(previous):
+            occupied = self._occupied | self._bit(body.head)
+            # The old tail leaves unless a duplicate of it stays behind
+            if previous.padding == 0 and previous.tail not in body:
+                occupied &= ~self._bit(previous.tail)
+        else:
+            occupied = self._build_occupancy(body)
+        self._body = body
+        self._occupied = occupied
+        return occupied
+
+    def _build_occupancy(self, body: SnakeBody) -> int:
+        """Set the bit of every segment.
+
+        Args:
+            body: Snake body.
+
+        Returns:
+            Bitboard with the body cells set.
+        """
+        stride = self._stride
+        bits = bytearray(((stride * self._size[1]) >> 3) + 1)
+        coordinates = body.coordinates()
+        for i in range(0, len(coordinates), 2):
+            index = coordinates[i + 1] * stride + coordinates[i]
+            bits[index >> 3] |= 1 << (index & 7)
+        return int.from_bytes(bits, "little")
+
+    def _bit(self, position: Position) -> int:
+        """Get the bitboard with only one cell set.
+
+        Args:
+            position: Cell on the board.
+
+        Returns:
+            Bitboard of the cell.
+        """
+        return 1 << (position.y * self._stride + position.x)
+
+    def _prepare(self, width: int, height: int) -> None:
+        """Compute the board mask for a board size.
+
+        Args:
+            width: Board width in cells.
+            height: Board height in cells.
+        """
+        self._size = (width, height)
+        self._stride = width + 1
+        row = (1 << width) - 1
+        board = 0
+        for y in range(height):
+            board |= row << (y * self._stride)
+        self._board = board
@@ -0,0 +1,347 @@
+"""Mutable game simulation for bots that search many moves per tick."""
+
+import random
+from typing import Dict, List, Optional, Tuple
+
+from src.models.game_state import GameState
+from src.models.move_table import MOVES, move_table
+
+# Index of each move's reversal in MOVES
+REVERSE_MOVES: Tuple[int, ...] = tuple(MOVES.index(move.opposite) for move in MOVES)
+
+# Random cells tried for a food spawn before scanning the board
+SPAWN_ATTEMPTS = 32
+
+# Food cell of a board with no free cell left
+NO_FOOD = -1
+
+# Random 64-bit key of every cell, per board area
+_cell_keys: Dict[int, List[int]] = {}
+
+# What a step changed: previous direction, food, pending growth and
+# eaten count, whether the tail left and whether the head was placed
+_Change = Tuple[int, int, int, int, bool, bool]
+
+
+def cell_keys(area: int) -> List[int]:
+    """Get the Zobrist keys of the cells of a board.
+
+    Keys are drawn from a generator seeded with the area, so they are
+    the same in every process.
+
+    Args:
+        area: Number of cells on the board.
+
+    Returns:
+        A random 64-bit key per cell.
+    """
+    keys = _cell_keys.get(area)
+    if keys is None:
+        rng = random.Random(area)
+        keys = [rng.getrandbits(64) for _ in range(area)]
+        _cell_keys[area] = keys
+    return keys
+
+
+class Simulation:
+    """A snake game that moves in place and can take moves back.
+
+    Cells are indexed ``y * width + x`` and moves are indices into
+    ``MOVES``. The body is a list of cells from tail to head; a step
+    appends the head and moves the tail index forward, and ``undo``
+    reverses exactly that, so stepping and undoing allocate almost
+    nothing. Undone moves can be replayed with ``redo``, which puts the
+    food back where it spawned the first time.
+
+    Follows the rules of ``GameLoop.update``: reversals keep the current
+    direction, the tail leaves its cell before the head arrives, and
+    eating keeps the tail in place for one more move. Food spawns on a
+    free cell drawn from the simulation's own random generator, unless
+    respawning is off.
+
+    ``key`` is the XOR of the Zobrist keys of the occupied cells, kept
+    up to date by every step and undo, for transposition tables.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        cells: List[int],
+        direction: int,
+        food: int,
+        pending: int = 0,
+        rng: Optional[random.Random] = None,
+        respawn: bool = True,
+    ) -> None:
+        """Initialize a simulation.
+
+        Args:
+            width: Board width in cells.
+            height: Board height in cells.
+            cells: Snake cells from tail to head, each cell once.
+            direction: Index of the current move in ``MOVES``.
+            food: Food cell, or ``NO_FOOD``.
+            pending: Moves the tail stays in place (grown segments).
+            rng: Random generator for food spawns.
+            respawn: Spawn new food after eating (otherwise the board
+                is left with ``NO_FOOD``).
+        """
+        self.width = width
+        self.height = height
+        self.area = width * height
+        self.neighbours = move_table(width, height).neighbour_cells
+        self.cells = cells
+        self.start = 0
+        self.occupied = bytearray(self.area)
+        self.keys = cell_keys(self.area)
+        self.key = 0
+        for cell in cells:
+            self.occupied[cell] = 1
+            self.key ^= self.keys[cell]
+        self.direction = direction
+        self.food = food
+        self.pending = pending
+        self.eaten = 0
+        self.alive = True
+        self.rng = rng if rng is not None else random.Random()
+        self.respawn = respawn
+        self._history: List[_Change] = []
+        self._redo: List[Tuple[int, int]] = []
+
+    @classmethod
+    def from_state(
+        cls,
+        state: GameState,
+        rng: Optional[random.Random] = None,
+        respawn: bool = True,
+    ) -> "Simulation":
+        """Create a simulation of a game state.
+
+        A new snake on a small board may start with its tail outside
+        the board. Those segments leave first, so they are simulated as
+        pending growth: the tail on the board stays put until they are
+        gone.
+
+        Args:
+            state: Game state to simulate.
+            rng: Random generator for food spawns.
+            respawn: Spawn new food after eating.
+
+        Returns:
+            A new simulation at the state.
+        """
+        width, height = state.width, state.height
+        body = state.snake.body
+        coordinates = body.coordinates()
+        cells = []
+        outside = 0
+        for i in range(0, len(coordinates), 2):
+            x, y = coordinates[i], coordinates[i + 1]
+            if 0 <= x < width and 0 <= y < height:
+                cells.append(y * width + x)
+            else:
+                outside += 1
+        food = state.food.position
+        return cls(
+            width,
+            height,
+            cells,
+            MOVES.index(state.snake.direction),
+            food.y * width + food.x,
+            pending=body.padding + outside,
+            rng=rng,
+            respawn=respawn,
+        )
+
+    @property
+    def head(self) -> int:
+        """Get the head cell."""
+        return self.cells[-1]
+
+    @property
+    def length(self) -> int:
+        """Get the snake length, counting grown segments still to come."""
+        return len(self.cells) - self.start + self.pending
+
+    @property
+    def depth(self) -> int:
+        """Get the number of moves that can be undone."""
+        return len(self._history)
+
+    def clone(self, rng: Optional[random.Random] = None) -> "Simulation":
+        """Copy the current position without its undo history.
+
+        Args:
+            rng: Random generator for the copy's food spawns (shares
+                this one's if omitted).
+
+        Returns:
+            A new simulation at the same position.
+        """
+        copy = Simulation.__new__(Simulation)
+        copy.width = self.width
+        copy.height = self.height
+        copy.area = self.area
+        copy.neighbours = self.neighbours
+        copy.cells = self.cells[self.start :]
+        copy.start = 0
+        copy.occupied = bytearray(self.occupied)
+        copy.keys = self.keys
+        copy.key = self.key
+        copy.direction = self.direction
+        copy.food = self.food
+        copy.pending = self.pending
+        copy.eaten = self.eaten
+        copy.alive = self.alive
+        copy.rng = rng if rng is not None else self.rng
+        copy.respawn = self.respawn
+        copy._history = []
+        copy._redo = []
+        return copy
+
+    def safe_moves(self) -> List[int]:
+        """Get the moves that survive the next step.
+
+        Returns:
+            Indices into ``MOVES`` of the legal moves that hit neither a
+            wall nor the body.
+        """
+        if not self.alive:
+            return []
+        occupied = self.occupied
+        reverse = REVERSE_MOVES[self.direction]
+        # The tail leaves its cell first unless it has grown
+        tail = self.cells[self.start] if self.pending == 0 else -1
+        moves = []
+        for move, cell in enumerate(self.neighbours(self.cells[-1])):
+            if move == reverse or cell < 0:
+                continue
+            if occupied[cell] and cell != tail:
+                continue
+            moves.append(move)
+        return moves
+
+    def step(self, move: int) -> bool:
+        """Advance one tick.
+
+        Args:
+            move: Index into ``MOVES``; a reversal keeps the current
+                direction.
+
+        Returns:
+            True if the snake ate.
+
+        Raises:
+            ValueError: If the snake is already dead.
+        """
+        self._redo.clear()
+        return self._apply(move, None)
+
+    def undo(self) -> None:
+        """Take back the last step.
+
+        Raises:
+            IndexError: If there is no step to undo.
+        """
+        direction, food, pending, eaten, dropped, placed = self._history.pop()
+        cells = self.cells
+        occupied = self.occupied
+        self._redo.append((self.direction, self.food))
+        keys = self.keys
+        if placed:
+            cell = cells.pop()
+            occupied[cell] = 0
+            self.key ^= keys[cell]
+        if dropped:
+            self.start -= 1
+            cell = cells[self.start]
+            occupied[cell] = 1
+            self.key ^= keys[cell]
+        self.direction = direction
+        self.food = food
+        self.pending = pending
+        self.eaten = eaten
+        self.alive = True
+
+    def redo(self) -> bool:
+        """Replay the last undone step, with the same food spawn.
+
+        Returns:
+            True if the snake ate.
+
+        Raises:
+            IndexError: If there is no undone step.
+        """
+        move, food = self._redo.pop()
+        return self._apply(move, food)
+
+    def _apply(self, move: int, spawned: Optional[int]) -> bool:
+        """Advance one tick, recording how to take it back.
+
+        Args:
+            move: Index into ``MOVES``.
+            spawned: Food cell to use if the snake eats, instead of a
+                random one.
+
+        Returns:
+            True if the snake ate.
+
+        Raises:
+            ValueError: If the snake is already dead.
+        """
+        if not self.alive:
+            raise ValueError("Cannot step a dead snake")
+        if move == REVERSE_MOVES[self.direction]:
+            move = self.direction
+        cells = self.cells
+        occupied = self.occupied
+        target = self.neighbours(cells[-1])[move]
+        previous = (self.direction, self.food, self.pending, self.eaten)
+        self.direction = move
+
+        dropped = placed = False
+        if target >= 0:
+            if self.pending:
+                self.pending -= 1
+            else:
+                tail = cells[self.start]
+                occupied[tail] = 0
+                self.key ^= self.keys[tail]
+                self.start += 1
+                dropped = True
+            if not occupied[target]:
+                cells.append(target)
+                occupied[target] = 1
+                self.key ^= self.keys[target]
+                placed = True
+        self._history.append(previous + (dropped, placed))
+        if not placed:
+            self.alive = False
+            return False
+        if target != self.food:
+            return False
+
+        self.eaten += 1
+        self.pending += 1
+        if spawned is not None:
+            self.food = spawned
+        else:
+            self.food = self._spawn_food() if self.respawn else NO_FOOD
+        return True
+
+    def _spawn_food(self) -> int:
+        """Pick a free cell for the food.
+
+        Returns:
+            A free cell, or ``NO_FOOD`` if the board is full.
+        """
+        occupied = self.occupied
+        randrange = self.rng.randrange
+        area = self.area
+        for _ in range(SPAWN_ATTEMPTS):
+            cell = randrange(area)
+            if not occupied[cell]:
+                return cell
+        free = [cell for cell in range(area) if not occupied[cell]]
+        return self.rng.choice(free) if free else NO_FOOD
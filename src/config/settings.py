@@ -17,9 +17,57 @@ class Settings:
     # Window size (in pixels)
     WINDOW_SIZE: int = 600
 
+    # Allow resizing the window (the board is refitted to the new size)
+    RESIZABLE_WINDOW: bool = True
+
+    # Pixels per cell for drawing the board at low resolution and
+    # upscaling it to the window (0 = draw at full window resolution)
+    LOW_RES_CELL_SIZE: int = 0
+
+    # Pixels per cell for showing only the area around the snake head,
+    # with a minimap, on boards too large for the window (0 = off)
+    VIEWPORT_CELL_SIZE: int = 0
+
+    # Watch this many bot games tiled in one window instead of playing
+    # (0 = play normally)
+    SPECTATOR_GAMES: int = 0
+
+    # Play in the terminal with ANSI output instead of a window, e.g.
+    # over SSH on machines without a display
+    TERMINAL_MODE: bool = False
+
+    # Bot that plays instead of the keyboard: "bfs", "hamiltonian",
+    # "mcts" or "planner" ("" = off)
+    AUTOPILOT: str = ""
+
+    # Share of each tick (1 / FPS) that searching bots may think for,
+    # split evenly between the games in spectator mode
+    BOT_TIME_FRACTION: float = 0.5
+
     # Points per food eaten
     POINTS_PER_FOOD: int = 10
 
+    # Food items on the board at once
+    FOOD_COUNT: int = 1
+
+    # Skip redrawing unchanged frames and sleep while paused or game over
+    IDLE_MODE: bool = True
+
+    # Diagnostics: trace allocations per tick and print a report on exit
+    TRACE_MEMORY: bool = False
+
+    # Record every rendered frame as PNG images in CAPTURE_PATH
+    CAPTURE_FRAMES: bool = False
+    CAPTURE_PATH: str = "captures"
+
+    # Save every game played as a replay (seed and per-tick input) in
+    # REPLAY_PATH, for python -m src.replay_export
+    RECORD_REPLAYS: bool = False
+    REPLAY_PATH: str = "replays"
+
+    # Freeze startup objects and run garbage collection between frames
+    GC_TUNING: bool = False
+
 
 # Default settings instance
 DEFAULT_SETTINGS = Settings()
@@ -0,0 +1,314 @@
+"""Arena mode: many snakes moving at once on one board."""
+
+import random
+from array import array
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.models.direction import Direction
+from src.models.food import Food
+from src.models.move_table import MOVES, REVERSALS, move_table
+from src.models.position import Position
+from src.models.snake import Snake
+
+# Owner of a cell no snake is on
+EMPTY = -1
+
+# Random cells tried when placing a snake or food before giving up or
+# scanning the board
+SPAWN_ATTEMPTS = 64
+
+# Points per food eaten
+POINTS_PER_FOOD = 10
+
+
+class Crash(Enum):
+    """How a snake died."""
+
+    WALL = "WALL"
+    BODY = "BODY"
+    HEAD_ON = "HEAD_ON"
+
+
+@dataclass(frozen=True)
+class ArenaTick:
+    """What happened in one arena tick.
+
+    Attributes:
+        eaten: Snakes that ate this tick.
+        crashes: How each snake that died this tick crashed.
+    """
+
+    eaten: Tuple[int, ...]
+    crashes: Dict[int, Crash]
+
+
+class Arena:
+    """Any number of snakes sharing a board, moved simultaneously.
+
+    Snakes are numbered by their index in ``snakes``. Every cell records
+    which snake is on it, so a tick costs one grid lookup per snake
+    whatever the number and length of the snakes, instead of comparing
+    every head with every body. Neighbour cells come from the
+    ``move_table`` of the board size.
+
+    A tick follows the rules of ``GameLoop.update`` for all snakes at
+    once: every tail leaves its cell first (unless the snake has just
+    grown), then all heads move. A head that leaves the board, lands on
+    any body, or lands on the same cell as another head dies; snakes
+    that died are removed from the board at the end of the tick. A
+    surviving head on food eats it, and eaten food respawns on cells
+    free of every body and food.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        snakes: Sequence[Snake],
+        food_count: int = 1,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """Create an arena with snakes already placed.
+
+        Args:
+            width: Grid width (number of columns).
+            height: Grid height (number of rows).
+            snakes: Snakes on the board; they must not overlap.
+            food_count: Food items kept on the board.
+            rng: Random generator for food spawns.
+
+        Raises:
+            ValueError: If a snake is off the board or overlaps another.
+        """
+        self.width = width
+        self.height = height
+        self.rng = rng if rng is not None else random.Random()
+        self.snakes = list(snakes)
+        self.alive = [True] * len(self.snakes)
+        self.scores = [0] * len(self.snakes)
+        self.ticks = 0
+        self._table = move_table(width, height)
+        self._owners = array("i", [EMPTY]) * (width * height)
+        for index, snake in enumerate(self.snakes):
+            for position in snake.body:
+                if not position.is_in_bounds(width, height):
+                    raise ValueError(f"Snake {index} is off the board")
+                cell = self._cell(position)
+                if self._owners[cell] not in (EMPTY, index):
+                    raise ValueError(f"Snake {index} overlaps another snake")
+                self._owners[cell] = index
+        # Food by cell, so eating is a single lookup
+        self.food: Dict[int, Food] = {}
+        for _ in range(food_count):
+            self._spawn_food()
+
+    @classmethod
+    def create(
+        cls,
+        width: int,
+        height: int,
+        snake_count: int,
+        length: int = 3,
+        food_count: int = 1,
+        rng: Optional[random.Random] = None,
+    ) -> "Arena":
+        """Create an arena with straight snakes at random free places.
+
+        Args:
+            width: Grid width (number of columns).
+            height: Grid height (number of rows).
+            snake_count: Number of snakes.
+            length: Segments of every snake.
+            food_count: Food items kept on the board.
+            rng: Random generator for placing snakes and food.
+
+        Returns:
+            A new arena.
+
+        Raises:
+            ValueError: If a snake cannot be placed.
+        """
+        rng = rng if rng is not None else random.Random()
+        taken = set()
+        snakes = []
+        directions = Direction.all()
+        for index in range(snake_count):
+            for _ in range(SPAWN_ATTEMPTS):
+                direction = rng.choice(directions)
+                head = Position(x=rng.randrange(width), y=rng.randrange(height))
+                step = direction.opposite.delta
+                body = [head]
+                for _ in range(length - 1):
+                    body.append(body[-1] + step)
+                if all(
+                    position.is_in_bounds(width, height) and position not in taken
+                    for position in body
+                ):
+                    break
+            else:
+                raise ValueError(f"No room for snake {index}")
+            taken.update(body)
+            snakes.append(Snake(body=tuple(body), direction=direction))
+        return cls(width, height, snakes, food_count=food_count, rng=rng)
+
+    @property
+    def live_count(self) -> int:
+        """Get the number of snakes still alive."""
+        return sum(self.alive)
+
+    def owner(self, position: Position) -> int:
+        """Get the snake on a cell.
+
+        Args:
+            position: Cell on the board.
+
+        Returns:
+            Index of the snake, or ``EMPTY``.
+        """
+        return self._owners[self._cell(position)]
+
+    def safe_moves(self, index: int) -> List[Direction]:
+        """Get the moves of a snake that hit no wall or body next tick.
+
+        Other snakes' heads may still move into the same cell.
+
+        Args:
+            index: Snake to move.
+
+        Returns:
+            Safe directions, in ``Direction.all()`` order.
+        """
+        if not self.alive[index]:
+            return []
+        snake = self.snakes[index]
+        owners = self._owners
+        table = self._table
+        head = self._cell(snake.head)
+        reversal = REVERSALS[snake.direction]
+        moves = []
+        for direction, cell in zip(MOVES, table.neighbour_cells(head)):
+            if direction is reversal or cell < 0:
+                continue
+            owner = owners[cell]
+            if owner != EMPTY:
+                # Only a tail that leaves this tick frees its cell
+                body = self.snakes[owner].body
+                if body.padding or self._cell(body.tail) != cell:
+                    continue
+            moves.append(direction)
+        return moves
+
+    def step(self, moves: Sequence[Optional[Direction]]) -> ArenaTick:
+        """Advance every live snake by one tick.
+
+        Args:
+            moves: Direction for each snake, by index; None keeps the
+                current direction, reversals are ignored and moves of
+                dead snakes are ignored.
+
+        Returns:
+            Snakes that ate and snakes that crashed this tick.
+        """
+        owners = self._owners
+        live = [index for index, alive in enumerate(self.alive) if alive]
+
+        # Tails leave their cells before any head arrives
+        for index in live:
+            body = self.snakes[index].body
+            if body.padding == 0:
+                owners[self._cell(body.tail)] = EMPTY
+
+        # Turn and move every snake, claiming the target cells
+        claims: Dict[int, List[int]] = {}
+        crashes: Dict[int, Crash] = {}
+        for index in live:
+            snake = self.snakes[index]
+            move = moves[index] if index < len(moves) else None
+            if move is not None:
+                snake = snake.change_direction(move)
+            snake = snake.move()
+            self.snakes[index] = snake
+            if not snake.head.is_in_bounds(self.width, self.height):
+                crashes[index] = Crash.WALL
+                continue
+            claims.setdefault(self._cell(snake.head), []).append(index)
+
+        # Resolve head-on and head-to-body collisions through the grid
+        for cell, claimants in claims.items():
+            if len(claimants) > 1:
+                for index in claimants:
+                    crashes[index] = Crash.HEAD_ON
+            elif owners[cell] != EMPTY:
+                crashes[claimants[0]] = Crash.BODY
+            else:
+                owners[cell] = claimants[0]
+
+        for index in crashes:
+            self._remove(index)
+
+        # Surviving heads on food eat it
+        eaten = []
+        for index in live:
+            if index in crashes:
+                continue
+            snake = self.snakes[index]
+            if self.food.pop(self._cell(snake.head), None) is not None:
+                self.snakes[index] = snake.grow()
+                self.scores[index] += POINTS_PER_FOOD
+                eaten.append(index)
+        for _ in eaten:
+            self._spawn_food()
+
+        self.ticks += 1
+        return ArenaTick(eaten=tuple(eaten), crashes=crashes)
+
+    def _cell(self, position: Position) -> int:
+        """Get the grid index of a position on the board.
+
+        Args:
+            position: Cell on the board.
+
+        Returns:
+            ``y * width + x``.
+        """
+        return position.y * self.width + position.x
+
+    def _remove(self, index: int) -> None:
+        """Take a crashed snake off the board.
+
+        Args:
+            index: Snake that crashed.
+        """
+        self.alive[index] = False
+        owners = self._owners
+        width, height = self.width, self.height
+        for position in self.snakes[index].body:
+            if position.is_in_bounds(width, height):
+                cell = self._cell(position)
+                # Cells other snakes took over this tick stay theirs
+                if owners[cell] == index:
+                    owners[cell] = EMPTY
+
+    def _spawn_food(self) -> None:
+        """Place one food item on a cell free of every body and food."""
+        owners = self._owners
+        food = self.food
+        area = self.width * self.height
+        randrange = self.rng.randrange
+        for _ in range(SPAWN_ATTEMPTS):
+            cell = randrange(area)
+            if owners[cell] == EMPTY and cell not in food:
+                break
+        else:
+            free = [
+                cell
+                for cell in range(area)
+                if owners[cell] == EMPTY and cell not in food
+            ]
+            if not free:
+                return
+            cell = self.rng.choice(free)
+        y, x = divmod(cell, self.width)
+        food[cell] = Food(position=Position(x=x, y=y))
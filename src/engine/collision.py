@@ -2,6 +2,7 @@
 
 from src.models.snake import Snake
 from src.models.food import Food
+from src.models.food_index import FoodIndex
 
 
 class CollisionChecker:
@@ -51,6 +52,19 @@ class CollisionChecker:
         """
         return snake.head == food.position
 
+    def check_food_index_collision(self, snake: Snake, foods: FoodIndex) -> bool:
+        """Check if snake's head is on any of several food items.
+
+        Args:
+            snake: The snake to check.
+            foods: The food items to check, indexed by position.
+
+        Returns:
+            True if a food item is at the snake head position (a single
+            hash lookup, however many items there are).
+        """
+        return snake.head in foods
+
     def has_collision(self, snake: Snake, food: Food) -> bool:
         """Check if any game-ending collision exists.
 
@@ -1,28 +1,99 @@
 """Game loop for the Snake game."""
 
-import pygame
+import random
+import sys
+import time
+from src.engine.lazy_pygame import init_display, pygame
 from src.models.game_state import GameState, GameStatus
 from src.engine.collision import CollisionChecker
+from src.engine.gc_control import GCController
 from src.engine.input_handler import InputHandler, InputAction
+from src.engine.memory_tracer import MemoryTracer
 from src.models.direction import Direction
-from typing import Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.bots.base import Autopilot
+    from src.engine.replay import Replay
+    from src.renderer.frame_capture import FrameCapture
+    from src.renderer.renderer import Renderer
+
+# Longest time an idle loop blocks waiting for input (milliseconds)
+IDLE_WAIT_MS = 500
 
 
 class GameLoop:
     """Main game loop controller."""
 
-    def __init__(self, width: int = 20, height: int = 20, fps: int = 5) -> None:
+    def __init__(
+        self,
+        width: int = 20,
+        height: int = 20,
+        fps: int = 5,
+        memory_tracer: Optional[MemoryTracer] = None,
+        gc_controller: Optional[GCController] = None,
+        idle_mode: bool = False,
+        window_size: int = 600,
+        resizable: bool = False,
+        low_res_cell_size: int = 0,
+        viewport_cell_size: int = 0,
+        frame_capture: Optional["FrameCapture"] = None,
+        terminal: bool = False,
+        autopilot: Optional["Autopilot"] = None,
+        food_count: int = 1,
+        record_replays: bool = False,
+    ) -> None:
         """Initialize game loop.
 
         Args:
             width: Grid width (number of columns).
             height: Grid height (number of rows).
             fps: Target frames per second (game speed).
+            memory_tracer: If given, traces allocations of every update
+                and render while ``run`` is active.
+            gc_controller: If given, moves garbage collection into idle
+                time after each frame while ``run`` is active.
+            idle_mode: If True, ``run`` skips rendering unchanged states and
+                blocks on the event queue while paused or game over.
+            window_size: Initial window width and height in pixels.
+            resizable: If True, the window can be resized and the board
+                is refitted to the new size.
+            low_res_cell_size: If positive, draw the board at this many
+                pixels per cell and upscale it to the window, instead of
+                drawing every cell at full window resolution.
+            viewport_cell_size: If positive, draw only the cells around
+                the snake head at this many pixels per cell, with a
+                minimap of the whole board. Takes precedence over
+                ``low_res_cell_size``.
+            frame_capture: If given, every rendered frame is recorded
+                by it in the background while ``run`` is active.
+            terminal: If True, ``run`` plays in the terminal with ANSI
+                output and keyboard input from stdin instead of opening a
+                pygame window. Window and capture options are ignored.
+            autopilot: If given, a bot that picks the move before every
+                tick, as if its input actions came from the keyboard.
+            food_count: Food items on the board at once.
+            record_replays: If True, every game played is recorded in
+                ``replays`` as its random seed and per-tick input.
         """
         self.width = width
         self.height = height
         self.fps = fps
-        self.state = GameState.create_initial(width, height)
+        self.food_count = food_count
+        self.memory_tracer = memory_tracer
+        self.gc_controller = gc_controller
+        self.idle_mode = idle_mode
+        self.window_size = window_size
+        self.resizable = resizable
+        self.low_res_cell_size = low_res_cell_size
+        self.viewport_cell_size = viewport_cell_size
+        self.frame_capture = frame_capture
+        self.terminal = terminal
+        self.autopilot = autopilot
+        self.first_frame_seconds: Optional[float] = None
+        self.record_replays = record_replays
+        self.replays: List["Replay"] = []
+        self._start_game()
         self.collision_checker = CollisionChecker(width, height)
         self.input_handler = InputHandler()
         self.pending_direction: Optional[Direction] = None
@@ -36,7 +107,7 @@ class GameLoop:
         if action == InputAction.QUIT:
             self.state = self.state.game_over()
         elif action == InputAction.RESTART:
-            self.state = GameState.create_initial(self.width, self.height)
+            self._start_game()
             self.pending_direction = None
         elif action == InputAction.PAUSE:
             if self.state.status == GameStatus.PLAYING:
@@ -49,12 +120,36 @@ class GameLoop:
             if direction:
                 self.pending_direction = direction
 
+    def _start_game(self) -> None:
+        """Create the initial state, starting a new replay if recording."""
+        if self.record_replays:
+            # Imported here: the replay module plays games with GameLoop
+            from src.engine.replay import Replay
+
+            # Food placement follows the global generator, so a fresh
+            # seed is all a replay needs to reproduce it
+            seed = random.randrange(2**32)
+            random.seed(seed)
+            self.replays.append(
+                Replay(self.width, self.height, seed, food_count=self.food_count)
+            )
+        self.state = GameState.create_initial(self.width, self.height, self.food_count)
+
     def update(self) -> None:
         """Update game state by one tick."""
         # Don't update if paused or game over
         if not self.state.is_playing():
             return
 
+        # Let the autopilot steer
+        if self.autopilot is not None:
+            action = self.autopilot.next_action(self.state)
+            if action is not None:
+                self.handle_input(action)
+
+        if self.record_replays:
+            self.replays[-1].moves.append(self.pending_direction)
+
         # Apply pending direction change
         if self.pending_direction:
             self.state = self.state.change_direction(self.pending_direction)
@@ -64,74 +159,243 @@ class GameLoop:
         self.state = self.state.move_snake(grow=False)
 
         # Check if snake head is on food (after moving)
+        snake = self.state.snake
         eats_food = self.collision_checker.check_food_collision(
-            self.state.snake, self.state.food
+            snake, self.state.food
+        )
+        eats_extra_food = not eats_food and (
+            self.collision_checker.check_food_index_collision(
+                snake, self.state.extra_food
+            )
         )
 
-        if eats_food:
+        if eats_food or eats_extra_food:
             # Snake ate food - grow snake, increase score, and respawn food
             self.state = self.state.__class__(
-                snake=self.state.snake.grow(),
+                snake=snake.grow(),
                 food=self.state.food,
                 score=self.state.score + 10,
                 status=self.state.status,
                 width=self.state.width,
-                height=self.state.height
-            ).respawn_food()
+                height=self.state.height,
+                extra_food=self.state.extra_food,
+            )
+            if eats_food:
+                self.state = self.state.respawn_food()
+            else:
+                self.state = self.state.respawn_extra_food(snake.head)
 
         # Check for collisions (wall or self)
         if self.collision_checker.has_collision(self.state.snake, self.state.food):
             self.state = self.state.game_over()
 
+    def setup_display(self) -> "Renderer":
+        """Open the game window and create a renderer for it.
+
+        Only the display and font subsystems are started; audio and
+        joystick support are never initialized.
+
+        Returns:
+            A Renderer drawing to the game window.
+        """
+        init_display()
+
+        # Create window
+        flags = pygame.RESIZABLE if self.resizable else 0
+        screen = pygame.display.set_mode((self.window_size, self.window_size), flags)
+        pygame.display.set_caption("贪吃蛇 - Snake Game")
+
+        # Import renderer here to avoid pygame issues in tests
+        if self.viewport_cell_size > 0:
+            from src.renderer.viewport import ViewportRenderer
+
+            return ViewportRenderer(screen, self.viewport_cell_size)
+
+        if self.low_res_cell_size > 0:
+            from src.renderer.scaled import ScaledRenderer
+
+            return ScaledRenderer(screen, self.low_res_cell_size)
+
+        from src.renderer.renderer import Renderer
+
+        cell_size = self._fit_cell_size((self.window_size, self.window_size))
+        return Renderer(screen, cell_size)
+
+    def _fit_cell_size(self, size: Tuple[int, int]) -> int:
+        """Get the largest cell size that fits the board in a window.
+
+        Args:
+            size: Window size in pixels.
+
+        Returns:
+            Cell size in pixels (at least 1).
+        """
+        return max(1, min(size) // max(self.width, self.height))
+
+    def _resize(self, renderer: "Renderer") -> None:
+        """Point the renderer at the resized window and refit the board.
+
+        Args:
+            renderer: Renderer drawing to the window.
+        """
+        renderer.screen = pygame.display.get_surface()
+        if self.viewport_cell_size <= 0 and self.low_res_cell_size <= 0:
+            renderer.cell_size = self._fit_cell_size(renderer.screen.get_size())
+
     def run(self) -> None:
         """Run the main game loop (blocking).
 
         This method initializes pygame and runs the game loop
         until the game is over or user quits.
         """
-        # Initialize pygame
-        pygame.init()
+        if self.terminal:
+            self._run_terminal()
+            return
+
+        start = time.perf_counter()
+        renderer = self.setup_display()
         clock = pygame.time.Clock()
 
-        # Calculate cell size based on screen size
-        SCREEN_SIZE = 600
-        cell_size = SCREEN_SIZE // max(self.width, self.height)
+        try:
+            if self.memory_tracer is not None:
+                self.memory_tracer.attach(self, renderer)
 
-        # Create window
-        screen = pygame.display.set_mode((SCREEN_SIZE, SCREEN_SIZE))
-        pygame.display.set_caption("贪吃蛇 - Snake Game")
+            if self.frame_capture is not None:
+                renderer.capture = self.frame_capture
+                self.frame_capture.start()
 
-        # Import renderer here to avoid pygame issues in tests
-        from src.renderer.renderer import Renderer
+            # Startup is done: freeze long-lived objects and tune thresholds
+            if self.gc_controller is not None:
+                self.gc_controller.start()
+
+            # Game loop
+            running = True
+            rendered_state: Optional[GameState] = None
+            while running:
+                # Nothing changes while paused or over until input arrives
+                idle = (
+                    self.idle_mode
+                    and not self.state.is_playing()
+                    and self.state is rendered_state
+                )
 
-        renderer = Renderer(screen, cell_size)
-
-        # Game loop
-        running = True
-        while running:
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.KEYDOWN:
-                    action = self.input_handler.handle_key(event.key)
-                    if action == InputAction.QUIT:
+                # Handle events
+                for event in self._poll_events(idle):
+                    if event.type == pygame.QUIT:
                         running = False
+                    elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                        # Window contents were lost - draw the frame again
+                        rendered_state = None
+                    elif event.type == pygame.VIDEORESIZE:
+                        self._resize(renderer)
+                        rendered_state = None
+                    elif event.type == pygame.KEYDOWN:
+                        action = self.input_handler.handle_key(event.key)
+                        if action == InputAction.QUIT:
+                            running = False
+                        else:
+                            self.handle_input(action)
+
+                # Update game state
+                self.update()
+
+                # Render (states are immutable, so identity means unchanged)
+                if not self.idle_mode or self.state is not rendered_state:
+                    renderer.render(self.state)
+                    rendered_state = self.state
+                    if self.first_frame_seconds is None:
+                        self.first_frame_seconds = time.perf_counter() - start
+
+                # Cap framerate
+                clock.tick(self.fps)
+
+                # Collect garbage in the idle time before the next frame
+                if self.gc_controller is not None:
+                    self.gc_controller.collect_idle()
+
+                # Check if game over and user wants to quit
+                if self.state.is_over() and not self.idle_mode:
+                    # Brief pause before potentially closing
+                    pygame.time.delay(1000)
+        finally:
+            if self.gc_controller is not None:
+                self.gc_controller.stop()
+            if self.memory_tracer is not None:
+                self.memory_tracer.detach()
+            try:
+                if self.frame_capture is not None:
+                    # Finish writing queued frames before shutting pygame down
+                    self.frame_capture.stop()
+            finally:
+                pygame.quit()
+
+    def _run_terminal(self) -> None:
+        """Run the game loop in the terminal until the user quits."""
+        from src.engine.terminal_input import TerminalInput
+        from src.renderer.terminal import TerminalRenderer
+
+        renderer = TerminalRenderer(sys.stdout)
+        if self.memory_tracer is not None:
+            self.memory_tracer.attach(self, renderer)
+        if self.gc_controller is not None:
+            self.gc_controller.start()
+
+        start = time.perf_counter()
+        interval = 1.0 / self.fps
+        next_frame = start
+        rendered_state: Optional[GameState] = None
+        try:
+            with TerminalInput(sys.stdin) as keys:
+                running = True
+                while running:
+                    # Wait for the next tick, waking up early for input
+                    if self.state.is_playing():
+                        timeout = next_frame - time.perf_counter()
                     else:
-                        self.handle_input(action)
+                        timeout = IDLE_WAIT_MS / 1000
+                    for action in keys.read_actions(timeout):
+                        if action == InputAction.QUIT:
+                            running = False
+                        else:
+                            self.handle_input(action)
+                    if not running:
+                        break
+                    if time.perf_counter() < next_frame:
+                        continue
+                    next_frame = max(next_frame + interval, time.perf_counter())
+
+                    self.update()
 
-            # Update game state
-            self.update()
+                    # States are immutable, so identity means unchanged
+                    if self.state is not rendered_state:
+                        renderer.render(self.state)
+                        rendered_state = self.state
+                        if self.first_frame_seconds is None:
+                            self.first_frame_seconds = time.perf_counter() - start
 
-            # Render
-            renderer.render(self.state)
+                    if self.gc_controller is not None:
+                        self.gc_controller.collect_idle()
+        finally:
+            renderer.close()
+            if self.gc_controller is not None:
+                self.gc_controller.stop()
+            if self.memory_tracer is not None:
+                self.memory_tracer.detach()
 
-            # Cap framerate
-            clock.tick(self.fps)
+    def _poll_events(self, idle: bool) -> List[Any]:
+        """Collect pending events, blocking briefly when idle.
 
-            # Check if game over and user wants to quit
-            if self.state.is_over():
-                # Brief pause before potentially closing
-                pygame.time.delay(1000)
+        Args:
+            idle: If True, wait up to IDLE_WAIT_MS for the next event
+                instead of returning immediately.
+
+        Returns:
+            Events to handle this iteration.
+        """
+        if not idle:
+            return pygame.event.get()
 
-        pygame.quit()
+        event = pygame.event.wait(IDLE_WAIT_MS)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
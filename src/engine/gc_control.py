@@ -0,0 +1,181 @@
+"""Garbage collection pause control for the game loop."""
+
+import gc
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class GCPause:
+    """One garbage collection run.
+
+    Attributes:
+        generation: Generation that was collected.
+        duration: Pause length in seconds.
+        collected: Number of unreachable objects found.
+        idle: True if the collection was run explicitly in idle time.
+    """
+
+    generation: int
+    duration: float
+    collected: int
+    idle: bool
+
+
+@dataclass(frozen=True)
+class GCStats:
+    """Summary of recorded garbage collection pauses.
+
+    Attributes:
+        count: Number of collections recorded.
+        idle_count: Collections run explicitly in idle time.
+        total: Total pause time in seconds.
+        max_in_frame: Longest pause outside idle time, in seconds.
+        max_idle: Longest idle-time pause, in seconds.
+    """
+
+    count: int
+    idle_count: int
+    total: float
+    max_in_frame: float
+    max_idle: float
+
+    def format(self) -> str:
+        """Format the summary as human-readable text.
+
+        Returns:
+            One-line summary.
+        """
+        return (
+            f"GC: {self.count} collections ({self.idle_count} idle), "
+            f"total {self.total * 1000:.2f} ms, "
+            f"max in-frame {self.max_in_frame * 1000:.2f} ms, "
+            f"max idle {self.max_idle * 1000:.2f} ms"
+        )
+
+
+class GCController:
+    """Moves cyclic garbage collection out of frames into idle time.
+
+    After startup, long-lived objects are frozen into the permanent
+    generation so collections never rescan them, and the automatic
+    collection thresholds are raised so collections rarely fire while a
+    frame is being built. The loop then calls ``collect_idle`` after
+    ``clock.tick``, which collects whichever generations are due under
+    the idle thresholds. Every collection is timed through
+    ``gc.callbacks``.
+    """
+
+    def __init__(
+        self,
+        thresholds: Tuple[int, int, int] = (50_000, 50, 100),
+        idle_thresholds: Tuple[int, int, int] = (700, 10, 10),
+        freeze: bool = True,
+        history: int = 1000,
+    ) -> None:
+        """Initialize GC controller.
+
+        Args:
+            thresholds: Automatic collection thresholds while active.
+            idle_thresholds: Allocation counts at which ``collect_idle``
+                collects generations 0, 1 and 2.
+            freeze: If True, freeze objects that exist at ``start``.
+            history: Number of recorded pauses kept.
+        """
+        self.thresholds = thresholds
+        self.idle_thresholds = idle_thresholds
+        self.freeze = freeze
+        self.pauses: Deque[GCPause] = deque(maxlen=history)
+        self._saved_thresholds: Optional[Tuple[int, int, int]] = None
+        self._started_at: Optional[float] = None
+        self._in_idle = False
+
+    @property
+    def active(self) -> bool:
+        """Check if the controller is currently applied."""
+        return self._saved_thresholds is not None
+
+    def start(self) -> None:
+        """Freeze startup objects, raise thresholds and start timing."""
+        if self.active:
+            return
+        self._saved_thresholds = gc.get_threshold()
+        if self.freeze:
+            # Collect startup garbage first so it is not frozen forever
+            gc.collect()
+            gc.freeze()
+        gc.set_threshold(*self.thresholds)
+        gc.callbacks.append(self._on_gc)
+
+    def stop(self) -> None:
+        """Restore thresholds, unfreeze objects and stop timing."""
+        if self._saved_thresholds is None:
+            return
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        gc.set_threshold(*self._saved_thresholds)
+        if self.freeze:
+            gc.unfreeze()
+        self._saved_thresholds = None
+
+    def collect_idle(self) -> int:
+        """Collect the generations that are due, during idle time.
+
+        Returns:
+            The generation collected, or -1 if nothing was due.
+        """
+        if not self.active:
+            return -1
+
+        counts = gc.get_count()
+        generation = -1
+        for index, threshold in enumerate(self.idle_thresholds):
+            if counts[index] >= threshold:
+                generation = index
+        if generation < 0:
+            return -1
+
+        self._in_idle = True
+        try:
+            gc.collect(generation)
+        finally:
+            self._in_idle = False
+        return generation
+
+    def _on_gc(self, phase: str, info: Dict[str, Any]) -> None:
+        """Time collections reported by ``gc.callbacks``.
+
+        Args:
+            phase: "start" or "stop".
+            info: Collection details from the garbage collector.
+        """
+        if phase == "start":
+            self._started_at = time.perf_counter()
+        elif self._started_at is not None:
+            self.pauses.append(
+                GCPause(
+                    generation=info.get("generation", 0),
+                    duration=time.perf_counter() - self._started_at,
+                    collected=info.get("collected", 0),
+                    idle=self._in_idle,
+                )
+            )
+            self._started_at = None
+
+    def stats(self) -> GCStats:
+        """Summarize the recorded pauses.
+
+        Returns:
+            Pause statistics.
+        """
+        idle = [pause.duration for pause in self.pauses if pause.idle]
+        in_frame = [pause.duration for pause in self.pauses if not pause.idle]
+        return GCStats(
+            count=len(self.pauses),
+            idle_count=len(idle),
+            total=sum(idle) + sum(in_frame),
+            max_in_frame=max(in_frame, default=0.0),
+            max_idle=max(idle, default=0.0),
+        )
@@ -1,8 +1,8 @@
 """Input handler for the Snake game."""
 
 from enum import Enum
-from typing import Optional
-import pygame
+from typing import Dict, Optional
+from src.engine.lazy_pygame import pygame
 from src.models.direction import Direction
 
 
@@ -37,12 +37,17 @@ class InputAction(Enum):
         return mapping.get(action)
 
 
-class InputHandler:
-    """Maps keyboard input to game actions."""
+def build_key_map() -> Dict[int, InputAction]:
+    """Build the key to action mapping.
 
-    # Key to action mapping
+    Key codes come from pygame, so the map is built on first use instead
+    of at import time.
+
+    Returns:
+        Mapping of pygame key code to input action.
+    """
     # Note: Use lowercase for letter keys as Pygame provides them that way
-    KEY_MAP = {
+    return {
         # Arrow keys
         pygame.K_UP: InputAction.MOVE_UP,
         pygame.K_DOWN: InputAction.MOVE_DOWN,
@@ -60,6 +65,33 @@ class InputHandler:
         pygame.K_ESCAPE: InputAction.QUIT,
     }
 
+
+class _LazyKeyMap:
+    """Class attribute holding the key map, built on first access."""
+
+    def __init__(self) -> None:
+        """Initialize without touching pygame."""
+        self._key_map: Optional[Dict[int, InputAction]] = None
+
+    def __get__(self, instance: object, owner: type) -> Dict[int, InputAction]:
+        """Get the key map, building it on first access.
+
+        Returns:
+            The same mapping of pygame key code to input action on
+            every access, so changes to it are kept.
+        """
+        if self._key_map is None:
+            self._key_map = build_key_map()
+        return self._key_map
+
+
+class InputHandler:
+    """Maps keyboard input to game actions."""
+
+    # Mapping of pygame key code to input action, filled on first access
+    # so that importing this module does not load pygame
+    KEY_MAP: Dict[int, InputAction] = _LazyKeyMap()  # type: ignore[assignment]
+
     def handle_key(self, key: int) -> Optional[InputAction]:
         """Handle a key press and return corresponding action.
 
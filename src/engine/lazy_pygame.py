@@ -0,0 +1,67 @@
+"""Deferred pygame import for the engine package.
+
+Importing pygame loads SDL and takes a noticeable share of startup time,
+so engine modules use the ``pygame`` proxy below. The real module is
+imported on first attribute access, and only when something actually
+needs a window, fonts, events or key codes.
+"""
+
+import importlib
+import os
+from types import ModuleType
+from typing import Any, Optional
+
+
+class LazyModule:
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize the proxy without importing anything.
+
+        Args:
+            name: Fully qualified module name.
+        """
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def load(self) -> ModuleType:
+        """Import the module if needed and return it.
+
+        Returns:
+            The real module.
+        """
+        module: Optional[ModuleType] = self.__dict__["_module"]
+        if module is None:
+            module = importlib.import_module(self.__dict__["_name"])
+            self.__dict__["_module"] = module
+        return module
+
+    @property
+    def loaded(self) -> bool:
+        """Check if the real module has been imported."""
+        return self.__dict__["_module"] is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        """Forward attribute access to the real module."""
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        """Describe the proxy and whether it is loaded."""
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy module {self.__dict__['_name']!r} ({state})>"
+
+
+pygame: Any = LazyModule("pygame")
+
+
+def init_display() -> None:
+    """Initialize only the pygame subsystems the game uses.
+
+    ``pygame.init()`` also starts audio, joystick and other subsystems,
+    which costs startup time and is not needed to draw the board.
+    Also hides the pygame banner, which is noise for batch workers, if
+    pygame is not imported yet.
+    """
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    pygame.display.init()
+    pygame.font.init()
@@ -0,0 +1,280 @@
+"""Allocation and memory tracing for game ticks."""
+
+import gc
+import tracemalloc
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+# Model types whose live instances are counted in reports
+MODEL_TYPES = ("Position", "Snake", "SnakeBody", "GameState", "Food")
+
+
+@dataclass(frozen=True)
+class LineAllocation:
+    """Net allocations attributed to one source line.
+
+    Attributes:
+        location: Source location as ``file:line``.
+        size: Net bytes allocated (negative if freed).
+        count: Net number of memory blocks allocated.
+    """
+
+    location: str
+    size: int
+    count: int
+
+
+@dataclass(frozen=True)
+class TickAllocations:
+    """Allocations made by one traced call.
+
+    Attributes:
+        phase: Name of the traced call ("update" or "render").
+        tick: Tick number the call belongs to.
+        size: Net bytes allocated during the call.
+        count: Net number of memory blocks allocated during the call.
+        lines: Largest per-line allocations, biggest first.
+    """
+
+    phase: str
+    tick: int
+    size: int
+    count: int
+    lines: Tuple[LineAllocation, ...]
+
+
+@dataclass(frozen=True)
+class MemoryReport:
+    """Summary of a tracing session.
+
+    Attributes:
+        ticks: Recorded per-call allocations (most recent last).
+        current: Currently traced memory in bytes.
+        peak: Peak traced memory in bytes.
+        object_counts: Live instances per model type name.
+    """
+
+    ticks: Tuple[TickAllocations, ...]
+    current: int
+    peak: int
+    object_counts: Dict[str, int] = field(default_factory=dict)
+
+    def top_lines(self, limit: int = 10) -> List[LineAllocation]:
+        """Aggregate allocations per line over all recorded ticks.
+
+        Args:
+            limit: Maximum number of lines to return.
+
+        Returns:
+            Lines sorted by total net bytes, biggest first.
+        """
+        sizes: Counter = Counter()
+        counts: Counter = Counter()
+        for tick in self.ticks:
+            for line in tick.lines:
+                sizes[line.location] += line.size
+                counts[line.location] += line.count
+        return [
+            LineAllocation(location=location, size=size, count=counts[location])
+            for location, size in sizes.most_common(limit)
+        ]
+
+    def format(self, limit: int = 10) -> str:
+        """Format the report as human-readable text.
+
+        Args:
+            limit: Maximum number of source lines to list.
+
+        Returns:
+            Multi-line report text.
+        """
+        lines = [
+            f"Traced memory: current {self.current / 1024:.1f} KiB, "
+            f"peak {self.peak / 1024:.1f} KiB",
+        ]
+        for phase in sorted({tick.phase for tick in self.ticks}):
+            calls = [tick for tick in self.ticks if tick.phase == phase]
+            average = sum(tick.size for tick in calls) / len(calls)
+            blocks = sum(tick.count for tick in calls) / len(calls)
+            lines.append(
+                f"{phase}: {len(calls)} calls, "
+                f"{average:+.0f} B/{blocks:+.1f} blocks per call"
+            )
+        if self.object_counts:
+            counts = ", ".join(
+                f"{name}={count}" for name, count in self.object_counts.items()
+            )
+            lines.append(f"Live objects: {counts}")
+        lines.append("Top allocating lines:")
+        for line in self.top_lines(limit):
+            lines.append(f"  {line.location}: {line.size:+d} B, {line.count:+d} blocks")
+        return "\n".join(lines)
+
+
+def count_model_objects(type_names: Tuple[str, ...] = MODEL_TYPES) -> Dict[str, int]:
+    """Count live garbage-collector-tracked instances of model types.
+
+    Args:
+        type_names: Class names to count.
+
+    Returns:
+        Mapping of class name to live instance count.
+    """
+    counts = dict.fromkeys(type_names, 0)
+    for obj in gc.get_objects():
+        name = type(obj).__name__
+        if name in counts:
+            counts[name] += 1
+    return counts
+
+
+class MemoryTracer:
+    """Wraps game calls with tracemalloc snapshots.
+
+    Each traced call takes a snapshot before and after, and records the
+    net allocations grouped by source line. Only the most recent calls
+    are kept so the tracer itself does not grow memory in long sessions.
+    """
+
+    def __init__(
+        self, top_lines: int = 10, history: int = 600, frames: int = 1
+    ) -> None:
+        """Initialize memory tracer.
+
+        Args:
+            top_lines: Number of source lines kept per traced call.
+            history: Number of traced calls kept for the report.
+            frames: Stack frames stored per allocation by tracemalloc.
+        """
+        self.top_lines = top_lines
+        self.frames = frames
+        self.ticks: Deque[TickAllocations] = deque(maxlen=history)
+        self.tick = 0
+        self._started_tracing = False
+        self._last_memory = (0, 0)
+        self._attached: List[Tuple[Any, str]] = []
+        self._filters = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        )
+
+    def start(self) -> None:
+        """Start tracing allocations (no-op if already tracing)."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        tracemalloc.reset_peak()
+
+    def stop(self) -> None:
+        """Stop tracing if this tracer started it."""
+        if self._started_tracing:
+            self._last_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def trace(self, phase: str) -> Iterator[None]:
+        """Record allocations made inside the block.
+
+        Args:
+            phase: Name recorded for the traced call.
+        """
+        if not tracemalloc.is_tracing():
+            yield
+            return
+
+        before = tracemalloc.take_snapshot().filter_traces(self._filters)
+        try:
+            yield
+        finally:
+            after = tracemalloc.take_snapshot().filter_traces(self._filters)
+            stats = after.compare_to(before, "lineno")
+            lines = tuple(
+                LineAllocation(
+                    location=f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    size=stat.size_diff,
+                    count=stat.count_diff,
+                )
+                for stat in stats[: self.top_lines]
+                if stat.size_diff or stat.count_diff
+            )
+            self.ticks.append(
+                TickAllocations(
+                    phase=phase,
+                    tick=self.tick,
+                    size=sum(stat.size_diff for stat in stats),
+                    count=sum(stat.count_diff for stat in stats),
+                    lines=lines,
+                )
+            )
+
+    def wrap(self, phase: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a callable so every call is traced.
+
+        Args:
+            phase: Name recorded for each call.
+            func: Callable to wrap.
+
+        Returns:
+            The wrapped callable.
+        """
+
+        @wraps(func)
+        def traced(*args: Any, **kwargs: Any) -> Any:
+            with self.trace(phase):
+                return func(*args, **kwargs)
+
+        return traced
+
+    def attach(self, loop: Any, renderer: Optional[Any] = None) -> None:
+        """Start tracing ``loop.update`` and ``renderer.render`` calls.
+
+        Args:
+            loop: Game loop whose updates are traced (each is one tick).
+            renderer: Optional renderer whose renders are traced.
+        """
+        update = loop.update
+
+        def traced_update() -> None:
+            self.tick += 1
+            with self.trace("update"):
+                update()
+
+        loop.update = wraps(update)(traced_update)
+        self._attached.append((loop, "update"))
+        if renderer is not None:
+            renderer.render = self.wrap("render", renderer.render)
+            self._attached.append((renderer, "render"))
+        self.start()
+
+    def detach(self) -> None:
+        """Restore wrapped methods and stop tracing."""
+        for obj, name in self._attached:
+            # Wrappers live on the instance; removing them exposes the class method
+            obj.__dict__.pop(name, None)
+        self._attached.clear()
+        self.stop()
+
+    def report(self, count_objects: bool = True) -> MemoryReport:
+        """Build a report of the traced calls so far.
+
+        Args:
+            count_objects: If True, count live model objects (walks the heap).
+
+        Returns:
+            The memory report.
+        """
+        current, peak = (
+            tracemalloc.get_traced_memory()
+            if tracemalloc.is_tracing()
+            else self._last_memory
+        )
+        return MemoryReport(
+            ticks=tuple(self.ticks),
+            current=current,
+            peak=peak,
+            object_counts=count_model_objects() if count_objects else {},
+        )
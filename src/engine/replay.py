@@ -0,0 +1,126 @@
+"""Recorded games that can be played back tick by tick."""
+
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Union
+
+from src.engine.game_loop import GameLoop
+from src.models.direction import Direction
+from src.models.game_state import GameState
+
+
+@dataclass
+class Replay:
+    """A game recorded as its random seed and the input of every tick.
+
+    Food is placed with the ``random`` module, so seeding it the same
+    way and applying the same direction changes reproduces the game
+    exactly. A file is a few bytes per tick whatever the board size.
+
+    Attributes:
+        width: Grid width (number of columns).
+        height: Grid height (number of rows).
+        seed: Seed for ``random`` when the game started.
+        moves: Direction change applied before each tick, or None if the
+            snake kept going.
+        food_count: Food items on the board at once.
+    """
+
+    width: int
+    height: int
+    seed: int
+    moves: List[Optional[Direction]] = field(default_factory=list)
+    food_count: int = 1
+
+    def states(self) -> Iterator[GameState]:
+        """Play the game back.
+
+        Reseeds the global ``random`` generator.
+
+        Yields:
+            The initial state, then the state after each tick, stopping
+            at game over.
+        """
+        random.seed(self.seed)
+        loop = GameLoop(
+            width=self.width, height=self.height, food_count=self.food_count
+        )
+        yield loop.state
+        for move in self.moves:
+            if not loop.state.is_playing():
+                return
+            loop.pending_direction = move
+            loop.update()
+            yield loop.state
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the replay as JSON.
+
+        Args:
+            path: File to write.
+        """
+        data = {
+            "width": self.width,
+            "height": self.height,
+            "seed": self.seed,
+            "moves": [move.name if move else None for move in self.moves],
+            "food_count": self.food_count,
+        }
+        with open(path, "w") as file:
+            json.dump(data, file)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Replay":
+        """Read a replay written by ``save``.
+
+        Args:
+            path: File to read.
+
+        Returns:
+            The recorded game.
+
+        Raises:
+            ValueError: If the file is not a valid replay.
+        """
+        with open(path) as file:
+            data = json.load(file)
+        try:
+            return cls(
+                width=data["width"],
+                height=data["height"],
+                seed=data["seed"],
+                moves=[Direction[move] if move else None for move in data["moves"]],
+                food_count=data.get("food_count", 1),
+            )
+        except (KeyError, TypeError) as error:
+            raise ValueError(f"Invalid replay file {path}: {error}") from error
+
+
+def save_replays(replays: Sequence[Replay], directory: Union[str, Path]) -> List[Path]:
+    """Write recorded games to a directory, one JSON file each.
+
+    Files are named after the time of saving and the game's number, so
+    later sessions add to the directory. Games without a single tick are
+    skipped.
+
+    Args:
+        replays: Recorded games.
+        directory: Directory to write to; created if needed.
+
+    Returns:
+        The files written.
+    """
+    directory = Path(directory)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    paths = []
+    for number, replay in enumerate(replays, start=1):
+        if not replay.moves:
+            continue
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"game-{stamp}-{number:03d}.json"
+        replay.save(path)
+        paths.append(path)
+    return paths
@@ -0,0 +1,197 @@
+"""Spectator loop that runs many bot games in one window."""
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence
+
+from src.engine.game_loop import GameLoop
+from src.engine.input_handler import InputAction
+from src.engine.lazy_pygame import init_display, pygame
+from src.models.direction import Direction
+from src.models.game_state import GameState
+
+if TYPE_CHECKING:
+    from src.renderer.spectator import TiledView
+
+# Chooses the next direction for a game, or None to keep going
+Policy = Callable[[GameState], Optional[Direction]]
+
+# Most ticks a game may catch up in one frame before its backlog is
+# dropped, so a slow frame never snowballs into a slower one
+MAX_CATCH_UP_TICKS = 4
+
+
+def chase_food(state: GameState) -> Optional[Direction]:
+    """Steer straight towards the food, avoiding immediate collisions.
+
+    Args:
+        state: Current game state.
+
+    Returns:
+        Direction to turn to, or None to keep the current direction.
+    """
+    snake = state.snake
+    head = snake.head
+    food = state.food.position
+    preferred = []
+    if food.x != head.x:
+        preferred.append(Direction.RIGHT if food.x > head.x else Direction.LEFT)
+    if food.y != head.y:
+        preferred.append(Direction.DOWN if food.y > head.y else Direction.UP)
+    candidates = preferred + [snake.direction] + Direction.all()
+
+    safe = state.safe_moves()
+    for direction in candidates:
+        if direction in safe:
+            return direction
+    return None
+
+
+@dataclass
+class SimulatedGame:
+    """A game advanced on its own clock.
+
+    Attributes:
+        loop: Game being simulated.
+        interval: Seconds between ticks.
+        policy: Bot choosing each move of this game.
+        next_tick: Clock time of the next tick.
+    """
+
+    loop: GameLoop
+    interval: float
+    policy: Policy = chase_food
+    next_tick: float = 0.0
+
+    def advance(self, now: float) -> int:
+        """Run the ticks that are due, restarting after game over.
+
+        Args:
+            now: Current clock time in seconds.
+
+        Returns:
+            Number of ticks run.
+        """
+        ticks = 0
+        while self.next_tick <= now:
+            if ticks == MAX_CATCH_UP_TICKS:
+                self.next_tick = now + self.interval
+                break
+            loop = self.loop
+            if loop.state.is_over():
+                loop.handle_input(InputAction.RESTART)
+            else:
+                loop.pending_direction = self.policy(loop.state)
+                loop.update()
+            self.next_tick += self.interval
+            ticks += 1
+        return ticks
+
+
+class SpectatorLoop:
+    """Runs many bot games side by side and shows them tiled.
+
+    Each game ticks at its own rate, independent of the display frame
+    rate. Every frame advances the games that are due and redraws only
+    their tiles.
+    """
+
+    def __init__(
+        self,
+        tick_rates: Sequence[float],
+        width: int = 20,
+        height: int = 20,
+        fps: int = 30,
+        window_size: int = 600,
+        policy: Policy = chase_food,
+        policies: Optional[Sequence[Policy]] = None,
+    ) -> None:
+        """Initialize spectator loop.
+
+        Args:
+            tick_rates: Ticks per second of every game; one game is
+                created per entry.
+            width: Grid width of every game.
+            height: Grid height of every game.
+            fps: Display frame rate.
+            window_size: Window width and height in pixels.
+            policy: Bot playing every game; must be stateless, since the
+                games take turns calling it.
+            policies: Bot of each game in tile order, instead of sharing
+                ``policy``; stateful autopilots need one per game.
+
+        Raises:
+            ValueError: If ``policies`` does not have one bot per game.
+        """
+        if policies is None:
+            policies = [policy] * len(tick_rates)
+        elif len(policies) != len(tick_rates):
+            raise ValueError(
+                f"Expected {len(tick_rates)} policies, got {len(policies)}"
+            )
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.window_size = window_size
+        self.games: List[SimulatedGame] = [
+            SimulatedGame(GameLoop(width=width, height=height), 1.0 / rate, bot)
+            for rate, bot in zip(tick_rates, policies)
+        ]
+
+    def states(self) -> List[GameState]:
+        """Get the current state of every game.
+
+        Returns:
+            States in tile order.
+        """
+        return [game.loop.state for game in self.games]
+
+    def step(self, now: float) -> int:
+        """Advance every game to a point in time.
+
+        Args:
+            now: Current clock time in seconds.
+
+        Returns:
+            Total number of ticks run.
+        """
+        return sum(game.advance(now) for game in self.games)
+
+    def setup_display(self) -> "TiledView":
+        """Open the window and create the tiled view for it.
+
+        Returns:
+            A TiledView drawing to the window.
+        """
+        init_display()
+        screen = pygame.display.set_mode((self.window_size, self.window_size))
+        pygame.display.set_caption("贪吃蛇 - Spectator")
+
+        from src.renderer.spectator import TiledView
+
+        return TiledView(screen, len(self.games), self.width, self.height)
+
+    def run(self) -> None:
+        """Run the spectator loop until the window is closed (blocking)."""
+        view = self.setup_display()
+        clock = pygame.time.Clock()
+
+        start = time.perf_counter()
+        for game in self.games:
+            game.next_tick = start
+
+        running = True
+        while running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    view.invalidate()
+
+            self.step(time.perf_counter())
+            view.render(self.states())
+            clock.tick(self.fps)
+
+        pygame.quit()
@@ -0,0 +1,127 @@
+"""Startup time measurement for the Snake game.
+
+Each measurement runs in a fresh interpreter so module caches from the
+current process do not hide import costs.
+
+Usage:
+    python -m src.engine.startup_profile
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+# Directory containing the ``src`` package
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+ENGINE_MODULES = (
+    "src.engine.game_loop",
+    "src.engine.input_handler",
+    "src.engine.collision",
+    "src.models.game_state",
+)
+
+_IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+print(json.dumps({{
+    "seconds": time.perf_counter() - start,
+    "pygame_loaded": "pygame" in sys.modules,
+}}))
+"""
+
+_FIRST_FRAME_SCRIPT = """
+import json, time
+start = time.perf_counter()
+from src.engine.game_loop import GameLoop
+loop = GameLoop(width={width}, height={height})
+renderer = loop.setup_display()
+renderer.render(loop.state)
+print(json.dumps({{"seconds": time.perf_counter() - start}}))
+"""
+
+
+def _run_script(script: str) -> Dict[str, object]:
+    """Run a measurement script in a fresh headless interpreter.
+
+    Args:
+        script: Python source printing one JSON object.
+
+    Returns:
+        The decoded JSON object.
+    """
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure_import_time(modules: tuple = ENGINE_MODULES, runs: int = 5) -> float:
+    """Measure the median time to import engine and model modules.
+
+    Args:
+        modules: Modules to import.
+        runs: Number of fresh interpreters to sample.
+
+    Returns:
+        Median import time in seconds.
+    """
+    samples: List[float] = [
+        float(_run_script(_IMPORT_SCRIPT.format(modules=modules))["seconds"])
+        for _ in range(runs)
+    ]
+    return statistics.median(samples)
+
+
+def imports_pygame(modules: tuple = ENGINE_MODULES) -> bool:
+    """Check whether importing the given modules loads pygame.
+
+    Args:
+        modules: Modules to import.
+
+    Returns:
+        True if pygame ends up in ``sys.modules``.
+    """
+    return bool(_run_script(_IMPORT_SCRIPT.format(modules=modules))["pygame_loaded"])
+
+
+def measure_first_frame(width: int = 20, height: int = 20, runs: int = 3) -> float:
+    """Measure the median time from interpreter start to the first frame.
+
+    Covers importing the engine, initializing display and fonts, opening
+    the (dummy) window and rendering the initial state.
+
+    Args:
+        width: Grid width.
+        height: Grid height.
+        runs: Number of fresh interpreters to sample.
+
+    Returns:
+        Median time to first frame in seconds.
+    """
+    script = _FIRST_FRAME_SCRIPT.format(width=width, height=height)
+    samples = [float(_run_script(script)["seconds"]) for _ in range(runs)]
+    return statistics.median(samples)
+
+
+def main() -> None:
+    """Print startup measurements."""
+    print(f"Engine import:  {measure_import_time() * 1000:.1f} ms")
+    print(f"Imports pygame: {imports_pygame()}")
+    print(f"First frame:    {measure_first_frame() * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
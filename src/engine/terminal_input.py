@@ -0,0 +1,161 @@
+"""Keyboard input read from a terminal instead of a pygame window."""
+
+import os
+import select
+import time
+from types import TracebackType
+from typing import Any, Dict, List, Optional, TextIO, Tuple, Type
+
+from src.engine.input_handler import InputAction
+
+# Escape sequences sent by the arrow keys
+ARROW_KEYS: Dict[str, InputAction] = {
+    "\x1b[A": InputAction.MOVE_UP,
+    "\x1b[B": InputAction.MOVE_DOWN,
+    "\x1b[C": InputAction.MOVE_RIGHT,
+    "\x1b[D": InputAction.MOVE_LEFT,
+    # Sent instead in application cursor mode
+    "\x1bOA": InputAction.MOVE_UP,
+    "\x1bOB": InputAction.MOVE_DOWN,
+    "\x1bOC": InputAction.MOVE_RIGHT,
+    "\x1bOD": InputAction.MOVE_LEFT,
+}
+
+# Starts of arrow key sequences that may still be waiting for the rest
+_SEQUENCE_STARTS = {sequence[:length] for sequence in ARROW_KEYS for length in (1, 2)}
+
+# Seconds to wait for the rest of an escape sequence split across reads
+# before a lone escape counts as the Escape key
+ESCAPE_TIMEOUT = 0.05
+
+# Same bindings as the pygame key map
+CHARACTER_KEYS: Dict[str, InputAction] = {
+    "w": InputAction.MOVE_UP,
+    "s": InputAction.MOVE_DOWN,
+    "a": InputAction.MOVE_LEFT,
+    "d": InputAction.MOVE_RIGHT,
+    " ": InputAction.PAUSE,
+    "r": InputAction.RESTART,
+    "q": InputAction.QUIT,
+    "\x1b": InputAction.QUIT,
+}
+
+
+def parse_keys(data: str) -> List[InputAction]:
+    """Translate terminal input into actions.
+
+    Args:
+        data: Characters read from the terminal.
+
+    Returns:
+        Actions in the order their keys were pressed; unknown keys are
+        skipped.
+    """
+    actions: List[InputAction] = []
+    i = 0
+    while i < len(data):
+        sequence = data[i : i + 3]
+        if sequence in ARROW_KEYS:
+            actions.append(ARROW_KEYS[sequence])
+            i += 3
+            continue
+        action = CHARACTER_KEYS.get(data[i].lower())
+        if action is not None:
+            actions.append(action)
+        i += 1
+    return actions
+
+
+def split_incomplete(data: str) -> Tuple[str, str]:
+    """Split off an arrow key sequence cut short at the end of the input.
+
+    Args:
+        data: Characters read from the terminal.
+
+    Returns:
+        The characters that can be parsed now, and the trailing start of
+        an escape sequence (empty if there is none).
+    """
+    for length in (2, 1):
+        if data[-length:] in _SEQUENCE_STARTS:
+            return data[:-length], data[-length:]
+    return data, ""
+
+
+class TerminalInput:
+    """Reads key presses from a terminal without waiting for Enter.
+
+    Used as a context manager: the terminal is switched to cbreak mode
+    (no line buffering, no echo) on entry and restored on exit. Streams
+    that are not terminals are read as they are.
+
+    An escape at the end of a read is held back until the next read, as
+    the terminal may have split an arrow key sequence; it counts as the
+    Escape key once ``ESCAPE_TIMEOUT`` passes without more input.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        """Initialize terminal input.
+
+        Args:
+            stream: Terminal input stream (usually ``sys.stdin``).
+        """
+        self.stream = stream
+        self._saved_mode: Optional[Any] = None
+        # Unfinished escape sequence from the last read, and when it came
+        self._pending = ""
+        self._pending_since = 0.0
+
+    def __enter__(self) -> "TerminalInput":
+        """Switch the terminal to cbreak mode."""
+        if self.stream.isatty():
+            import termios
+            import tty
+
+            fd = self.stream.fileno()
+            self._saved_mode = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Restore the terminal mode saved on entry."""
+        if self._saved_mode is not None:
+            import termios
+
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN, self._saved_mode)
+            self._saved_mode = None
+
+    def read_actions(self, timeout: float = 0.0) -> List[InputAction]:
+        """Collect the actions of keys pressed so far.
+
+        Args:
+            timeout: Longest time to wait for the first key, in seconds.
+
+        Returns:
+            Actions in the order their keys were pressed.
+        """
+        fd = self.stream.fileno()
+        wait = max(timeout, 0.0)
+        if self._pending:
+            # Wake up in time to settle a lone escape
+            deadline = self._pending_since + ESCAPE_TIMEOUT
+            wait = min(wait, max(deadline - time.monotonic(), 0.0))
+        ready, _, _ = select.select([fd], [], [], wait)
+        data = os.read(fd, 1024) if ready else b""
+
+        if data:
+            text = self._pending + data.decode("utf-8", errors="ignore")
+            text, self._pending = split_incomplete(text)
+            self._pending_since = time.monotonic()
+        elif self._pending and (
+            time.monotonic() - self._pending_since >= ESCAPE_TIMEOUT
+        ):
+            text, self._pending = self._pending, ""
+        else:
+            return []
+        return parse_keys(text)
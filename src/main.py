@@ -4,7 +4,12 @@ A classic Snake game implementation using Python and Pygame.
 """
 
 import sys
+from dataclasses import replace
+from src.engine.gc_control import GCController
 from src.engine.game_loop import GameLoop
+from src.engine.memory_tracer import MemoryTracer
+from src.engine.replay import save_replays
+from src.engine.spectator import SpectatorLoop, chase_food
 from src.config.settings import Settings
 
 
@@ -13,15 +18,79 @@ def main() -> None:
     # Load settings
     settings = Settings()
 
+    games = settings.SPECTATOR_GAMES
+    if games > 0:
+        policies = None
+        if settings.AUTOPILOT:
+            # Imported here because the bots load numpy
+            from src.bots.factory import create_autopilot
+
+            # Autopilots keep per-game state, and all games share a frame,
+            # so each gets its own bot and a share of the thinking time
+            game_settings = replace(
+                settings, BOT_TIME_FRACTION=settings.BOT_TIME_FRACTION / games
+            )
+            policies = [
+                create_autopilot(settings.AUTOPILOT, game_settings)
+                for _ in range(games)
+            ]
+        spectator = SpectatorLoop(
+            tick_rates=[settings.FPS] * games,
+            width=settings.GRID_WIDTH,
+            height=settings.GRID_HEIGHT,
+            window_size=settings.WINDOW_SIZE,
+            policy=chase_food,
+            policies=policies,
+        )
+        try:
+            spectator.run()
+        except KeyboardInterrupt:
+            sys.exit(0)
+        return
+
+    autopilot = None
+    if settings.AUTOPILOT:
+        from src.bots.factory import create_autopilot
+
+        autopilot = create_autopilot(settings.AUTOPILOT, settings)
+
+    frame_capture = None
+    if settings.CAPTURE_FRAMES:
+        # Imported here because the capture module loads pygame
+        from src.renderer.frame_capture import FrameCapture
+
+        frame_capture = FrameCapture(settings.CAPTURE_PATH)
+
     # Create and run game loop
     game = GameLoop(
         width=settings.GRID_WIDTH,
         height=settings.GRID_HEIGHT,
-        fps=settings.FPS
+        fps=settings.FPS,
+        food_count=settings.FOOD_COUNT,
+        record_replays=settings.RECORD_REPLAYS,
+        idle_mode=settings.IDLE_MODE,
+        window_size=settings.WINDOW_SIZE,
+        resizable=settings.RESIZABLE_WINDOW,
+        low_res_cell_size=settings.LOW_RES_CELL_SIZE,
+        viewport_cell_size=settings.VIEWPORT_CELL_SIZE,
+        frame_capture=frame_capture,
+        terminal=settings.TERMINAL_MODE,
+        autopilot=autopilot,
+        memory_tracer=MemoryTracer() if settings.TRACE_MEMORY else None,
+        gc_controller=GCController() if settings.GC_TUNING else None,
     )
 
     try:
         game.run()
+        if settings.TRACE_MEMORY:
+            print(game.memory_tracer.report().format())
+        if settings.GC_TUNING:
+            print(game.gc_controller.stats().format())
+        if settings.CAPTURE_FRAMES:
+            print(frame_capture.stats().format())
+        if settings.RECORD_REPLAYS:
+            saved = save_replays(game.replays, settings.REPLAY_PATH)
+            print(f"Saved {len(saved)} replays to {settings.REPLAY_PATH}")
     except KeyboardInterrupt:
         print("\nGame interrupted by user.")
         sys.exit(0)
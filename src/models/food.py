@@ -1,9 +1,18 @@
 """Food model for the Snake game."""
 
 import random
+from collections.abc import Set
 from dataclasses import dataclass
-from typing import Iterable, Optional
+from typing import Container, Iterable, List, Optional, Sequence
 from src.models.position import Position
+from src.models.snake_body import SnakeBody
+
+# Random probes made before falling back to enumerating free cells
+MAX_SPAWN_ATTEMPTS = 64
+
+# Extra random cells drawn per batch spawn, on top of twice the count,
+# to make up for occupied ones
+SPAWN_OVERSAMPLE = 16
 
 
 @dataclass(frozen=True)
@@ -35,22 +44,97 @@ class Food:
 
         Raises:
             ValueError: If no valid position exists.
+
+        Note:
+            Cells are sampled at random until a free one is found, so the
+            cost does not depend on the grid area unless the board is
+            almost full. Sets and snake bodies are probed in place.
         """
-        forbidden_set = set(forbidden) if forbidden else set()
+        blocked: Container[Position]
+        if forbidden is None:
+            blocked = frozenset()
+        elif isinstance(forbidden, (Set, SnakeBody)):
+            blocked = forbidden
+        else:
+            blocked = set(forbidden)
 
-        # Generate all possible positions
-        all_positions = {
-            Position(x=x, y=y)
-            for x in range(width)
-            for y in range(height)
-        }
+        area = width * height
+        if area <= 0:
+            raise ValueError("No valid position to spawn food")
+
+        # Rejection sampling: O(1) expected while the board has free space
+        for _ in range(MAX_SPAWN_ATTEMPTS):
+            y, x = divmod(random.randrange(area), width)
+            position = Position(x=x, y=y)
+            if position not in blocked:
+                return cls(position=position)
 
-        # Remove forbidden positions
-        valid_positions = all_positions - forbidden_set
+        # Board is nearly full - choose among the remaining free cells
+        valid_positions = [
+            position
+            for position in (
+                Position(x=x, y=y) for y in range(height) for x in range(width)
+            )
+            if position not in blocked
+        ]
 
         if not valid_positions:
             raise ValueError("No valid position to spawn food")
 
-        # Select random position
-        position = random.choice(list(valid_positions))
-        return cls(position=position)
+        return cls(position=random.choice(valid_positions))
+
+    @classmethod
+    def spawn_many(
+        cls,
+        width: int,
+        height: int,
+        count: int,
+        occupied: Sequence[Container[Position]] = (),
+    ) -> List["Food"]:
+        """Spawn several food items on distinct free cells in one pass.
+
+        Args:
+            width: Grid width.
+            height: Grid height.
+            count: Number of food items wanted.
+            occupied: Collections of positions where food cannot spawn
+                (e.g., the snake body and the food already on the
+                board), each probed in place.
+
+        Returns:
+            New Food instances on distinct free cells; fewer than
+            ``count`` if the board has no more room.
+
+        Note:
+            One random sample of distinct cells is drawn and filtered,
+            so the cost grows with ``count`` but not with the grid area
+            unless the board is almost full.
+        """
+        area = width * height
+        if count <= 0 or area <= 0:
+            return []
+
+        def is_free(position: Position) -> bool:
+            return not any(position in positions for positions in occupied)
+
+        foods = []
+        sample = random.sample(range(area), min(area, 2 * count + SPAWN_OVERSAMPLE))
+        for cell in sample:
+            y, x = divmod(cell, width)
+            position = Position(x=x, y=y)
+            if is_free(position):
+                foods.append(cls(position=position))
+                if len(foods) == count:
+                    return foods
+
+        # Board is nearly full - choose among the remaining free cells
+        chosen = {food.position for food in foods}
+        free = [
+            position
+            for position in (
+                Position(x=x, y=y) for y in range(height) for x in range(width)
+            )
+            if position not in chosen and is_free(position)
+        ]
+        picked = random.sample(free, min(len(free), count - len(foods)))
+        return foods + [cls(position=position) for position in picked]
@@ -0,0 +1,98 @@
+"""Food items indexed by the cell they are on."""
+
+from typing import Dict, Iterable, Iterator, Optional
+
+from src.models.food import Food
+from src.models.position import Position
+
+
+class FoodIndex:
+    """Immutable collection of food items, hashed by position.
+
+    Checking whether a cell holds food and finding that food are single
+    dictionary lookups, however many items there are, so the eat check
+    of every tick stays O(1). Removing or adding items builds a new
+    index and leaves this one unchanged.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, foods: Iterable[Food] = ()) -> None:
+        """Index food items.
+
+        Args:
+            foods: Food items, at most one per cell.
+        """
+        self._items: Dict[Position, Food] = {food.position: food for food in foods}
+
+    def __len__(self) -> int:
+        """Get the number of food items."""
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Food]:
+        """Iterate over the food items."""
+        return iter(self._items.values())
+
+    def __contains__(self, item: object) -> bool:
+        """Check whether a position, or a food item's cell, holds food."""
+        if isinstance(item, Food):
+            return self._items.get(item.position) == item
+        return item in self._items
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the food items of two indices."""
+        if not isinstance(other, FoodIndex):
+            return NotImplemented
+        return self._items == other._items
+
+    def __hash__(self) -> int:
+        """Hash the set of food positions."""
+        return hash(frozenset(self._items))
+
+    def __repr__(self) -> str:
+        """Show the food positions."""
+        return f"FoodIndex({list(self._items)!r})"
+
+    def get(self, position: Position) -> Optional[Food]:
+        """Get the food on a cell.
+
+        Args:
+            position: Cell to look at.
+
+        Returns:
+            The food there, or None.
+        """
+        return self._items.get(position)
+
+    def without(self, position: Position) -> "FoodIndex":
+        """Create an index with the food on a cell removed.
+
+        Args:
+            position: Cell of the food to remove.
+
+        Returns:
+            A new FoodIndex (this one if the cell holds no food).
+        """
+        if position not in self._items:
+            return self
+        index = FoodIndex()
+        index._items = dict(self._items)
+        del index._items[position]
+        return index
+
+    def with_foods(self, foods: Iterable[Food]) -> "FoodIndex":
+        """Create an index with more food items.
+
+        Args:
+            foods: Food items on cells without food.
+
+        Returns:
+            A new FoodIndex.
+        """
+        index = FoodIndex(foods)
+        index._items = {**self._items, **index._items}
+        return index
+
+
+# Index of a board without extra food
+NO_EXTRA_FOOD = FoodIndex()
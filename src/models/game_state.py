@@ -2,9 +2,13 @@
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import List, Optional, Tuple
 from src.models.snake import Snake
 from src.models.food import Food
+from src.models.food_index import NO_EXTRA_FOOD, FoodIndex
 from src.models.direction import Direction
+from src.models.position import Position
+from src.models.move_table import MOVES, REVERSALS, MoveOutcome, move_table
 
 
 class GameStatus(Enum):
@@ -26,6 +30,8 @@ class GameState:
         status: Game status (playing, paused, game over).
         width: Grid width.
         height: Grid height.
+        extra_food: Food items on the board besides ``food``, for modes
+            with several at once.
     """
 
     snake: Snake
@@ -34,20 +40,34 @@ class GameState:
     status: GameStatus
     width: int
     height: int
+    extra_food: FoodIndex = NO_EXTRA_FOOD
 
     @classmethod
-    def create_initial(cls, width: int = 20, height: int = 20) -> "GameState":
+    def create_initial(
+        cls, width: int = 20, height: int = 20, food_count: int = 1
+    ) -> "GameState":
         """Create initial game state.
 
         Args:
             width: Grid width.
             height: Grid height.
+            food_count: Food items on the board at once.
 
         Returns:
             A new GameState with default snake and random food.
         """
         snake = Snake.create_default(width, height)
         food = Food.spawn_random(width, height, forbidden=snake.body)
+        extra_food = NO_EXTRA_FOOD
+        if food_count > 1:
+            extra_food = FoodIndex(
+                Food.spawn_many(
+                    width,
+                    height,
+                    food_count - 1,
+                    occupied=(snake.body, {food.position}),
+                )
+            )
         return cls(
             snake=snake,
             food=food,
@@ -55,6 +75,7 @@ class GameState:
             status=GameStatus.PLAYING,
             width=width,
             height=height,
+            extra_food=extra_food,
         )
 
     def move_snake(self, grow: bool = False) -> "GameState":
@@ -76,6 +97,7 @@ class GameState:
             status=self.status,
             width=self.width,
             height=self.height,
+            extra_food=self.extra_food,
         )
 
     def change_direction(self, direction: Direction) -> "GameState":
@@ -95,6 +117,7 @@ class GameState:
             status=self.status,
             width=self.width,
             height=self.height,
+            extra_food=self.extra_food,
         )
 
     def pause(self) -> "GameState":
@@ -110,6 +133,7 @@ class GameState:
             status=GameStatus.PAUSED,
             width=self.width,
             height=self.height,
+            extra_food=self.extra_food,
         )
 
     def resume(self) -> "GameState":
@@ -125,6 +149,7 @@ class GameState:
             status=GameStatus.PLAYING,
             width=self.width,
             height=self.height,
+            extra_food=self.extra_food,
         )
 
     def game_over(self) -> "GameState":
@@ -140,6 +165,7 @@ class GameState:
             status=GameStatus.GAME_OVER,
             width=self.width,
             height=self.height,
+            extra_food=self.extra_food,
         )
 
     def with_score(self, score: int) -> "GameState":
@@ -158,17 +184,40 @@ class GameState:
             status=self.status,
             width=self.width,
             height=self.height,
+            extra_food=self.extra_food,
         )
 
     def respawn_food(self) -> "GameState":
         """Spawn food at new location avoiding snake body.
 
+        If extra food items take every free cell, one of them becomes
+        the main food instead, like ``respawn_extra_food`` removing an
+        item on a full board.
+
         Returns:
             A new GameState with new food position.
+
+        Raises:
+            ValueError: If no free cell is left and there is no extra
+                food to take over.
         """
-        new_food = Food.spawn_random(
-            self.width, self.height, forbidden=self.snake.body
-        )
+        extra_food = self.extra_food
+        if not extra_food:
+            new_food = Food.spawn_random(
+                self.width, self.height, forbidden=self.snake.body
+            )
+        else:
+            spawned = Food.spawn_many(
+                self.width,
+                self.height,
+                1,
+                occupied=(self.snake.body, extra_food),
+            )
+            if spawned:
+                new_food = spawned[0]
+            else:
+                new_food = next(iter(extra_food))
+                extra_food = extra_food.without(new_food.position)
         return self.__class__(
             snake=self.snake,
             food=new_food,
@@ -176,8 +225,98 @@ class GameState:
             status=self.status,
             width=self.width,
             height=self.height,
+            extra_food=extra_food,
+        )
+
+    def respawn_extra_food(self, position: Position) -> "GameState":
+        """Replace an eaten extra food item with one on a free cell.
+
+        If the board has no free cell left, the item is only removed.
+
+        Args:
+            position: Cell of the eaten item.
+
+        Returns:
+            A new GameState with the item moved.
+        """
+        remaining = self.extra_food.without(position)
+        spawned = Food.spawn_many(
+            self.width,
+            self.height,
+            1,
+            occupied=(self.snake.body, {self.food.position}, remaining),
+        )
+        return self.__class__(
+            snake=self.snake,
+            food=self.food,
+            score=self.score,
+            status=self.status,
+            width=self.width,
+            height=self.height,
+            extra_food=remaining.with_foods(spawned),
         )
 
+    @property
+    def food_count(self) -> int:
+        """Get the number of food items on the board."""
+        return 1 + len(self.extra_food)
+
+    def food_at(self, position: Position) -> Optional[Food]:
+        """Get the food item on a cell, in O(1).
+
+        Args:
+            position: Cell to look at.
+
+        Returns:
+            ``food`` or an extra item on that cell, or None.
+        """
+        if self.food.position == position:
+            return self.food
+        return self.extra_food.get(position)
+
+    def move_outcomes(self) -> Tuple[MoveOutcome, ...]:
+        """Look one move ahead in every direction.
+
+        Neighbour cells are worked out from the head's cell index, so no
+        snake is moved and no body is copied.
+
+        Returns:
+            Outcome of each move, in ``Direction.all()`` order.
+        """
+        snake = self.snake
+        body = snake.body
+        table = move_table(self.width, self.height)
+        reversal = REVERSALS[snake.direction]
+        # The tail leaves its cell this tick unless a duplicate stays
+        vacating = table.cell(body.tail) if body.padding == 0 else -1
+        food = table.cell(self.food.position)
+        extra_food = self.extra_food
+        outcomes = []
+        for direction, (cell, target) in zip(MOVES, table.neighbours(snake.head)):
+            on_board = cell >= 0
+            outcomes.append(
+                MoveOutcome(
+                    direction=direction,
+                    target=target,
+                    legal=direction is not reversal,
+                    hits_wall=not on_board,
+                    hits_body=on_board and cell != vacating and target in body,
+                    eats=cell == food or target in extra_food,
+                )
+            )
+        return tuple(outcomes)
+
+    def safe_moves(self) -> List[Direction]:
+        """Get the moves that survive the next tick.
+
+        Returns:
+            Legal moves that hit neither a wall nor the body, in
+            ``Direction.all()`` order.
+        """
+        return [
+            outcome.direction for outcome in self.move_outcomes() if outcome.safe
+        ]
+
     def is_playing(self) -> bool:
         """Check if game is in playing state.
 
@@ -0,0 +1,159 @@
+"""Cell index arithmetic for one-step move lookahead."""
+
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from src.models.direction import Direction
+from src.models.position import Position
+
+# Moves in Direction.all() order; outcomes are reported in this order
+MOVES: Tuple[Direction, ...] = tuple(Direction.all())
+
+# Reversal of every move
+REVERSALS: Dict[Direction, Direction] = {move: move.opposite for move in MOVES}
+
+# Tables already built, shared by all states in the process
+_tables: Dict[Tuple[int, int], "MoveTable"] = {}
+
+
+class MoveOutcome(NamedTuple):
+    """What one move would lead to on the next tick.
+
+    A named tuple rather than a dataclass: bots build four of these on
+    every tick, and tuples are several times cheaper to create.
+
+    Attributes:
+        direction: Move this outcome is for.
+        target: Cell the head would move into, or None if off the board.
+        legal: False if the move reverses the snake (the game ignores it).
+        hits_wall: True if the head would leave the board.
+        hits_body: True if the head would land on a segment that stays.
+        eats: True if the head would land on the food.
+    """
+
+    direction: Direction
+    target: Optional[Position]
+    legal: bool
+    hits_wall: bool
+    hits_body: bool
+    eats: bool
+
+    @property
+    def safe(self) -> bool:
+        """Check if the move is legal and survives the tick."""
+        return self.legal and not self.hits_wall and not self.hits_body
+
+
+class MoveTable:
+    """Neighbour lookup for one board size.
+
+    Cells are indexed ``y * width + x``. Neighbours are worked out from
+    the index with ``cell ± 1`` and ``cell ± width`` and an edge check,
+    in ``MOVES`` order, so the table costs the same on any board size
+    and a lookahead compares ints instead of building positions.
+    """
+
+    __slots__ = ("width", "height", "area")
+
+    def __init__(self, width: int, height: int) -> None:
+        """Create the lookup for a board size.
+
+        Args:
+            width: Board width in cells.
+            height: Board height in cells.
+        """
+        self.width = width
+        self.height = height
+        self.area = width * height
+
+    def cell(self, position: Position) -> int:
+        """Get the index of a cell.
+
+        Args:
+            position: Cell, on the board or not.
+
+        Returns:
+            ``y * width + x``, or -1 if the position is off the board.
+        """
+        x, y = position.x, position.y
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return -1
+
+    def position(self, cell: int) -> Position:
+        """Get the position of a cell index.
+
+        Args:
+            cell: Index of a cell on the board.
+
+        Returns:
+            The cell's position.
+        """
+        y, x = divmod(cell, self.width)
+        return Position(x=x, y=y)
+
+    def neighbour_cells(self, cell: int) -> Tuple[int, ...]:
+        """Get the neighbours of a cell.
+
+        Args:
+            cell: Index of a cell on the board.
+
+        Returns:
+            Index of each neighbour, -1 off the board, in ``MOVES``
+            order.
+        """
+        width = self.width
+        x = cell % width
+        below = cell + width
+        return (
+            cell - width if cell >= width else -1,
+            below if below < self.area else -1,
+            cell - 1 if x > 0 else -1,
+            cell + 1 if x < width - 1 else -1,
+        )
+
+    def neighbours(
+        self, position: Position
+    ) -> Tuple[Tuple[int, Optional[Position]], ...]:
+        """Get the neighbours of a position.
+
+        The position itself may be off the board, like the head of a
+        snake that has just crashed.
+
+        Args:
+            position: Cell to look around.
+
+        Returns:
+            Index and position of each neighbour, ``(-1, None)`` off the
+            board, in ``MOVES`` order.
+        """
+        width, height = self.width, self.height
+        x, y = position.x, position.y
+        result = []
+        # Up, down, left, right: the order of MOVES
+        for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+            if 0 <= nx < width and 0 <= ny < height:
+                result.append((ny * width + nx, Position(x=nx, y=ny)))
+            else:
+                result.append((-1, None))
+        return tuple(result)
+
+
+def move_table(width: int, height: int) -> MoveTable:
+    """Get the move table of a board size, creating it on first use.
+
+    Tables hold only the board size, so keeping one per size costs
+    nothing whatever the board area.
+
+    Args:
+        width: Board width in cells.
+        height: Board height in cells.
+
+    Returns:
+        The shared table for the board size.
+    """
+    key = (width, height)
+    table = _tables.get(key)
+    if table is None:
+        table = MoveTable(width, height)
+        _tables[key] = table
+    return table
@@ -1,9 +1,9 @@
 """Snake model for the Snake game."""
 
 from dataclasses import dataclass
-from typing import Tuple
 from src.models.position import Position
 from src.models.direction import Direction
+from src.models.snake_body import SnakeBody
 
 
 @dataclass(frozen=True)
@@ -11,17 +11,23 @@ class Snake:
     """Represents the snake in the game.
 
     Attributes:
-        body: Tuple of positions representing snake segments (head first).
+        body: Sequence of positions representing snake segments (head first).
+              A plain tuple is accepted and converted to a SnakeBody.
         direction: Current movement direction.
     """
 
-    body: Tuple[Position, ...]
+    body: SnakeBody
     direction: Direction
 
+    def __post_init__(self) -> None:
+        """Wrap plain position tuples in a SnakeBody."""
+        if not isinstance(self.body, SnakeBody):
+            object.__setattr__(self, "body", SnakeBody.from_positions(self.body))
+
     @property
     def head(self) -> Position:
         """Get the head position (first segment)."""
-        return self.body[0]
+        return self.body.head
 
     def __len__(self) -> int:
         """Get snake length (number of segments)."""
@@ -67,12 +73,8 @@ class Snake:
         # Calculate new head position
         new_head = self.head + self.direction.delta
 
-        # Build new body
-        new_body = (new_head,) + self.body
-
-        # Remove tail if not growing
-        if not grow:
-            new_body = new_body[:-1]
+        # Build new body (shares storage with this one, no full copy)
+        new_body = self.body.advance(new_head, grow=grow)
 
         return self.__class__(body=new_body, direction=self.direction)
 
@@ -83,7 +85,7 @@ class Snake:
             A new Snake with an additional tail segment.
         """
         # Duplicate the tail segment to make the snake longer
-        new_body = self.body + (self.body[-1],)
+        new_body = self.body.grow_tail()
         return self.__class__(body=new_body, direction=self.direction)
 
     def change_direction(self, new_direction: Direction) -> "Snake":
@@ -111,7 +113,7 @@ class Snake:
             True if head position is in body (excluding head itself).
         """
         # Check if head appears more than once in body
-        return self.body[1:].count(self.head) > 0
+        return self.body.head_collides()
 
     def contains(self, position: Position) -> bool:
         """Check if the snake contains a given position.
@@ -122,4 +124,4 @@ class Snake:
         Returns:
             True if position is part of the snake's body.
         """
-        return position in self.body_positions
+        return position in self.body
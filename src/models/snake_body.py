@@ -0,0 +1,285 @@
+"""Persistent body storage for the Snake model."""
+
+from array import array
+from typing import Dict, Iterator, List, Sequence, Tuple, Union, overload
+from src.models.position import Position
+
+# Dead trail entries tolerated before a body is compacted onto a fresh trail
+COMPACT_MIN = 1024
+
+
+class _Trail:
+    """Append-only log of head positions shared between snake bodies.
+
+    Attributes:
+        cells: Every head position in visiting order (oldest first).
+        previous: For each entry, the index of the previous visit to the
+            same cell, or -1 if the cell was not visited before.
+        last_seen: Most recent index at which each cell was visited.
+        xy: Flat x, y coordinate pairs of ``cells`` (C ints), for handing
+            bodies to array libraries without per-segment Python loops.
+    """
+
+    __slots__ = ("cells", "previous", "last_seen", "xy")
+
+    def __init__(self, cells: Sequence[Position] = ()) -> None:
+        """Initialize a trail from positions in visiting order.
+
+        Args:
+            cells: Positions to record, oldest first.
+        """
+        self.cells: List[Position] = []
+        self.previous: List[int] = []
+        self.last_seen: Dict[Position, int] = {}
+        self.xy = array("i")
+        for cell in cells:
+            self.append(cell)
+
+    def append(self, cell: Position) -> None:
+        """Record a new head position.
+
+        Args:
+            cell: Position visited by the head.
+        """
+        self.previous.append(self.last_seen.get(cell, -1))
+        self.last_seen[cell] = len(self.cells)
+        self.cells.append(cell)
+        self.xy.append(cell.x)
+        self.xy.append(cell.y)
+
+
+class SnakeBody(Sequence[Position]):
+    """Immutable sequence of snake segments (head first).
+
+    A snake body is always the most recent stretch of the head's path,
+    so bodies are stored as a window over a shared append-only trail.
+    Advancing the head appends one entry instead of copying the whole
+    body, and each trail entry remembers the previous visit to its cell,
+    which makes the head self-collision check O(1).
+
+    Segments duplicated by ``grow_tail`` are kept as a counter instead of
+    trail entries, matching the tuple semantics of ``body + (tail,)``.
+    """
+
+    __slots__ = ("_trail", "_end", "_span", "_pad")
+
+    def __init__(self, trail: _Trail, end: int, span: int, pad: int = 0) -> None:
+        """Initialize a body window.
+
+        Args:
+            trail: Shared trail holding the positions.
+            end: Trail index one past the head.
+            span: Number of trail entries covered by the body.
+            pad: Number of duplicated tail segments after the window.
+        """
+        self._trail = trail
+        self._end = end
+        self._span = span
+        self._pad = pad
+
+    @classmethod
+    def from_positions(cls, positions: Sequence[Position]) -> "SnakeBody":
+        """Create a body from segment positions.
+
+        Args:
+            positions: Segment positions, head first.
+
+        Returns:
+            A new SnakeBody holding the given segments.
+        """
+        positions = tuple(positions)
+        trail = _Trail(positions[::-1])
+        return cls(trail, len(positions), len(positions))
+
+    @property
+    def head(self) -> Position:
+        """Get the head position (first segment)."""
+        return self._trail.cells[self._end - 1]
+
+    @property
+    def tail(self) -> Position:
+        """Get the tail position (last segment)."""
+        return self._trail.cells[self._end - self._span]
+
+    @property
+    def padding(self) -> int:
+        """Get the number of duplicated tail segments from ``grow_tail``.
+
+        The tail cell stays occupied for this many extra ticks.
+        """
+        return self._pad
+
+    def __len__(self) -> int:
+        """Get the number of segments."""
+        return self._span + self._pad
+
+    @overload
+    def __getitem__(self, index: int) -> Position: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Tuple[Position, ...]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Position, Tuple[Position, ...]]:
+        """Get a segment by index, or a tuple of segments by slice.
+
+        Args:
+            index: Segment index (0 is the head) or slice.
+
+        Returns:
+            The segment position, or a tuple for slices.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            return tuple(self)[index]
+
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("snake body index out of range")
+        if index >= self._span:
+            return self.tail
+        return self._trail.cells[self._end - 1 - index]
+
+    def __iter__(self) -> Iterator[Position]:
+        """Iterate over segments from head to tail."""
+        if self._span == 0:
+            return
+        start = self._end - self._span
+        yield from self._trail.cells[start : self._end][::-1]
+        for _ in range(self._pad):
+            yield self._trail.cells[start]
+
+    def __contains__(self, position: object) -> bool:
+        """Check if a position is occupied by any segment.
+
+        Args:
+            position: The position to check.
+
+        Returns:
+            True if some segment is at the position.
+        """
+        if self._span == 0:
+            return False
+        trail = self._trail
+        index = trail.last_seen.get(position, -1)  # type: ignore[call-overload]
+        # Skip visits made after this body by newer bodies on the same trail
+        while index >= self._end:
+            index = trail.previous[index]
+        return index >= self._end - self._span
+
+    def __eq__(self, other: object) -> bool:
+        """Compare segments with another body or tuple."""
+        if isinstance(other, SnakeBody):
+            if (
+                self._trail is other._trail
+                and self._end == other._end
+                and self._span == other._span
+                and self._pad == other._pad
+            ):
+                return True
+            return len(self) == len(other) and tuple(self) == tuple(other)
+        if isinstance(other, tuple):
+            return len(self) == len(other) and tuple(self) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash like the equivalent tuple of segments."""
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        """Represent the body as its tuple of segments."""
+        return repr(tuple(self))
+
+    def coordinates(self) -> "array[int]":
+        """Get segment coordinates as flat x, y pairs, from tail to head.
+
+        Duplicated tail segments from ``grow_tail`` are not repeated.
+
+        Returns:
+            A new ``array("i")`` of 2 * n ints (a single memory copy).
+        """
+        start = self._end - self._span
+        return self._trail.xy[2 * start : 2 * self._end]
+
+    def head_collides(self) -> bool:
+        """Check if the head position appears again later in the body.
+
+        Returns:
+            True if any non-head segment shares the head position.
+        """
+        if self._span == 0:
+            return False
+        if self._span == 1:
+            return self._pad > 0
+        return self._trail.previous[self._end - 1] >= self._end - self._span
+
+    def follows(self, previous: "SnakeBody") -> bool:
+        """Check if this body is ``previous`` after one step of the head.
+
+        When True, the segments behind the head repeat ``previous`` from
+        its head onwards, except that the body may end in duplicated tail
+        segments (as after eating). Runs in O(1): only bodies advanced
+        along the same trail qualify, so a False result does not mean the
+        segments differ.
+
+        Args:
+            previous: The body before the step.
+
+        Returns:
+            True if this body is ``previous`` advanced by one cell.
+        """
+        if self._trail is not previous._trail or self._end != previous._end + 1:
+            return False
+        if len(self) - len(previous) not in (0, 1):
+            return False
+        return self._span - 1 <= previous._span
+
+    def advance(self, new_head: Position, grow: bool = False) -> "SnakeBody":
+        """Create the body after the head moves to a new position.
+
+        Args:
+            new_head: The new head position.
+            grow: If True, keep the tail (body gets one segment longer).
+
+        Returns:
+            A new SnakeBody; this body is left unchanged.
+        """
+        trail = self._trail
+        end = self._end
+        span = self._span
+
+        if end < len(trail.cells):
+            # Another body already advanced from here; share its entry
+            # when it took the same step, otherwise branch off a copy.
+            if trail.cells[end] != new_head:
+                trail = _Trail(trail.cells[end - span : end])
+                end = span
+                trail.append(new_head)
+        else:
+            if end - span > max(span, COMPACT_MIN):
+                # Drop trail entries no live body can reach any more
+                trail = _Trail(trail.cells[end - span : end])
+                end = span
+            trail.append(new_head)
+
+        pad = self._pad
+        if grow:
+            span += 1
+        elif pad:
+            # The new head takes the place of one duplicated tail segment
+            span += 1
+            pad -= 1
+        return SnakeBody(trail, end + 1, span, pad)
+
+    def grow_tail(self) -> "SnakeBody":
+        """Create a body with the tail segment duplicated.
+
+        Returns:
+            A new SnakeBody one segment longer.
+        """
+        return SnakeBody(self._trail, self._end, self._span, self._pad + 1)
@@ -0,0 +1,72 @@
+"""Finding the grid cells that change between two game states.
+
+Shared by the pixel and terminal renderers, and free of pygame.
+"""
+
+from typing import Optional, Set
+
+from src.models.game_state import GameState
+from src.models.position import Position
+from src.models.snake_body import SnakeBody
+
+
+def tail_run_start(body: SnakeBody) -> int:
+    """Find where the run of segments sharing the tail cell starts.
+
+    The run holds the tail and the segments duplicated onto it after
+    eating. It stops before the head even when the head is on the tail
+    cell (a collision), since callers place the head themselves.
+
+    Args:
+        body: Snake body.
+
+    Returns:
+        Index of the first segment of the trailing run (at least 1 for
+        bodies longer than one segment).
+    """
+    tail = body.tail
+    i = len(body) - 1
+    while i > 1 and body[i - 1] == tail:
+        i -= 1
+    return i
+
+
+def changed_cells(
+    previous: Optional[GameState], state: GameState
+) -> Optional[Set[Position]]:
+    """Find the grid cells that differ between two drawn states.
+
+    Runs in O(1) for consecutive ticks of a game, however long the
+    snake is.
+
+    Args:
+        previous: State currently drawn, if any.
+        state: State to draw next.
+
+    Returns:
+        Cells to repaint, or None if everything must be redrawn.
+    """
+    if previous is None:
+        return None
+    body = state.snake.body
+    old_body = previous.snake.body
+    if body is old_body:
+        cells: Set[Position] = set()
+    elif body.follows(old_body) and not body.head_collides():
+        # Behind the new head the body repeats the old one up to its
+        # tail run, so only the head, the neck and both tails changed
+        start = tail_run_start(body)
+        cells = {body.head, old_body.head}
+        cells.update(body[i] for i in range(start, len(body)))
+        cells.update(old_body[i] for i in range(max(start - 1, 0), len(old_body)))
+    else:
+        return None
+    if state.food != previous.food:
+        cells.add(previous.food.position)
+        cells.add(state.food.position)
+    if state.extra_food is not previous.extra_food:
+        # Only cells that gained or lost an extra food item changed
+        old_food = {food.position for food in previous.extra_food}
+        new_food = {food.position for food in state.extra_food}
+        cells.update(old_food ^ new_food)
+    return cells
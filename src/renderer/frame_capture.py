@@ -0,0 +1,323 @@
+"""Background capture of presented frames to disk.
+
+The game loop only copies pixels into a bounded queue; worker threads
+do the encoding and file writes. ``zlib.compress`` and file I/O
+release the GIL, so encoding runs in parallel with the loop.
+"""
+
+import json
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import pygame
+
+# Supported output formats
+PNG = "png"
+RAW = "raw"
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Seconds ``stop`` waits for the workers to finish the queued frames
+STOP_TIMEOUT = 30.0
+
+
+def encode_png(pixels: bytes, width: int, height: int, level: int = 1) -> bytes:
+    """Encode 24-bit RGB pixels as a PNG image.
+
+    Args:
+        pixels: Row-major RGB bytes (3 bytes per pixel, no padding).
+        width: Image width in pixels.
+        height: Image height in pixels.
+        level: zlib compression level (1 is fastest).
+
+    Returns:
+        The PNG file contents.
+    """
+    stride = width * 3
+    # Every row starts with filter type 0 (none)
+    rows = b"".join(
+        b"\x00" + pixels[offset : offset + stride]
+        for offset in range(0, stride * height, stride)
+    )
+
+    def chunk(tag: bytes, payload: bytes) -> bytes:
+        crc = zlib.crc32(tag + payload) & 0xFFFFFFFF
+        return struct.pack(">I", len(payload)) + tag + payload + struct.pack(">I", crc)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        _PNG_SIGNATURE
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(rows, level))
+        + chunk(b"IEND", b"")
+    )
+
+
+@dataclass(frozen=True)
+class CaptureStats:
+    """Summary of a capture session.
+
+    Attributes:
+        submitted: Frames offered by the renderer.
+        written: Frames written to disk.
+        dropped: Frames dropped because the queue was full.
+        max_wait: Longest time a submit blocked on a full queue, in
+            seconds.
+        failed: Frames that could not be encoded or written.
+        error: The first encoding or write error, if any.
+    """
+
+    submitted: int
+    written: int
+    dropped: int
+    max_wait: float
+    failed: int = 0
+    error: Optional[str] = None
+
+    def format(self) -> str:
+        """Format the summary as human-readable text.
+
+        Returns:
+            One-line summary.
+        """
+        text = (
+            f"Capture: {self.written}/{self.submitted} frames written, "
+            f"{self.dropped} dropped, "
+            f"max wait {self.max_wait * 1000:.2f} ms"
+        )
+        if self.failed:
+            text += f", {self.failed} failed ({self.error})"
+        return text
+
+
+class FrameCapture:
+    """Records frames to a PNG sequence or a raw RGB video file.
+
+    ``submit`` copies a surface's pixels into a bounded queue and
+    returns immediately. When the queue is full the frame is dropped,
+    or, with ``max_wait`` > 0, the caller waits up to that long for a
+    free slot first (back-pressure) and drops the frame only if none
+    frees up. With ``max_wait=None`` it waits as long as it takes and
+    no frame is ever dropped, which suits offline export.
+
+    PNG frames are written as ``frame_000000.png`` and so on by
+    ``workers`` threads. Raw video is a single file of concatenated
+    RGB24 frames, written in order by one thread; a ``.json`` file next
+    to it records the frame size and count. It can be converted with
+    ``ffmpeg -f rawvideo -pix_fmt rgb24 -s WxH -r FPS -i FILE out.mp4``.
+
+    A frame that fails to encode or write (a full disk, say) is counted
+    as failed and the workers carry on with the rest, so the queue keeps
+    draining and neither ``submit`` nor ``stop`` can wait on a dead
+    thread. ``stop`` raises once the workers are done if any frame
+    failed.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        format: str = PNG,
+        workers: int = 2,
+        max_queued: int = 32,
+        max_wait: Optional[float] = 0.0,
+        compression: int = 1,
+    ) -> None:
+        """Initialize frame capture.
+
+        Args:
+            path: Output directory for PNG frames, or output file for raw
+                video.
+            format: Either ``PNG`` or ``RAW``.
+            workers: Number of PNG encoding threads (raw video always
+                uses one writer).
+            max_queued: Frames that may wait for encoding.
+            max_wait: Longest time ``submit`` blocks on a full queue, in
+                seconds. 0 drops frames immediately and None waits
+                without limit.
+            compression: zlib level for PNG frames.
+
+        Raises:
+            ValueError: If the format is unknown.
+        """
+        if format not in (PNG, RAW):
+            raise ValueError(f"Unknown capture format: {format}")
+        self.path = Path(path)
+        self.format = format
+        self.workers = 1 if format == RAW else max(1, workers)
+        self.max_wait = max_wait
+        self.compression = compression
+        self._queue: "queue.Queue[Optional[Tuple[int, Tuple[int, int], bytes]]]" = (
+            queue.Queue(maxsize=max_queued)
+        )
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._error: Optional[BaseException] = None
+        self._max_wait = 0.0
+        self._frame_size: Optional[Tuple[int, int]] = None
+        self._raw_file = None
+
+    @property
+    def active(self) -> bool:
+        """Check if worker threads are running."""
+        return bool(self._threads)
+
+    def start(self) -> None:
+        """Create the output location and start the workers."""
+        if self.active:
+            return
+        if self.format == PNG:
+            self.path.mkdir(parents=True, exist_ok=True)
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._raw_file = open(self.path, "wb")
+        for number in range(self.workers):
+            thread = threading.Thread(
+                target=self._work, name=f"frame-capture-{number}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = STOP_TIMEOUT) -> None:
+        """Write the queued frames and stop the workers.
+
+        Args:
+            timeout: Seconds to wait for the workers to write the queued
+                frames; workers still busy after that are abandoned
+                (they are daemon threads).
+
+        Raises:
+            RuntimeError: If a frame could not be written, or the
+                workers did not finish in time.
+        """
+        if not self.active:
+            return
+        deadline = time.perf_counter() + timeout
+        for _ in self._threads:
+            try:
+                self._queue.put(None, timeout=max(0.0, deadline - time.perf_counter()))
+            except queue.Full:
+                # The workers are hung in a write; joining would block
+                break
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.perf_counter()))
+        stuck = [thread for thread in self._threads if thread.is_alive()]
+        self._threads = []
+        if self._raw_file is not None and not stuck:
+            self._raw_file.close()
+            self._raw_file = None
+            self._write_raw_metadata()
+        if stuck:
+            raise RuntimeError(
+                f"Frame capture workers did not finish within {timeout:.0f} s"
+            )
+        if self._error is not None:
+            raise RuntimeError(
+                f"{self._failed} captured frames could not be written: "
+                f"{self._error}"
+            ) from self._error
+
+    def submit(self, surface: pygame.Surface) -> bool:
+        """Queue a copy of a surface's pixels for encoding.
+
+        Args:
+            surface: The frame to capture.
+
+        Returns:
+            True if the frame was queued, False if it was dropped.
+        """
+        size = surface.get_size()
+        if self._frame_size is None:
+            self._frame_size = size
+        elif self.format == RAW and size != self._frame_size:
+            # A raw stream cannot change frame size midway
+            self._count(dropped=1)
+            return False
+
+        frame = (self._submitted, size, pygame.image.tobytes(surface, "RGB"))
+        self._submitted += 1
+        try:
+            if self.max_wait is None or self.max_wait > 0:
+                started = time.perf_counter()
+                try:
+                    self._queue.put(frame, timeout=self.max_wait)
+                finally:
+                    self._max_wait = max(self._max_wait, time.perf_counter() - started)
+            else:
+                self._queue.put_nowait(frame)
+        except queue.Full:
+            self._count(dropped=1)
+            return False
+        return True
+
+    def stats(self) -> CaptureStats:
+        """Summarize the capture so far.
+
+        Returns:
+            Frame counts and the longest back-pressure wait.
+        """
+        with self._lock:
+            return CaptureStats(
+                submitted=self._submitted,
+                written=self._written,
+                dropped=self._dropped,
+                max_wait=self._max_wait,
+                failed=self._failed,
+                error=None if self._error is None else str(self._error),
+            )
+
+    def _work(self) -> None:
+        """Encode and write frames until a stop sentinel arrives."""
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                return
+            index, (width, height), pixels = frame
+            try:
+                if self.format == RAW:
+                    self._raw_file.write(pixels)
+                else:
+                    data = encode_png(pixels, width, height, self.compression)
+                    with open(self.path / f"frame_{index:06d}.png", "wb") as file:
+                        file.write(data)
+            except Exception as error:
+                # Keep draining the queue; stop() reports the failure
+                with self._lock:
+                    self._failed += 1
+                    if self._error is None:
+                        self._error = error
+                continue
+            self._count(written=1)
+
+    def _count(self, written: int = 0, dropped: int = 0) -> None:
+        """Update the frame counters.
+
+        Args:
+            written: Frames written.
+            dropped: Frames dropped.
+        """
+        with self._lock:
+            self._written += written
+            self._dropped += dropped
+
+    def _write_raw_metadata(self) -> None:
+        """Record the raw stream layout next to the video file."""
+        width, height = self._frame_size or (0, 0)
+        metadata = {
+            "pixel_format": "rgb24",
+            "width": width,
+            "height": height,
+            "frames": self._written,
+        }
+        with open(os.fspath(self.path) + ".json", "w") as file:
+            json.dump(metadata, file)
@@ -0,0 +1,190 @@
+"""Pure-NumPy rasterizer for symbolic grid observations.
+
+Turns game states into channel-stacked occupancy tensors without
+pygame. Requires the optional ``numpy`` dependency.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from src.models.game_state import GameState
+
+# Channel indices of the observation tensor
+HEAD = 0
+BODY = 1
+FOOD = 2
+WALLS = 3
+NUM_CHANNELS = 4
+
+
+def body_coordinates(state: GameState) -> Tuple[np.ndarray, np.ndarray]:
+    """Get snake segment coordinates as arrays, from tail to head.
+
+    Args:
+        state: Game state holding the snake.
+
+    Returns:
+        Tuple of (xs, ys) integer arrays.
+    """
+    pairs = np.frombuffer(state.snake.body.coordinates(), dtype=np.intc)
+    return pairs[0::2], pairs[1::2]
+
+
+class GridRasterizer:
+    """Rasterizes game states into (channels, rows, columns) tensors.
+
+    Channels:
+        HEAD: 1 at the head cell.
+        BODY: Segment age ordering, 1 at the head falling to 1/n at the
+            tail, 0 on free cells.
+        FOOD: 1 at every food cell.
+        WALLS: 1 on the wall ring around the board (when ``border`` > 0).
+
+    Grid cells are offset by ``border`` so walls have room around the
+    board. All writes go into caller-provided (or reused) buffers.
+    """
+
+    def __init__(
+        self, width: int, height: int, border: int = 1, dtype: type = np.float32
+    ) -> None:
+        """Initialize rasterizer.
+
+        Args:
+            width: Grid width (number of columns).
+            height: Grid height (number of rows).
+            border: Width of the wall ring around the board, in cells.
+            dtype: Element type of allocated tensors.
+        """
+        self.width = width
+        self.height = height
+        self.border = border
+        self.dtype = dtype
+        self.shape: Tuple[int, int, int] = (
+            NUM_CHANNELS,
+            height + 2 * border,
+            width + 2 * border,
+        )
+        self._walls = np.ones(self.shape[1:], dtype=dtype)
+        self._walls[border : border + height, border : border + width] = 0
+
+    def rasterize(
+        self, state: GameState, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Rasterize one game state.
+
+        Args:
+            state: The game state to rasterize.
+            out: Optional buffer of shape ``self.shape`` to write into.
+
+        Returns:
+            The observation tensor (``out`` if given).
+
+        Raises:
+            ValueError: If ``out`` has the wrong shape.
+        """
+        out = self._output(out, self.shape)
+        self.rasterize_batch([state], out[np.newaxis])
+        return out
+
+    def rasterize_batch(
+        self, states: Sequence[GameState], out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Rasterize many game states into one (N, C, H, W) tensor.
+
+        The coordinates of all snakes are concatenated so each channel is
+        written with a single vectorized assignment.
+
+        Args:
+            states: Game states (all with this rasterizer's grid size).
+            out: Optional buffer of shape (N,) + ``self.shape``.
+
+        Returns:
+            The batch tensor (``out`` if given).
+
+        Raises:
+            ValueError: If ``out`` has the wrong shape.
+        """
+        out = self._output(out, (len(states),) + self.shape)
+        out[:, :WALLS] = 0
+        out[:, WALLS] = self._walls
+        if not states:
+            return out
+
+        xs_list, ys_list, ages_list, index_list = [], [], [], []
+        for index, state in enumerate(states):
+            xs, ys = body_coordinates(state)
+            count = len(xs)
+            xs_list.append(xs)
+            ys_list.append(ys)
+            ages_list.append(np.arange(1, count + 1, dtype=np.float64) / count)
+            index_list.append(np.full(count, index, dtype=np.intp))
+
+        batch = np.concatenate(index_list)
+        columns = np.concatenate(xs_list) + self.border
+        rows = np.concatenate(ys_list) + self.border
+        ages = np.concatenate(ages_list)
+
+        # Game-over states may hold a head outside the tensor
+        inside = (
+            (columns >= 0)
+            & (columns < self.shape[2])
+            & (rows >= 0)
+            & (rows < self.shape[1])
+        )
+        out[batch[inside], BODY, rows[inside], columns[inside]] = ages[inside]
+
+        heads = (
+            np.array(
+                [(state.snake.head.x, state.snake.head.y) for state in states],
+                dtype=np.intp,
+            )
+            + self.border
+        )
+        foods = (
+            np.array(
+                [(state.food.position.x, state.food.position.y) for state in states],
+                dtype=np.intp,
+            )
+            + self.border
+        )
+        everyone = np.arange(len(states))
+        head_inside = (
+            (heads[:, 0] >= 0)
+            & (heads[:, 0] < self.shape[2])
+            & (heads[:, 1] >= 0)
+            & (heads[:, 1] < self.shape[1])
+        )
+        out[
+            everyone[head_inside], HEAD, heads[head_inside, 1], heads[head_inside, 0]
+        ] = 1
+        out[everyone, FOOD, foods[:, 1], foods[:, 0]] = 1
+        extra = [
+            (index, food.position.x, food.position.y)
+            for index, state in enumerate(states)
+            for food in state.extra_food
+        ]
+        if extra:
+            cells = np.array(extra, dtype=np.intp)
+            out[
+                cells[:, 0], FOOD, cells[:, 2] + self.border, cells[:, 1] + self.border
+            ] = 1
+        return out
+
+    def _output(self, out: Optional[np.ndarray], shape: Tuple[int, ...]) -> np.ndarray:
+        """Validate a caller buffer or allocate a new one.
+
+        Args:
+            out: Caller buffer, or None to allocate.
+            shape: Required shape.
+
+        Returns:
+            The buffer to write into.
+
+        Raises:
+            ValueError: If ``out`` has the wrong shape.
+        """
+        if out is None:
+            return np.zeros(shape, dtype=self.dtype)
+        if out.shape != shape:
+            raise ValueError(f"Output must have shape {shape}")
+        return out
@@ -0,0 +1,164 @@
+"""Offscreen renderer that draws frames into NumPy arrays.
+
+Requires the optional ``numpy`` dependency.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+from src.config.colors import Colors, DEFAULT_COLORS
+from src.models.game_state import GameState
+from src.renderer.renderer import Renderer
+
+
+def surface_for(frame: np.ndarray) -> pygame.Surface:
+    """Create a surface whose pixels live in a NumPy frame.
+
+    Drawing on the surface writes straight into the array (no copy).
+
+    Args:
+        frame: C-contiguous uint8 array of shape (H, W, 3).
+
+    Returns:
+        A 24-bit RGB surface backed by the array memory.
+
+    Raises:
+        ValueError: If the array cannot back a surface.
+    """
+    if frame.ndim != 3 or frame.shape[2] != 3 or frame.dtype != np.uint8:
+        raise ValueError("Frame must be a uint8 array of shape (H, W, 3)")
+    if not frame.flags.c_contiguous or not frame.flags.writeable:
+        raise ValueError("Frame must be a writeable C-contiguous array")
+    height, width = frame.shape[:2]
+    return pygame.image.frombuffer(frame, (width, height), "RGB")
+
+
+class OffscreenRenderer(Renderer):
+    """Renders game states into preallocated NumPy observation arrays.
+
+    Frames are (H, W, 3) uint8 RGB arrays with H = height * cell_size and
+    W = width * cell_size, so a cell size of 1 gives one pixel per cell.
+    The renderer draws on surfaces that share memory with the arrays,
+    so no frame is ever copied, and the display is never touched.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        cell_size: int = 1,
+        colors: Colors = DEFAULT_COLORS,
+        show_hud: bool = False,
+        out: Optional[np.ndarray] = None,
+    ) -> None:
+        """Initialize offscreen renderer.
+
+        Args:
+            width: Grid width (number of columns).
+            height: Grid height (number of rows).
+            cell_size: Size of each grid cell in pixels.
+            colors: Color scheme to use.
+            show_hud: If True, draw the score and status overlays.
+            out: Optional preallocated frame array of ``frame_shape``.
+
+        Raises:
+            ValueError: If ``out`` has the wrong shape or layout.
+        """
+        self.frame_shape: Tuple[int, int, int] = (
+            height * cell_size,
+            width * cell_size,
+            3,
+        )
+        if out is None:
+            out = np.zeros(self.frame_shape, dtype=np.uint8)
+        elif out.shape != self.frame_shape:
+            raise ValueError(f"Frame must have shape {self.frame_shape}")
+        self.frame = out
+        self.show_hud = show_hud
+        self._frame_surface = surface_for(out)
+        self._batch_buffer: Optional[np.ndarray] = None
+        self._batch_surfaces: List[pygame.Surface] = []
+        # Frames are drawn directly: every state in a batch is unrelated, so
+        # there is nothing for cached layers to reuse
+        super().__init__(
+            self._frame_surface, cell_size, colors, present=False, layered=False
+        )
+
+    def render(self, state: GameState) -> np.ndarray:
+        """Render a game state into the frame array.
+
+        Args:
+            state: The game state to render.
+
+        Returns:
+            The frame array (the same object on every call).
+        """
+        self.screen = self._frame_surface
+        super().render(state)
+        return self.frame
+
+    def render_batch(
+        self, states: Sequence[GameState], out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Render many game states into one (N, H, W, 3) array.
+
+        Args:
+            states: Game states to render (all with this renderer's grid).
+            out: Optional preallocated array of shape (N, H, W, 3).
+                Reusing the same array across calls also reuses its
+                surfaces.
+
+        Returns:
+            The batch array.
+
+        Raises:
+            ValueError: If ``out`` has the wrong shape or layout.
+        """
+        shape = (len(states),) + self.frame_shape
+        if out is None:
+            out = np.zeros(shape, dtype=np.uint8)
+        elif out.shape != shape:
+            raise ValueError(f"Batch must have shape {shape}")
+
+        for surface, state in zip(self._surfaces_for_batch(out), states):
+            self.screen = surface
+            Renderer.render(self, state)
+        self.screen = self._frame_surface
+        return out
+
+    def _surfaces_for_batch(self, batch: np.ndarray) -> List[pygame.Surface]:
+        """Get surfaces backed by each frame of a batch array.
+
+        Args:
+            batch: Array of shape (N, H, W, 3).
+
+        Returns:
+            One surface per frame.
+        """
+        if batch is not self._batch_buffer:
+            self._batch_surfaces = [surface_for(frame) for frame in batch]
+            self._batch_buffer = batch
+        return self._batch_surfaces
+
+    def _draw_score(self, state: GameState) -> None:
+        """Draw the score only when the HUD is enabled.
+
+        Args:
+            state: Game state containing score.
+        """
+        if self.show_hud:
+            super()._draw_score(state)
+
+    def _draw_text_centered(
+        self, text: str, font: pygame.font.Font, offset: int = 0
+    ) -> None:
+        """Draw overlay text only when the HUD is enabled.
+
+        Args:
+            text: Text to draw.
+            font: Font to use.
+            offset: Vertical offset from center.
+        """
+        if self.show_hud:
+            super()._draw_text_centered(text, font, offset)
@@ -1,29 +1,147 @@
 """Renderer for the Snake game."""
 
 import pygame
+from contextlib import contextmanager
 from src.models.game_state import GameState, GameStatus
+from src.models.position import Position
 from src.config.colors import Colors, DEFAULT_COLORS
-from typing import Tuple
+from src.renderer.cell_diff import changed_cells, tail_run_start
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
+if TYPE_CHECKING:
+    from src.renderer.frame_capture import FrameCapture
 
-class Renderer:
-    """Renders the game state to screen."""
+# Top-left corner of the score text
+SCORE_POSITION = (10, 10)
+
+# Below this cell size triangles and borders no longer fit, so cells are
+# drawn as solid blocks instead
+DETAIL_MIN_CELL_SIZE = 12
+
+
+class _LayerCanvas(pygame.Surface):
+    """Transparent drawing surface that remembers where it was drawn on.
+
+    Only ``blit`` and ``fill`` calls are tracked. ``pygame.draw``
+    functions are not, so layers drawn only with them fall back to
+    scanning the canvas for its bounding rectangle.
+    """
+
+    def __init__(self, size: Tuple[int, int]) -> None:
+        """Initialize an empty canvas.
+
+        Args:
+            size: Canvas size in pixels.
+        """
+        super().__init__(size, pygame.SRCALPHA)
+        self._drawn: Optional[pygame.Rect] = None
+
+    def blit(self, source, dest, area=None, special_flags=0) -> pygame.Rect:
+        """Blit and record the affected area."""
+        return self._track(super().blit(source, dest, area, special_flags))
+
+    def fill(self, color, rect=None, special_flags=0) -> pygame.Rect:
+        """Fill and record the affected area."""
+        return self._track(super().fill(color, rect, special_flags))
+
+    def clear(self) -> None:
+        """Make the drawn area transparent again and forget it."""
+        if self._drawn is not None:
+            super().fill((0, 0, 0, 0), self._drawn)
+            self._drawn = None
+
+    def drawn_rect(self) -> pygame.Rect:
+        """Get the area drawn on since the last clear.
+
+        Returns:
+            The union of all tracked areas, or the bounding rectangle of
+            the visible pixels if no drawing call was tracked.
+        """
+        if self._drawn is None:
+            self._track(self.get_bounding_rect())
+        return self._drawn or pygame.Rect(0, 0, 0, 0)
+
+    def _track(self, rect: pygame.Rect) -> pygame.Rect:
+        """Add an affected area to the drawn rectangle.
+
+        Args:
+            rect: Area returned by the drawing call.
 
-    def __init__(self, screen: pygame.Surface, cell_size: int, colors: Colors = DEFAULT_COLORS) -> None:
+        Returns:
+            The same area.
+        """
+        if rect.width and rect.height:
+            self._drawn = rect.copy() if self._drawn is None else self._drawn.union(rect)
+        return rect
+
+
+class Renderer:
+    """Renders the game state to screen.
+
+    By default frames are composited from cached layers, blitted once
+    each in this order:
+
+    - Playfield: the static background with the snake and food drawn on
+      top. The background is drawn once per screen size, and between
+      consecutive game ticks only the cells that changed are repainted
+      from it.
+    - HUD: the score, redrawn only when the score changes.
+    - Overlay: the pause or game over message, redrawn only when the
+      status changes.
+    """
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        cell_size: int,
+        colors: Colors = DEFAULT_COLORS,
+        present: bool = True,
+        layered: bool = True,
+        capture: Optional["FrameCapture"] = None,
+    ) -> None:
         """Initialize renderer.
 
         Args:
             screen: Pygame surface to render to.
             cell_size: Size of each grid cell in pixels.
             colors: Color scheme to use.
+            present: If True, flip the display after each frame. Disable
+                for surfaces that are never shown on screen.
+            layered: If True, composite frames from cached layers.
+                Otherwise draw everything onto the screen each frame.
+            capture: If given, every rendered frame is handed to it for
+                recording.
         """
         self.screen = screen
         self.cell_size = cell_size
         self.colors = colors
-
-        # Initialize pygame if not already initialized
-        if not pygame.get_init():
-            pygame.init()
+        self.present = present
+        self.layered = layered
+        self.capture = capture
+
+        # Layer caches, rebuilt when the screen size or their inputs change
+        self._background: Optional[pygame.Surface] = None
+        self._playfield: Optional[pygame.Surface] = None
+        self._drawn_state: Optional[GameState] = None
+        self._hud: Optional[Tuple[pygame.Surface, Tuple[int, int]]] = None
+        self._hud_key: Optional[int] = None
+        self._overlay: Optional[Tuple[pygame.Surface, Tuple[int, int]]] = None
+        self._overlay_key: Optional[GameStatus] = None
+        # Areas the overlay dims, and where dimmed areas go while a layer
+        # is being drawn (None when drawing straight onto the screen)
+        self._overlay_backdrops: List[pygame.Rect] = []
+        self._backdrops: Optional[List[pygame.Rect]] = None
+        self._layout: Optional[Tuple[Tuple[int, int], Tuple[int, int], int]] = None
+        self._layer_canvas: Optional[_LayerCanvas] = None
+
+        # Pixel center of each grid column/row index, for the cell size
+        # the table was built with
+        self._centers: Dict[int, int] = {}
+        self._centers_cell_size = cell_size
+
+        # Initialize fonts if not already initialized (no other subsystems)
+        if not pygame.font.get_init():
+            pygame.font.init()
 
         # Initialize font
         try:
@@ -37,6 +155,23 @@ class Renderer:
     def render(self, state: GameState) -> None:
         """Render the current game state.
 
+        Args:
+            state: The game state to render.
+        """
+        if self.layered:
+            self._render_layers(state)
+        else:
+            self._render_direct(state)
+
+        if self.capture is not None:
+            self.capture.submit(self.screen)
+
+        if self.present:
+            self._present()
+
+    def _render_direct(self, state: GameState) -> None:
+        """Draw every element of a frame straight onto the screen.
+
         Args:
             state: The game state to render.
         """
@@ -46,6 +181,8 @@ class Renderer:
         # Draw game elements
         self._draw_snake(state.snake)
         self._draw_food(state.food)
+        for food in state.extra_food:
+            self._draw_food(food)
         self._draw_score(state)
 
         # Draw overlay if paused or game over
@@ -55,6 +192,235 @@ class Renderer:
             self._draw_text_centered("GAME OVER", self.large_font)
             self._draw_text_centered("Press R to Restart", self.font, offset=50)
 
+    def _render_layers(self, state: GameState) -> None:
+        """Composite a frame from the cached layers.
+
+        Args:
+            state: The game state to render.
+        """
+        layout = (self.screen.get_size(), self._playfield_size(state), self.cell_size)
+        if layout != self._layout:
+            self._build_background(layout[1])
+            self._layout = layout
+            self._layout_changed()
+
+        self._update_playfield(state)
+        self._composite_playfield()
+
+        if self._hud_key != state.score:
+            self._hud = self._build_layer(lambda: self._draw_score(state))
+            self._hud_key = state.score
+        if self._hud is not None:
+            self.screen.blit(*self._hud)
+
+        if self._overlay_key != state.status:
+            self._overlay_backdrops = []
+            self._overlay = self._build_layer(
+                lambda: self._draw_overlay(state), self._overlay_backdrops
+            )
+            self._overlay_key = state.status
+        for rect in self._overlay_backdrops:
+            self._draw_backdrop(rect)
+        if self._overlay is not None:
+            self.screen.blit(*self._overlay)
+
+    def _playfield_size(self, state: GameState) -> Tuple[int, int]:
+        """Get the pixel size of the playfield layer.
+
+        Args:
+            state: The game state to render.
+
+        Returns:
+            Tuple of (width, height); the screen size by default.
+        """
+        return self.screen.get_size()
+
+    def _layout_changed(self) -> None:
+        """React to a new screen size, playfield size or cell size."""
+
+    def _composite_playfield(self) -> None:
+        """Copy the playfield layer onto the screen."""
+        self.screen.blit(self._playfield, (0, 0))
+
+    def _build_background(self, size: Tuple[int, int]) -> None:
+        """Draw the static background and reset the other layers.
+
+        Args:
+            size: Playfield size in pixels.
+        """
+        # Match the screen pixel format so layer blits are plain copies
+        self._background = pygame.Surface(size, 0, self.screen)
+        self._playfield = pygame.Surface(size, 0, self.screen)
+        with self._drawing_on(self._background):
+            self._draw_background()
+        self._drawn_state = None
+        self._hud_key = None
+        self._overlay_key = None
+
+    def _draw_background(self) -> None:
+        """Draw everything that does not change during a game."""
+        self.screen.fill(self.colors.BACKGROUND)
+
+    def _update_playfield(self, state: GameState) -> None:
+        """Bring the playfield layer up to date with a game state.
+
+        Args:
+            state: The game state to show.
+        """
+        previous = self._drawn_state
+        if previous is state:
+            return
+
+        with self._drawing_on(self._playfield):
+            cells = self._changed_cells(previous, state)
+            if cells is None:
+                self.screen.blit(self._background, (0, 0))
+                self._draw_snake(state.snake)
+                self._draw_food(state.food)
+                for food in state.extra_food:
+                    self._draw_food(food)
+            else:
+                for cell in cells:
+                    self._redraw_cell(cell, state)
+        self._drawn_state = state
+
+    def _changed_cells(
+        self, previous: Optional[GameState], state: GameState
+    ) -> Optional[Set[Position]]:
+        """Find the grid cells that differ between two drawn states.
+
+        Args:
+            previous: State currently drawn on the playfield, if any.
+            state: State to draw next.
+
+        Returns:
+            Cells to repaint, or None if the playfield must be redrawn.
+        """
+        return changed_cells(previous, state)
+
+    def _redraw_cell(self, cell: Position, state: GameState) -> None:
+        """Repaint one grid cell of the playfield from scratch.
+
+        Drawing is clipped to the cell, so connection lines are drawn
+        only up to the cell border, exactly as a full redraw would.
+        Assumes the snake does not overlap itself apart from duplicated
+        tail segments.
+
+        Args:
+            cell: Grid cell to repaint.
+            state: The game state being drawn.
+        """
+        rect = pygame.Rect(self._cell_to_rect(cell))
+        self.screen.set_clip(rect)
+        self.screen.blit(self._background, rect, rect)
+
+        body = state.snake.body
+        last = len(body) - 1
+        indices = self._segments_in_cell(cell, state)
+        if indices and self.cell_size < DETAIL_MIN_CELL_SIZE:
+            color = self.colors.SNAKE_HEAD if 0 in indices else self.colors.SNAKE_BODY
+            self.screen.fill(color, rect)
+            indices = []
+        for i in indices:
+            if i > 0:
+                self._draw_connection(body[i - 1], body[i])
+            if i < last:
+                self._draw_connection(body[i], body[i + 1])
+        for i in indices:
+            color = self.colors.SNAKE_HEAD if i == 0 else self.colors.SNAKE_BODY
+            self._draw_triangle_segment(body[i], color)
+        food = state.food_at(cell)
+        if food is not None:
+            self._draw_food(food)
+
+        self.screen.set_clip(None)
+
+    def _segments_in_cell(self, cell: Position, state: GameState) -> List[int]:
+        """Find the snake segments drawn in a changed cell.
+
+        Only the head, the neck and the tail run can occupy a changed
+        cell (see ``_changed_cells``), so only those are checked.
+
+        Args:
+            cell: Grid cell.
+            state: The game state being drawn.
+
+        Returns:
+            Segment indices in drawing order.
+        """
+        body = state.snake.body
+        if cell not in body:
+            return []
+        indices = [i for i in (0, 1) if i < len(body) and body[i] == cell]
+        if body.tail == cell:
+            indices.extend(range(max(tail_run_start(body), 2), len(body)))
+        return indices
+
+    def _draw_overlay(self, state: GameState) -> None:
+        """Draw the status message, if the game is paused or over.
+
+        Args:
+            state: The game state to render.
+        """
+        if state.status == GameStatus.PAUSED:
+            self._draw_text_centered("PAUSED", self.large_font)
+        elif state.status == GameStatus.GAME_OVER:
+            self._draw_text_centered("GAME OVER", self.large_font)
+            self._draw_text_centered("Press R to Restart", self.font, offset=50)
+
+    def _build_layer(
+        self,
+        draw: Callable[[], None],
+        backdrops: Optional[List[pygame.Rect]] = None,
+    ) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Draw onto a transparent layer and crop it to what was drawn.
+
+        Args:
+            draw: Callback drawing onto ``self.screen``.
+            backdrops: Collects the areas ``draw`` dims instead of
+                drawing them on the layer; required if it dims any.
+
+        Returns:
+            Tuple of (surface, top-left position) ready to blit, or None
+            if nothing was drawn.
+        """
+        size = self.screen.get_size()
+        canvas = self._layer_canvas
+        if canvas is None or canvas.get_size() != size:
+            canvas = self._layer_canvas = _LayerCanvas(size)
+        canvas.clear()
+        self._backdrops = backdrops
+        try:
+            with self._drawing_on(canvas):
+                draw()
+        finally:
+            self._backdrops = None
+
+        # Cropping to the tracked area avoids scanning the whole canvas
+        bounds = canvas.drawn_rect()
+        if bounds.width == 0 or bounds.height == 0:
+            return None
+        return canvas.subsurface(bounds).copy(), bounds.topleft
+
+    @contextmanager
+    def _drawing_on(self, surface: pygame.Surface) -> Iterator[pygame.Surface]:
+        """Temporarily point the drawing methods at another surface.
+
+        Args:
+            surface: Surface to draw on.
+
+        Yields:
+            The surface.
+        """
+        screen = self.screen
+        self.screen = surface
+        try:
+            yield surface
+        finally:
+            self.screen = screen
+
+    def _present(self) -> None:
+        """Show the rendered frame on the display."""
         # Update display only if screen is the actual display
         try:
             pygame.display.flip()
@@ -65,9 +431,15 @@ class Renderer:
     def _draw_snake(self, snake) -> None:
         """Draw the snake as connected triangles.
 
+        Cells smaller than DETAIL_MIN_CELL_SIZE are drawn as solid blocks.
+
         Args:
             snake: The snake to draw.
         """
+        if self.cell_size < DETAIL_MIN_CELL_SIZE:
+            self._draw_snake_blocks(snake)
+            return
+
         # First draw connecting lines (so they appear behind triangles)
         self._draw_snake_connections(snake)
 
@@ -76,6 +448,20 @@ class Renderer:
             color = self.colors.SNAKE_HEAD if i == 0 else self.colors.SNAKE_BODY
             self._draw_triangle_segment(segment, color)
 
+    def _draw_snake_blocks(self, snake) -> None:
+        """Draw the snake as solid cells.
+
+        Args:
+            snake: The snake to draw.
+        """
+        fill = self.screen.fill
+        size = self.cell_size
+        body_color = self.colors.SNAKE_BODY
+        for segment in snake.body:
+            fill(body_color, (segment.x * size, segment.y * size, size, size))
+        head = snake.head
+        fill(self.colors.SNAKE_HEAD, (head.x * size, head.y * size, size, size))
+
     def _draw_triangle_segment(self, position, color) -> None:
         """Draw a single triangle segment.
 
@@ -106,28 +492,89 @@ class Renderer:
     def _draw_snake_connections(self, snake) -> None:
         """Draw connecting lines between snake segments.
 
+        The whole snake is drawn as one polyline, which produces the same
+        pixels as a line per segment pair in a single draw call.
+
         Args:
             snake: The snake whose connections to draw.
         """
         if len(snake.body) < 2:
             return
 
-        for i in range(len(snake.body) - 1):
-            current_pos = snake.body[i]
-            next_pos = snake.body[i + 1]
-
-            # Calculate center points of both triangles
-            center1 = self._get_triangle_center(current_pos)
-            center2 = self._get_triangle_center(next_pos)
-
-            # Draw connecting line
-            pygame.draw.line(
-                self.screen,
-                self.colors.SNAKE_BORDER,
-                center1,
-                center2,
-                3  # Line width
+        pygame.draw.lines(
+            self.screen,
+            self.colors.SNAKE_BORDER,
+            False,
+            self._segment_centers(snake.body),
+            3  # Line width
+        )
+
+    def _segment_centers(self, body) -> List[Tuple[int, int]]:
+        """Get the pixel centers of all segments.
+
+        Args:
+            body: Snake body.
+
+        Returns:
+            List of (x, y) pixel centers, head first.
+        """
+        coordinates = body.coordinates()
+        center = self._center_table().__getitem__
+        try:
+            points = list(
+                zip(map(center, coordinates[0::2]), map(center, coordinates[1::2]))
             )
+        except KeyError:
+            self._center_table(min(coordinates), max(coordinates))
+            return self._segment_centers(body)
+
+        points.reverse()
+        # Duplicated tail segments are left out of coordinates()
+        points.extend([points[-1]] * (len(body) - len(points)))
+        return points
+
+    def _center_table(self, low: int = 0, high: int = 0) -> Dict[int, int]:
+        """Get the table mapping grid indices to pixel centers.
+
+        The table is rebuilt when the cell size changes and widened to
+        cover ``low``..``high`` (and the off-board index -1) on request.
+
+        Args:
+            low: Smallest grid index the table must hold.
+            high: Largest grid index the table must hold.
+
+        Returns:
+            Dict from column or row index to its center pixel coordinate.
+        """
+        if self._centers_cell_size != self.cell_size:
+            self._centers = {}
+            self._centers_cell_size = self.cell_size
+        table = self._centers
+        if low not in table or high not in table:
+            half = self.cell_size // 2
+            for index in range(min(low, -1), high + 1):
+                table[index] = index * self.cell_size + half
+        return table
+
+    def _draw_connection(self, start, end) -> None:
+        """Draw the connecting line between two segments.
+
+        Args:
+            start: Grid position of one segment.
+            end: Grid position of the other segment.
+        """
+        # Calculate center points of both triangles
+        center1 = self._get_triangle_center(start)
+        center2 = self._get_triangle_center(end)
+
+        # Draw connecting line
+        pygame.draw.line(
+            self.screen,
+            self.colors.SNAKE_BORDER,
+            center1,
+            center2,
+            3  # Line width
+        )
 
     def _get_triangle_center(self, position) -> Tuple[int, int]:
         """Calculate the center point of a triangle at this position.
@@ -147,6 +594,10 @@ class Renderer:
         Args:
             food: The food to draw.
         """
+        if self.cell_size < DETAIL_MIN_CELL_SIZE:
+            self.screen.fill(self.colors.FOOD, self._cell_to_rect(food.position))
+            return
+
         x, y, width, height = self._cell_to_rect(food.position)
 
         # Draw food as a circle
@@ -192,13 +643,26 @@ class Renderer:
 
         # Draw with semi-transparent background
         bg_rect = rect.inflate(20, 20)
-        s = pygame.Surface((bg_rect.width, bg_rect.height))
-        s.set_alpha(128)
-        s.fill((0, 0, 0))
-        self.screen.blit(s, bg_rect.topleft)
+        if self._backdrops is not None:
+            # A transparent layer cannot hold a dimming box, so it is
+            # drawn onto the screen when the layer is composited
+            self._backdrops.append(bg_rect)
+        else:
+            self._draw_backdrop(bg_rect)
 
         self.screen.blit(text_surface, rect)
 
+    def _draw_backdrop(self, rect: pygame.Rect) -> None:
+        """Dim an area of the screen behind overlay text.
+
+        Args:
+            rect: Area to dim.
+        """
+        s = pygame.Surface((rect.width, rect.height))
+        s.set_alpha(128)
+        s.fill((0, 0, 0))
+        self.screen.blit(s, rect.topleft)
+
     def _cell_to_rect(self, position) -> Tuple[int, int, int, int]:
         """Convert grid position to pixel rectangle.
 
@@ -0,0 +1,108 @@
+"""Low-resolution renderer that upscales the board to the window."""
+
+from typing import List, Optional, Tuple
+
+import pygame
+from src.config.colors import Colors, DEFAULT_COLORS
+from src.models.game_state import GameState
+from src.renderer.renderer import Renderer
+
+
+def fit_rect(content: Tuple[int, int], window: Tuple[int, int]) -> pygame.Rect:
+    """Find where to show content scaled to fit a window.
+
+    Content is scaled by the largest whole factor that fits, so every
+    cell becomes the same number of pixels. Content larger than the
+    window is shrunk to fit instead. The result keeps the aspect ratio
+    and is centered.
+
+    Args:
+        content: Content size in pixels.
+        window: Window size in pixels.
+
+    Returns:
+        The target rectangle inside the window.
+    """
+    scale = min(window[0] / content[0], window[1] / content[1])
+    if scale >= 1:
+        scale = int(scale)
+    size = (max(1, int(content[0] * scale)), max(1, int(content[1] * scale)))
+    rect = pygame.Rect((0, 0), size)
+    rect.center = (window[0] // 2, window[1] // 2)
+    return rect
+
+
+class ScaledRenderer(Renderer):
+    """Draws the board at a few pixels per cell and upscales it.
+
+    The playfield layer is only ``grid * cell_size`` pixels, so drawing
+    the snake costs the same whatever the window size. Each frame the
+    layer is scaled to the window with ``pygame.transform.scale``
+    (nearest neighbour, so cells stay sharp), letterboxed to keep square
+    cells. The score and overlays are drawn at window resolution, so
+    text stays readable.
+
+    The fit is recomputed whenever the screen size changes, so the
+    renderer follows resizable windows.
+    """
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        cell_size: int = 1,
+        colors: Colors = DEFAULT_COLORS,
+        present: bool = True,
+    ) -> None:
+        """Initialize scaled renderer.
+
+        Args:
+            screen: Pygame surface to render to (usually the window).
+            cell_size: Size of each grid cell in the low-resolution
+                playfield, in pixels.
+            colors: Color scheme to use.
+            present: If True, flip the display after each frame.
+        """
+        super().__init__(screen, cell_size, colors, present=present)
+        self.board_rect = pygame.Rect(0, 0, 0, 0)
+        self._board_target: Optional[pygame.Surface] = None
+        self._margins: List[pygame.Rect] = []
+
+    def _playfield_size(self, state: GameState) -> Tuple[int, int]:
+        """Get the low-resolution board size.
+
+        Args:
+            state: The game state to render.
+
+        Returns:
+            Tuple of (width, height) in pixels.
+        """
+        return (state.width * self.cell_size, state.height * self.cell_size)
+
+    def _layout_changed(self) -> None:
+        """Fit the board into the screen and find the margins around it."""
+        width, height = self.screen.get_size()
+        board = fit_rect(self._playfield.get_size(), (width, height))
+        self.board_rect = board
+        self._board_target = self.screen.subsurface(board)
+        self._margins = [
+            rect
+            for rect in (
+                pygame.Rect(0, 0, width, board.top),
+                pygame.Rect(0, board.bottom, width, height - board.bottom),
+                pygame.Rect(0, board.top, board.left, board.height),
+                pygame.Rect(board.right, board.top, width - board.right, board.height),
+            )
+            if rect.width > 0 and rect.height > 0
+        ]
+
+    def _composite_playfield(self) -> None:
+        """Scale the playfield onto the screen and clear the margins.
+
+        Margins are cleared every frame because the HUD and overlay
+        layers may be blended over them.
+        """
+        for margin in self._margins:
+            self.screen.fill(self.colors.BACKGROUND, margin)
+        pygame.transform.scale(
+            self._playfield, self.board_rect.size, self._board_target
+        )
@@ -0,0 +1,266 @@
+"""Tiled view that shows many games in one window."""
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pygame
+from src.config.colors import Colors, DEFAULT_COLORS
+from src.models.food import Food
+from src.models.game_state import GameState
+from src.models.position import Position
+from src.renderer.renderer import DETAIL_MIN_CELL_SIZE, Renderer
+
+# Pixels between neighbouring tiles
+TILE_GAP = 2
+
+# Sprites are drawn in the top-left cell
+_ORIGIN = Position(x=0, y=0)
+
+# Key of a cached sprite: (sprite kind, cell size, fill color)
+SpriteKey = Tuple[str, int, Tuple[int, int, int]]
+
+
+class SpriteCache:
+    """Pre-drawn cell sprites shared by every tile of a view.
+
+    Sprites are transparent apart from the shape itself, so blitting
+    one gives the same pixels as drawing the shape in place.
+    """
+
+    def __init__(self, colors: Colors = DEFAULT_COLORS) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            colors: Color scheme of the sprites.
+        """
+        self.colors = colors
+        self._sprites: Dict[SpriteKey, pygame.Surface] = {}
+
+    def segment(self, cell_size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Get a bordered snake triangle.
+
+        Args:
+            cell_size: Size of a grid cell in pixels.
+            color: Triangle fill color.
+
+        Returns:
+            Sprite of one cell.
+        """
+        key = ("segment", cell_size, color)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = self._draw(
+                cell_size,
+                lambda renderer: renderer._draw_triangle_segment(_ORIGIN, color),
+            )
+        return sprite
+
+    def food(self, cell_size: int) -> pygame.Surface:
+        """Get a food item.
+
+        Args:
+            cell_size: Size of a grid cell in pixels.
+
+        Returns:
+            Sprite of one cell.
+        """
+        key = ("food", cell_size, self.colors.FOOD)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = self._draw(
+                cell_size,
+                lambda renderer: renderer._draw_food(Food(position=_ORIGIN)),
+            )
+        return sprite
+
+    def _draw(self, cell_size: int, draw) -> pygame.Surface:
+        """Draw a sprite with the plain renderer's drawing code.
+
+        Args:
+            cell_size: Size of a grid cell in pixels.
+            draw: Callback drawing the shape at the origin cell.
+
+        Returns:
+            The transparent sprite.
+        """
+        sprite = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
+        draw(Renderer(sprite, cell_size, self.colors, present=False))
+        return sprite
+
+
+class TileRenderer(Renderer):
+    """Renderer for one tile of a tiled view.
+
+    Snake segments and food are blitted from a shared sprite cache
+    instead of being drawn shape by shape, and the view decides when
+    the display is updated.
+    """
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        cell_size: int,
+        sprites: SpriteCache,
+        colors: Colors = DEFAULT_COLORS,
+    ) -> None:
+        """Initialize tile renderer.
+
+        Args:
+            screen: Subsurface of the window covering the tile.
+            cell_size: Size of each grid cell in pixels.
+            sprites: Sprite cache shared with the other tiles.
+            colors: Color scheme to use.
+        """
+        super().__init__(screen, cell_size, colors, present=False)
+        self.sprites = sprites
+
+    def _draw_triangle_segment(self, position, color) -> None:
+        """Blit a cached snake triangle.
+
+        Args:
+            position: Grid position of the segment.
+            color: Triangle fill color.
+        """
+        sprite = self.sprites.segment(self.cell_size, color)
+        self.screen.blit(sprite, self._cell_to_rect(position))
+
+    def _draw_food(self, food) -> None:
+        """Blit cached food.
+
+        Args:
+            food: The food to draw.
+        """
+        rect = self._cell_to_rect(food.position)
+        if self.cell_size < DETAIL_MIN_CELL_SIZE:
+            self.screen.fill(self.colors.FOOD, rect)
+            return
+        self.screen.blit(self.sprites.food(self.cell_size), rect)
+
+
+def tile_grid(count: int) -> Tuple[int, int]:
+    """Find the most square grid of tiles holding a number of games.
+
+    Args:
+        count: Number of games.
+
+    Returns:
+        Tuple of (columns, rows).
+    """
+    columns = max(1, math.ceil(math.sqrt(count)))
+    return columns, max(1, math.ceil(count / columns))
+
+
+class TiledView:
+    """Draws many games side by side in one window.
+
+    Every game gets a tile, a subsurface of the screen with its own
+    layered ``TileRenderer``, so a tile only repaints the cells that
+    changed. Tiles whose game has not advanced are skipped entirely,
+    and only the rectangles of the tiles that were redrawn are pushed
+    to the display.
+    """
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        count: int,
+        grid_width: int,
+        grid_height: int,
+        colors: Colors = DEFAULT_COLORS,
+        present: bool = True,
+    ) -> None:
+        """Initialize tiled view.
+
+        Args:
+            screen: Pygame surface to render to (usually the window).
+            count: Number of games to show.
+            grid_width: Board width of every game, in cells.
+            grid_height: Board height of every game, in cells.
+            colors: Color scheme to use.
+            present: If True, update the redrawn tiles on the display.
+        """
+        self.screen = screen
+        self.colors = colors
+        self.present = present
+        self.sprites = SpriteCache(colors)
+        self.columns, self.rows = tile_grid(count)
+
+        width, height = screen.get_size()
+        tile_width = (width - TILE_GAP * (self.columns - 1)) // self.columns
+        tile_height = (height - TILE_GAP * (self.rows - 1)) // self.rows
+        self.cell_size = max(
+            1, min(tile_width // grid_width, tile_height // grid_height)
+        )
+        board = (grid_width * self.cell_size, grid_height * self.cell_size)
+
+        # One small font pair for all tiles instead of full-size fonts each
+        font_size = max(12, board[1] // 8)
+        try:
+            font = pygame.font.Font(None, font_size)
+            large_font = pygame.font.Font(None, font_size * 2)
+        except pygame.error:
+            font = large_font = None
+
+        self.tiles: List[pygame.Rect] = []
+        self.renderers: List[TileRenderer] = []
+        for index in range(count):
+            row, column = divmod(index, self.columns)
+            rect = pygame.Rect(
+                column * (tile_width + TILE_GAP),
+                row * (tile_height + TILE_GAP),
+                *board,
+            )
+            renderer = TileRenderer(
+                screen.subsurface(rect), self.cell_size, self.sprites, colors
+            )
+            renderer.font = font
+            renderer.large_font = large_font
+            self.tiles.append(rect)
+            self.renderers.append(renderer)
+
+        self._rendered: List[Optional[GameState]] = [None] * count
+        self._cleared = False
+
+    def render(self, states: Sequence[GameState]) -> List[pygame.Rect]:
+        """Redraw the tiles whose game state changed.
+
+        Args:
+            states: Current state of every game, in tile order.
+
+        Returns:
+            Screen rectangles that were redrawn.
+        """
+        dirty: List[pygame.Rect] = []
+        if not self._cleared:
+            self.screen.fill(self.colors.BACKGROUND)
+            dirty.append(self.screen.get_rect())
+            self._cleared = True
+
+        for index, state in enumerate(states):
+            # States are immutable, so identity means unchanged
+            if state is self._rendered[index]:
+                continue
+            self.renderers[index].render(state)
+            self._rendered[index] = state
+            dirty.append(self.tiles[index])
+
+        if self.present and dirty:
+            self._present(dirty)
+        return dirty
+
+    def invalidate(self) -> None:
+        """Redraw the whole screen on the next frame."""
+        self._rendered = [None] * len(self._rendered)
+        self._cleared = False
+
+    def _present(self, dirty: List[pygame.Rect]) -> None:
+        """Show the redrawn areas on the display.
+
+        Args:
+            dirty: Screen rectangles to update.
+        """
+        try:
+            pygame.display.update(dirty)
+        except pygame.error:
+            # Screen is not the actual display (e.g., in tests)
+            pass
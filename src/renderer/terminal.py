@@ -0,0 +1,224 @@
+"""Renderer that draws the board in a terminal with ANSI escape codes.
+
+Does not use pygame, so it works over SSH on machines without a display.
+"""
+
+from typing import Dict, List, Optional, Set, TextIO, Tuple
+
+from src.config.colors import Colors, DEFAULT_COLORS
+from src.models.game_state import GameState, GameStatus
+from src.models.position import Position
+from src.renderer.cell_diff import changed_cells
+
+# Control sequences
+CSI = "\x1b["
+CLEAR_SCREEN = CSI + "2J"
+HIDE_CURSOR = CSI + "?25l"
+SHOW_CURSOR = CSI + "?25h"
+RESET = CSI + "0m"
+
+# Terminal characters are about twice as tall as wide, so every cell is
+# two characters wide to look square
+CELL_WIDTH = 2
+
+# Status line text per game status
+STATUS_TEXT = {
+    GameStatus.PLAYING: "",
+    GameStatus.PAUSED: "PAUSED",
+    GameStatus.GAME_OVER: "GAME OVER - Press R to Restart",
+}
+
+
+def _background(color: Tuple[int, ...]) -> str:
+    """Get the escape sequence selecting a 24-bit background color.
+
+    Args:
+        color: RGB color.
+
+    Returns:
+        SGR control sequence.
+    """
+    red, green, blue = color[:3]
+    return f"{CSI}48;2;{red};{green};{blue}m"
+
+
+class TerminalRenderer:
+    """Draws game states as colored blocks in a terminal.
+
+    The first frame paints the whole board. After that only cells whose
+    contents changed are written, each preceded by a cursor move, and the
+    score and status lines are rewritten only when they change. Between
+    consecutive ticks that is the new head, the old head and the tail,
+    so a frame costs a few dozen bytes whatever the board size.
+    """
+
+    def __init__(self, stream: TextIO, colors: Colors = DEFAULT_COLORS) -> None:
+        """Initialize terminal renderer.
+
+        Args:
+            stream: Terminal output stream (usually ``sys.stdout``).
+            colors: Color scheme to use.
+        """
+        self.stream = stream
+        self.colors = colors
+        self.bytes_written = 0
+        self._cell_styles: Dict[str, str] = {
+            "head": _background(colors.SNAKE_HEAD),
+            "body": _background(colors.SNAKE_BODY),
+            "food": _background(colors.FOOD),
+        }
+        self._empty_style = _background(colors.BACKGROUND)
+        self._border_style = _background(colors.GRID)
+
+        # What is currently on the terminal
+        self._size: Optional[Tuple[int, int]] = None
+        self._drawn_state: Optional[GameState] = None
+        self._drawn: Dict[Position, str] = {}
+        self._score: Optional[int] = None
+        self._status: Optional[GameStatus] = None
+
+        # Cursor position and style after the last write
+        self._cursor: Optional[Tuple[int, int]] = None
+        self._style: Optional[str] = None
+
+    def render(self, state: GameState) -> None:
+        """Write the changes since the previous frame.
+
+        Args:
+            state: The game state to render.
+        """
+        out: List[str] = []
+        if (state.width, state.height) != self._size:
+            self._paint_board(state, out)
+            cells: Optional[Set[Position]] = None
+        else:
+            cells = changed_cells(self._drawn_state, state)
+        if cells is None:
+            # Unrelated state: revisit everything drawn and to be drawn
+            cells = set(self._drawn)
+            cells.update(state.snake.body)
+            cells.add(state.food.position)
+            cells.update(food.position for food in state.extra_food)
+
+        width, height = state.width, state.height
+        for cell in sorted(cells, key=lambda cell: (cell.y, cell.x)):
+            if not (0 <= cell.x < width and 0 <= cell.y < height):
+                # A head that died in the wall; the border stays as it is
+                continue
+            kind = self._cell_kind(cell, state)
+            if kind != self._drawn.get(cell):
+                self._write_cell(cell, kind, out)
+        self._drawn_state = state
+
+        if state.score != self._score:
+            self._write_line(state.height + 3, f"Score: {state.score}", out)
+            self._score = state.score
+        if state.status != self._status:
+            self._write_line(state.height + 4, STATUS_TEXT[state.status], out)
+            self._status = state.status
+
+        self._flush(out)
+
+    def close(self) -> None:
+        """Restore the terminal and move the cursor below the board."""
+        out = [RESET]
+        if self._size is not None:
+            out.append(f"{CSI}{self._size[1] + 5};1H")
+        out.append(SHOW_CURSOR)
+        self._flush(out)
+        self._cursor = None
+        self._style = None
+
+    def _cell_kind(self, cell: Position, state: GameState) -> Optional[str]:
+        """Find what occupies a cell.
+
+        Args:
+            cell: Grid cell.
+            state: The game state being drawn.
+
+        Returns:
+            ``"head"``, ``"body"`` or ``"food"``, or None if empty.
+        """
+        snake = state.snake
+        if snake.head == cell:
+            return "head"
+        if cell in snake.body:
+            return "body"
+        if state.food_at(cell) is not None:
+            return "food"
+        return None
+
+    def _paint_board(self, state: GameState, out: List[str]) -> None:
+        """Clear the terminal and draw the empty board with its border.
+
+        Args:
+            state: The game state being drawn.
+            out: Output buffer.
+        """
+        width, height = state.width, state.height
+        edge = " " * (CELL_WIDTH * (width + 2))
+        inside = " " * (CELL_WIDTH * width)
+        side = " " * CELL_WIDTH
+        out.append(RESET + CLEAR_SCREEN + HIDE_CURSOR)
+        out.append(f"{CSI}1;1H{self._border_style}{edge}")
+        for row in range(2, height + 2):
+            out.append(
+                f"{CSI}{row};1H{self._border_style}{side}"
+                f"{self._empty_style}{inside}{self._border_style}{side}"
+            )
+        out.append(f"{CSI}{height + 2};1H{self._border_style}{edge}{RESET}")
+        self._size = (width, height)
+        self._drawn = {}
+        self._drawn_state = None
+        self._score = None
+        self._status = None
+        self._cursor = None
+        self._style = None
+
+    def _write_cell(self, cell: Position, kind: Optional[str], out: List[str]) -> None:
+        """Write one cell, skipping cursor moves and styles already set.
+
+        Args:
+            cell: Grid cell (inside the border).
+            kind: What occupies the cell, or None if empty.
+            out: Output buffer.
+        """
+        row = cell.y + 2
+        column = (cell.x + 1) * CELL_WIDTH + 1
+        if self._cursor != (row, column):
+            out.append(f"{CSI}{row};{column}H")
+        style = self._cell_styles[kind] if kind else self._empty_style
+        if style != self._style:
+            out.append(style)
+            self._style = style
+        out.append(" " * CELL_WIDTH)
+        self._cursor = (row, column + CELL_WIDTH)
+        if kind:
+            self._drawn[cell] = kind
+        else:
+            self._drawn.pop(cell, None)
+
+    def _write_line(self, row: int, text: str, out: List[str]) -> None:
+        """Replace a text line below the board.
+
+        Args:
+            row: Terminal row (1-based).
+            text: New line contents.
+            out: Output buffer.
+        """
+        out.append(f"{CSI}{row};1H{RESET}{CSI}2K{text}")
+        self._cursor = None
+        self._style = None
+
+    def _flush(self, out: List[str]) -> None:
+        """Write the buffered output in one call.
+
+        Args:
+            out: Output buffer.
+        """
+        if not out:
+            return
+        data = "".join(out)
+        self.stream.write(data)
+        self.stream.flush()
+        self.bytes_written += len(data)
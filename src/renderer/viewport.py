@@ -0,0 +1,474 @@
+"""Camera view of large boards with culling and a minimap.
+
+Only the cells around the snake head are drawn. The snake body is
+indexed by square chunks of cells, so finding the visible segments
+costs time proportional to the view, not to the snake length.
+"""
+
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+import pygame
+from src.config.colors import Colors, DEFAULT_COLORS
+from src.models.game_state import GameState
+from src.models.position import Position
+from src.models.snake_body import SnakeBody
+from src.renderer.cell_diff import tail_run_start
+from src.renderer.renderer import DETAIL_MIN_CELL_SIZE, Renderer
+
+Chunk = Tuple[int, int]
+
+# Default side of a spatial index chunk, in cells
+CHUNK_SIZE = 32
+
+# Default longest side of the minimap, in pixels
+MINIMAP_SIZE = 150
+
+
+class Camera:
+    """Rectangle of cells shown on screen, following a target cell.
+
+    The camera stays put while the target is inside the view, away from
+    its edges by at least ``margin`` cells. When the target leaves that
+    zone the camera recenters on it. Keeping the view still between
+    jumps lets the renderer repaint only the changed cells on most ticks.
+
+    Attributes:
+        left: Leftmost visible column.
+        top: Topmost visible row.
+        columns: Number of visible columns.
+        rows: Number of visible rows.
+        margin: Distance from the view edge that triggers a recenter.
+    """
+
+    def __init__(self, columns: int, rows: int, margin: Optional[int] = None) -> None:
+        """Initialize a camera at the top-left of the board.
+
+        Args:
+            columns: Number of visible columns.
+            rows: Number of visible rows.
+            margin: Recenter distance in cells. Defaults to a quarter of
+                the smaller view side.
+        """
+        self.left = 0
+        self.top = 0
+        self.columns = columns
+        self.rows = rows
+        self.margin = min(columns, rows) // 4 if margin is None else margin
+
+    def follow(self, target: Position, grid_width: int, grid_height: int) -> bool:
+        """Move the view if the target got too close to its edge.
+
+        Args:
+            target: Cell to keep in view (usually the snake head).
+            grid_width: Board width in cells.
+            grid_height: Board height in cells.
+
+        Returns:
+            True if the view moved.
+        """
+        left = self._axis(target.x, self.left, self.columns, grid_width)
+        top = self._axis(target.y, self.top, self.rows, grid_height)
+        moved = (left, top) != (self.left, self.top)
+        self.left, self.top = left, top
+        return moved
+
+    def _axis(self, target: int, start: int, span: int, limit: int) -> int:
+        """Get the new view start along one axis.
+
+        Args:
+            target: Target coordinate.
+            start: Current view start.
+            span: View length.
+            limit: Board length.
+
+        Returns:
+            The view start, clamped to the board.
+        """
+        margin = min(self.margin, (span - 1) // 2)
+        if start + margin <= target < start + span - margin:
+            return start
+        return max(0, min(target - span // 2, limit - span))
+
+    def contains(self, position: Position) -> bool:
+        """Check if a cell is inside the view.
+
+        Args:
+            position: Grid position.
+
+        Returns:
+            True if the cell is visible.
+        """
+        return (
+            self.left <= position.x < self.left + self.columns
+            and self.top <= position.y < self.top + self.rows
+        )
+
+
+class ChunkIndex:
+    """Spatial index of snake segments by square chunks of cells.
+
+    Segments get ids that never change while they are part of the
+    snake: the tail has the smallest live id and each new head gets the
+    next one, so segment ``id`` is connected to ``id - 1`` and ``id + 1``.
+    Advancing the snake by one step updates the index in O(1); any other
+    change rebuilds it.
+    """
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE) -> None:
+        """Initialize an empty index.
+
+        Args:
+            chunk_size: Side of a chunk in cells.
+        """
+        self.chunk_size = chunk_size
+        self._body: Optional[SnakeBody] = None
+        self._cells: List[Position] = []
+        self._offset = 0  # id of self._cells[0]
+        self._tail_id = 0
+        self._chunks: Dict[Chunk, Set[int]] = {}
+        self._toggled: Set[Chunk] = set()
+
+    @property
+    def head_id(self) -> int:
+        """Get the id of the head segment."""
+        return self._offset + len(self._cells) - 1
+
+    @property
+    def tail_id(self) -> int:
+        """Get the id of the tail segment."""
+        return self._tail_id
+
+    def position(self, segment_id: int) -> Position:
+        """Get the cell of a live segment.
+
+        Args:
+            segment_id: Segment id.
+
+        Returns:
+            The segment position.
+        """
+        return self._cells[segment_id - self._offset]
+
+    def chunk_of(self, position: Position) -> Chunk:
+        """Get the chunk containing a cell.
+
+        Args:
+            position: Grid position.
+
+        Returns:
+            Tuple of (chunk column, chunk row).
+        """
+        return (position.x // self.chunk_size, position.y // self.chunk_size)
+
+    def occupied_chunks(self) -> Iterator[Chunk]:
+        """Iterate over chunks holding at least one segment."""
+        return iter(self._chunks)
+
+    def is_occupied(self, chunk: Chunk) -> bool:
+        """Check if a chunk holds at least one segment.
+
+        Args:
+            chunk: Tuple of (chunk column, chunk row).
+
+        Returns:
+            True if some segment is inside the chunk.
+        """
+        return chunk in self._chunks
+
+    def take_toggled(self) -> Set[Chunk]:
+        """Get and reset the chunks that became empty or occupied.
+
+        Returns:
+            Chunks whose occupancy changed since the last call.
+        """
+        toggled, self._toggled = self._toggled, set()
+        return toggled
+
+    def update(self, body: SnakeBody) -> None:
+        """Bring the index up to date with a snake body.
+
+        Args:
+            body: The current snake body.
+        """
+        previous = self._body
+        if body is previous:
+            return
+        if previous is not None and body.follows(previous):
+            self._advance(body)
+        else:
+            self._rebuild(body)
+        self._body = body
+
+    def segments_in(
+        self, left: int, top: int, columns: int, rows: int
+    ) -> Iterator[Tuple[int, Position]]:
+        """Iterate over the segments inside a rectangle of cells.
+
+        Only chunks overlapping the rectangle are visited.
+
+        Args:
+            left: Leftmost column.
+            top: Topmost row.
+            columns: Rectangle width in cells.
+            rows: Rectangle height in cells.
+
+        Yields:
+            Tuples of (segment id, position).
+        """
+        size = self.chunk_size
+        right = left + columns
+        bottom = top + rows
+        for chunk_y in range(top // size, (bottom - 1) // size + 1):
+            for chunk_x in range(left // size, (right - 1) // size + 1):
+                for segment_id in self._chunks.get((chunk_x, chunk_y), ()):
+                    cell = self._cells[segment_id - self._offset]
+                    if left <= cell.x < right and top <= cell.y < bottom:
+                        yield segment_id, cell
+
+    def _advance(self, body: SnakeBody) -> None:
+        """Apply one step of the head.
+
+        Args:
+            body: Body that follows the indexed one.
+        """
+        self._add(body.head)
+        while self.head_id - self._tail_id + 1 > len(body):
+            self._discard(self._tail_id)
+            self._tail_id += 1
+
+        # Duplicated tail segments (after eating) sit on the tail cell
+        tail = body.tail
+        segment_id = self._tail_id
+        run_end = self._tail_id + len(body) - tail_run_start(body)
+        while segment_id < run_end:
+            if self.position(segment_id) != tail:
+                self._discard(segment_id)
+                self._cells[segment_id - self._offset] = tail
+                self._insert(segment_id)
+            segment_id += 1
+
+        # Drop dead entries once they outnumber the live ones
+        dead = self._tail_id - self._offset
+        if dead > len(self._cells) // 2:
+            del self._cells[:dead]
+            self._offset = self._tail_id
+
+    def _rebuild(self, body: SnakeBody) -> None:
+        """Index a body from scratch.
+
+        Args:
+            body: The body to index.
+        """
+        self._toggled.update(self._chunks)
+        self._chunks = {}
+        self._offset = self._tail_id = self.head_id + 1
+        self._cells = []
+        for cell in reversed(tuple(body)):
+            self._add(cell)
+
+    def _add(self, cell: Position) -> None:
+        """Append a new head segment.
+
+        Args:
+            cell: Head position.
+        """
+        self._cells.append(cell)
+        self._insert(self.head_id)
+
+    def _insert(self, segment_id: int) -> None:
+        """Add a segment to the chunk of its cell.
+
+        Args:
+            segment_id: Segment id.
+        """
+        chunk = self.chunk_of(self.position(segment_id))
+        members = self._chunks.get(chunk)
+        if members is None:
+            members = self._chunks[chunk] = set()
+            self._toggled.add(chunk)
+        members.add(segment_id)
+
+    def _discard(self, segment_id: int) -> None:
+        """Remove a segment from the chunk of its cell.
+
+        Args:
+            segment_id: Segment id.
+        """
+        chunk = self.chunk_of(self.position(segment_id))
+        members = self._chunks[chunk]
+        members.discard(segment_id)
+        if not members:
+            del self._chunks[chunk]
+            self._toggled.add(chunk)
+
+
+class ViewportRenderer(Renderer):
+    """Draws the cells around the snake head, with a minimap.
+
+    Cells keep a fixed pixel size however large the board is. A
+    :class:`Camera` picks the visible cells and a :class:`ChunkIndex`
+    finds the segments inside them, so segments off screen are never
+    touched. While the camera stays still, ticks repaint only the
+    changed cells, as in :class:`Renderer`.
+
+    The minimap shows the whole board at one pixel per index chunk,
+    upscaled into a corner. Chunk pixels are updated only when a chunk
+    becomes empty or occupied.
+    """
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        cell_size: int = DETAIL_MIN_CELL_SIZE,
+        colors: Colors = DEFAULT_COLORS,
+        present: bool = True,
+        chunk_size: int = CHUNK_SIZE,
+        minimap_size: int = MINIMAP_SIZE,
+    ) -> None:
+        """Initialize viewport renderer.
+
+        Args:
+            screen: Pygame surface to render to.
+            cell_size: Size of each grid cell in pixels.
+            colors: Color scheme to use.
+            present: If True, flip the display after each frame.
+            chunk_size: Side of a spatial index chunk (and of a minimap
+                pixel) in cells.
+            minimap_size: Longest side of the minimap in pixels, or 0 to
+                hide it.
+        """
+        super().__init__(screen, cell_size, colors, present=present)
+        self.camera = Camera(1, 1)
+        self.index = ChunkIndex(chunk_size)
+        self.minimap_size = minimap_size
+        self._minimap: Optional[pygame.Surface] = None
+        self._minimap_rect = pygame.Rect(0, 0, 0, 0)
+
+    def _layout_changed(self) -> None:
+        """Resize the camera to the cells that fit on screen."""
+        width, height = self.screen.get_size()
+        size = self.cell_size
+        self.camera = Camera(-(-width // size), -(-height // size))
+        self._minimap = None
+
+    def _update_playfield(self, state: GameState) -> None:
+        """Move the camera and draw the visible cells.
+
+        Args:
+            state: The game state to show.
+        """
+        self.index.update(state.snake.body)
+        if self.camera.follow(state.snake.head, state.width, state.height):
+            self._drawn_state = None
+        super()._update_playfield(state)
+
+    def _composite_playfield(self) -> None:
+        """Copy the playfield to the screen and draw the minimap on top."""
+        super()._composite_playfield()
+        if self.minimap_size > 0 and self._drawn_state is not None:
+            self._draw_minimap(self._drawn_state)
+
+    def _cell_to_rect(self, position) -> Tuple[int, int, int, int]:
+        """Convert grid position to pixel rectangle on the view.
+
+        Args:
+            position: Grid position.
+
+        Returns:
+            Tuple of (x, y, width, height) in pixels.
+        """
+        x = (position.x - self.camera.left) * self.cell_size
+        y = (position.y - self.camera.top) * self.cell_size
+        return (x, y, self.cell_size, self.cell_size)
+
+    def _draw_snake(self, snake) -> None:
+        """Draw the segments inside the view.
+
+        Args:
+            snake: The snake to draw.
+        """
+        index = self.index
+        index.update(snake.body)
+        camera = self.camera
+        visible = list(
+            index.segments_in(camera.left, camera.top, camera.columns, camera.rows)
+        )
+        head_id = index.head_id
+
+        if self.cell_size < DETAIL_MIN_CELL_SIZE:
+            for segment_id, cell in visible:
+                if segment_id != head_id:
+                    self.screen.fill(self.colors.SNAKE_BODY, self._cell_to_rect(cell))
+            if camera.contains(snake.head):
+                self.screen.fill(self.colors.SNAKE_HEAD, self._cell_to_rect(snake.head))
+            return
+
+        # Connections first so they appear behind triangles. Each visible
+        # segment draws its line towards the tail; lines crossing into the
+        # view from a hidden segment are drawn by the visible end.
+        for segment_id, cell in visible:
+            if segment_id > index.tail_id:
+                self._draw_connection(cell, index.position(segment_id - 1))
+            if segment_id < head_id:
+                toward_head = index.position(segment_id + 1)
+                if not camera.contains(toward_head):
+                    self._draw_connection(toward_head, cell)
+        for segment_id, cell in visible:
+            color = (
+                self.colors.SNAKE_HEAD
+                if segment_id == head_id
+                else self.colors.SNAKE_BODY
+            )
+            self._draw_triangle_segment(cell, color)
+
+    def _draw_minimap(self, state: GameState) -> None:
+        """Draw the board overview with the view and food marked.
+
+        Args:
+            state: The game state being shown.
+        """
+        size = self.index.chunk_size
+        shape = (-(-state.width // size), -(-state.height // size))
+        toggled = self.index.take_toggled()
+        if self._minimap is None or self._minimap.get_size() != shape:
+            self._minimap = pygame.Surface(shape)
+            self._minimap.fill(self.colors.GRID)
+            toggled = set(self.index.occupied_chunks())
+            scale = self.minimap_size / max(shape)
+            rect = pygame.Rect(0, 0, int(shape[0] * scale), int(shape[1] * scale))
+            rect.bottomright = (
+                self.screen.get_width() - 10,
+                self.screen.get_height() - 10,
+            )
+            self._minimap_rect = rect
+
+        for chunk in toggled:
+            if 0 <= chunk[0] < shape[0] and 0 <= chunk[1] < shape[1]:
+                occupied = self.index.is_occupied(chunk)
+                color = self.colors.SNAKE_BODY if occupied else self.colors.GRID
+                self._minimap.set_at(chunk, color)
+
+        rect = self._minimap_rect
+        self.screen.blit(pygame.transform.scale(self._minimap, rect.size), rect)
+
+        # Mark the food and the camera view in minimap pixels
+        scale_x = rect.width / state.width
+        scale_y = rect.height / state.height
+        for food in (state.food, *state.extra_food):
+            self.screen.fill(
+                self.colors.FOOD,
+                (
+                    rect.x + int(food.position.x * scale_x),
+                    rect.y + int(food.position.y * scale_y),
+                    2,
+                    2,
+                ),
+            )
+        camera = self.camera
+        view = pygame.Rect(
+            rect.x + int(camera.left * scale_x),
+            rect.y + int(camera.top * scale_y),
+            max(2, int(camera.columns * scale_x)),
+            max(2, int(camera.rows * scale_y)),
+        ).clip(rect)
+        pygame.draw.rect(self.screen, self.colors.TEXT_PRIMARY, view, 1)
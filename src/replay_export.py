@@ -0,0 +1,165 @@
+"""Export recorded games to image sequences or raw video.
+
+Usage::
+
+    python -m src.replay_export REPLAY_DIR OUTPUT_DIR [--workers N]
+        [--format png|raw] [--cell-size PX]
+
+Every ``*.json`` replay in REPLAY_DIR is rendered headlessly. Each one
+becomes a directory of PNG frames, or an ``.rgb`` raw video file that
+``ffmpeg`` can encode. Replays are spread over a pool of processes,
+each running its own pygame on the dummy video driver.
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from src.renderer.frame_capture import PNG, RAW
+
+
+@dataclass(frozen=True)
+class ExportResult:
+    """Outcome of exporting one replay.
+
+    Attributes:
+        name: Replay file name without its extension.
+        frames: Frames written.
+        seconds: Time spent rendering and encoding.
+    """
+
+    name: str
+    frames: int
+    seconds: float
+
+    def format(self) -> str:
+        """Format the result as human-readable text.
+
+        Returns:
+            One-line summary.
+        """
+        return f"{self.name}: {self.frames} frames in {self.seconds:.2f} s"
+
+
+def _init_worker() -> None:
+    """Start a headless pygame display and fonts in a pool process."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    from src.engine.lazy_pygame import init_display
+
+    init_display()
+
+
+def export_replay(
+    replay_path: Path, output_dir: Path, format: str = PNG, cell_size: int = 20
+) -> ExportResult:
+    """Render every frame of a replay to disk.
+
+    Frames are drawn on an offscreen surface and handed to a
+    ``FrameCapture`` that waits instead of dropping frames, so encoding
+    overlaps with rendering the next frame.
+
+    Args:
+        replay_path: Replay file to export.
+        output_dir: Directory for the frames or video file.
+        format: Either ``PNG`` or ``RAW``.
+        cell_size: Size of each grid cell in pixels.
+
+    Returns:
+        What was written and how long it took.
+    """
+    import pygame
+    from src.engine.replay import Replay
+    from src.renderer.frame_capture import FrameCapture
+    from src.renderer.renderer import Renderer
+
+    started = time.perf_counter()
+    if not (pygame.display.get_init() and pygame.font.get_init()):
+        _init_worker()
+    replay = Replay.load(replay_path)
+    name = replay_path.stem
+    target = output_dir / (name if format == PNG else f"{name}.rgb")
+    screen = pygame.Surface((replay.width * cell_size, replay.height * cell_size))
+    capture = FrameCapture(target, format=format, max_wait=None)
+    renderer = Renderer(screen, cell_size, present=False, capture=capture)
+
+    capture.start()
+    try:
+        for state in replay.states():
+            renderer.render(state)
+    finally:
+        capture.stop()
+
+    return ExportResult(
+        name=name,
+        frames=capture.stats().written,
+        seconds=time.perf_counter() - started,
+    )
+
+
+def export_replays(
+    replay_dir: Path,
+    output_dir: Path,
+    format: str = PNG,
+    cell_size: int = 20,
+    workers: Optional[int] = None,
+) -> List[ExportResult]:
+    """Export every replay in a directory across a process pool.
+
+    Args:
+        replay_dir: Directory of ``*.json`` replay files.
+        output_dir: Directory for the exported frames or videos.
+        format: Either ``PNG`` or ``RAW``.
+        cell_size: Size of each grid cell in pixels.
+        workers: Number of processes (defaults to the CPU count).
+
+    Returns:
+        One result per replay, in file name order.
+    """
+    paths = sorted(replay_dir.glob("*.json"))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if not paths:
+        return []
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [
+            pool.submit(export_replay, path, output_dir, format, cell_size)
+            for path in paths
+        ]
+        return [future.result() for future in futures]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command-line entry point for replay export.
+
+    Args:
+        argv: Arguments to parse (defaults to ``sys.argv``).
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("replay_dir", type=Path, help="directory of replays")
+    parser.add_argument("output_dir", type=Path, help="directory for the output")
+    parser.add_argument("--format", choices=(PNG, RAW), default=PNG)
+    parser.add_argument("--cell-size", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    results = export_replays(
+        args.replay_dir,
+        args.output_dir,
+        format=args.format,
+        cell_size=args.cell_size,
+        workers=args.workers,
+    )
+    for result in results:
+        print(result.format())
+    elapsed = time.perf_counter() - started
+    print(f"Exported {len(results)} replays in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
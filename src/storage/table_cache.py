@@ -0,0 +1,102 @@
+"""On-disk cache for precomputed integer lookup tables."""
+
+import os
+from array import array
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+# Where tables are cached unless a directory is given
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "snake-game"
+
+# Environment variable that overrides the default directory, e.g. for
+# tests and the worker processes they start
+CACHE_DIR_ENV = "SNAKE_GAME_CACHE_DIR"
+
+# Element type of cached tables (signed int)
+TYPECODE = "i"
+
+
+def default_cache_dir() -> Path:
+    """Get the directory tables are cached in unless one is given.
+
+    Returns:
+        The directory named by ``CACHE_DIR_ENV`` if set, otherwise
+        ``DEFAULT_CACHE_DIR``.
+    """
+    return Path(os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+
+
+def load_table(path: Union[str, Path], length: int) -> "array[int]":
+    """Read a table written by ``save_table``.
+
+    Args:
+        path: Table file.
+        length: Expected number of entries.
+
+    Returns:
+        The table.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file does not hold exactly ``length`` entries.
+    """
+    table = array(TYPECODE)
+    with open(path, "rb") as file:
+        data = file.read()
+    if len(data) != length * table.itemsize:
+        raise ValueError(f"Table {path} does not have {length} entries")
+    table.frombytes(data)
+    return table
+
+
+def save_table(path: Union[str, Path], table: "array[int]") -> None:
+    """Write a table atomically, creating its directory if needed.
+
+    Args:
+        path: Table file.
+        table: Table to write.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(partial, "wb") as file:
+        table.tofile(file)
+    # Concurrent writers of the same table each replace it whole
+    os.replace(partial, path)
+
+
+def cached_table(
+    path: Union[str, Path],
+    length: int,
+    build: Callable[[], "array[int]"],
+    validate: Optional[Callable[["array[int]"], bool]] = None,
+) -> "array[int]":
+    """Load a table from disk, building and saving it on a miss.
+
+    Unreadable or truncated files, and tables ``validate`` rejects, are
+    rebuilt, and a cache directory that cannot be written only costs
+    the rebuild next time.
+
+    Args:
+        path: Table file.
+        length: Expected number of entries.
+        build: Computes the table when it is not cached.
+        validate: Checks a loaded table is usable, e.g. one written by
+            an older version.
+
+    Returns:
+        The table.
+    """
+    try:
+        table = load_table(path, length)
+    except (OSError, ValueError):
+        pass
+    else:
+        if validate is None or validate(table):
+            return table
+    table = build()
+    try:
+        save_table(path, table)
+    except OSError:
+        pass
+    return table
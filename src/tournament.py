@@ -0,0 +1,383 @@
+"""Play bots against the same seeded games and compare them.
+
+Usage::
+
+    python -m src.tournament AGENT [AGENT ...] [--seeds N]
+        [--first-seed S] [--width W] [--height H] [--max-ticks T]
+        [--fps F] [--workers N]
+
+An AGENT is an autopilot name from ``src.bots.factory.AUTOPILOTS``, or
+``module:Class`` for any ``Autopilot`` subclass, e.g. a copy of a bot
+kept for comparison. Every agent plays one game per seed, headlessly
+through ``GameLoop.update``, and the games are spread over a pool of
+processes. Each agent's throughput, scores and decision latencies are
+printed.
+"""
+
+import argparse
+import importlib
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from src.bots.base import Autopilot
+from src.bots.factory import AUTOPILOTS, create_autopilot
+from src.config.settings import Settings
+from src.engine.game_loop import GameLoop
+from src.engine.input_handler import InputAction
+from src.models.direction import Direction
+from src.models.game_state import GameState
+
+# Ticks after which a game that is still going is stopped
+DEFAULT_MAX_TICKS = 2000
+
+# Latency percentiles reported for every agent
+LATENCY_PERCENTILES = (50, 90, 99)
+
+# Decision returned by a timed agent method
+T = TypeVar("T")
+
+
+def load_agent(spec: str, settings: Settings) -> Autopilot:
+    """Create an agent from its name or ``module:Class`` path.
+
+    Args:
+        spec: Name in ``AUTOPILOTS``, or ``module:Class``.
+        settings: Game settings the agent is configured from.
+
+    Returns:
+        A new autopilot.
+
+    Raises:
+        ValueError: If the spec names no autopilot.
+    """
+    if spec in AUTOPILOTS or ":" not in spec:
+        return create_autopilot(spec, settings)
+    module_name, _, class_name = spec.partition(":")
+    try:
+        agent = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError) as error:
+        raise ValueError(f"Unknown agent {spec}: {error}") from error
+    if not (isinstance(agent, type) and issubclass(agent, Autopilot)):
+        raise ValueError(f"{spec} is not an Autopilot")
+    return agent.from_settings(settings)
+
+
+class _TimedAutopilot(Autopilot):
+    """Wraps an agent to time its decisions and keep food deterministic.
+
+    The global ``random`` state, which places the food, is restored
+    after every decision, so an agent that draws from it cannot change
+    where the food of the game appears.
+    """
+
+    def __init__(self, agent: Autopilot) -> None:
+        """Wrap an agent.
+
+        Args:
+            agent: Agent being measured.
+        """
+        self.agent = agent
+        # Seconds taken by each decision
+        self.latencies: List[float] = []
+
+    def choose(self, state: GameState) -> Optional[Direction]:
+        """Ask the agent for its direction, timing the call.
+
+        Args:
+            state: Current game state.
+
+        Returns:
+            The agent's direction.
+        """
+        return self._timed(self.agent.choose, state)
+
+    def next_action(self, state: GameState) -> Optional[InputAction]:
+        """Ask the agent for its action, timing the call.
+
+        Args:
+            state: Current game state.
+
+        Returns:
+            The agent's action.
+        """
+        return self._timed(self.agent.next_action, state)
+
+    def _timed(self, decide: Callable[[GameState], T], state: GameState) -> T:
+        """Make one decision, recording its latency.
+
+        Args:
+            decide: Decision method of the agent.
+            state: Current game state.
+
+        Returns:
+            The decision.
+        """
+        food_random = random.getstate()
+        started = time.perf_counter()
+        decision = decide(state)
+        self.latencies.append(time.perf_counter() - started)
+        random.setstate(food_random)
+        return decision
+
+
+@dataclass(frozen=True)
+class GameResult:
+    """Outcome of one agent playing one seeded game.
+
+    Attributes:
+        agent: Agent spec.
+        seed: Seed of the game's food placement.
+        score: Final score.
+        length: Final snake length.
+        ticks: Ticks played.
+        seconds: Time spent playing, decisions included.
+        latencies: Seconds taken by each decision.
+    """
+
+    agent: str
+    seed: int
+    score: int
+    length: int
+    ticks: int
+    seconds: float
+    latencies: Tuple[float, ...]
+
+
+def play_game(
+    agent: str,
+    seed: int,
+    width: int = 20,
+    height: int = 20,
+    max_ticks: int = DEFAULT_MAX_TICKS,
+    fps: int = 5,
+) -> GameResult:
+    """Play one game with an agent, without a display.
+
+    Reseeds the global ``random`` generator, like ``Replay.states``, so
+    every agent sees the same food for the same moves.
+
+    Args:
+        agent: Agent spec for ``load_agent``.
+        seed: Seed of the food placement.
+        width: Grid width (number of columns).
+        height: Grid height (number of rows).
+        max_ticks: Ticks after which the game is stopped.
+        fps: Game speed the agent is configured for (time budgets).
+
+    Returns:
+        How the game went.
+    """
+    settings = Settings(GRID_WIDTH=width, GRID_HEIGHT=height, FPS=fps)
+    timed = _TimedAutopilot(load_agent(agent, settings))
+    random.seed(seed)
+    loop = GameLoop(width=width, height=height, fps=fps, autopilot=timed)
+
+    ticks = 0
+    started = time.perf_counter()
+    while ticks < max_ticks and loop.state.is_playing():
+        loop.update()
+        ticks += 1
+    seconds = time.perf_counter() - started
+
+    return GameResult(
+        agent=agent,
+        seed=seed,
+        score=loop.state.score,
+        length=len(loop.state.snake),
+        ticks=ticks,
+        seconds=seconds,
+        latencies=tuple(timed.latencies),
+    )
+
+
+def percentile(values: Sequence[float], percent: float) -> float:
+    """Get a nearest-rank percentile.
+
+    Args:
+        values: Values in ascending order.
+        percent: Percentile between 0 and 100.
+
+    Returns:
+        The smallest value with at least ``percent`` percent of the
+        values at or below it, or 0 if there are none.
+    """
+    if not values:
+        return 0.0
+    rank = max(1, -(-len(values) * percent // 100))
+    return values[int(rank) - 1]
+
+
+@dataclass(frozen=True)
+class AgentReport:
+    """Summary of every game one agent played.
+
+    Attributes:
+        agent: Agent spec.
+        scores: Final score of each game, in seed order.
+        ticks: Ticks played over all games.
+        seconds: Time spent playing over all games.
+        latencies: Decision latency percentiles in seconds, by percent,
+            plus the slowest decision under 100.
+    """
+
+    agent: str
+    scores: Tuple[int, ...]
+    ticks: int
+    seconds: float
+    latencies: Dict[int, float]
+
+    @classmethod
+    def from_results(cls, agent: str, results: Sequence[GameResult]) -> "AgentReport":
+        """Summarize an agent's games.
+
+        Args:
+            agent: Agent spec.
+            results: The agent's games.
+
+        Returns:
+            The agent's report.
+        """
+        latencies = sorted(
+            latency for result in results for latency in result.latencies
+        )
+        return cls(
+            agent=agent,
+            scores=tuple(result.score for result in results),
+            ticks=sum(result.ticks for result in results),
+            seconds=sum(result.seconds for result in results),
+            latencies={
+                percent: percentile(latencies, percent)
+                for percent in LATENCY_PERCENTILES + (100,)
+            },
+        )
+
+    @property
+    def ticks_per_second(self) -> float:
+        """Get the ticks played per second of play."""
+        return self.ticks / self.seconds if self.seconds > 0 else 0.0
+
+    def format(self) -> str:
+        """Format the report as human-readable text.
+
+        Returns:
+            Lines for throughput, score distribution and decision
+            latencies.
+        """
+        scores = sorted(self.scores)
+        if len(scores) > 1:
+            quartiles = statistics.quantiles(scores, n=4, method="inclusive")
+            spread = statistics.stdev(scores)
+        else:
+            quartiles, spread = [float(scores[0])] * 3, 0.0
+        latencies = ", ".join(
+            f"p{percent} {self.latencies[percent] * 1000:.2f}"
+            for percent in LATENCY_PERCENTILES
+        )
+        return "\n".join(
+            [
+                f"{self.agent}: {len(scores)} games, {self.ticks} ticks, "
+                f"{self.ticks_per_second:.0f} ticks/s",
+                f"  score: mean {statistics.fmean(scores):.1f}, stdev {spread:.1f}, "
+                f"min {scores[0]}, q1 {quartiles[0]:.0f}, "
+                f"median {quartiles[1]:.0f}, q3 {quartiles[2]:.0f}, max {scores[-1]}",
+                f"  decision ms: {latencies}, max {self.latencies[100] * 1000:.2f}",
+            ]
+        )
+
+
+def run_tournament(
+    agents: Sequence[str],
+    seeds: Sequence[int],
+    width: int = 20,
+    height: int = 20,
+    max_ticks: int = DEFAULT_MAX_TICKS,
+    fps: int = 5,
+    workers: Optional[int] = None,
+) -> List[AgentReport]:
+    """Play every agent on every seed across a process pool.
+
+    Args:
+        agents: Agent specs for ``load_agent``.
+        seeds: Seeds of the games every agent plays.
+        width: Grid width (number of columns).
+        height: Grid height (number of rows).
+        max_ticks: Ticks after which a game is stopped.
+        fps: Game speed the agents are configured for.
+        workers: Number of processes (defaults to the CPU count).
+
+    Returns:
+        One report per agent, in the order given.
+
+    Raises:
+        ValueError: If there are no agents or seeds, or an agent spec
+            names no autopilot.
+    """
+    if not agents or not seeds:
+        raise ValueError("A tournament needs at least one agent and seed")
+    # Fail before starting any process on a misspelt agent
+    settings = Settings(GRID_WIDTH=width, GRID_HEIGHT=height, FPS=fps)
+    for agent in agents:
+        load_agent(agent, settings)
+    games = [(agent, seed) for agent in agents for seed in seeds]
+
+    workers = min(workers or os.cpu_count() or 1, len(games))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(play_game, agent, seed, width, height, max_ticks, fps)
+            for agent, seed in games
+        ]
+        results = [future.result() for future in futures]
+
+    per_agent = len(seeds)
+    return [
+        AgentReport.from_results(
+            agent, results[index * per_agent : (index + 1) * per_agent]
+        )
+        for index, agent in enumerate(agents)
+    ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command-line entry point for tournaments.
+
+    Args:
+        argv: Arguments to parse (defaults to ``sys.argv``).
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("agents", nargs="+", help="autopilot names or module:Class")
+    parser.add_argument("--seeds", type=int, default=20, help="games per agent")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--height", type=int, default=20)
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument("--fps", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        reports = run_tournament(
+            args.agents,
+            range(args.first_seed, args.first_seed + args.seeds),
+            width=args.width,
+            height=args.height,
+            max_ticks=args.max_ticks,
+            fps=args.fps,
+            workers=args.workers,
+        )
+    except ValueError as error:
+        parser.error(str(error))
+    for report in reports:
+        print(report.format())
+    elapsed = time.perf_counter() - started
+    print(f"Played {len(args.agents) * args.seeds} games in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
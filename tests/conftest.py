@@ -0,0 +1,69 @@
+"""Shared pytest configuration and fixtures."""
+
+import pytest
+from src.models.food import Food
+from src.models.game_state import GameState, GameStatus
+from src.models.position import Position
+from src.models.snake import Snake
+from src.models.snake_body import SnakeBody
+from src.storage.table_cache import CACHE_DIR_ENV
+
+
+def pytest_addoption(parser):
+    """Add the option that enables slow tests."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked slow (timing sweeps over large boards)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow; run with --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def table_cache_dir(tmp_path_factory):
+    """Keep cached tables out of the user's cache directory.
+
+    The directory is passed through the environment so that worker
+    processes started by the tests use it too.
+    """
+    path = tmp_path_factory.mktemp("table_cache")
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv(CACHE_DIR_ENV, str(path))
+        yield path
+
+
+@pytest.fixture
+def make_state():
+    """Create playing states with a given snake and food.
+
+    Body segments (head first) and the food may be given as positions
+    or as (x, y) pairs.
+    """
+
+    def point(cell):
+        return cell if isinstance(cell, Position) else Position(x=cell[0], y=cell[1])
+
+    def make(body, direction, food=(9, 9), width=10, height=10):
+        return GameState(
+            snake=Snake(
+                body=SnakeBody.from_positions([point(cell) for cell in body]),
+                direction=direction,
+            ),
+            food=Food(position=point(food)),
+            score=0,
+            status=GameStatus.PLAYING,
+            width=width,
+            height=height,
+        )
+
+    return make
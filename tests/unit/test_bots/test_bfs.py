@@ -0,0 +1,179 @@
+"""Unit tests for the BFS autopilot."""
+
+import random
+from dataclasses import replace
+
+import pytest
+from src.bots.base import Autopilot
+from src.bots.bfs import BFSAutopilot
+from src.bots.factory import create_autopilot
+from src.engine.game_loop import GameLoop
+from src.engine.input_handler import InputAction
+from src.models.direction import Direction
+from src.models.game_state import GameState
+from src.models.position import Position
+from src.models.snake_body import SnakeBody
+
+
+def _cells(*points):
+    """Create positions from (x, y) pairs."""
+    return [Position(x=x, y=y) for x, y in points]
+
+
+class TestBFSAutopilot:
+    """Test moves follow shortest safe paths."""
+
+    def test_moves_straight_to_food(self, make_state):
+        """Test the first move heads for food in line with the head."""
+        state = make_state(_cells((2, 5), (1, 5)), Direction.RIGHT, Position(x=2, y=1))
+
+        assert BFSAutopilot().choose(state) == Direction.UP
+
+    def test_goes_around_body(self, make_state):
+        """Test the path avoids segments that are still there."""
+        # Food behind the neck, with the body running off to the left
+        body = _cells((4, 4), (4, 3), (3, 3), (2, 3), (1, 3), (0, 3))
+        state = make_state(body, Direction.DOWN, Position(x=4, y=1))
+
+        assert BFSAutopilot().choose(state) == Direction.RIGHT
+
+    def test_never_reverses(self, make_state):
+        """Test food right behind the head does not cause a reversal."""
+        state = make_state(
+            _cells((5, 5), (6, 5), (7, 5)), Direction.LEFT, Position(x=8, y=5)
+        )
+
+        assert BFSAutopilot().choose(state) != Direction.RIGHT
+
+    def test_may_follow_its_tail(self, make_state):
+        """Test the tail cell counts as free because it moves away."""
+        # Head in the corner whose only exit is the cell its tail leaves
+        body = _cells((0, 0), (1, 0), (1, 1), (0, 1))
+        state = make_state(body, Direction.LEFT, Position(x=9, y=9))
+
+        assert BFSAutopilot().choose(state) == Direction.DOWN
+
+    def test_grown_tail_stays(self, make_state):
+        """Test a tail that just grew blocks its cell for another tick."""
+        body = _cells((0, 0), (1, 0), (1, 1), (0, 1))
+        state = make_state(body, Direction.LEFT, Position(x=9, y=9))
+        grown = replace(state, snake=state.snake.grow())
+
+        assert BFSAutopilot().choose(grown) is None
+
+    def test_trapped_snake_keeps_direction(self, make_state):
+        """Test a snake with no safe move returns None."""
+        body = _cells((0, 0), (1, 0), (1, 1), (0, 1), (0, 2))
+        state = make_state(body, Direction.LEFT, Position(x=9, y=9))
+
+        assert BFSAutopilot().choose(state) is None
+
+    def test_avoids_food_in_a_pocket(self, make_state):
+        """Test a path into a pocket too small for the snake is refused."""
+        # The food sits in a 2x2 pocket walled off by the body
+        body = _cells(
+            (2, 0), (2, 1), (2, 2), (1, 2), (0, 2), (0, 3),
+            (1, 3), (2, 3), (3, 3), (4, 3), (5, 3), (6, 3),
+        )  # fmt: skip
+        state = make_state(body, Direction.UP, Position(x=0, y=0))
+
+        assert BFSAutopilot().choose(state) == Direction.RIGHT
+
+    def test_buffers_are_reused(self):
+        """Test searches on the same board allocate no new buffers."""
+        bot = BFSAutopilot()
+        state = GameState.create_initial(width=20, height=20)
+        bot.choose(state)
+        buffers = (bot._seen, bot._distance, bot._queue, bot._serial)
+
+        bot.choose(state.move_snake())
+
+        assert (bot._seen, bot._distance, bot._queue, bot._serial) == buffers
+        assert all(
+            a is b
+            for a, b in zip(
+                buffers, (bot._seen, bot._distance, bot._queue, bot._serial)
+            )
+        )
+
+    def test_advanced_body_not_rescanned(self, monkeypatch):
+        """Test a body that only advanced is marked without copying it."""
+        bot = BFSAutopilot()
+        state = GameState.create_initial(width=20, height=20)
+        bot.choose(state)
+        monkeypatch.setattr(SnakeBody, "coordinates", pytest.fail)
+
+        bot.choose(state.move_snake())
+
+    @pytest.mark.parametrize("seed", [4, 5])
+    def test_incremental_marking_matches_fresh_bot(self, seed):
+        """Test every decision equals that of a bot seeing the state first."""
+        random.seed(seed)
+        bot = BFSAutopilot()
+        loop = GameLoop(width=10, height=10, autopilot=bot)
+
+        for _ in range(400):
+            if not loop.state.is_playing():
+                break
+            assert bot.choose(loop.state) == BFSAutopilot().choose(loop.state)
+            loop.update()
+
+    def test_off_board_segments_mark_nothing(self, make_state):
+        """Test a tail outside the board does not wrap onto a real cell."""
+        # (-1, 2) would wrap onto (3, 1) on a 4-wide board
+        state = make_state(
+            [(1, 2), (0, 2), (-1, 2)], Direction.RIGHT, food=(3, 1), width=4, height=5
+        )
+        bot = BFSAutopilot()
+
+        assert bot.choose(state) in (Direction.UP, Direction.RIGHT)
+        assert bot._serial[1 * 4 + 3] == 0
+        bot.choose(state.move_snake())
+        assert bot._serial[1 * 4 + 3] == 0
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_plays_through_game_loop(self, seed):
+        """Test the bot eats steadily when driving a game."""
+        random.seed(seed)
+        loop = GameLoop(width=12, height=12, autopilot=BFSAutopilot())
+
+        for _ in range(300):
+            if not loop.state.is_playing():
+                break
+            loop.update()
+
+        assert loop.state.score >= 100
+
+
+class TestAutopilotActions:
+    """Test bots hand input actions to the game loop."""
+
+    def test_next_action_turns(self, make_state):
+        """Test a turn becomes the matching move action."""
+        state = make_state(_cells((2, 5), (1, 5)), Direction.RIGHT, Position(x=2, y=1))
+
+        assert BFSAutopilot().next_action(state) == InputAction.MOVE_UP
+
+    def test_next_action_none_when_going_straight(self, make_state):
+        """Test no action is sent when the snake keeps its direction."""
+        state = make_state(_cells((2, 5), (1, 5)), Direction.RIGHT, Position(x=8, y=5))
+
+        assert BFSAutopilot().next_action(state) is None
+
+    def test_base_class_is_abstract(self):
+        """Test an autopilot without choose cannot be created."""
+        with pytest.raises(TypeError):
+            Autopilot()
+
+
+class TestCreateAutopilot:
+    """Test autopilots are created from their settings names."""
+
+    def test_creates_bfs(self):
+        """Test the bfs name creates a BFS autopilot."""
+        assert isinstance(create_autopilot("bfs"), BFSAutopilot)
+
+    def test_unknown_name_raises(self):
+        """Test an unknown name raises ValueError."""
+        with pytest.raises(ValueError):
+            create_autopilot("random")
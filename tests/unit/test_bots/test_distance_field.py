@@ -0,0 +1,202 @@
+"""Unit tests for the shared BFS distance fields."""
+
+import random
+from collections import deque
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.bots.distance_field import UNREACHABLE, DistanceFields
+from src.engine.collision import CollisionChecker
+from src.models.direction import Direction
+from src.models.food import Food
+from src.models.game_state import GameState, GameStatus
+from src.models.position import Position
+
+
+def _reference(state, source):
+    """Compute distances from a cell with a plain queue-based BFS."""
+    width, height = state.width, state.height
+    blocked = set(state.snake.body)
+    field = np.full((height, width), UNREACHABLE, dtype=np.int32)
+    field[source.y, source.x] = 0
+    queue = deque([source])
+    while queue:
+        current = queue.popleft()
+        for direction in Direction.all():
+            nxt = current + direction.delta
+            if not (0 <= nxt.x < width and 0 <= nxt.y < height):
+                continue
+            if nxt in blocked or field[nxt.y, nxt.x] != UNREACHABLE:
+                continue
+            field[nxt.y, nxt.x] = field[current.y, current.x] + 1
+            queue.append(nxt)
+    return field
+
+
+class TestDistanceFields:
+    """Test the fields and their incremental upkeep."""
+
+    def test_fields_match_bfs(self, make_state):
+        """Test both fields match a plain BFS around the body."""
+        state = make_state(
+            [(2, 0), (2, 1), (2, 2), (1, 2), (0, 2)],
+            Direction.UP,
+            food=(0, 0),
+            width=6,
+            height=6,
+        )
+        fields = DistanceFields(6, 6)
+
+        fields.update(state)
+
+        assert (fields.food_field == _reference(state, state.food.position)).all()
+        assert (fields.head_field == _reference(state, state.snake.head)).all()
+
+    def test_queries(self, make_state):
+        """Test single-cell queries, with the food walled off from a pocket."""
+        state = make_state(
+            [(2, 0), (2, 1), (2, 2), (1, 2), (0, 2)],
+            Direction.UP,
+            food=(5, 5),
+            width=6,
+            height=6,
+        )
+        fields = DistanceFields(6, 6)
+
+        fields.update(state)
+
+        assert fields.food_distance(Position(x=5, y=3)) == 2
+        assert fields.head_distance(Position(x=3, y=0)) == 1
+        assert fields.food_distance(Position(x=0, y=0)) == UNREACHABLE
+        assert fields.head_distance(Position(x=1, y=1)) == 2
+
+    def test_same_state_is_free(self, make_state):
+        """Test updating to the current state does no work."""
+        state = make_state(
+            [(2, 2), (1, 2), (0, 2)], Direction.RIGHT, food=(5, 5), width=6, height=6
+        )
+        fields = DistanceFields(6, 6)
+        fields.update(state)
+
+        fields.update(state)
+
+        assert fields.full_updates == 1
+        assert fields.repaired_cells == 0
+
+    def test_step_repairs_locally(self, make_state):
+        """Test a plain move repairs the food field without a recompute."""
+        state = make_state(
+            [(2, 2), (1, 2), (0, 2)], Direction.RIGHT, food=(5, 5), width=6, height=6
+        )
+        fields = DistanceFields(6, 6)
+        fields.update(state)
+
+        moved = state.move_snake()
+        fields.update(moved)
+
+        assert fields.full_updates == 1
+        assert 0 < fields.repaired_cells < 36
+        assert (fields.food_field == _reference(moved, moved.food.position)).all()
+        assert (fields.head_field == _reference(moved, moved.snake.head)).all()
+
+    def test_respawn_recomputes(self, make_state):
+        """Test moving the food recomputes its field."""
+        state = make_state(
+            [(2, 2), (1, 2), (0, 2)], Direction.RIGHT, food=(5, 5), width=6, height=6
+        )
+        fields = DistanceFields(6, 6)
+        fields.update(state)
+
+        moved = GameState(
+            snake=state.snake,
+            food=Food(position=Position(x=0, y=0)),
+            score=0,
+            status=GameStatus.PLAYING,
+            width=6,
+            height=6,
+        )
+        fields.update(moved)
+
+        assert fields.full_updates == 2
+        assert fields.food_distance(Position(x=0, y=1)) == 1
+
+    def test_winding_corridor_matches_bfs(self, make_state):
+        """Test distances longer than the wave limit are still exact."""
+        # Walls leave one corridor zigzagging down a 7x7 board
+        walls = (
+            [(x, 1) for x in range(6)]
+            + [(x, 3) for x in range(1, 7)]
+            + [(x, 5) for x in range(6)]
+        )
+        state = make_state(walls, Direction.LEFT, food=(0, 0), width=7, height=7)
+        fields = DistanceFields(7, 7)
+        fields.update(state)
+
+        assert fields.food_distance(Position(x=6, y=6)) == 24
+        assert (fields.food_field == _reference(state, Position(x=0, y=0))).all()
+
+    def test_rejects_other_board(self):
+        """Test a state on another board size is refused."""
+        fields = DistanceFields(6, 6)
+
+        with pytest.raises(ValueError):
+            fields.update(GameState.create_initial(width=8, height=8))
+
+    def test_snake_starting_off_a_small_board(self):
+        """Test segments outside the board never block a cell on it."""
+        random.seed(0)
+        state = GameState.create_initial(width=4, height=5)
+        assert state.snake.body.tail.x < 0
+        fields = DistanceFields(4, 5)
+
+        for _ in range(3):
+            fields.update(state)
+            fresh = DistanceFields(4, 5)
+            fresh.update(state)
+            assert fields.food_distance(state.food.position) == 0
+            assert (fields.food_field == fresh.food_field).all()
+            assert (fields.food_field == _reference(state, state.food.position)).all()
+            assert (fields.head_field == fresh.head_field).all()
+            state = state.move_snake()
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_incremental_matches_full_over_a_game(self, seed):
+        """Test the repaired fields equal fresh ones on every tick."""
+        random.seed(seed)
+        rng = random.Random(seed)
+        checker = CollisionChecker(10, 10)
+        state = GameState.create_initial(width=10, height=10)
+        fields = DistanceFields(10, 10)
+
+        for _ in range(400):
+            fields.update(state)
+            fresh = DistanceFields(10, 10)
+            fresh.update(state)
+            assert (fields.food_field == fresh.food_field).all()
+            assert (fields.head_field == fresh.head_field).all()
+
+            moves = state.safe_moves()
+            if not moves:
+                break
+            # Mostly head for the food so the snake grows
+            target = state.food.position
+            move = min(
+                moves, key=lambda d: (state.snake.head + d.delta).distance_to(target)
+            )
+            state = state.change_direction(
+                move if rng.random() < 0.7 else rng.choice(moves)
+            ).move_snake()
+            if state.snake.head == state.food.position:
+                state = GameState(
+                    snake=state.snake.grow(),
+                    food=state.food,
+                    score=state.score + 10,
+                    status=state.status,
+                    width=10,
+                    height=10,
+                ).respawn_food()
+            assert not checker.check_self_collision(state.snake)
+
+        assert fields.full_updates < fields.repaired_cells
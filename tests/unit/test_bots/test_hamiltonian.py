@@ -0,0 +1,159 @@
+"""Unit tests for the Hamiltonian-cycle autopilot."""
+
+import random
+from array import array
+
+import pytest
+from src.bots import hamiltonian
+from src.bots.factory import create_autopilot
+from src.bots.hamiltonian import (
+    HamiltonianAutopilot,
+    build_cycle,
+    is_cycle,
+    load_cycle,
+)
+from src.config.settings import Settings
+from src.engine.game_loop import GameLoop
+from src.models.direction import Direction
+from src.models.food import Food
+from src.models.game_state import GameState, GameStatus
+from src.models.position import Position
+from src.models.snake import Snake
+from src.models.snake_body import SnakeBody
+
+
+@pytest.fixture(autouse=True)
+def fresh_cycles(monkeypatch):
+    """Start every test without cycles cached in memory."""
+    monkeypatch.setattr(hamiltonian, "_cycles", {})
+
+
+class TestBuildCycle:
+    """Test cycles visit every cell once and close up."""
+
+    @pytest.mark.parametrize("size", [(2, 2), (4, 3), (3, 4), (6, 6), (20, 15)])
+    def test_cycle_is_hamiltonian(self, size):
+        """Test the order table describes a closed path over all cells."""
+        assert is_cycle(build_cycle(*size), *size)
+
+    @pytest.mark.parametrize("size", [(3, 3), (5, 7), (1, 4)])
+    def test_boards_without_cycle_raise(self, size):
+        """Test boards with both sides odd, or too thin, raise ValueError."""
+        with pytest.raises(ValueError):
+            build_cycle(*size)
+
+    def test_rejects_non_cycles(self):
+        """Test tables that skip, repeat or jump between cells are not cycles."""
+        good = build_cycle(4, 4)
+        repeated = array("i", good)
+        repeated[1] = repeated[0]
+        swapped = array("i", good)
+        swapped[0], swapped[5] = swapped[5], swapped[0]
+
+        assert is_cycle(good, 4, 4)
+        assert not is_cycle(good[:-1], 4, 4)
+        assert not is_cycle(repeated, 4, 4)
+        assert not is_cycle(swapped, 4, 4)
+        # A path that wraps from the end of a row to the start of the next
+        assert not is_cycle(array("i", range(4)), 2, 2)
+
+
+class TestLoadCycle:
+    """Test cycle tables are cached on disk and in memory."""
+
+    def test_table_written_and_reused(self, tmp_path, monkeypatch):
+        """Test a cached table is read back instead of rebuilt."""
+        first = load_cycle(6, 4, tmp_path)
+        assert (tmp_path / "hamiltonian_6x4.bin").exists()
+
+        monkeypatch.setattr(hamiltonian, "_cycles", {})
+        monkeypatch.setattr(hamiltonian, "build_cycle", None)
+
+        assert load_cycle(6, 4, tmp_path) == first
+
+    def test_memory_cache_shared(self, tmp_path):
+        """Test the same board size returns the same table object."""
+        assert load_cycle(4, 4, tmp_path) is load_cycle(4, 4, tmp_path)
+
+    def test_memory_cache_per_directory(self, tmp_path):
+        """Test another cache directory gets its own table file."""
+        load_cycle(4, 4, tmp_path / "a")
+        load_cycle(4, 4, tmp_path / "b")
+
+        assert (tmp_path / "b" / "hamiltonian_4x4.bin").exists()
+
+    def test_stale_table_rebuilt(self, tmp_path):
+        """Test a cached file of the right size that is no cycle is replaced."""
+        path = tmp_path / "hamiltonian_4x4.bin"
+        path.write_bytes(array("i", range(16)).tobytes())
+
+        cycle = load_cycle(4, 4, tmp_path)
+
+        assert is_cycle(cycle, 4, 4)
+        assert array("i", path.read_bytes()) == cycle
+
+
+class TestHamiltonianAutopilot:
+    """Test the bot fills the board without dying."""
+
+    def test_rejects_odd_board_before_playing(self):
+        """Test a board with both sides odd is refused at creation."""
+        settings = Settings(GRID_WIDTH=21, GRID_HEIGHT=21)
+
+        with pytest.raises(ValueError):
+            create_autopilot("hamiltonian", settings)
+        assert isinstance(
+            create_autopilot("hamiltonian", Settings(GRID_WIDTH=21, GRID_HEIGHT=20)),
+            HamiltonianAutopilot,
+        )
+
+    @pytest.mark.parametrize("size,seed", [((6, 6), 1), ((8, 5), 2), ((7, 8), 3)])
+    def test_fills_board(self, tmp_path, size, seed):
+        """Test the snake grows to fill the board."""
+        random.seed(seed)
+        width, height = size
+        loop = GameLoop(
+            width=width, height=height, autopilot=HamiltonianAutopilot(tmp_path)
+        )
+
+        for _ in range(5000):
+            if len(loop.state.snake.body) >= width * height - 1:
+                break
+            loop.update()
+            assert loop.state.is_playing()
+
+        assert len(loop.state.snake.body) >= width * height - 1
+
+    def test_shortcut_towards_food(self, tmp_path):
+        """Test a short snake cuts across the cycle to reach food sooner."""
+        random.seed(4)
+        bot = HamiltonianAutopilot(tmp_path)
+        loop = GameLoop(width=20, height=20, autopilot=bot)
+        eaten_at = None
+
+        for tick in range(1, 400):
+            loop.update()
+            if loop.state.score > 0:
+                eaten_at = tick
+                break
+
+        # Following the whole 400-cell cycle could take up to 400 ticks
+        assert eaten_at is not None and eaten_at < 60
+
+    def test_never_enters_body(self, tmp_path):
+        """Test the bot avoids its body before it is on the cycle."""
+        body = SnakeBody.from_positions(
+            [Position(x=1, y=1), Position(x=1, y=0), Position(x=2, y=0)]
+        )
+        state = GameState(
+            snake=Snake(body=body, direction=Direction.DOWN),
+            food=Food(position=Position(x=3, y=3)),
+            score=0,
+            status=GameStatus.PLAYING,
+            width=4,
+            height=4,
+        )
+
+        direction = HamiltonianAutopilot(tmp_path).choose(state)
+
+        assert direction in (Direction.LEFT, Direction.DOWN, Direction.RIGHT)
@@ -0,0 +1,105 @@
+"""Unit tests for the Monte Carlo tree search autopilot."""
+
+import random
+
+import pytest
+from src.bots.factory import create_autopilot
+from src.bots.mcts import MCTSAutopilot
+from src.engine.game_loop import GameLoop
+from src.models.direction import Direction
+from src.models.game_state import GameState
+
+
+def _bot(**options):
+    """Create a deterministic bot that searches a fixed number of times."""
+    return MCTSAutopilot(
+        time_budget=None,
+        max_iterations=options.pop("max_iterations", 300),
+        seed=options.pop("seed", 0),
+        **options,
+    )
+
+
+class TestMCTSAutopilot:
+    """Test moves picked by tree search."""
+
+    def test_avoids_dead_end(self, make_state):
+        """Test food in a pocket too small for the snake is passed up."""
+        body = [
+            (2, 0), (2, 1), (2, 2), (1, 2), (0, 2), (0, 3),
+            (1, 3), (2, 3), (3, 3), (4, 3), (5, 3), (6, 3),
+        ]  # fmt: skip
+        state = make_state(body, Direction.UP, food=(0, 0))
+
+        assert _bot().choose(state) == Direction.RIGHT
+
+    def test_only_safe_move(self, make_state):
+        """Test a single way out of a corner is taken."""
+        state = make_state([(0, 0), (1, 0), (2, 0)], Direction.LEFT)
+
+        assert _bot().choose(state) == Direction.DOWN
+
+    def test_no_safe_move_returns_none(self, make_state):
+        """Test a trapped snake gets None."""
+        state = make_state([(0, 0), (1, 0), (1, 1), (0, 1), (0, 2)], Direction.LEFT)
+
+        assert _bot().choose(state) is None
+
+    def test_same_seed_same_moves(self):
+        """Test seeded bots with an iteration limit agree move for move."""
+        state = GameState.create_initial(width=12, height=12)
+
+        first = [_bot(seed=4, max_iterations=50).choose(state) for _ in range(2)]
+
+        assert first[0] == first[1]
+
+    def test_reuses_subtree(self, make_state):
+        """Test the chosen move's statistics carry over to the next tick."""
+        bot = _bot(max_iterations=200)
+        state = make_state([(5, 5), (4, 5), (3, 5)], Direction.RIGHT)
+        direction = bot.choose(state)
+        kept = bot._root
+        visits = kept.visits
+
+        bot.choose(state.change_direction(direction).move_snake())
+
+        assert visits > 0
+        assert kept.visits == visits + 200
+
+    def test_tree_dropped_without_reuse(self, make_state):
+        """Test no subtree is kept when reuse is off."""
+        bot = _bot(reuse_tree=False)
+
+        bot.choose(make_state([(5, 5), (4, 5), (3, 5)], Direction.RIGHT))
+
+        assert bot._root is None
+
+    def test_needs_a_limit(self):
+        """Test a bot without budget or iteration limit is refused."""
+        with pytest.raises(ValueError):
+            MCTSAutopilot(time_budget=None)
+
+    def test_time_budget_bounds_search(self):
+        """Test a time budget stops the search on its own."""
+        bot = MCTSAutopilot(time_budget=0.002, seed=1)
+
+        bot.choose(GameState.create_initial(width=20, height=20))
+
+        assert bot.iterations >= 1
+
+    def test_plays_through_game_loop(self):
+        """Test the bot eats and survives when driving a game."""
+        random.seed(2)
+        loop = GameLoop(width=10, height=10, autopilot=_bot(max_iterations=40))
+
+        for _ in range(200):
+            if not loop.state.is_playing():
+                break
+            loop.update()
+
+        assert loop.state.is_playing()
+        assert loop.state.score >= 30
+
+    def test_created_by_name(self):
+        """Test the mcts name creates an MCTS autopilot."""
+        assert isinstance(create_autopilot("mcts"), MCTSAutopilot)
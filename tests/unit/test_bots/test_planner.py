@@ -0,0 +1,134 @@
+"""Unit tests for the iterative-deepening planner."""
+
+import random
+import time
+
+import pytest
+from src.bots.factory import create_autopilot
+from src.bots.mcts import MCTSAutopilot
+from src.bots.planner import PlannerAutopilot
+from src.config.settings import Settings
+from src.engine.game_loop import GameLoop
+from src.models.direction import Direction
+from src.models.game_state import GameState
+
+
+def _planner(max_depth=6):
+    """Create a planner limited by depth rather than by time."""
+    return PlannerAutopilot(fps=0.01, max_depth=max_depth)
+
+
+class TestPlannerAutopilot:
+    """Test moves picked by the planner."""
+
+    def test_heads_for_food(self, make_state):
+        """Test the first move closes in on the food."""
+        state = make_state([(5, 5), (4, 5), (3, 5)], Direction.RIGHT, food=(5, 2))
+
+        assert _planner().choose(state) == Direction.UP
+
+    def test_eats_sooner_rather_than_later(self, make_state):
+        """Test food next to the head is eaten at once."""
+        state = make_state([(5, 5), (4, 5), (3, 5)], Direction.RIGHT, food=(6, 5))
+
+        assert _planner().choose(state) == Direction.RIGHT
+
+    def test_avoids_dead_end(self, make_state):
+        """Test food in a pocket too small for the snake is passed up."""
+        body = [
+            (2, 0), (2, 1), (2, 2), (1, 2), (0, 2), (0, 3),
+            (1, 3), (2, 3), (3, 3), (4, 3), (5, 3), (6, 3),
+        ]  # fmt: skip
+        state = make_state(body, Direction.UP, food=(0, 0))
+
+        assert _planner().choose(state) == Direction.RIGHT
+
+    def test_measures_distance_around_body(self, make_state):
+        """Test the food behind a wall of body is approached the long way."""
+        pytest.importorskip("numpy")
+        # Head on the right edge, body wall at x = 4 with the food behind it
+        body = [
+            (6, 2), (6, 1), (6, 0), (5, 0), (4, 0),
+            (4, 1), (4, 2), (4, 3), (4, 4), (4, 5),
+        ]  # fmt: skip
+        state = make_state(body, Direction.DOWN, food=(2, 2), width=7, height=7)
+
+        assert _planner(max_depth=1).choose(state) == Direction.DOWN
+
+    def test_straight_distance_without_numpy(self, make_state, monkeypatch):
+        """Test the planner still plays when the distance fields are missing."""
+        monkeypatch.setattr("src.bots.planner.DistanceFields", None)
+        body = [
+            (6, 2), (6, 1), (6, 0), (5, 0), (4, 0),
+            (4, 1), (4, 2), (4, 3), (4, 4), (4, 5),
+        ]  # fmt: skip
+        state = make_state(body, Direction.DOWN, food=(2, 2), width=7, height=7)
+
+        assert _planner(max_depth=1).choose(state) == Direction.LEFT
+
+    def test_no_safe_move_returns_none(self, make_state):
+        """Test a trapped snake gets None."""
+        state = make_state([(0, 0), (1, 0), (1, 1), (0, 1), (0, 2)], Direction.LEFT)
+
+        assert _planner().choose(state) is None
+
+    def test_stops_at_max_depth(self, make_state):
+        """Test the search stops deepening at the depth limit."""
+        bot = _planner(max_depth=4)
+
+        bot.choose(make_state([(5, 5), (4, 5), (3, 5)], Direction.RIGHT))
+
+        assert bot.depth == 4
+        assert bot._table
+
+    def test_budget_follows_fps(self):
+        """Test the budget is a share of the tick interval."""
+        assert PlannerAutopilot(fps=20, time_fraction=0.5).time_budget == 0.025
+        assert PlannerAutopilot(fps=40, time_fraction=0.5).time_budget == 0.0125
+
+    def test_returns_within_budget(self):
+        """Test a short budget cuts the search off in time."""
+        bot = PlannerAutopilot(fps=200, time_fraction=0.5)
+        state = GameState.create_initial(width=30, height=30)
+
+        started = time.perf_counter()
+        direction = bot.choose(state)
+        elapsed = time.perf_counter() - started
+
+        assert direction is not None
+        assert bot.depth < bot.max_depth
+        assert elapsed < bot.time_budget + 0.05
+
+    def test_plays_through_game_loop(self):
+        """Test the planner eats steadily when driving a game."""
+        random.seed(3)
+        loop = GameLoop(width=10, height=10, autopilot=_planner(max_depth=5))
+
+        for _ in range(150):
+            if not loop.state.is_playing():
+                break
+            loop.update()
+
+        assert loop.state.score >= 50
+
+
+class TestSettingsBudget:
+    """Test searching bots are budgeted from the settings."""
+
+    def test_planner_from_settings(self):
+        """Test the planner uses FPS and the time fraction."""
+        settings = Settings(FPS=10, BOT_TIME_FRACTION=0.25)
+
+        bot = create_autopilot("planner", settings)
+
+        assert isinstance(bot, PlannerAutopilot)
+        assert bot.time_budget == 0.025
+
+    def test_mcts_from_settings(self):
+        """Test MCTS searches for the same share of the tick."""
+        settings = Settings(FPS=10, BOT_TIME_FRACTION=0.25)
+
+        bot = create_autopilot("mcts", settings)
+
+        assert isinstance(bot, MCTSAutopilot)
+        assert bot.time_budget == 0.025
@@ -0,0 +1,123 @@
+"""Unit tests for the bitboard safety analysis."""
+
+import random
+
+from src.bots.bfs import BFSAutopilot
+from src.bots.safety import SafetyAnalyzer
+from src.engine.game_loop import GameLoop
+from src.models.direction import Direction
+
+
+# Head at (2, 0) with a 2x2 pocket to its left, walled off by the body
+POCKET_BODY = [
+    (2, 0), (2, 1), (2, 2), (1, 2), (0, 2), (0, 3),
+    (1, 3), (2, 3), (3, 3), (4, 3), (5, 3), (6, 3),
+]  # fmt: skip
+
+
+class TestReachableArea:
+    """Test reachable areas after each move."""
+
+    def test_open_board(self, make_state):
+        """Test a short snake can reach every cell but its head's."""
+        state = make_state([(2, 5), (1, 5)], Direction.RIGHT)
+
+        areas = SafetyAnalyzer().move_areas(state)
+
+        assert areas == {
+            Direction.UP: 99,
+            Direction.DOWN: 99,
+            Direction.LEFT: 0,
+            Direction.RIGHT: 99,
+        }
+
+    def test_wall_and_reversal_are_zero(self, make_state):
+        """Test moving off the board or backwards has no area."""
+        state = make_state([(0, 0), (1, 0)], Direction.LEFT)
+        analyzer = SafetyAnalyzer()
+
+        assert analyzer.reachable_area(state, Direction.LEFT) == 0
+        assert analyzer.reachable_area(state, Direction.UP) == 0
+        assert analyzer.reachable_area(state, Direction.RIGHT) == 0
+
+    def test_body_collision_is_zero(self, make_state):
+        """Test moving into a segment that stays has no area."""
+        state = make_state([(1, 1), (1, 2), (2, 2), (2, 1), (2, 0)], Direction.UP)
+
+        assert SafetyAnalyzer().reachable_area(state, Direction.RIGHT) == 0
+
+    def test_detects_pocket(self, make_state):
+        """Test a pocket the body walls off is smaller than the snake."""
+        areas = SafetyAnalyzer().move_areas(make_state(POCKET_BODY, Direction.UP))
+
+        assert areas[Direction.LEFT] == 4
+        assert areas[Direction.RIGHT] > len(POCKET_BODY)
+
+    def test_tail_vacating_opens_pocket(self, make_state):
+        """Test a pocket whose wall is the tail counts the cells behind it."""
+        # The only way out of the corner is the cell the tail leaves
+        state = make_state([(0, 0), (1, 0), (1, 1), (0, 1)], Direction.LEFT)
+
+        assert SafetyAnalyzer().reachable_area(state, Direction.DOWN) > 90
+
+    def test_eating_keeps_tail_in_place(self, make_state):
+        """Test the tail cell is not free on the tick the snake eats."""
+        body = [(0, 0), (1, 0), (1, 1), (0, 1)]
+        analyzer = SafetyAnalyzer()
+
+        hungry = make_state(body, Direction.LEFT, food=(9, 9))
+        eating = make_state(body, Direction.LEFT, food=(0, 1))
+
+        assert analyzer.reachable_area(hungry, Direction.DOWN) > 0
+        assert analyzer.reachable_area(eating, Direction.DOWN) == 0
+
+    def test_limit_stops_counting(self, make_state):
+        """Test the fill stops once the limit is reached."""
+        state = make_state([(2, 5), (1, 5)], Direction.RIGHT)
+
+        area = SafetyAnalyzer().reachable_area(state, Direction.RIGHT, limit=10)
+
+        assert 10 <= area < 99
+
+    def test_rows_do_not_wrap(self, make_state):
+        """Test regions do not leak from one row's end into the next."""
+        # The body walls off the first column: down the second column,
+        # along the top row and down the last column to the tail
+        body = (
+            [(1, y) for y in range(5, -1, -1)]
+            + [(x, 0) for x in range(2, 10)]
+            + [(9, y) for y in range(1, 6)]
+        )
+        state = make_state(body, Direction.DOWN, width=10, height=6)
+
+        # The column's walls stay far longer than its 6 cells last
+        assert SafetyAnalyzer().reachable_area(state, Direction.LEFT) == 6
+
+
+class TestOccupancy:
+    """Test the occupancy bitboard tracks the body."""
+
+    def test_incremental_matches_rebuild(self):
+        """Test updates from the previous body match a fresh build."""
+        random.seed(4)
+        loop = GameLoop(width=12, height=12, autopilot=BFSAutopilot())
+        analyzer = SafetyAnalyzer()
+
+        for _ in range(200):
+            if not loop.state.is_playing():
+                break
+            assert analyzer.occupancy(loop.state) == (
+                SafetyAnalyzer().occupancy(loop.state)
+            )
+            loop.update()
+
+        assert loop.state.score > 0
+
+    def test_board_size_change_rebuilds(self, make_state):
+        """Test a state on another board size is not updated in place."""
+        analyzer = SafetyAnalyzer()
+        analyzer.occupancy(make_state([(2, 5), (1, 5)], Direction.RIGHT))
+
+        state = make_state([(2, 5), (1, 5)], Direction.RIGHT, width=20, height=20)
+
+        assert analyzer.occupancy(state) == SafetyAnalyzer().occupancy(state)
@@ -0,0 +1,283 @@
+"""Unit tests for the mutable game simulation."""
+
+import random
+
+import pytest
+from src.bots.simulation import NO_FOOD, Simulation
+from src.models.direction import Direction
+from src.models.game_state import GameState, GameStatus
+from src.models.move_table import MOVES
+
+UP, DOWN, LEFT, RIGHT = (MOVES.index(d) for d in Direction.all())
+
+
+def _snapshot(simulation):
+    """Capture everything a step may change."""
+    return (
+        simulation.cells[simulation.start :],
+        bytes(simulation.occupied),
+        simulation.direction,
+        simulation.food,
+        simulation.pending,
+        simulation.eaten,
+        simulation.alive,
+    )
+
+
+class TestSimulation:
+    """Test stepping, undoing and redoing moves."""
+
+    def test_from_state(self, make_state):
+        """Test the simulation starts at the state's position."""
+        state = make_state([(5, 5), (4, 5), (3, 5)], Direction.RIGHT, food=(7, 2))
+
+        simulation = Simulation.from_state(state)
+
+        assert simulation.head == 55
+        assert simulation.cells == [53, 54, 55]
+        assert simulation.food == 27
+        assert simulation.direction == RIGHT
+        assert simulation.length == 3
+
+    def test_step_moves_head_and_tail(self, make_state):
+        """Test a step adds the head and frees the tail cell."""
+        simulation = Simulation.from_state(
+            make_state([(5, 5), (4, 5), (3, 5)], Direction.RIGHT)
+        )
+
+        ate = simulation.step(UP)
+
+        assert not ate
+        assert simulation.head == 45
+        assert simulation.length == 3
+        assert not simulation.occupied[53]
+        assert simulation.direction == UP
+
+    def test_eating_keeps_tail(self, make_state):
+        """Test eating grows the snake on the next step and respawns food."""
+        simulation = Simulation.from_state(
+            make_state([(5, 5), (4, 5), (3, 5)], Direction.RIGHT, food=(6, 5)),
+            random.Random(1),
+        )
+
+        assert simulation.step(RIGHT)
+        simulation.step(RIGHT)
+
+        assert simulation.length == 4
+        assert simulation.eaten == 1
+        assert simulation.occupied[54]
+        assert simulation.food not in simulation.cells[simulation.start :]
+
+    def test_reversal_keeps_direction(self, make_state):
+        """Test a reversal is ignored like in the game loop."""
+        simulation = Simulation.from_state(
+            make_state([(5, 5), (4, 5), (3, 5)], Direction.RIGHT)
+        )
+
+        simulation.step(LEFT)
+
+        assert simulation.head == 56
+        assert simulation.alive
+
+    def test_wall_and_body_kill(self, make_state):
+        """Test leaving the board or hitting the body ends the game."""
+        wall = Simulation.from_state(make_state([(0, 0), (1, 0)], Direction.LEFT))
+        wall.step(LEFT)
+
+        body = Simulation.from_state(
+            make_state([(1, 1), (1, 2), (2, 2), (2, 1), (2, 0)], Direction.UP)
+        )
+        body.step(RIGHT)
+
+        assert not wall.alive
+        assert not body.alive
+        with pytest.raises(ValueError):
+            wall.step(DOWN)
+
+    def test_moving_into_leaving_tail(self, make_state):
+        """Test the cell the tail leaves is safe to move into."""
+        simulation = Simulation.from_state(
+            make_state([(0, 0), (1, 0), (1, 1), (0, 1)], Direction.LEFT)
+        )
+
+        assert simulation.safe_moves() == [DOWN]
+        simulation.step(DOWN)
+
+        assert simulation.alive
+
+    def test_undo_restores_position(self):
+        """Test undoing a random game returns to the start exactly."""
+        rng = random.Random(3)
+        simulation = Simulation.from_state(GameState.create_initial(8, 8), rng)
+        start = _snapshot(simulation)
+
+        while simulation.alive and simulation.depth < 200:
+            moves = simulation.safe_moves()
+            simulation.step(rng.choice(moves) if moves else UP)
+        while simulation.depth:
+            simulation.undo()
+
+        assert _snapshot(simulation) == start
+
+    def test_redo_replays_food_spawns(self):
+        """Test redone steps end where the original steps did."""
+        rng = random.Random(5)
+        simulation = Simulation.from_state(GameState.create_initial(8, 8), rng)
+        while simulation.alive and simulation.depth < 100:
+            moves = simulation.safe_moves()
+            if not moves:
+                break
+            # Head for the food so some steps eat and respawn it
+            targets = simulation.neighbours(simulation.head)
+            simulation.step(min(moves, key=lambda m: abs(targets[m] - simulation.food)))
+        end = _snapshot(simulation)
+        steps = simulation.depth
+
+        for _ in range(steps):
+            simulation.undo()
+        for _ in range(steps):
+            simulation.redo()
+
+        assert simulation.eaten > 0
+        assert _snapshot(simulation) == end
+
+    def test_step_clears_redo(self, make_state):
+        """Test a new step discards the undone steps."""
+        simulation = Simulation.from_state(
+            make_state([(5, 5), (4, 5), (3, 5)], Direction.RIGHT)
+        )
+        simulation.step(UP)
+        simulation.undo()
+
+        simulation.step(DOWN)
+
+        with pytest.raises(IndexError):
+            simulation.redo()
+
+    def test_clone_is_independent(self, make_state):
+        """Test stepping a clone leaves the original alone."""
+        simulation = Simulation.from_state(
+            make_state([(5, 5), (4, 5), (3, 5)], Direction.RIGHT)
+        )
+        simulation.step(UP)
+        before = _snapshot(simulation)
+
+        copy = simulation.clone()
+        copy.step(LEFT)
+
+        assert _snapshot(simulation) == before
+        assert copy.depth == 1
+        assert copy.head == 44
+
+    def test_full_board_has_no_food(self, make_state):
+        """Test eating the last free cell leaves no food."""
+        state = make_state(
+            [(0, 0), (0, 1), (1, 1)], Direction.UP, food=(1, 0), width=2, height=2
+        )
+        grown = GameState(
+            snake=state.snake.grow(),
+            food=state.food,
+            score=0,
+            status=GameStatus.PLAYING,
+            width=2,
+            height=2,
+        )
+        simulation = Simulation.from_state(grown)
+
+        simulation.step(RIGHT)
+
+        assert simulation.length == 5
+        assert simulation.food == NO_FOOD
+
+    def test_no_respawn(self, make_state):
+        """Test food is not replaced when respawning is off."""
+        simulation = Simulation.from_state(
+            make_state([(5, 5), (4, 5), (3, 5)], Direction.RIGHT, food=(6, 5)),
+            respawn=False,
+        )
+
+        simulation.step(RIGHT)
+
+        assert simulation.food == NO_FOOD
+
+    def test_key_tracks_occupied_cells(self):
+        """Test the Zobrist key matches the body after steps and undos."""
+        rng = random.Random(9)
+        simulation = Simulation.from_state(GameState.create_initial(8, 8), rng)
+        start = simulation.key
+
+        for _ in range(50):
+            moves = simulation.safe_moves()
+            if not moves:
+                break
+            simulation.step(rng.choice(moves))
+            expected = 0
+            for cell in simulation.cells[simulation.start :]:
+                expected ^= simulation.keys[cell]
+            assert simulation.key == expected
+        while simulation.depth:
+            simulation.undo()
+
+        assert simulation.key == start
+
+    def test_safe_moves_match_game_state(self):
+        """Test the simulation agrees with the game state on every tick."""
+        random.seed(11)
+        rng = random.Random(11)
+        state = GameState.create_initial(width=8, height=8)
+        simulation = Simulation.from_state(state)
+
+        for _ in range(300):
+            safe = [MOVES.index(d) for d in state.safe_moves()]
+            assert simulation.safe_moves() == safe
+            if not safe:
+                break
+            move = rng.choice(safe)
+            state = state.change_direction(MOVES[move]).move_snake()
+            if state.snake.head == state.food.position:
+                state = GameState(
+                    snake=state.snake.grow(),
+                    food=state.food,
+                    score=state.score + 10,
+                    status=state.status,
+                    width=8,
+                    height=8,
+                ).respawn_food()
+            simulation.step(move)
+            # Food spawns differ; follow the game's food
+            food = state.food.position
+            simulation.food = food.y * 8 + food.x
+            assert simulation.length == len(state.snake)
+
+    def test_snake_starting_off_a_small_board(self):
+        """Test a tail outside a small board is not wrapped onto it."""
+        random.seed(3)
+        rng = random.Random(3)
+        state = GameState.create_initial(width=4, height=5)
+        simulation = Simulation.from_state(state)
+        assert simulation.occupied[1 * 4 + 3] == 0
+        assert simulation.length == len(state.snake)
+
+        for _ in range(40):
+            safe = [MOVES.index(d) for d in state.safe_moves()]
+            assert simulation.safe_moves() == safe
+            if not safe:
+                break
+            move = rng.choice(safe)
+            state = state.change_direction(MOVES[move]).move_snake()
+            if state.snake.head == state.food.position:
+                state = GameState(
+                    snake=state.snake.grow(),
+                    food=state.food,
+                    score=state.score + 10,
+                    status=state.status,
+                    width=4,
+                    height=5,
+                ).respawn_food()
+            simulation.step(move)
+            food = state.food.position
+            simulation.food = food.y * 4 + food.x
+            fresh = Simulation.from_state(state)
+            assert simulation.occupied == fresh.occupied
+            assert simulation.key == fresh.key
+            assert simulation.length == len(state.snake)
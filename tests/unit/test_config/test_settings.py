@@ -31,6 +31,41 @@ class TestSettingsDefaults:
         settings = Settings()
 
         assert settings.POINTS_PER_FOOD == 10
+        assert settings.FOOD_COUNT == 1
+
+    def test_default_idle_mode_enabled(self):
+        """Test idle mode is on by default."""
+        settings = Settings()
+
+        assert settings.IDLE_MODE is True
+
+    def test_default_diagnostics_disabled(self):
+        """Test diagnostic modes are off by default."""
+        settings = Settings()
+
+        assert settings.TRACE_MEMORY is False
+        assert settings.GC_TUNING is False
+
+    def test_default_window_resizable_at_full_resolution(self):
+        """Test the window is resizable and drawn at full resolution."""
+        settings = Settings()
+
+        assert settings.RESIZABLE_WINDOW is True
+        assert settings.LOW_RES_CELL_SIZE == 0
+        assert settings.VIEWPORT_CELL_SIZE == 0
+        assert settings.SPECTATOR_GAMES == 0
+        assert settings.TERMINAL_MODE is False
+        assert settings.AUTOPILOT == ""
+        assert settings.BOT_TIME_FRACTION == 0.5
+
+    def test_default_frame_capture_disabled(self):
+        """Test frames are not recorded by default."""
+        settings = Settings()
+
+        assert settings.CAPTURE_FRAMES is False
+        assert settings.CAPTURE_PATH == "captures"
+        assert settings.RECORD_REPLAYS is False
+        assert settings.REPLAY_PATH == "replays"
 
 
 class TestSettingsCustomization:
@@ -0,0 +1,205 @@
+"""Unit tests for the multi-snake arena."""
+
+import random
+
+import pytest
+from src.engine.arena import EMPTY, Arena, Crash
+from src.models.direction import Direction
+from src.models.food import Food
+from src.models.position import Position
+from src.models.snake import Snake
+
+
+def _snake(body, direction):
+    """Create a snake from (x, y) pairs, head first."""
+    return Snake(body=tuple(Position(x=x, y=y) for x, y in body), direction=direction)
+
+
+def _arena(*snakes, width=10, height=10):
+    """Create a seeded arena with one food item."""
+    return Arena(width, height, snakes, rng=random.Random(0))
+
+
+def _owners(arena):
+    """Rebuild the owner of every cell from the live snakes."""
+    owners = {}
+    for index, snake in enumerate(arena.snakes):
+        if arena.alive[index]:
+            for position in snake.body:
+                owners[position] = index
+    return owners
+
+
+class TestArenaSetup:
+    """Test creating arenas."""
+
+    def test_create_places_snakes_apart(self):
+        """Test random placement gives every snake its own cells."""
+        arena = Arena.create(30, 30, 40, length=4, food_count=25, rng=random.Random(1))
+
+        cells = [position for snake in arena.snakes for position in snake.body]
+        assert len(arena.snakes) == 40
+        assert all(len(snake) == 4 for snake in arena.snakes)
+        assert len(set(cells)) == len(cells)
+        assert len(arena.food) == 25
+        assert not set(food.position for food in arena.food.values()) & set(cells)
+
+    def test_owner(self):
+        """Test cells report the snake on them."""
+        arena = _arena(
+            _snake([(2, 2), (1, 2)], Direction.RIGHT),
+            _snake([(5, 5), (5, 6)], Direction.UP),
+        )
+
+        assert arena.owner(Position(x=1, y=2)) == 0
+        assert arena.owner(Position(x=5, y=6)) == 1
+        assert arena.owner(Position(x=0, y=0)) == EMPTY
+
+    def test_rejects_overlap(self):
+        """Test snakes sharing a cell or off the board are refused."""
+        with pytest.raises(ValueError):
+            _arena(
+                _snake([(2, 2), (1, 2)], Direction.RIGHT),
+                _snake([(1, 3), (1, 2)], Direction.UP),
+            )
+        with pytest.raises(ValueError):
+            _arena(_snake([(0, 0), (-1, 0)], Direction.RIGHT))
+
+    def test_no_room(self):
+        """Test placement fails when the board cannot hold the snakes."""
+        with pytest.raises(ValueError):
+            Arena.create(3, 3, 5, length=3, rng=random.Random(0))
+
+
+class TestArenaStep:
+    """Test simultaneous moves and collisions."""
+
+    def test_moves_every_snake(self):
+        """Test all snakes move and their tails free their cells."""
+        arena = _arena(
+            _snake([(2, 2), (1, 2)], Direction.RIGHT),
+            _snake([(5, 5), (5, 6)], Direction.UP),
+        )
+
+        tick = arena.step([None, Direction.LEFT])
+
+        assert tick.crashes == {}
+        assert arena.snakes[0].head == Position(x=3, y=2)
+        assert arena.snakes[1].head == Position(x=4, y=5)
+        assert arena.owner(Position(x=1, y=2)) == EMPTY
+        assert arena.owner(Position(x=4, y=5)) == 1
+
+    def test_head_on(self):
+        """Test two heads entering the same cell both die."""
+        arena = _arena(
+            _snake([(3, 5), (2, 5)], Direction.RIGHT),
+            _snake([(5, 5), (6, 5)], Direction.LEFT),
+            _snake([(0, 0), (0, 1)], Direction.UP),
+        )
+
+        tick = arena.step([None, None, Direction.RIGHT])
+
+        assert tick.crashes == {0: Crash.HEAD_ON, 1: Crash.HEAD_ON}
+        assert arena.alive == [False, False, True]
+        assert arena.owner(Position(x=4, y=5)) == EMPTY
+        assert arena.owner(Position(x=3, y=5)) == EMPTY
+
+    def test_heads_swapping_places(self):
+        """Test adjacent heads moving into each other both die."""
+        arena = _arena(
+            _snake([(4, 5), (3, 5)], Direction.RIGHT),
+            _snake([(5, 5), (6, 5)], Direction.LEFT),
+        )
+
+        tick = arena.step([None, None])
+
+        assert tick.crashes == {0: Crash.BODY, 1: Crash.BODY}
+
+    def test_head_into_body(self):
+        """Test a head entering another body dies and the other lives."""
+        arena = _arena(
+            _snake([(4, 4), (4, 5), (4, 6)], Direction.UP),
+            _snake([(3, 5), (2, 5)], Direction.RIGHT),
+        )
+
+        tick = arena.step([None, None])
+
+        assert tick.crashes == {1: Crash.BODY}
+        assert arena.alive == [True, False]
+        assert arena.owner(Position(x=4, y=5)) == 0
+        assert arena.owner(Position(x=2, y=5)) == EMPTY
+
+    def test_following_a_tail(self):
+        """Test a head may enter the cell another tail leaves."""
+        arena = _arena(
+            _snake([(4, 4), (4, 5)], Direction.UP),
+            _snake([(3, 5), (2, 5)], Direction.RIGHT),
+        )
+
+        assert Direction.RIGHT in arena.safe_moves(1)
+        tick = arena.step([None, None])
+
+        assert tick.crashes == {}
+        assert arena.owner(Position(x=4, y=5)) == 1
+
+    def test_grown_tail_stays(self):
+        """Test the tail of a snake that just ate still blocks."""
+        arena = _arena(
+            _snake([(4, 4), (4, 5)], Direction.UP),
+            _snake([(3, 5), (2, 5)], Direction.RIGHT),
+        )
+        arena.snakes[0] = arena.snakes[0].grow()
+
+        assert Direction.RIGHT not in arena.safe_moves(1)
+        tick = arena.step([None, None])
+
+        assert tick.crashes == {1: Crash.BODY}
+
+    def test_wall(self):
+        """Test leaving the board kills the snake."""
+        arena = _arena(_snake([(0, 3), (1, 3)], Direction.LEFT))
+
+        assert arena.safe_moves(0) == [Direction.UP, Direction.DOWN]
+        tick = arena.step([None])
+
+        assert tick.crashes == {0: Crash.WALL}
+        assert arena.live_count == 0
+        assert arena.owner(Position(x=1, y=3)) == EMPTY
+
+    def test_eating(self):
+        """Test eating grows the snake, scores and respawns the food."""
+        arena = _arena(_snake([(2, 2), (1, 2)], Direction.RIGHT))
+        arena.food = {2 * 10 + 3: Food(position=Position(x=3, y=2))}
+
+        tick = arena.step([None])
+        arena.step([None])
+
+        assert tick.eaten == (0,)
+        assert arena.scores == [10]
+        assert len(arena.snakes[0]) == 3
+        assert len(arena.food) == 1
+        assert Position(x=3, y=2) not in {f.position for f in arena.food.values()}
+
+    def test_random_play_keeps_grid(self):
+        """Test the owner grid matches the live snakes on every tick."""
+        rng = random.Random(4)
+        arena = Arena.create(20, 20, 30, food_count=10, rng=rng)
+
+        for _ in range(150):
+            moves = []
+            for index in range(len(arena.snakes)):
+                safe = arena.safe_moves(index)
+                moves.append(rng.choice(safe) if safe else None)
+            tick = arena.step(moves)
+            # A safe move can only be spoilt by another head
+            for index, crash in tick.crashes.items():
+                assert moves[index] is None or crash == Crash.HEAD_ON
+
+            owners = _owners(arena)
+            for y in range(20):
+                for x in range(20):
+                    position = Position(x=x, y=y)
+                    assert arena.owner(position) == owners.get(position, EMPTY)
+            assert not set(owners) & {f.position for f in arena.food.values()}
+
+        assert sum(arena.scores) > 0
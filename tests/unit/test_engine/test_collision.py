@@ -103,6 +103,22 @@ class TestFoodCollision:
 
         assert not checker.check_food_collision(snake, food)
 
+    def test_food_index_collision(self):
+        """Test the head is looked up among many food items."""
+        from src.models.food_index import FoodIndex
+
+        snake = Snake(
+            body=(Position(x=5, y=10), Position(x=4, y=10)),
+            direction=Direction.RIGHT
+        )
+        foods = FoodIndex(Food(position=Position(x=x, y=0)) for x in range(20))
+        checker = CollisionChecker(width=20, height=20)
+
+        assert not checker.check_food_index_collision(snake, foods)
+        assert checker.check_food_index_collision(
+            snake, foods.with_foods([Food(position=Position(x=5, y=10))])
+        )
+
 
 class TestAnyCollision:
     """Test combined collision checking."""
@@ -3,6 +3,8 @@
 import os
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 
+import random
+
 import pygame
 import pytest
 from unittest.mock import Mock, MagicMock, patch
@@ -199,3 +201,65 @@ class TestGameLoopRestart:
 
         assert loop.state.is_playing()
         assert loop.state.score == 0
+
+
+class TestGameLoopManyFood:
+    """Test playing with several food items on the board."""
+
+    def test_eating_extra_food(self):
+        """Test an extra item grows the snake and is replaced."""
+        from src.models.snake import Snake
+        from src.models.position import Position
+        from src.models.food import Food
+        from src.models.food_index import FoodIndex
+
+        loop = GameLoop(width=20, height=20, fps=10, food_count=3)
+        eaten = Position(x=6, y=10)
+        loop.state = GameState(
+            snake=Snake(
+                body=(Position(x=5, y=10), Position(x=4, y=10)),
+                direction=Direction.RIGHT
+            ),
+            food=Food(position=Position(x=0, y=0)),
+            score=0,
+            status=GameStatus.PLAYING,
+            width=20,
+            height=20,
+            extra_food=FoodIndex(
+                [Food(position=eaten), Food(position=Position(x=15, y=15))]
+            ),
+        )
+
+        loop.update()
+        loop.update()
+
+        assert loop.state.score == 10
+        assert len(loop.state.snake) == 3
+        assert loop.state.food == Food(position=Position(x=0, y=0))
+        assert loop.state.food_count == 3
+        assert eaten not in loop.state.extra_food
+
+    def test_restart_keeps_food_count(self):
+        """Test a restarted game gets the same number of food items."""
+        loop = GameLoop(width=20, height=20, fps=10, food_count=25)
+
+        loop.state = loop.state.game_over()
+        loop.handle_input(InputAction.RESTART)
+
+        assert loop.state.food_count == 25
+
+    def test_crowded_board_fills_up_without_crashing(self):
+        """Test eating when extra food takes every free cell ends well."""
+        for seed in range(20):
+            random.seed(seed)
+            loop = GameLoop(width=10, height=10, fps=10, food_count=60)
+            for _ in range(200):
+                state = loop.state
+                if not state.is_playing():
+                    break
+                # Greedily eat whatever food is next to the head
+                moves = state.safe_moves()
+                eating = [d for d in moves if state.food_at(state.snake.head + d.delta)]
+                loop.pending_direction = (eating or moves or [None])[0]
+                loop.update()
+                assert loop.state.food.position not in loop.state.extra_food
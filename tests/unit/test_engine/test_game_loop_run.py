@@ -7,6 +7,8 @@ import pytest
 from unittest.mock import Mock, MagicMock, patch, call
 import pygame
 from src.engine.game_loop import GameLoop
+from src.engine.input_handler import InputAction
+from src.models.direction import Direction
 from src.models.game_state import GameStatus
 
 
@@ -14,6 +16,7 @@ class TestGameLoopRun:
     """Test GameLoop.run() method."""
 
     @patch('src.engine.game_loop.pygame.init')
+    @patch('src.engine.game_loop.init_display')
     @patch('src.engine.game_loop.pygame.time.Clock')
     @patch('src.engine.game_loop.pygame.display.set_mode')
     @patch('src.engine.game_loop.pygame.display.set_caption')
@@ -24,6 +27,7 @@ class TestGameLoopRun:
         mock_set_caption,
         mock_set_mode,
         mock_clock_class,
+        mock_init_display,
         mock_init
     ):
         """Test run initializes pygame components."""
@@ -44,8 +48,9 @@ class TestGameLoopRun:
             game = GameLoop(width=20, height=20, fps=10)
             game.run()
 
-        # Verify initialization
-        mock_init.assert_called_once()
+        # Verify only display and fonts are initialized
+        mock_init_display.assert_called_once()
+        mock_init.assert_not_called()
         mock_set_mode.assert_called_once()
         mock_set_caption.assert_called_once_with("贪吃蛇 - Snake Game")
         mock_renderer_class.assert_called_once()
@@ -176,6 +181,7 @@ class TestGameLoopRun:
 
         # Verify render was called
         assert mock_renderer.render.call_count >= 1
+        assert game.first_frame_seconds is not None
 
     @patch('src.engine.game_loop.pygame.init')
     @patch('src.engine.game_loop.pygame.time.Clock')
@@ -243,3 +249,268 @@ class TestGameLoopRun:
 
         # Verify pygame.quit was called
         mock_quit.assert_called_once()
+
+    @patch('src.engine.game_loop.pygame.init')
+    @patch('src.engine.game_loop.pygame.time.Clock')
+    @patch('src.engine.game_loop.pygame.display.set_mode')
+    @patch('src.engine.game_loop.pygame.display.set_caption')
+    @patch('src.renderer.renderer.Renderer')
+    def test_run_drives_gc_controller(
+        self,
+        mock_renderer_class,
+        mock_set_caption,
+        mock_set_mode,
+        mock_clock_class,
+        mock_init
+    ):
+        """Test run starts, idles and stops the GC controller."""
+        mock_set_mode.return_value = MagicMock()
+        mock_clock_class.return_value = MagicMock()
+        mock_renderer_class.return_value = MagicMock()
+        controller = MagicMock()
+
+        with patch('src.engine.game_loop.pygame.event.get') as mock_events:
+            mock_events.return_value = [MagicMock(type=pygame.QUIT)]
+
+            game = GameLoop(width=10, height=10, fps=10, gc_controller=controller)
+            game.run()
+
+        controller.start.assert_called_once()
+        controller.collect_idle.assert_called()
+        controller.stop.assert_called_once()
+
+    @patch('src.engine.game_loop.pygame.init')
+    @patch('src.engine.game_loop.pygame.time.Clock')
+    @patch('src.engine.game_loop.pygame.display.set_mode')
+    @patch('src.engine.game_loop.pygame.display.set_caption')
+    @patch('src.renderer.renderer.Renderer')
+    def test_run_records_frames_with_capture(
+        self,
+        mock_renderer_class,
+        mock_set_caption,
+        mock_set_mode,
+        mock_clock_class,
+        mock_init
+    ):
+        """Test run hands the capture to the renderer and stops it on exit."""
+        mock_set_mode.return_value = MagicMock()
+        mock_clock_class.return_value = MagicMock()
+        mock_renderer = MagicMock()
+        mock_renderer_class.return_value = mock_renderer
+        capture = MagicMock()
+
+        with patch('src.engine.game_loop.pygame.event.get') as mock_events:
+            mock_events.return_value = [MagicMock(type=pygame.QUIT)]
+
+            game = GameLoop(width=10, height=10, fps=10, frame_capture=capture)
+            game.run()
+
+        assert mock_renderer.capture is capture
+        capture.start.assert_called_once()
+        capture.stop.assert_called_once()
+
+    @patch('src.engine.game_loop.pygame.init')
+    @patch('src.engine.game_loop.pygame.quit')
+    @patch('src.engine.game_loop.pygame.time.Clock')
+    @patch('src.engine.game_loop.pygame.display.set_mode')
+    @patch('src.engine.game_loop.pygame.display.set_caption')
+    @patch('src.renderer.renderer.Renderer')
+    def test_run_tears_down_on_error(
+        self,
+        mock_renderer_class,
+        mock_set_caption,
+        mock_set_mode,
+        mock_clock_class,
+        mock_quit,
+        mock_init
+    ):
+        """Test an error mid-game still stops GC tuning, tracing and capture."""
+        mock_set_mode.return_value = MagicMock()
+        mock_clock_class.return_value = MagicMock()
+        mock_renderer = MagicMock()
+        mock_renderer.render.side_effect = RuntimeError("render failed")
+        mock_renderer_class.return_value = mock_renderer
+        controller = MagicMock()
+        tracer = MagicMock()
+        capture = MagicMock()
+
+        with patch('src.engine.game_loop.pygame.event.get') as mock_events:
+            mock_events.return_value = []
+
+            game = GameLoop(
+                width=10,
+                height=10,
+                fps=10,
+                gc_controller=controller,
+                memory_tracer=tracer,
+                frame_capture=capture,
+            )
+            with pytest.raises(RuntimeError):
+                game.run()
+
+        controller.stop.assert_called_once()
+        tracer.detach.assert_called_once()
+        capture.stop.assert_called_once()
+        mock_quit.assert_called_once()
+
+
+class TestGameLoopRunIdleMode:
+    """Test GameLoop.run() in idle mode."""
+
+    @pytest.fixture
+    def pygame_mocks(self):
+        """Patch pygame setup calls and provide the mock renderer."""
+        with patch('src.engine.game_loop.pygame.init'), \
+                patch('src.engine.game_loop.pygame.quit'), \
+                patch('src.engine.game_loop.pygame.time.Clock'), \
+                patch('src.engine.game_loop.pygame.display.set_mode'), \
+                patch('src.engine.game_loop.pygame.display.set_caption'), \
+                patch('src.renderer.renderer.Renderer') as mock_renderer_class:
+            mock_renderer = MagicMock()
+            mock_renderer_class.return_value = mock_renderer
+            yield mock_renderer
+
+    def test_paused_game_renders_once_and_waits(self, pygame_mocks):
+        """Test an unchanged paused state is not re-rendered."""
+        game = GameLoop(width=10, height=10, fps=10, idle_mode=True)
+        game.state = game.state.pause()
+        timeout = MagicMock(type=pygame.NOEVENT)
+
+        with patch('src.engine.game_loop.pygame.event.get') as mock_get, \
+                patch('src.engine.game_loop.pygame.event.wait') as mock_wait:
+            mock_get.return_value = []
+            mock_wait.side_effect = [timeout, timeout, MagicMock(type=pygame.QUIT)]
+
+            game.run()
+
+        assert pygame_mocks.render.call_count == 1
+        assert mock_wait.call_count == 3
+
+    @patch('src.engine.game_loop.pygame.time.delay')
+    def test_game_over_responds_to_restart(self, mock_delay, pygame_mocks):
+        """Test the game-over screen handles input without delays."""
+        game = GameLoop(width=10, height=10, fps=10, idle_mode=True)
+        game.state = game.state.game_over()
+        restart = MagicMock(type=pygame.KEYDOWN, key=pygame.K_r)
+
+        with patch('src.engine.game_loop.pygame.event.get') as mock_get, \
+                patch('src.engine.game_loop.pygame.event.wait') as mock_wait:
+            mock_get.side_effect = [[], [], [MagicMock(type=pygame.QUIT)]]
+            mock_wait.return_value = restart
+
+            game.run()
+
+        mock_delay.assert_not_called()
+        assert game.state.is_playing()
+        assert pygame_mocks.render.call_count == 3
+
+    def test_expose_event_forces_redraw(self, pygame_mocks):
+        """Test a window expose event redraws the unchanged state."""
+        game = GameLoop(width=10, height=10, fps=10, idle_mode=True)
+        game.state = game.state.pause()
+
+        with patch('src.engine.game_loop.pygame.event.get') as mock_get, \
+                patch('src.engine.game_loop.pygame.event.wait') as mock_wait:
+            mock_get.return_value = []
+            mock_wait.side_effect = [
+                MagicMock(type=pygame.VIDEOEXPOSE),
+                MagicMock(type=pygame.QUIT),
+            ]
+
+            game.run()
+
+        assert pygame_mocks.render.call_count == 2
+
+
+class TestGameLoopDisplay:
+    """Test window setup and resizing."""
+
+    @patch('src.engine.game_loop.init_display')
+    @patch('src.engine.game_loop.pygame.display.set_caption')
+    @patch('src.engine.game_loop.pygame.display.set_mode')
+    def test_setup_display_uses_window_size(self, mock_set_mode, mock_caption, mock_init):
+        """Test the window size and cell size follow the settings."""
+        mock_set_mode.return_value = pygame.Surface((800, 800))
+        game = GameLoop(width=20, height=10, window_size=800, resizable=True)
+
+        renderer = game.setup_display()
+
+        mock_set_mode.assert_called_once_with((800, 800), pygame.RESIZABLE)
+        assert renderer.cell_size == 40
+
+    @patch('src.engine.game_loop.init_display')
+    @patch('src.engine.game_loop.pygame.display.set_caption')
+    @patch('src.engine.game_loop.pygame.display.set_mode')
+    def test_setup_display_low_res(self, mock_set_mode, mock_caption, mock_init):
+        """Test a low-resolution cell size selects the scaled renderer."""
+        from src.renderer.scaled import ScaledRenderer
+
+        mock_set_mode.return_value = pygame.Surface((600, 600))
+        game = GameLoop(width=20, height=20, low_res_cell_size=2)
+
+        renderer = game.setup_display()
+
+        assert isinstance(renderer, ScaledRenderer)
+        assert renderer.cell_size == 2
+
+    @patch('src.engine.game_loop.init_display')
+    @patch('src.engine.game_loop.pygame.display.set_caption')
+    @patch('src.engine.game_loop.pygame.display.set_mode')
+    def test_setup_display_viewport(self, mock_set_mode, mock_caption, mock_init):
+        """Test a viewport cell size selects the camera renderer."""
+        from src.renderer.viewport import ViewportRenderer
+
+        mock_set_mode.return_value = pygame.Surface((600, 600))
+        game = GameLoop(width=500, height=500, viewport_cell_size=12)
+
+        renderer = game.setup_display()
+
+        assert isinstance(renderer, ViewportRenderer)
+        assert renderer.cell_size == 12
+
+    def test_resize_event_refits_cells(self):
+        """Test a resized window redraws the frame with a new cell size."""
+        game = GameLoop(width=10, height=10, fps=10, idle_mode=True, resizable=True)
+        game.state = game.state.pause()
+        renderer = MagicMock(cell_size=60)
+        resized = pygame.Surface((300, 400))
+
+        with patch.object(game, 'setup_display', return_value=renderer), \
+                patch('src.engine.game_loop.pygame.quit'), \
+                patch('src.engine.game_loop.pygame.time.Clock'), \
+                patch('src.engine.game_loop.pygame.display.get_surface',
+                      return_value=resized), \
+                patch('src.engine.game_loop.pygame.event.get', return_value=[]), \
+                patch('src.engine.game_loop.pygame.event.wait') as mock_wait:
+            mock_wait.side_effect = [
+                MagicMock(type=pygame.VIDEORESIZE),
+                MagicMock(type=pygame.QUIT),
+            ]
+
+            game.run()
+
+        assert renderer.screen is resized
+        assert renderer.cell_size == 30
+        assert renderer.render.call_count == 2
+
+
+class TestGameLoopTerminal:
+    """Test GameLoop.run() in terminal mode."""
+
+    @patch('src.renderer.terminal.TerminalRenderer')
+    @patch('src.engine.terminal_input.TerminalInput')
+    def test_runs_without_pygame_window(self, mock_input_class, mock_renderer_class):
+        """Test terminal mode reads keys from stdin and renders as text."""
+        keys = mock_input_class.return_value.__enter__.return_value
+        keys.read_actions.side_effect = [[InputAction.MOVE_DOWN], [InputAction.QUIT]]
+        renderer = mock_renderer_class.return_value
+
+        with patch('src.engine.game_loop.pygame.display.set_mode') as mock_set_mode:
+            game = GameLoop(width=10, height=10, fps=10, terminal=True)
+            game.run()
+
+        mock_set_mode.assert_not_called()
+        renderer.render.assert_called_once_with(game.state)
+        assert game.state.snake.direction == Direction.DOWN
+        renderer.close.assert_called_once()
+        mock_input_class.return_value.__exit__.assert_called_once()
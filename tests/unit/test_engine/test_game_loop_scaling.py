@@ -0,0 +1,194 @@
+"""Asymptotic scaling tests for GameLoop.update().
+
+These tests time consecutive ticks on seeded games across grid sizes
+from 20x20 to 2000x2000 and snake lengths from 3 up to a nearly full
+board, fit the log-log slope of tick time against length and grid area,
+and fail when the fitted exponent points at linear (or worse) growth.
+
+They build bodies of up to 300k segments and depend on wall-clock
+timing, so they are marked ``slow`` and run only with ``--run-slow``.
+"""
+
+import math
+import random
+import time
+from dataclasses import replace
+from typing import List, Sequence, Tuple
+
+import pytest
+from src.engine.game_loop import GameLoop
+from src.models.direction import Direction
+from src.models.food import Food
+from src.models.game_state import GameState, GameStatus
+from src.models.position import Position
+from src.models.snake import Snake
+
+# Fitted exponents at or above this value fail (1.0 would be linear)
+MAX_EXPONENT = 0.25
+
+SEED = 1234
+TICKS = 200
+REPEATS = 5
+
+
+def _path_cell(index: int, width: int) -> Position:
+    """Get the cell at an index along a row-by-row serpentine path."""
+    y, offset = divmod(index, width)
+    x = offset if y % 2 == 0 else width - 1 - offset
+    return Position(x=x, y=y)
+
+
+def _step_direction(source: Position, target: Position) -> Direction:
+    """Get the direction of a single step between adjacent cells."""
+    for direction in Direction.all():
+        if source + direction.delta == target:
+            return direction
+    raise ValueError("cells are not adjacent")
+
+
+def _serpentine_state(
+    width: int, height: int, length: int, food_ahead: bool = False
+) -> GameState:
+    """Build a seeded state with the snake laid along a serpentine path.
+
+    The cell after the head on the path is always free, so one update
+    moves the snake without ending the game.
+
+    Args:
+        width: Grid width.
+        height: Grid height.
+        length: Snake length (must leave at least two free cells).
+        food_ahead: If True, place food on the cell the head moves into.
+
+    Returns:
+        A PLAYING game state.
+    """
+    random.seed(SEED)
+    body = tuple(_path_cell(k, width) for k in range(length - 1, -1, -1))
+    next_cell = _path_cell(length, width)
+    snake = Snake(body=body, direction=_step_direction(body[0], next_cell))
+    if food_ahead:
+        food = Food(position=next_cell)
+    else:
+        food = Food(position=_path_cell(width * height - 1, width))
+    return GameState(
+        snake=snake,
+        food=food,
+        score=0,
+        status=GameStatus.PLAYING,
+        width=width,
+        height=height,
+    )
+
+
+def _time_ticks(width: int, height: int, length: int, food_ahead: bool) -> float:
+    """Measure the best per-tick time of GameLoop.update over real play.
+
+    Every repeat plays consecutive ticks from a freshly built state,
+    steering the head along the serpentine path, so each tick extends
+    the body the way a game does rather than replaying a shared step.
+
+    Args:
+        width: Grid width.
+        height: Grid height.
+        length: Snake length at the start.
+        food_ahead: If True, every tick eats food placed in front of the
+            head.
+
+    Returns:
+        Seconds per tick (minimum over repeats).
+    """
+    # Every tick takes one free cell of the path
+    ticks = min(TICKS, width * height - length - 1)
+    steps = [
+        _step_direction(_path_cell(k - 1, width), _path_cell(k, width))
+        for k in range(length, length + ticks)
+    ]
+    foods = [Food(position=_path_cell(k, width)) for k in range(length, length + ticks)]
+    best = math.inf
+    for _ in range(REPEATS):
+        loop = GameLoop(width=width, height=height, fps=10)
+        loop.state = _serpentine_state(width, height, length, food_ahead)
+        start = time.perf_counter()
+        for tick in range(ticks):
+            if food_ahead:
+                loop.state = replace(loop.state, food=foods[tick])
+            loop.pending_direction = steps[tick]
+            loop.update()
+        best = min(best, (time.perf_counter() - start) / ticks)
+        assert loop.state.is_playing()
+        assert len(loop.state.snake) == length + (ticks if food_ahead else 0)
+    return best
+
+
+def _fit_exponent(sizes: Sequence[float], times: Sequence[float]) -> float:
+    """Fit the slope of log(time) against log(size) by least squares."""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(t) for t in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+def _sweep(configs: List[Tuple[int, int, int]], food_ahead: bool) -> List[float]:
+    """Time one tick for each (width, height, length) configuration."""
+    return [
+        _time_ticks(width, height, length, food_ahead)
+        for width, height, length in configs
+    ]
+
+
+class TestFitExponent:
+    """Test the slope fitting helper itself."""
+
+    def test_constant_is_flat(self):
+        """Test constant times give a zero exponent."""
+        assert _fit_exponent([1, 10, 100], [2.0, 2.0, 2.0]) == pytest.approx(0)
+
+    def test_linear_has_unit_exponent(self):
+        """Test linear times give an exponent of one."""
+        assert _fit_exponent([1, 10, 100], [1.0, 10.0, 100.0]) == pytest.approx(1)
+
+
+@pytest.mark.slow
+class TestTickScaling:
+    """Test per-tick cost does not grow with snake length or grid area."""
+
+    @pytest.mark.parametrize("side", [20, 200])
+    def test_move_tick_flat_up_to_near_full_board(self, side):
+        """Test plain move ticks stay flat as the snake fills the board."""
+        area = side * side
+        lengths = [3, area // 10, area // 2, area * 9 // 10]
+        times = _sweep([(side, side, length) for length in lengths], False)
+
+        assert _fit_exponent(lengths, times) < MAX_EXPONENT
+
+    def test_move_tick_flat_with_length_on_large_board(self):
+        """Test plain move ticks stay flat with length on a 2000x2000 grid."""
+        lengths = [3, 300, 30_000, 300_000]
+        times = _sweep([(2000, 2000, length) for length in lengths], False)
+
+        assert _fit_exponent(lengths, times) < MAX_EXPONENT
+
+    def test_move_tick_flat_with_grid_area(self):
+        """Test plain move ticks stay flat from 20x20 to 2000x2000."""
+        sides = [20, 200, 2000]
+        times = _sweep([(side, side, 3) for side in sides], False)
+
+        assert _fit_exponent([side * side for side in sides], times) < MAX_EXPONENT
+
+    def test_eat_tick_flat_with_grid_area(self):
+        """Test eating ticks (grow and food respawn) stay flat with area."""
+        sides = [20, 200, 2000]
+        times = _sweep([(side, side, 3) for side in sides], True)
+
+        assert _fit_exponent([side * side for side in sides], times) < MAX_EXPONENT
+
+    def test_eat_tick_flat_with_length(self):
+        """Test eating ticks stay flat with length up to a half-full board."""
+        lengths = [3, 400, 4_000, 20_000]
+        times = _sweep([(200, 200, length) for length in lengths], True)
+
+        assert _fit_exponent(lengths, times) < MAX_EXPONENT
@@ -0,0 +1,95 @@
+"""Unit tests for GCController."""
+
+import gc
+
+import pytest
+from src.engine.gc_control import GCController, GCPause
+
+
+@pytest.fixture
+def controller():
+    """Provide a controller that is always stopped afterwards."""
+    controller = GCController()
+    yield controller
+    controller.stop()
+
+
+class TestGCControllerLifecycle:
+    """Test applying and restoring GC settings."""
+
+    def test_start_raises_thresholds_and_freezes(self, controller):
+        """Test start applies thresholds and freezes startup objects."""
+        controller.start()
+
+        assert controller.active
+        assert gc.get_threshold() == controller.thresholds
+        assert gc.get_freeze_count() > 0
+        assert controller._on_gc in gc.callbacks
+
+    def test_stop_restores_settings(self):
+        """Test stop restores thresholds and removes the callback."""
+        original = gc.get_threshold()
+        controller = GCController()
+
+        controller.start()
+        controller.stop()
+
+        assert not controller.active
+        assert gc.get_threshold() == original
+        assert gc.get_freeze_count() == 0
+        assert controller._on_gc not in gc.callbacks
+
+    def test_start_is_idempotent(self, controller):
+        """Test starting twice registers a single callback."""
+        controller.start()
+        controller.start()
+
+        assert gc.callbacks.count(controller._on_gc) == 1
+
+
+class TestGCControllerCollection:
+    """Test idle collections and pause recording."""
+
+    def test_collect_idle_when_inactive(self, controller):
+        """Test nothing is collected before start."""
+        assert controller.collect_idle() == -1
+
+    def test_collect_idle_collects_due_generation(self):
+        """Test a due generation is collected and marked idle."""
+        controller = GCController(idle_thresholds=(0, 10**9, 10**9))
+        controller.start()
+        try:
+            generation = controller.collect_idle()
+        finally:
+            controller.stop()
+
+        assert generation == 0
+        assert controller.pauses[-1].idle
+        assert controller.pauses[-1].generation == 0
+
+    def test_in_frame_collections_are_recorded(self, controller):
+        """Test collections outside collect_idle are timed too."""
+        controller.start()
+
+        gc.collect(0)
+
+        assert not controller.pauses[-1].idle
+        assert controller.pauses[-1].duration >= 0
+
+    def test_stats_summarize_pauses(self, controller):
+        """Test stats split idle and in-frame pauses."""
+        controller.pauses.extend(
+            [
+                GCPause(generation=0, duration=0.002, collected=1, idle=True),
+                GCPause(generation=2, duration=0.010, collected=5, idle=False),
+            ]
+        )
+
+        stats = controller.stats()
+
+        assert stats.count == 2
+        assert stats.idle_count == 1
+        assert stats.total == pytest.approx(0.012)
+        assert stats.max_in_frame == pytest.approx(0.010)
+        assert stats.max_idle == pytest.approx(0.002)
+        assert "2 collections" in stats.format()
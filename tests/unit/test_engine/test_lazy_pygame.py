@@ -0,0 +1,72 @@
+"""Unit tests for deferred pygame loading and startup measurement."""
+
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+from unittest.mock import patch
+
+from src.engine import startup_profile
+from src.engine.input_handler import InputHandler, build_key_map
+from src.engine.lazy_pygame import LazyModule, init_display, pygame
+
+
+class TestLazyModule:
+    """Test the lazy module proxy."""
+
+    def test_import_deferred_until_attribute_access(self):
+        """Test the module is imported on first attribute access only."""
+        proxy = LazyModule("json")
+
+        assert not proxy.loaded
+        assert proxy.dumps([1]) == "[1]"
+        assert proxy.loaded
+
+    def test_attributes_can_be_patched(self):
+        """Test mock.patch can replace attributes on the proxy."""
+        proxy = LazyModule("json")
+
+        with patch.object(proxy, "dumps", return_value="patched"):
+            assert proxy.dumps([1]) == "patched"
+
+        assert proxy.dumps([1]) == "[1]"
+
+
+class TestInitDisplay:
+    """Test only the needed subsystems are started."""
+
+    def test_starts_display_and_fonts_quietly(self, monkeypatch):
+        """Test display and fonts are up and the pygame banner is hidden."""
+        monkeypatch.delenv("PYGAME_HIDE_SUPPORT_PROMPT", raising=False)
+
+        init_display()
+
+        assert os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] == "1"
+        assert pygame.display.get_init() and pygame.font.get_init()
+        pygame.quit()
+
+
+class TestLazyKeyMap:
+    """Test the key map is built on demand."""
+
+    def test_key_map_is_cached(self):
+        """Test the key map is built once and reused."""
+        assert InputHandler.KEY_MAP is InputHandler.KEY_MAP
+        assert InputHandler().KEY_MAP is InputHandler.KEY_MAP
+        assert InputHandler.KEY_MAP == build_key_map()
+
+
+class TestStartupProfile:
+    """Test startup measurements."""
+
+    def test_engine_imports_without_pygame(self):
+        """Test engine and model modules import without loading pygame."""
+        assert startup_profile.imports_pygame() is False
+
+    def test_measure_import_time(self):
+        """Test import time is measured in a fresh interpreter."""
+        assert startup_profile.measure_import_time(runs=1) > 0
+
+    def test_measure_first_frame(self):
+        """Test time to first frame is measured headlessly."""
+        assert startup_profile.measure_first_frame(width=10, height=10, runs=1) > 0
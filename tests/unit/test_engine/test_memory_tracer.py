@@ -0,0 +1,113 @@
+"""Unit tests for MemoryTracer."""
+
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+import tracemalloc
+
+import pygame
+import pytest
+from src.engine.game_loop import GameLoop
+from src.engine.memory_tracer import MemoryTracer, count_model_objects
+from src.models.game_state import GameState
+from src.renderer.renderer import Renderer
+
+
+@pytest.fixture
+def tracer():
+    """Provide a tracer that is always detached afterwards."""
+    tracer = MemoryTracer()
+    yield tracer
+    tracer.detach()
+
+
+class TestMemoryTracerTrace:
+    """Test tracing individual blocks."""
+
+    def test_trace_records_allocations(self, tracer):
+        """Test a traced block records net allocations by line."""
+        tracer.start()
+        kept = []
+
+        with tracer.trace("update"):
+            kept.append([object() for _ in range(1000)])
+
+        tick = tracer.ticks[-1]
+        assert tick.phase == "update"
+        assert tick.size > 0
+        assert tick.lines
+        assert any("test_memory_tracer.py" in line.location for line in tick.lines)
+
+    def test_trace_without_tracing_records_nothing(self, tracer):
+        """Test tracing is a no-op until the tracer is started."""
+        with tracer.trace("update"):
+            pass
+
+        assert len(tracer.ticks) == 0
+
+    def test_history_is_bounded(self):
+        """Test only the most recent calls are kept."""
+        tracer = MemoryTracer(history=3)
+        tracer.start()
+        try:
+            for _ in range(5):
+                with tracer.trace("update"):
+                    pass
+        finally:
+            tracer.stop()
+
+        assert len(tracer.ticks) == 3
+
+
+class TestMemoryTracerAttach:
+    """Test attaching to a game loop and renderer."""
+
+    def test_attach_traces_update_and_render(self, tracer):
+        """Test attached update and render calls are recorded per tick."""
+        pygame.init()
+        loop = GameLoop(width=10, height=10, fps=10)
+        renderer = Renderer(pygame.Surface((300, 300)), 30)
+
+        tracer.attach(loop, renderer)
+        for _ in range(3):
+            loop.update()
+            renderer.render(loop.state)
+        report = tracer.report()
+        tracer.detach()
+        pygame.quit()
+
+        phases = [(tick.phase, tick.tick) for tick in report.ticks]
+        assert phases == [
+            ("update", 1),
+            ("render", 1),
+            ("update", 2),
+            ("render", 2),
+            ("update", 3),
+            ("render", 3),
+        ]
+        assert report.peak > 0
+        assert report.object_counts["GameState"] >= 1
+        assert "update: 3 calls" in report.format()
+
+    def test_detach_restores_methods(self, tracer):
+        """Test detach removes the wrappers and stops tracing."""
+        was_tracing = tracemalloc.is_tracing()
+        loop = GameLoop(width=10, height=10, fps=10)
+
+        tracer.attach(loop)
+        tracer.detach()
+
+        assert "update" not in vars(loop)
+        assert tracemalloc.is_tracing() == was_tracing
+
+
+class TestCountModelObjects:
+    """Test live model object counting."""
+
+    def test_counts_live_states(self):
+        """Test live GameState instances are counted."""
+        before = count_model_objects()["GameState"]
+        states = [GameState.create_initial(10, 10) for _ in range(5)]
+
+        assert count_model_objects()["GameState"] >= before + len(states)
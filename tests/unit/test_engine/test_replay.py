@@ -0,0 +1,120 @@
+"""Unit tests for recorded game replays."""
+
+import random
+
+import pytest
+from src.engine.game_loop import GameLoop
+from src.engine.input_handler import InputAction
+from src.engine.replay import Replay, save_replays
+from src.models.direction import Direction
+
+MOVES = [None, Direction.DOWN, None, Direction.RIGHT, None, Direction.UP] * 5
+
+
+def _record(seed, moves, size=10):
+    """Play a game live and collect its states."""
+    random.seed(seed)
+    loop = GameLoop(width=size, height=size)
+    states = [loop.state]
+    for move in moves:
+        if not loop.state.is_playing():
+            break
+        loop.pending_direction = move
+        loop.update()
+        states.append(loop.state)
+    return states
+
+
+class TestReplay:
+    """Test replays reproduce the recorded game."""
+
+    def test_states_match_live_game(self):
+        """Test playback yields the same states as the original game."""
+        live = _record(seed=7, moves=MOVES)
+
+        replayed = list(Replay(10, 10, seed=7, moves=MOVES).states())
+
+        assert [
+            (s.snake.body, s.food.position, s.score, s.status) for s in replayed
+        ] == [(s.snake.body, s.food.position, s.score, s.status) for s in live]
+
+    def test_playback_stops_at_game_over(self):
+        """Test moves after the snake dies are ignored."""
+        replay = Replay(5, 5, seed=1, moves=[Direction.UP] * 20)
+
+        states = list(replay.states())
+
+        assert states[-1].is_over()
+        assert len(states) < 21
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        """Test a saved replay loads back unchanged."""
+        replay = Replay(12, 8, seed=3, moves=MOVES)
+        path = tmp_path / "game.json"
+
+        replay.save(path)
+
+        assert Replay.load(path) == replay
+
+    def test_load_rejects_invalid_file(self, tmp_path):
+        """Test a file missing replay fields raises ValueError."""
+        path = tmp_path / "game.json"
+        path.write_text('{"width": 10}')
+
+        with pytest.raises(ValueError):
+            Replay.load(path)
+
+
+def _summary(states):
+    """Reduce states to what a replay must reproduce."""
+    return [
+        (s.snake.body, s.food.position, s.extra_food, s.score, s.status) for s in states
+    ]
+
+
+class TestRecording:
+    """Test GameLoop records the games it plays."""
+
+    @pytest.mark.parametrize("food_count", [1, 4])
+    def test_recorded_game_plays_back(self, food_count):
+        """Test a recorded game replays to the same states."""
+        loop = GameLoop(width=10, height=10, food_count=food_count, record_replays=True)
+        live = [loop.state]
+        for move in MOVES:
+            if not loop.state.is_playing():
+                break
+            loop.pending_direction = move
+            loop.update()
+            live.append(loop.state)
+
+        (replay,) = loop.replays
+
+        assert replay.food_count == food_count
+        assert _summary(replay.states()) == _summary(live)
+
+    def test_restart_starts_new_replay(self):
+        """Test every game after a restart gets its own replay."""
+        loop = GameLoop(width=10, height=10, record_replays=True)
+        loop.update()
+        loop.handle_input(InputAction.RESTART)
+        loop.update()
+        loop.update()
+
+        assert [len(replay.moves) for replay in loop.replays] == [1, 2]
+        assert list(loop.replays[1].states())[-1].snake == loop.state.snake
+
+    def test_not_recording_by_default(self):
+        """Test a loop records nothing unless asked."""
+        loop = GameLoop(width=10, height=10)
+        loop.update()
+
+        assert loop.replays == []
+
+    def test_save_replays(self, tmp_path):
+        """Test recorded games are written one file each, skipping empty ones."""
+        replays = [Replay(10, 10, seed=1, moves=MOVES), Replay(10, 10, seed=2)]
+
+        paths = save_replays(replays, tmp_path / "replays")
+
+        assert len(paths) == 1
+        assert Replay.load(paths[0]) == replays[0]
@@ -0,0 +1,94 @@
+"""Unit tests for the spectator loop."""
+
+import pytest
+from src.engine.spectator import MAX_CATCH_UP_TICKS, SpectatorLoop, chase_food
+from src.models.direction import Direction
+from src.models.position import Position
+
+
+class TestChaseFood:
+    """Test the default bot policy."""
+
+    def test_turns_towards_food(self, make_state):
+        """Test the bot heads for the food."""
+        state = make_state(
+            [Position(x=5, y=5), Position(x=4, y=5)],
+            Direction.RIGHT,
+            Position(x=5, y=1),
+        )
+
+        assert chase_food(state) == Direction.UP
+
+    def test_avoids_walls(self, make_state):
+        """Test the bot does not steer off the board."""
+        state = make_state(
+            [Position(x=9, y=0), Position(x=8, y=0)],
+            Direction.RIGHT,
+            Position(x=0, y=0),
+        )
+
+        assert chase_food(state) == Direction.DOWN
+
+
+class TestSpectatorLoop:
+    """Test games advance on independent clocks."""
+
+    def test_games_tick_at_their_own_rate(self):
+        """Test each game runs as many ticks as its rate allows."""
+        spectator = SpectatorLoop(tick_rates=[1, 2])
+
+        ticks = [game.advance(1.0) for game in spectator.games]
+
+        assert ticks == [2, 3]
+
+    def test_catch_up_is_capped(self):
+        """Test a long stall does not run the whole backlog at once."""
+        spectator = SpectatorLoop(tick_rates=[10])
+        game = spectator.games[0]
+
+        assert game.advance(100.0) == MAX_CATCH_UP_TICKS
+        assert game.next_tick > 100.0
+
+    def test_finished_games_restart(self):
+        """Test a game that ends is restarted on its next tick."""
+        spectator = SpectatorLoop(tick_rates=[10], width=5, height=5)
+        game = spectator.games[0]
+        game.loop.state = game.loop.state.game_over()
+
+        spectator.step(0.0)
+
+        assert game.loop.state.is_playing()
+
+    def test_step_keeps_snakes_alive(self):
+        """Test the bots play without dying straight away."""
+        spectator = SpectatorLoop(tick_rates=[10] * 4)
+
+        for frame in range(1, 31):
+            spectator.step(frame / 10)
+
+        assert all(state.score > 0 for state in spectator.states())
+
+    def test_each_game_has_its_own_policy(self):
+        """Test per-game bots only ever see their own game, tick after tick."""
+        seen = [[], []]
+
+        def recorder(bodies):
+            def policy(state):
+                bodies.append(state.snake.body)
+                return chase_food(state)
+
+            return policy
+
+        spectator = SpectatorLoop(
+            tick_rates=[10, 10], policies=[recorder(seen[0]), recorder(seen[1])]
+        )
+        spectator.step(0.25)
+
+        for bodies in seen:
+            assert len(bodies) == 3
+            assert all(b.follows(a) for a, b in zip(bodies, bodies[1:]))
+
+    def test_policies_must_match_games(self):
+        """Test a policy count different from the game count is rejected."""
+        with pytest.raises(ValueError):
+            SpectatorLoop(tick_rates=[10, 10], policies=[chase_food])
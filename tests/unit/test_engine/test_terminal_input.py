@@ -0,0 +1,82 @@
+"""Unit tests for terminal keyboard input."""
+
+import os
+import time
+
+from src.engine.input_handler import InputAction
+from src.engine.terminal_input import (
+    ESCAPE_TIMEOUT,
+    TerminalInput,
+    parse_keys,
+    split_incomplete,
+)
+
+
+class TestParseKeys:
+    """Test terminal characters are translated into actions."""
+
+    def test_arrow_keys(self):
+        """Test arrow key escape sequences are moves."""
+        assert parse_keys("\x1b[A\x1b[D\x1bOB") == [
+            InputAction.MOVE_UP,
+            InputAction.MOVE_LEFT,
+            InputAction.MOVE_DOWN,
+        ]
+
+    def test_letter_keys(self):
+        """Test letter bindings match the window key map."""
+        assert parse_keys("dW rq") == [
+            InputAction.MOVE_RIGHT,
+            InputAction.MOVE_UP,
+            InputAction.PAUSE,
+            InputAction.RESTART,
+            InputAction.QUIT,
+        ]
+
+    def test_lone_escape_quits_and_unknown_keys_are_skipped(self):
+        """Test escape without a sequence quits and other keys do nothing."""
+        assert parse_keys("x1\x1b") == [InputAction.QUIT]
+
+    def test_split_incomplete_holds_back_sequence_starts(self):
+        """Test a trailing escape or escape prefix is held back."""
+        assert split_incomplete("w\x1b") == ("w", "\x1b")
+        assert split_incomplete("\x1b[A\x1bO") == ("\x1b[A", "\x1bO")
+        assert split_incomplete("\x1b\x1b[") == ("\x1b", "\x1b[")
+        assert split_incomplete("\x1b[A") == ("\x1b[A", "")
+
+
+class TestTerminalInput:
+    """Test keys are read without blocking."""
+
+    def test_reads_available_keys(self):
+        """Test pending input is returned and an empty pipe returns nothing."""
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(read_fd) as stream, TerminalInput(stream) as keys:
+            assert keys.read_actions() == []
+            os.write(write_fd, b"w\x1b[C")
+            assert keys.read_actions(timeout=1.0) == [
+                InputAction.MOVE_UP,
+                InputAction.MOVE_RIGHT,
+            ]
+        os.close(write_fd)
+
+    def test_arrow_key_split_across_reads(self):
+        """Test an escape sequence cut between two reads is not a quit."""
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(read_fd) as stream, TerminalInput(stream) as keys:
+            os.write(write_fd, b"\x1b")
+            assert keys.read_actions(timeout=1.0) == []
+            os.write(write_fd, b"[C")
+            assert keys.read_actions(timeout=1.0) == [InputAction.MOVE_RIGHT]
+        os.close(write_fd)
+
+    def test_lone_escape_quits_after_timeout(self):
+        """Test an escape with nothing after it quits once the wait is over."""
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(read_fd) as stream, TerminalInput(stream) as keys:
+            os.write(write_fd, b"\x1b")
+            assert keys.read_actions() == []
+            start = time.monotonic()
+            assert keys.read_actions(timeout=5.0) == [InputAction.QUIT]
+            assert time.monotonic() - start < 1.0 + ESCAPE_TIMEOUT
+        os.close(write_fd)
@@ -83,6 +83,43 @@ class TestMainFunction:
         # Verify error exit code
         mock_exit.assert_called_once_with(1)
 
+    @patch('src.main.GameLoop')
+    @patch('src.main.SpectatorLoop')
+    @patch('src.main.Settings')
+    def test_main_runs_spectator_mode(
+        self, mock_settings_class, mock_spectator_class, mock_game_loop_class
+    ):
+        """Test main shows tiled bot games when spectator mode is set."""
+        from src import main
+        from src.config.settings import Settings
+
+        mock_settings_class.return_value = Settings(SPECTATOR_GAMES=4)
+
+        main.main()
+
+        assert mock_spectator_class.call_args.kwargs['tick_rates'] == [5] * 4
+        mock_spectator_class.return_value.run.assert_called_once()
+        mock_game_loop_class.assert_not_called()
+
+    @patch('src.main.SpectatorLoop')
+    @patch('src.main.Settings')
+    def test_spectator_games_get_own_autopilots(
+        self, mock_settings_class, mock_spectator_class
+    ):
+        """Test each spectator game gets its own bot and share of the frame."""
+        from src import main
+        from src.config.settings import Settings
+
+        mock_settings_class.return_value = Settings(
+            SPECTATOR_GAMES=4, AUTOPILOT="planner", BOT_TIME_FRACTION=0.5
+        )
+
+        main.main()
+
+        policies = mock_spectator_class.call_args.kwargs['policies']
+        assert len({id(policy) for policy in policies}) == 4
+        assert all(policy.time_fraction == 0.125 for policy in policies)
+
 
 class TestMainImports:
     """Test that main module imports correctly."""
@@ -102,3 +139,21 @@ class TestMainImports:
         sig = inspect.signature(main.main)
         assert len(sig.parameters) == 0
         assert sig.return_annotation == None
+
+    def test_import_does_not_load_bots(self):
+        """Test the bots and numpy are only imported when a bot plays."""
+        import subprocess
+
+        code = (
+            "import sys, src.main; "
+            "print('src.bots.factory' in sys.modules, 'numpy' in sys.modules)"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.abspath(root),
+        )
+        assert result.stdout.split() == ["False", "False"]
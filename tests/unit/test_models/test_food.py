@@ -1,5 +1,7 @@
 """Unit tests for Food model."""
 
+import random
+
 import pytest
 from src.models.food import Food
 from src.models.position import Position
@@ -55,3 +57,39 @@ class TestFoodGeneration:
 
         food = Food.spawn_random(width=20, height=20, forbidden=forbidden)
         assert food.position == Position(x=0, y=0)
+
+
+class TestFoodBatchSpawn:
+    """Test spawning many food items at once."""
+
+    def test_spawn_many_on_distinct_free_cells(self):
+        """Test a batch fills distinct cells avoiding every collection."""
+        body = {Position(x=x, y=0) for x in range(20)}
+        placed = {Position(x=3, y=3)}
+
+        foods = Food.spawn_many(20, 20, 100, occupied=(body, placed))
+
+        positions = {food.position for food in foods}
+        assert len(foods) == len(positions) == 100
+        assert not positions & (body | placed)
+        assert all(0 <= p.x < 20 and 0 <= p.y < 20 for p in positions)
+
+    def test_spawn_many_on_crowded_board(self):
+        """Test the last free cells are found when sampling misses them."""
+        random.seed(0)
+        free = {Position(x=0, y=0), Position(x=19, y=19), Position(x=7, y=3)}
+        forbidden = {
+            Position(x=x, y=y) for x in range(20) for y in range(20)
+        } - free
+
+        foods = Food.spawn_many(20, 20, 3, occupied=(forbidden,))
+
+        assert {food.position for food in foods} == free
+
+    def test_spawn_many_returns_what_fits(self):
+        """Test a full board yields fewer items instead of failing."""
+        forbidden = {Position(x=x, y=0) for x in range(3)}
+
+        assert len(Food.spawn_many(3, 2, 5, occupied=(forbidden,))) == 3
+        assert Food.spawn_many(3, 1, 2, occupied=(forbidden,)) == []
+        assert Food.spawn_many(3, 2, 0) == []
@@ -0,0 +1,55 @@
+"""Unit tests for the food index."""
+
+from src.models.food import Food
+from src.models.food_index import NO_EXTRA_FOOD, FoodIndex
+from src.models.position import Position
+
+
+def _food(x, y):
+    """Create food at a cell."""
+    return Food(position=Position(x=x, y=y))
+
+
+class TestFoodIndex:
+    """Test looking up, removing and adding food items."""
+
+    def test_lookup(self):
+        """Test cells and food items are found by position."""
+        index = FoodIndex([_food(1, 2), _food(3, 4)])
+
+        assert len(index) == 2
+        assert Position(x=1, y=2) in index
+        assert _food(3, 4) in index
+        assert Position(x=2, y=2) not in index
+        assert index.get(Position(x=3, y=4)) == _food(3, 4)
+        assert index.get(Position(x=0, y=0)) is None
+        assert set(index) == {_food(1, 2), _food(3, 4)}
+
+    def test_without_leaves_original(self):
+        """Test removing an item builds a new index."""
+        index = FoodIndex([_food(1, 2), _food(3, 4)])
+
+        smaller = index.without(Position(x=1, y=2))
+
+        assert list(smaller) == [_food(3, 4)]
+        assert len(index) == 2
+        assert index.without(Position(x=9, y=9)) is index
+
+    def test_with_foods(self):
+        """Test adding items builds a new index."""
+        index = FoodIndex([_food(1, 2)])
+
+        larger = index.with_foods([_food(5, 5)])
+
+        assert set(larger) == {_food(1, 2), _food(5, 5)}
+        assert len(index) == 1
+
+    def test_equality(self):
+        """Test indices with the same items are equal and hash alike."""
+        first = FoodIndex([_food(1, 2), _food(3, 4)])
+        second = FoodIndex([_food(3, 4), _food(1, 2)])
+
+        assert first == second
+        assert hash(first) == hash(second)
+        assert first != NO_EXTRA_FOOD
+        assert not NO_EXTRA_FOOD
@@ -1,9 +1,13 @@
 """Unit tests for GameState model."""
 
+import random
+
 import pytest
+from src.engine.collision import CollisionChecker
 from src.models.game_state import GameState, GameStatus
 from src.models.snake import Snake
 from src.models.food import Food
+from src.models.food_index import FoodIndex
 from src.models.position import Position
 from src.models.direction import Direction
 
@@ -167,3 +171,242 @@ class TestGameStateQuery:
         """Test is_over returns True when game over."""
         state = GameState.create_initial(width=20, height=20).game_over()
         assert state.is_over()
+
+
+def _lookahead_state(body, direction, food=Position(x=9, y=9)):
+    """Create a playing 10x10 state with the given snake and food."""
+    return GameState(
+        snake=Snake(
+            body=tuple(Position(x=x, y=y) for x, y in body), direction=direction
+        ),
+        food=Food(position=food),
+        score=0,
+        status=GameStatus.PLAYING,
+        width=10,
+        height=10,
+    )
+
+
+class TestGameStateLookahead:
+    """Test one-step lookahead over all moves."""
+
+    def test_outcomes_follow_direction_order(self):
+        """Test one outcome is reported per move, in Direction.all() order."""
+        state = GameState.create_initial(width=20, height=20)
+
+        outcomes = state.move_outcomes()
+
+        assert [o.direction for o in outcomes] == Direction.all()
+
+    def test_reversal_is_illegal(self):
+        """Test moving back into the neck is flagged as illegal."""
+        state = _lookahead_state([(5, 5), (4, 5), (3, 5)], Direction.RIGHT)
+
+        outcomes = {o.direction: o for o in state.move_outcomes()}
+
+        assert not outcomes[Direction.LEFT].legal
+        assert outcomes[Direction.RIGHT].legal
+        assert state.safe_moves() == [Direction.UP, Direction.DOWN, Direction.RIGHT]
+
+    def test_wall(self):
+        """Test moves off the board hit the wall and have no target."""
+        state = _lookahead_state([(0, 0), (1, 0), (2, 0)], Direction.LEFT)
+
+        outcomes = {o.direction: o for o in state.move_outcomes()}
+
+        assert outcomes[Direction.UP].hits_wall
+        assert outcomes[Direction.UP].target is None
+        assert outcomes[Direction.LEFT].hits_wall
+        assert not outcomes[Direction.DOWN].hits_wall
+        assert outcomes[Direction.DOWN].target == Position(x=0, y=1)
+        assert state.safe_moves() == [Direction.DOWN]
+
+    def test_head_off_the_board(self):
+        """Test a head that crashed through the wall sees the board beside it."""
+        state = _lookahead_state([(-1, 3), (0, 3), (1, 3)], Direction.LEFT)
+
+        outcomes = {o.direction: o for o in state.move_outcomes()}
+
+        assert outcomes[Direction.UP].hits_wall
+        assert outcomes[Direction.DOWN].hits_wall
+        assert outcomes[Direction.RIGHT].hits_body
+        assert outcomes[Direction.RIGHT].target == Position(x=0, y=3)
+
+    def test_vacating_tail_is_free(self):
+        """Test the cell the tail leaves this tick does not collide."""
+        state = _lookahead_state([(0, 0), (1, 0), (1, 1), (0, 1)], Direction.LEFT)
+
+        outcomes = {o.direction: o for o in state.move_outcomes()}
+
+        assert not outcomes[Direction.DOWN].hits_body
+        assert outcomes[Direction.DOWN].safe
+
+    def test_grown_tail_stays(self):
+        """Test a tail that just grew keeps its cell for another tick."""
+        snake = Snake(
+            body=(
+                Position(x=0, y=0),
+                Position(x=1, y=0),
+                Position(x=1, y=1),
+                Position(x=0, y=1),
+            ),
+            direction=Direction.LEFT,
+        )
+        state = GameState(
+            snake=snake.grow(),
+            food=Food(position=Position(x=9, y=9)),
+            score=0,
+            status=GameStatus.PLAYING,
+            width=10,
+            height=10,
+        )
+
+        outcomes = {o.direction: o for o in state.move_outcomes()}
+
+        assert outcomes[Direction.DOWN].hits_body
+        assert state.safe_moves() == []
+
+    def test_eats(self):
+        """Test a move onto the food is flagged as eating."""
+        state = _lookahead_state(
+            [(5, 5), (4, 5), (3, 5)], Direction.RIGHT, food=Position(x=5, y=4)
+        )
+
+        eats = [o.direction for o in state.move_outcomes() if o.eats]
+
+        assert eats == [Direction.UP]
+
+    def test_matches_speculative_moves(self):
+        """Test outcomes agree with actually moving the snake."""
+        random.seed(7)
+        state = GameState.create_initial(width=8, height=8)
+        checker = CollisionChecker(width=8, height=8)
+
+        for _ in range(300):
+            for outcome in state.move_outcomes():
+                if not outcome.legal:
+                    continue
+                moved = state.change_direction(outcome.direction).move_snake()
+                assert outcome.safe != checker.has_collision(moved.snake, moved.food)
+                assert outcome.eats == checker.check_food_collision(
+                    moved.snake, moved.food
+                )
+            safe = state.safe_moves()
+            if not safe:
+                break
+            state = state.change_direction(random.choice(safe)).move_snake()
+            if state.snake.head == state.food.position:
+                state = GameState(
+                    snake=state.snake.grow(),
+                    food=state.food,
+                    score=state.score + 10,
+                    status=state.status,
+                    width=8,
+                    height=8,
+                ).respawn_food()
+
+
+class TestGameStateExtraFood:
+    """Test boards with several food items."""
+
+    def test_create_with_many_food_items(self):
+        """Test the initial state spreads food over free cells."""
+        random.seed(3)
+        state = GameState.create_initial(width=20, height=20, food_count=50)
+
+        positions = {food.position for food in state.extra_food}
+        positions.add(state.food.position)
+        assert state.food_count == 50
+        assert len(positions) == 50
+        assert not any(position in state.snake.body for position in positions)
+
+    def test_single_food_by_default(self):
+        """Test the default board has no extra food."""
+        state = GameState.create_initial(width=10, height=10)
+
+        assert state.food_count == 1
+        assert not state.extra_food
+
+    def test_food_at(self):
+        """Test any food item is found by its cell."""
+        random.seed(4)
+        state = GameState.create_initial(width=10, height=10, food_count=5)
+        extra = next(iter(state.extra_food))
+
+        assert state.food_at(state.food.position) == state.food
+        assert state.food_at(extra.position) == extra
+        assert state.food_at(state.snake.head) is None
+
+    def test_updates_keep_extra_food(self):
+        """Test state transitions carry the extra food along."""
+        random.seed(5)
+        state = GameState.create_initial(width=10, height=10, food_count=5)
+
+        moved = state.change_direction(Direction.UP).move_snake().pause().resume()
+
+        assert moved.extra_food is state.extra_food
+        assert moved.with_score(30).game_over().extra_food is state.extra_food
+
+    def test_respawn_extra_food(self):
+        """Test an eaten item moves to a free cell and the count holds."""
+        random.seed(6)
+        state = GameState.create_initial(width=10, height=10, food_count=8)
+        eaten = next(iter(state.extra_food)).position
+
+        respawned = state.respawn_extra_food(eaten)
+
+        assert respawned.food_count == 8
+        assert eaten not in respawned.extra_food
+        assert respawned.food == state.food
+        assert respawned.food.position not in respawned.extra_food
+
+    def test_respawn_food_avoids_extra_food(self):
+        """Test the main food never lands on an extra item."""
+        random.seed(7)
+        state = GameState.create_initial(width=4, height=4, food_count=12)
+
+        for _ in range(20):
+            state = state.respawn_food()
+            assert state.food.position not in state.extra_food
+            assert state.food.position not in state.snake.body
+
+    def test_respawn_food_on_full_board_promotes_extra_food(self):
+        """Test extra food takes over when it fills the last free cells."""
+        # Snake on the top row of a 3x2 board, extra food on the other row
+        state = GameState(
+            snake=Snake(
+                body=(Position(x=0, y=0), Position(x=1, y=0), Position(x=2, y=0)),
+                direction=Direction.LEFT,
+            ),
+            food=Food(position=Position(x=0, y=0)),
+            score=0,
+            status=GameStatus.PLAYING,
+            width=3,
+            height=2,
+            extra_food=FoodIndex(Food(position=Position(x=x, y=1)) for x in range(3)),
+        )
+
+        respawned = state.respawn_food()
+
+        assert respawned.food.position.y == 1
+        assert respawned.food_count == 3
+        assert respawned.food.position not in respawned.extra_food
+
+    def test_outcomes_see_extra_food(self):
+        """Test the lookahead flags moves onto extra food."""
+        state = GameState(
+            snake=Snake(
+                body=(Position(x=5, y=5), Position(x=4, y=5)),
+                direction=Direction.RIGHT,
+            ),
+            food=Food(position=Position(x=0, y=0)),
+            score=0,
+            status=GameStatus.PLAYING,
+            width=10,
+            height=10,
+            extra_food=FoodIndex([Food(position=Position(x=5, y=4))]),
+        )
+
+        eats = [outcome.direction for outcome in state.move_outcomes() if outcome.eats]
+
+        assert eats == [Direction.UP]
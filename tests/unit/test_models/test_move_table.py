@@ -0,0 +1,60 @@
+"""Unit tests for the precomputed move tables."""
+
+from src.models.direction import Direction
+from src.models.move_table import MOVES, REVERSALS, move_table
+from src.models.position import Position
+
+
+class TestMoveTable:
+    """Test neighbour tables per board size."""
+
+    def test_neighbours_in_move_order(self):
+        """Test neighbours follow Direction.all() with -1 off the board."""
+        table = move_table(4, 3)
+        corner = Position(x=0, y=0)
+
+        assert list(MOVES) == Direction.all()
+        assert table.neighbours(corner) == (
+            (-1, None),
+            (4, Position(x=0, y=1)),
+            (-1, None),
+            (1, Position(x=1, y=0)),
+        )
+        assert table.neighbour_cells(table.cell(corner)) == (-1, 4, -1, 1)
+
+    def test_far_corner(self):
+        """Test the bottom-right corner has only up and left neighbours."""
+        table = move_table(4, 3)
+
+        cells = table.neighbour_cells(table.cell(Position(x=3, y=2)))
+
+        assert cells == (7, -1, 10, -1)
+
+    def test_row_edges_do_not_wrap(self):
+        """Test left and right stop at the row ends on every row."""
+        table = move_table(5, 4)
+
+        for cell in range(5 * 4):
+            up, down, left, right = table.neighbour_cells(cell)
+            neighbours = table.neighbours(table.position(cell))
+            assert [index for index, _ in neighbours] == [up, down, left, right]
+            for index, position in neighbours:
+                assert index == -1 or table.cell(position) == index
+
+    def test_off_board_positions(self):
+        """Test positions off the board have no cell and on-board neighbours."""
+        table = move_table(4, 3)
+        outside = Position(x=2, y=-1)
+
+        assert table.cell(outside) == -1
+        assert table.cell(Position(x=4, y=0)) == -1
+        assert table.neighbours(outside)[1] == (2, Position(x=2, y=0))
+
+    def test_tables_are_cached_per_size(self):
+        """Test the same board size returns the same table."""
+        assert move_table(6, 7) is move_table(6, 7)
+        assert move_table(6, 7) is not move_table(7, 6)
+
+    def test_reversals(self):
+        """Test each move maps to its opposite."""
+        assert all(REVERSALS[move] == move.opposite for move in MOVES)
@@ -0,0 +1,175 @@
+"""Unit tests for SnakeBody persistent storage."""
+
+import pytest
+from src.models.position import Position
+from src.models.snake_body import COMPACT_MIN, SnakeBody
+
+
+def _cells(*coords):
+    """Build a tuple of positions from (x, y) pairs."""
+    return tuple(Position(x=x, y=y) for x, y in coords)
+
+
+class TestSnakeBodySequence:
+    """Test SnakeBody behaves like a tuple of positions."""
+
+    def test_from_positions_round_trip(self):
+        """Test a body built from positions iterates in the same order."""
+        cells = _cells((5, 5), (4, 5), (3, 5))
+        body = SnakeBody.from_positions(cells)
+
+        assert tuple(body) == cells
+        assert body == cells
+        assert len(body) == 3
+        assert body.head == Position(x=5, y=5)
+        assert body.tail == Position(x=3, y=5)
+
+    def test_indexing_and_slicing(self):
+        """Test integer and slice indexing."""
+        cells = _cells((5, 5), (4, 5), (3, 5))
+        body = SnakeBody.from_positions(cells)
+
+        assert body[0] == cells[0]
+        assert body[-1] == cells[-1]
+        assert body[1:] == cells[1:]
+        with pytest.raises(IndexError):
+            body[3]
+
+    def test_hash_matches_tuple(self):
+        """Test equal bodies hash like their tuples."""
+        cells = _cells((1, 1), (1, 2))
+
+        assert hash(SnakeBody.from_positions(cells)) == hash(cells)
+
+
+class TestSnakeBodyAdvance:
+    """Test advancing bodies without copying."""
+
+    def test_advance_slides_window(self):
+        """Test advance adds a head and drops the tail."""
+        body = SnakeBody.from_positions(_cells((5, 5), (4, 5), (3, 5)))
+
+        moved = body.advance(Position(x=6, y=5))
+
+        assert moved == _cells((6, 5), (5, 5), (4, 5))
+        assert body == _cells((5, 5), (4, 5), (3, 5))
+
+    def test_advance_with_grow_keeps_tail(self):
+        """Test advance with grow keeps every segment."""
+        body = SnakeBody.from_positions(_cells((5, 5), (4, 5)))
+
+        moved = body.advance(Position(x=6, y=5), grow=True)
+
+        assert moved == _cells((6, 5), (5, 5), (4, 5))
+
+    def test_grow_tail_duplicates_tail(self):
+        """Test grow_tail matches tuple tail duplication across moves."""
+        body = SnakeBody.from_positions(_cells((5, 5), (4, 5)))
+
+        grown = body.grow_tail()
+        moved = grown.advance(Position(x=6, y=5))
+
+        assert grown == _cells((5, 5), (4, 5), (4, 5))
+        assert moved == _cells((6, 5), (5, 5), (4, 5))
+
+    def test_padding_counts_duplicated_tail(self):
+        """Test padding reports tail duplicates until they are used up."""
+        body = SnakeBody.from_positions(_cells((5, 5), (4, 5)))
+
+        grown = body.grow_tail().grow_tail()
+
+        assert (body.padding, grown.padding) == (0, 2)
+        assert grown.advance(Position(x=6, y=5)).padding == 1
+
+    def test_branching_keeps_both_bodies(self):
+        """Test advancing the same body twice in different directions."""
+        body = SnakeBody.from_positions(_cells((5, 5), (4, 5)))
+
+        up = body.advance(Position(x=5, y=4))
+        down = body.advance(Position(x=5, y=6))
+        up_again = body.advance(Position(x=5, y=4))
+
+        assert up == _cells((5, 4), (5, 5))
+        assert down == _cells((5, 6), (5, 5))
+        assert up_again == up
+
+    def test_compaction_preserves_segments(self):
+        """Test long games compact storage without changing the body."""
+        body = SnakeBody.from_positions(_cells((0, 0), (0, 1)))
+        for step in range(1, COMPACT_MIN * 3):
+            body = body.advance(Position(x=step, y=0))
+
+        assert body == _cells((COMPACT_MIN * 3 - 1, 0), (COMPACT_MIN * 3 - 2, 0))
+
+
+class TestSnakeBodyOccupancy:
+    """Test membership and self-collision queries."""
+
+    def test_contains(self):
+        """Test membership for occupied and free cells."""
+        body = SnakeBody.from_positions(_cells((5, 5), (4, 5), (3, 5)))
+        moved = body.advance(Position(x=6, y=5))
+
+        assert Position(x=3, y=5) in body
+        assert Position(x=3, y=5) not in moved
+        assert Position(x=6, y=5) in moved
+        assert Position(x=6, y=5) not in body
+
+    def test_head_collides(self):
+        """Test the head is detected on a later segment."""
+        square = _cells((1, 1), (2, 1), (2, 2), (1, 2))
+        body = SnakeBody.from_positions(square)
+
+        looped = body.advance(Position(x=1, y=2), grow=True)
+
+        assert not body.head_collides()
+        assert looped.head_collides()
+
+    def test_head_follows_tail_without_collision(self):
+        """Test moving into the cell the tail just left is safe."""
+        body = SnakeBody.from_positions(_cells((1, 1), (2, 1), (2, 2), (1, 2)))
+
+        moved = body.advance(Position(x=1, y=2))
+
+        assert not moved.head_collides()
+
+    def test_single_segment_grown_collides(self):
+        """Test a one-segment body with a duplicated tail collides."""
+        body = SnakeBody.from_positions(_cells((1, 1)))
+
+        assert body.grow_tail().head_collides()
+
+
+class TestSnakeBodyCoordinates:
+    """Test flat coordinate export."""
+
+    def test_coordinates_tail_to_head(self):
+        """Test coordinates are x, y pairs ordered from tail to head."""
+        body = SnakeBody.from_positions(_cells((5, 5), (4, 5), (3, 5)))
+
+        moved = body.advance(Position(x=5, y=6)).grow_tail()
+
+        assert list(body.coordinates()) == [3, 5, 4, 5, 5, 5]
+        assert list(moved.coordinates()) == [4, 5, 5, 5, 5, 6]
+
+
+class TestSnakeBodyFollows:
+    """Test detection of one-step successors."""
+
+    def test_advanced_body_follows(self):
+        """Test plain and growing steps follow the previous body."""
+        body = SnakeBody.from_positions(_cells((5, 5), (4, 5), (3, 5)))
+
+        assert body.advance(Position(x=6, y=5)).follows(body)
+        assert body.advance(Position(x=6, y=5), grow=True).follows(body)
+        assert body.advance(Position(x=6, y=5)).grow_tail().follows(body)
+
+    def test_unrelated_bodies_do_not_follow(self):
+        """Test equal segments on another trail or two steps do not count."""
+        body = SnakeBody.from_positions(_cells((5, 5), (4, 5), (3, 5)))
+        moved = body.advance(Position(x=6, y=5))
+        copy = SnakeBody.from_positions(tuple(moved))
+
+        assert not copy.follows(body)
+        assert not body.follows(body)
+        assert not moved.advance(Position(x=7, y=5)).follows(body)
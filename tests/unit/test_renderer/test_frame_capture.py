@@ -0,0 +1,165 @@
+"""Unit tests for background frame capture."""
+
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+import json
+import threading
+
+import pygame
+import pytest
+from src.models.game_state import GameState
+from src.renderer.frame_capture import RAW, FrameCapture, encode_png
+from src.renderer.renderer import Renderer
+
+
+@pytest.fixture
+def surface():
+    """Create a small surface with distinct pixels."""
+    pygame.init()
+    surface = pygame.Surface((7, 5))
+    surface.fill((10, 20, 30))
+    surface.fill((200, 100, 50), pygame.Rect(2, 1, 3, 2))
+    yield surface
+    pygame.quit()
+
+
+class TestEncodePng:
+    """Test the PNG encoder."""
+
+    def test_round_trips_through_pygame(self, surface, tmp_path):
+        """Test an encoded image loads back with the same pixels."""
+        pixels = pygame.image.tobytes(surface, "RGB")
+        path = tmp_path / "frame.png"
+        path.write_bytes(encode_png(pixels, 7, 5))
+
+        loaded = pygame.image.load(str(path))
+
+        assert loaded.get_size() == (7, 5)
+        assert pygame.image.tobytes(loaded, "RGB") == pixels
+
+
+class TestFrameCapture:
+    """Test frames are queued and written by worker threads."""
+
+    def test_writes_png_sequence(self, surface, tmp_path):
+        """Test every submitted frame becomes a numbered PNG file."""
+        capture = FrameCapture(tmp_path / "frames")
+        capture.start()
+        for _ in range(3):
+            assert capture.submit(surface)
+        capture.stop()
+
+        names = sorted(path.name for path in (tmp_path / "frames").iterdir())
+        assert names == ["frame_000000.png", "frame_000001.png", "frame_000002.png"]
+        loaded = pygame.image.load(str(tmp_path / "frames" / names[0]))
+        assert loaded.get_at((3, 1))[:3] == (200, 100, 50)
+        assert capture.stats().written == 3
+
+    def test_drops_frames_when_queue_full(self, surface, tmp_path):
+        """Test submit returns at once and drops frames it cannot queue."""
+        capture = FrameCapture(tmp_path, max_queued=2)
+
+        results = [capture.submit(surface) for _ in range(5)]
+
+        assert results == [True, True, False, False, False]
+        stats = capture.stats()
+        assert (stats.submitted, stats.dropped) == (5, 3)
+
+    def test_back_pressure_waits_for_free_slot(self, surface, tmp_path):
+        """Test a full queue blocks submit until a worker takes a frame."""
+        capture = FrameCapture(tmp_path, max_queued=1, max_wait=5.0)
+        capture.submit(surface)
+        timer = threading.Timer(0.05, capture.start)
+        timer.start()
+
+        assert capture.submit(surface)
+
+        timer.join()
+        capture.stop()
+        stats = capture.stats()
+        assert (stats.written, stats.dropped) == (2, 0)
+        assert stats.max_wait > 0
+
+    def test_writes_raw_video_with_metadata(self, surface, tmp_path):
+        """Test raw frames are concatenated and described in a JSON file."""
+        path = tmp_path / "game.rgb"
+        capture = FrameCapture(path, format=RAW)
+        capture.start()
+        capture.submit(surface)
+        capture.submit(surface)
+        assert not capture.submit(pygame.Surface((3, 3)))
+        capture.stop()
+
+        assert path.read_bytes() == pygame.image.tobytes(surface, "RGB") * 2
+        metadata = json.loads((tmp_path / "game.rgb.json").read_text())
+        assert metadata == {
+            "pixel_format": "rgb24",
+            "width": 7,
+            "height": 5,
+            "frames": 2,
+        }
+
+    def test_write_errors_are_reported(self, surface, tmp_path):
+        """Test a failed write is recorded and the other frames still drain."""
+        (tmp_path / "frame_000001.png").mkdir()
+        capture = FrameCapture(tmp_path, max_queued=1, max_wait=None)
+        capture.start()
+        for _ in range(4):
+            assert capture.submit(surface)
+
+        with pytest.raises(RuntimeError):
+            capture.stop()
+
+        stats = capture.stats()
+        assert (stats.written, stats.failed) == (3, 1)
+        assert "frame_000001.png" in stats.error
+        assert "1 failed" in stats.format()
+        assert not capture.active
+
+    def test_stop_gives_up_on_hung_workers(self, surface, tmp_path, monkeypatch):
+        """Test stop returns after its timeout when a write never finishes."""
+        release = threading.Event()
+        monkeypatch.setattr(
+            "src.renderer.frame_capture.encode_png",
+            lambda *args: release.wait() and b"",
+        )
+        capture = FrameCapture(tmp_path, max_queued=1)
+        capture.start()
+        capture.submit(surface)
+        capture.submit(surface)
+
+        with pytest.raises(RuntimeError):
+            capture.stop(timeout=0.05)
+
+        release.set()
+        assert not capture.active
+
+    def test_rejects_unknown_format(self, tmp_path):
+        """Test an unsupported format raises ValueError."""
+        with pytest.raises(ValueError):
+            FrameCapture(tmp_path, format="gif")
+
+
+class TestRendererCapture:
+    """Test the renderer hands frames to the capture."""
+
+    def test_render_submits_frame(self, tmp_path):
+        """Test each rendered frame is recorded."""
+        pygame.init()
+        capture = FrameCapture(tmp_path)
+        renderer = Renderer(pygame.Surface((200, 200)), 20, capture=capture)
+        state = GameState.create_initial(width=10, height=10)
+
+        capture.start()
+        renderer.render(state)
+        renderer.render(state.move_snake())
+        capture.stop()
+
+        assert capture.stats().written == 2
+        loaded = pygame.image.load(str(tmp_path / "frame_000001.png"))
+        assert pygame.image.tobytes(loaded, "RGB") == pygame.image.tobytes(
+            renderer.screen, "RGB"
+        )
+        pygame.quit()
@@ -0,0 +1,139 @@
+"""Unit tests for GridRasterizer."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+from src.models.direction import Direction
+from src.models.food import Food
+from src.models.game_state import GameState, GameStatus
+from src.models.position import Position
+from src.models.snake import Snake
+from src.renderer.grid_rasterizer import (
+    BODY,
+    FOOD,
+    HEAD,
+    NUM_CHANNELS,
+    WALLS,
+    GridRasterizer,
+)
+
+
+def _state(body, food=(7, 5), width=10, height=8):
+    """Build a state from (x, y) body pairs, head first."""
+    snake = Snake(
+        body=tuple(Position(x=x, y=y) for x, y in body),
+        direction=Direction.RIGHT,
+    )
+    return GameState(
+        snake=snake,
+        food=Food(position=Position(x=food[0], y=food[1])),
+        score=0,
+        status=GameStatus.PLAYING,
+        width=width,
+        height=height,
+    )
+
+
+class TestRasterize:
+    """Test single-state rasterization."""
+
+    def test_shape_includes_wall_border(self):
+        """Test tensors have a wall ring around the board."""
+        rasterizer = GridRasterizer(width=10, height=8)
+
+        tensor = rasterizer.rasterize(_state([(3, 2), (2, 2), (1, 2)]))
+
+        assert tensor.shape == (NUM_CHANNELS, 10, 12)
+        assert tensor[WALLS, 0].all() and tensor[WALLS, :, 0].all()
+        assert tensor[WALLS, 1:-1, 1:-1].sum() == 0
+
+    def test_channels(self):
+        """Test head, body ages and food are placed on the right cells."""
+        rasterizer = GridRasterizer(width=10, height=8, border=0)
+
+        tensor = rasterizer.rasterize(_state([(3, 2), (2, 2), (1, 2)]))
+
+        assert tensor[HEAD, 2, 3] == 1 and tensor[HEAD].sum() == 1
+        assert tensor[BODY, 2, 3] == pytest.approx(1.0)
+        assert tensor[BODY, 2, 2] == pytest.approx(2 / 3)
+        assert tensor[BODY, 2, 1] == pytest.approx(1 / 3)
+        assert tensor[FOOD, 5, 7] == 1 and tensor[FOOD].sum() == 1
+        assert tensor[WALLS].sum() == 0
+
+    def test_extra_food(self):
+        """Test every food item is marked in the food channel."""
+        from dataclasses import replace
+
+        from src.models.food_index import FoodIndex
+
+        rasterizer = GridRasterizer(width=10, height=8)
+        state = replace(
+            _state([(3, 2), (2, 2), (1, 2)]),
+            extra_food=FoodIndex(
+                [Food(position=Position(x=0, y=0)), Food(position=Position(x=9, y=7))]
+            ),
+        )
+
+        tensor = rasterizer.rasterize(state)
+
+        assert tensor[FOOD].sum() == 3
+        assert tensor[FOOD, 1, 1] == 1 and tensor[FOOD, 8, 10] == 1
+
+    def test_writes_into_caller_buffer(self):
+        """Test stale contents of a reused buffer are overwritten."""
+        rasterizer = GridRasterizer(width=10, height=8)
+        out = np.full(rasterizer.shape, 7, dtype=np.float32)
+
+        result = rasterizer.rasterize(_state([(3, 2), (2, 2)]), out=out)
+
+        assert result is out
+        assert out[HEAD].sum() == 1
+        assert out[FOOD].sum() == 1
+
+    def test_rejects_wrong_buffer_shape(self):
+        """Test a mismatched buffer is rejected."""
+        rasterizer = GridRasterizer(width=10, height=8)
+
+        with pytest.raises(ValueError):
+            rasterizer.rasterize(_state([(3, 2)]), out=np.zeros((4, 8, 10)))
+
+    def test_head_outside_board_is_skipped(self):
+        """Test a game-over head beyond the wall ring does not raise."""
+        rasterizer = GridRasterizer(width=10, height=8, border=0)
+
+        tensor = rasterizer.rasterize(_state([(10, 2), (9, 2)]))
+
+        assert tensor[HEAD].sum() == 0
+        assert tensor[BODY, 2, 9] == pytest.approx(0.5)
+
+    def test_does_not_import_pygame(self):
+        """Test the rasterizer module itself does not need pygame."""
+        import src.renderer.grid_rasterizer as module
+
+        assert "pygame" not in module.__dict__
+
+
+class TestRasterizeBatch:
+    """Test batch rasterization."""
+
+    def test_batch_matches_single_states(self):
+        """Test each batch slot equals the single-state tensor."""
+        rasterizer = GridRasterizer(width=10, height=8)
+        states = [
+            _state([(3, 2), (2, 2), (1, 2)]),
+            _state([(5, 5), (5, 6)], food=(0, 0)),
+        ]
+
+        batch = rasterizer.rasterize_batch(states)
+
+        assert batch.shape == (2,) + rasterizer.shape
+        for index, state in enumerate(states):
+            assert (batch[index] == rasterizer.rasterize(state)).all()
+
+    def test_empty_batch(self):
+        """Test an empty batch returns an empty tensor."""
+        rasterizer = GridRasterizer(width=10, height=8)
+
+        assert rasterizer.rasterize_batch([]).shape == (0,) + rasterizer.shape
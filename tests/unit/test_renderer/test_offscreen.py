@@ -0,0 +1,124 @@
+"""Unit tests for OffscreenRenderer."""
+
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import pygame
+from src.config.colors import DEFAULT_COLORS
+from src.models.direction import Direction
+from src.models.food import Food
+from src.models.game_state import GameState, GameStatus
+from src.models.position import Position
+from src.models.snake import Snake
+from src.renderer.offscreen import OffscreenRenderer, surface_for
+
+
+def _state(width=10, height=8):
+    """Build a small state with a known snake and food."""
+    snake = Snake(
+        body=(Position(x=3, y=2), Position(x=2, y=2), Position(x=1, y=2)),
+        direction=Direction.RIGHT,
+    )
+    return GameState(
+        snake=snake,
+        food=Food(position=Position(x=7, y=5)),
+        score=0,
+        status=GameStatus.PLAYING,
+        width=width,
+        height=height,
+    )
+
+
+class TestSurfaceFor:
+    """Test array-backed surfaces."""
+
+    def test_drawing_writes_into_array(self):
+        """Test surface pixels share memory with the array."""
+        frame = np.zeros((4, 6, 3), dtype=np.uint8)
+
+        surface_for(frame).fill((1, 2, 3))
+
+        assert (frame == (1, 2, 3)).all()
+
+    def test_rejects_wrong_layout(self):
+        """Test non-contiguous or wrongly shaped arrays are rejected."""
+        with pytest.raises(ValueError):
+            surface_for(np.zeros((4, 6), dtype=np.uint8))
+        with pytest.raises(ValueError):
+            surface_for(np.zeros((6, 4, 3), dtype=np.uint8).transpose(1, 0, 2))
+
+
+class TestOffscreenRender:
+    """Test single-frame rendering."""
+
+    def test_frame_shape_follows_cell_size(self):
+        """Test frames are grid size times cell size."""
+        renderer = OffscreenRenderer(width=10, height=8, cell_size=2)
+
+        assert renderer.frame_shape == (16, 20, 3)
+        assert renderer.render(_state()).shape == (16, 20, 3)
+
+    def test_one_pixel_per_cell(self):
+        """Test a cell size of 1 maps each cell to one pixel."""
+        renderer = OffscreenRenderer(width=10, height=8)
+
+        frame = renderer.render(_state())
+
+        assert tuple(frame[2, 3]) == DEFAULT_COLORS.SNAKE_HEAD
+        assert tuple(frame[2, 1]) == DEFAULT_COLORS.SNAKE_BODY
+        assert tuple(frame[5, 7]) == DEFAULT_COLORS.FOOD
+        assert tuple(frame[0, 0]) == DEFAULT_COLORS.BACKGROUND
+
+    def test_renders_into_preallocated_array(self):
+        """Test frames are written into the caller's array without copies."""
+        out = np.zeros((8, 10, 3), dtype=np.uint8)
+        renderer = OffscreenRenderer(width=10, height=8, out=out)
+
+        assert renderer.render(_state()) is out
+        assert out.any()
+
+    def test_rejects_wrong_out_shape(self):
+        """Test a mismatched preallocated array is rejected."""
+        with pytest.raises(ValueError):
+            OffscreenRenderer(width=10, height=8, out=np.zeros((10, 8, 3), np.uint8))
+
+    def test_detailed_drawing_at_large_cell_size(self):
+        """Test large cells use the regular triangle drawing."""
+        pygame.font.init()
+        renderer = OffscreenRenderer(width=10, height=8, cell_size=20, show_hud=True)
+
+        frame = renderer.render(_state().game_over())
+
+        assert frame.shape == (160, 200, 3)
+        assert frame.any()
+
+
+class TestOffscreenBatch:
+    """Test batch rendering."""
+
+    def test_batch_matches_single_frames(self):
+        """Test each batch slot equals the single-frame render."""
+        renderer = OffscreenRenderer(width=10, height=8)
+        states = [_state(), _state().move_snake(), _state().move_snake().move_snake()]
+
+        batch = renderer.render_batch(states)
+
+        assert batch.shape == (3, 8, 10, 3)
+        for index, state in enumerate(states):
+            assert (batch[index] == renderer.render(state)).all()
+
+    def test_batch_reuses_buffer(self):
+        """Test a preallocated batch buffer is filled in place."""
+        renderer = OffscreenRenderer(width=10, height=8)
+        out = np.zeros((2, 8, 10, 3), dtype=np.uint8)
+
+        first = renderer.render_batch([_state(), _state()], out=out)
+        second = renderer.render_batch([_state(), _state()], out=out)
+
+        assert first is out and second is out
+        assert out[1].any()
@@ -141,3 +141,51 @@ class TestDrawingMethods:
         assert height == cell_size
 
         pygame.quit()
+
+
+class TestSnakeConnections:
+    """Test the polyline drawing of snake connections."""
+
+    def _line_per_pair(self, renderer, snake):
+        """Draw connections the slow way, one line per segment pair."""
+        body = snake.body
+        for i in range(len(body) - 1):
+            renderer._draw_connection(body[i], body[i + 1])
+
+    def test_polyline_matches_line_per_pair(self):
+        """Test the polyline draws the same pixels as separate lines."""
+        from src.models.snake import Snake
+
+        pygame.init()
+        body = tuple(Position(x=x, y=y) for y in range(3) for x in range(5))
+        # Head one cell off the board, as in a game over, and a grown tail
+        snake = Snake(body=(Position(x=-1, y=0),) + body, direction=Direction.LEFT)
+        snake = snake.grow()
+        expected = Renderer(pygame.Surface((200, 200)), 20)
+        actual = Renderer(pygame.Surface((200, 200)), 20)
+
+        self._line_per_pair(expected, snake)
+        actual._draw_snake_connections(snake)
+
+        assert pygame.image.tobytes(actual.screen, "RGB") == pygame.image.tobytes(
+            expected.screen, "RGB"
+        )
+
+        pygame.quit()
+
+    def test_segment_centers_follow_cell_size(self):
+        """Test the center table is rebuilt when the cell size changes."""
+        from src.models.snake import Snake
+
+        pygame.init()
+        renderer = Renderer(pygame.Surface((200, 200)), 20)
+        snake = Snake(
+            body=(Position(x=2, y=1), Position(x=1, y=1)), direction=Direction.RIGHT
+        )
+
+        assert renderer._segment_centers(snake.body) == [(50, 30), (30, 30)]
+
+        renderer.cell_size = 10
+        assert renderer._segment_centers(snake.body) == [(25, 15), (15, 15)]
+
+        pygame.quit()
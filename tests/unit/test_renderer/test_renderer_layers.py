@@ -0,0 +1,180 @@
+"""Unit tests for Renderer layer compositing."""
+
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+import random
+from unittest.mock import patch
+
+import pygame
+import pytest
+from src.engine.game_loop import GameLoop
+from src.engine.input_handler import InputAction
+from src.models.direction import Direction
+from src.models.game_state import GameState
+from src.renderer.renderer import Renderer
+
+CELL_SIZE = 20
+GRID = 10
+
+
+def _renderers(cell_size):
+    """Create a layered and a direct renderer."""
+    size = (GRID * cell_size, GRID * cell_size)
+    layered = Renderer(pygame.Surface(size), cell_size)
+    direct = Renderer(pygame.Surface(size), cell_size, layered=False)
+    return layered, direct
+
+
+@pytest.fixture
+def renderers():
+    """Create a layered and a direct renderer at the default cell size."""
+    pygame.init()
+    yield _renderers(CELL_SIZE)
+    pygame.quit()
+
+
+def _pixels(renderer):
+    """Get the raw pixels of a renderer's screen."""
+    return pygame.image.tobytes(renderer.screen, "RGB")
+
+
+def _play(ticks, seed):
+    """Yield the states of games played by chasing the food.
+
+    Random detours make the snake turn, run into walls and itself, and
+    the game restarts after each game over.
+    """
+    random.seed(seed)
+    loop = GameLoop(width=GRID, height=GRID)
+    yield loop.state
+    for _ in range(ticks):
+        if loop.state.is_over():
+            loop.handle_input(InputAction.RESTART)
+        head = loop.state.snake.head
+        food = loop.state.food.position
+        if random.random() < 0.1:
+            loop.pending_direction = random.choice(list(Direction))
+        elif food.x != head.x:
+            loop.pending_direction = (
+                Direction.RIGHT if food.x > head.x else Direction.LEFT
+            )
+        else:
+            loop.pending_direction = Direction.DOWN if food.y > head.y else Direction.UP
+        loop.update()
+        yield loop.state
+
+
+class TestLayeredMatchesDirect:
+    """Test incremental layers produce the same frames as full redraws."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    @pytest.mark.parametrize("cell_size", [4, CELL_SIZE])
+    def test_played_game_frames_match(self, cell_size, seed):
+        """Test every frame of a played game matches a direct render."""
+        pygame.init()
+        layered, direct = _renderers(cell_size)
+
+        for state in _play(ticks=200, seed=seed):
+            layered.render(state)
+            direct.render(state)
+            assert _pixels(layered) == _pixels(direct)
+
+        pygame.quit()
+
+    def test_moves_repaint_only_changed_cells(self, renderers):
+        """Test a plain move repaints cells instead of the playfield."""
+        layered, _ = renderers
+        state = GameState.create_initial(width=GRID, height=GRID)
+        layered.render(state)
+
+        with patch.object(layered, "_draw_snake") as draw_snake:
+            layered.render(state.move_snake())
+
+        draw_snake.assert_not_called()
+
+    def test_unrelated_state_redraws_playfield(self, renderers):
+        """Test a state that does not follow the last one is fully drawn."""
+        layered, direct = renderers
+        layered.render(GameState.create_initial(width=GRID, height=GRID).move_snake())
+        restarted = GameState.create_initial(width=GRID, height=GRID)
+
+        layered.render(restarted)
+        direct.render(restarted)
+
+        assert _pixels(layered) == _pixels(direct)
+
+
+class TestLayerCaching:
+    """Test layers are rebuilt only when their inputs change."""
+
+    def test_background_built_once_per_size(self):
+        """Test the background is drawn once until the screen is resized."""
+        pygame.init()
+        renderer = Renderer(pygame.Surface((200, 200)), CELL_SIZE)
+        state = GameState.create_initial(width=GRID, height=GRID)
+
+        with patch.object(
+            renderer, "_draw_background", wraps=renderer._draw_background
+        ) as draw_background:
+            renderer.render(state)
+            renderer.render(state.move_snake())
+            assert draw_background.call_count == 1
+
+            renderer.screen = pygame.Surface((300, 300))
+            renderer.render(state)
+            assert draw_background.call_count == 2
+
+        pygame.quit()
+
+    def test_hud_redrawn_only_when_score_changes(self):
+        """Test the score text is rendered once per score value."""
+        pygame.init()
+        renderer = Renderer(pygame.Surface((200, 200)), CELL_SIZE)
+        state = GameState.create_initial(width=GRID, height=GRID)
+
+        with patch.object(
+            renderer, "_draw_score", wraps=renderer._draw_score
+        ) as draw_score:
+            renderer.render(state)
+            renderer.render(state.move_snake())
+            assert draw_score.call_count == 1
+
+            renderer.render(state.with_score(10))
+            assert draw_score.call_count == 2
+
+        pygame.quit()
+
+    def test_overlay_redrawn_only_when_status_changes(self):
+        """Test the overlay is drawn once per status."""
+        pygame.init()
+        renderer = Renderer(pygame.Surface((200, 200)), CELL_SIZE)
+        paused = GameState.create_initial(width=GRID, height=GRID).pause()
+
+        with patch.object(
+            renderer, "_draw_overlay", wraps=renderer._draw_overlay
+        ) as draw_overlay:
+            renderer.render(paused)
+            renderer.render(paused.with_score(10))
+            assert draw_overlay.call_count == 1
+
+            renderer.render(paused.resume())
+            assert draw_overlay.call_count == 2
+
+        pygame.quit()
+
+    @pytest.mark.parametrize("status", ["pause", "game_over"])
+    def test_overlay_matches_direct(self, renderers, status):
+        """Test the cached overlay dims the board like a direct render."""
+        layered, direct = renderers
+        state = GameState.create_initial(width=GRID, height=GRID)
+        layered.render(state)
+        state = getattr(state, status)()
+
+        layered.render(state)
+        direct.render(state)
+
+        assert _pixels(layered) == _pixels(direct)
+        # Dimmed by half, not blacked out
+        assert layered.screen.get_at((100, 100))[:3] == (10, 10, 15)
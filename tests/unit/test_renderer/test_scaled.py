@@ -0,0 +1,78 @@
+"""Unit tests for ScaledRenderer."""
+
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+import pygame
+import pytest
+from src.config.colors import DEFAULT_COLORS
+from src.models.game_state import GameState
+from src.renderer.scaled import ScaledRenderer, fit_rect
+
+
+@pytest.fixture(autouse=True)
+def pygame_ready():
+    """Initialize pygame for each test."""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class TestFitRect:
+    """Test fitting the board into a window."""
+
+    def test_whole_scale_factor(self):
+        """Test content is scaled by the largest whole factor."""
+        assert fit_rect((20, 20), (600, 600)) == pygame.Rect(0, 0, 600, 600)
+        assert fit_rect((20, 20), (650, 610)) == pygame.Rect(25, 5, 600, 600)
+
+    def test_letterbox_keeps_aspect_ratio(self):
+        """Test wide windows get side margins."""
+        assert fit_rect((20, 10), (100, 100)) == pygame.Rect(0, 25, 100, 50)
+
+    def test_shrinks_large_content(self):
+        """Test content larger than the window is shrunk to fit."""
+        assert fit_rect((100, 50), (60, 60)) == pygame.Rect(0, 15, 60, 30)
+
+
+class TestScaledRenderer:
+    """Test low-resolution rendering with upscaling."""
+
+    def _render(self, screen, cell_size=1):
+        """Render the initial 10x10 state onto a screen."""
+        renderer = ScaledRenderer(screen, cell_size, present=False)
+        renderer.font = None
+        renderer.large_font = None
+        state = GameState.create_initial(width=10, height=10)
+        renderer.render(state)
+        return renderer, state
+
+    def test_playfield_is_low_resolution(self):
+        """Test the playfield holds cell_size pixels per cell."""
+        renderer, _ = self._render(pygame.Surface((400, 400)), cell_size=2)
+
+        assert renderer._playfield.get_size() == (20, 20)
+        assert renderer.board_rect == pygame.Rect(0, 0, 400, 400)
+
+    def test_cells_are_upscaled_to_window(self):
+        """Test each cell fills a block of the window."""
+        screen = pygame.Surface((200, 100))
+        renderer, state = self._render(screen)
+
+        head = state.snake.head
+        board = renderer.board_rect
+        assert board == pygame.Rect(50, 0, 100, 100)
+        for dx, dy in ((0, 0), (9, 9)):
+            pixel = (board.x + head.x * 10 + dx, board.y + head.y * 10 + dy)
+            assert screen.get_at(pixel)[:3] == DEFAULT_COLORS.SNAKE_HEAD
+        assert screen.get_at((0, 0))[:3] == DEFAULT_COLORS.BACKGROUND
+
+    def test_refits_after_resize(self):
+        """Test a new screen size refits the board."""
+        renderer, state = self._render(pygame.Surface((100, 100)))
+
+        renderer.screen = pygame.Surface((300, 200))
+        renderer.render(state.move_snake())
+
+        assert renderer.board_rect == pygame.Rect(50, 0, 200, 200)
@@ -0,0 +1,110 @@
+"""Unit tests for the tiled spectator view."""
+
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+import pygame
+import pytest
+from src.models.game_state import GameState
+from src.renderer.renderer import Renderer
+from src.renderer.spectator import TiledView, TileRenderer, SpriteCache, tile_grid
+
+GRID = 10
+
+
+@pytest.fixture
+def display():
+    """Initialize pygame for the test."""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _pixels(surface):
+    """Get the raw pixels of a surface."""
+    return pygame.image.tobytes(surface, "RGB")
+
+
+class TestTileGrid:
+    """Test tiles are laid out in a near-square grid."""
+
+    @pytest.mark.parametrize(
+        "count,grid", [(1, (1, 1)), (4, (2, 2)), (5, (3, 2)), (64, (8, 8))]
+    )
+    def test_grid_holds_all_games(self, count, grid):
+        """Test the grid has room for every game."""
+        assert tile_grid(count) == grid
+
+
+class TestTileRenderer:
+    """Test sprite-based tiles look like the plain renderer."""
+
+    @pytest.mark.parametrize("cell_size", [6, 20])
+    def test_sprites_match_drawn_shapes(self, display, cell_size):
+        """Test blitted sprites give the same pixels as drawing."""
+        size = (GRID * cell_size, GRID * cell_size)
+        tile = TileRenderer(pygame.Surface(size), cell_size, SpriteCache())
+        plain = Renderer(pygame.Surface(size), cell_size, present=False)
+        for renderer in (tile, plain):
+            renderer.font = None
+            renderer.large_font = None
+        state = GameState.create_initial(width=GRID, height=GRID)
+
+        for _ in range(5):
+            tile.render(state)
+            plain.render(state)
+            assert _pixels(tile.screen) == _pixels(plain.screen)
+            state = state.move_snake()
+
+    def test_tiles_share_sprites(self, display):
+        """Test sprites are drawn once for all tiles."""
+        sprites = SpriteCache()
+
+        first = sprites.segment(20, (1, 2, 3))
+
+        assert sprites.segment(20, (1, 2, 3)) is first
+        assert sprites.food(20) is sprites.food(20)
+
+
+class TestTiledView:
+    """Test the view draws every game into its own tile."""
+
+    def test_tiles_fit_screen_without_overlap(self, display):
+        """Test tiles are inside the screen and apart from each other."""
+        view = TiledView(pygame.Surface((300, 300)), 5, GRID, GRID, present=False)
+
+        assert len(view.tiles) == 5
+        screen = pygame.Rect(0, 0, 300, 300)
+        for index, tile in enumerate(view.tiles):
+            assert screen.contains(tile)
+            assert tile.collidelist(view.tiles[index + 1 :]) == -1
+
+    def test_tile_shows_its_game(self, display):
+        """Test each tile holds the frame of its own game."""
+        screen = pygame.Surface((300, 300))
+        view = TiledView(screen, 4, GRID, GRID, present=False)
+        states = [GameState.create_initial(width=GRID, height=GRID) for _ in range(4)]
+        states[3] = states[3].move_snake()
+
+        view.render(states)
+
+        plain = Renderer(
+            pygame.Surface(view.tiles[3].size), view.cell_size, present=False
+        )
+        plain.font = view.renderers[3].font
+        plain.large_font = view.renderers[3].large_font
+        plain.render(states[3])
+        assert _pixels(screen.subsurface(view.tiles[3])) == _pixels(plain.screen)
+
+    def test_only_changed_tiles_are_dirty(self, display):
+        """Test unchanged games are neither redrawn nor updated."""
+        view = TiledView(pygame.Surface((300, 300)), 4, GRID, GRID, present=False)
+        states = [GameState.create_initial(width=GRID, height=GRID) for _ in range(4)]
+        assert len(view.render(states)) == 5
+
+        states[2] = states[2].move_snake()
+        dirty = view.render(states)
+
+        assert dirty == [view.tiles[2]]
+        assert view.render(states) == []
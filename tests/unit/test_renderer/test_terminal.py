@@ -0,0 +1,176 @@
+"""Unit tests for the terminal renderer."""
+
+import io
+import random
+import re
+
+import pytest
+from src.config.colors import DEFAULT_COLORS
+from src.engine.game_loop import GameLoop
+from src.engine.input_handler import InputAction
+from src.models.direction import Direction
+from src.models.game_state import GameState
+from src.models.position import Position
+from src.renderer.terminal import CELL_WIDTH, TerminalRenderer
+
+GRID = 10
+
+_SEQUENCE = re.compile(r"\x1b\[([0-9;?]*)([A-Za-z])|([^\x1b])")
+
+
+class FakeTerminal:
+    """Interprets the escape sequences used by the renderer."""
+
+    def __init__(self):
+        """Start with an empty screen."""
+        self.cells = {}
+        self.lines = {}
+        self.row = self.column = 1
+        self.background = None
+
+    def feed(self, data):
+        """Apply renderer output to the screen."""
+        for params, command, char in _SEQUENCE.findall(data):
+            if char:
+                self.cells[(self.row, self.column)] = self.background
+                self.lines.setdefault(self.row, {})[self.column] = char
+                self.column += 1
+            elif command == "H":
+                self.row, self.column = (int(n) for n in params.split(";"))
+            elif command == "J":
+                self.cells.clear()
+                self.lines.clear()
+            elif command == "K":
+                self.lines.pop(self.row, None)
+            elif command == "m":
+                codes = params.split(";")
+                if codes[:2] == ["48", "2"]:
+                    self.background = tuple(int(n) for n in codes[2:5])
+                elif codes == ["0"]:
+                    self.background = None
+
+    def cell_color(self, x, y):
+        """Get the background color shown for a grid cell."""
+        row, column = y + 2, (x + 1) * CELL_WIDTH + 1
+        colors = {self.cells.get((row, column + i)) for i in range(CELL_WIDTH)}
+        assert len(colors) == 1
+        return colors.pop()
+
+    def line(self, row):
+        """Get the text of a terminal row."""
+        chars = self.lines.get(row, {})
+        return "".join(chars[column] for column in sorted(chars)).strip()
+
+
+def _expected_color(state, x, y):
+    """Get the color a cell should show."""
+    snake = state.snake
+    if snake.head.x == x and snake.head.y == y:
+        return DEFAULT_COLORS.SNAKE_HEAD
+    if any(segment.x == x and segment.y == y for segment in snake.body):
+        return DEFAULT_COLORS.SNAKE_BODY
+    if state.food_at(Position(x=x, y=y)) is not None:
+        return DEFAULT_COLORS.FOOD
+    return DEFAULT_COLORS.BACKGROUND
+
+
+def _play(ticks, seed, food_count=1):
+    """Yield the states of games played by chasing the food."""
+    random.seed(seed)
+    loop = GameLoop(width=GRID, height=GRID, food_count=food_count)
+    yield loop.state
+    for _ in range(ticks):
+        if loop.state.is_over():
+            loop.handle_input(InputAction.RESTART)
+        head = loop.state.snake.head
+        food = loop.state.food.position
+        if random.random() < 0.1:
+            loop.pending_direction = random.choice(list(Direction))
+        elif food.x != head.x:
+            loop.pending_direction = (
+                Direction.RIGHT if food.x > head.x else Direction.LEFT
+            )
+        else:
+            loop.pending_direction = Direction.DOWN if food.y > head.y else Direction.UP
+        loop.update()
+        yield loop.state
+
+
+class TestTerminalRenderer:
+    """Test the terminal shows the game after every frame."""
+
+    @pytest.mark.parametrize("seed, food_count", [(1, 1), (2, 1), (3, 6)])
+    def test_screen_matches_played_game(self, seed, food_count):
+        """Test every cell, the score and status are right at every frame."""
+        stream = io.StringIO()
+        renderer = TerminalRenderer(stream)
+        terminal = FakeTerminal()
+
+        for state in _play(ticks=200, seed=seed, food_count=food_count):
+            renderer.render(state)
+            terminal.feed(stream.getvalue())
+            stream.seek(0)
+            stream.truncate()
+
+            for y in range(GRID):
+                for x in range(GRID):
+                    assert terminal.cell_color(x, y) == _expected_color(state, x, y)
+            assert terminal.line(GRID + 3) == f"Score: {state.score}"
+            assert ("GAME OVER" in terminal.line(GRID + 4)) == state.is_over()
+
+    def test_crash_into_wall_keeps_border(self):
+        """Test a head dying past the wall is not drawn over the border."""
+        stream = io.StringIO()
+        renderer = TerminalRenderer(stream)
+        terminal = FakeTerminal()
+        loop = GameLoop(width=GRID, height=GRID)
+        loop.pending_direction = Direction.UP
+
+        while loop.state.is_playing():
+            loop.update()
+            renderer.render(loop.state)
+        assert loop.state.snake.head.y == -1
+        loop.handle_input(InputAction.RESTART)
+        renderer.render(loop.state)
+        terminal.feed(stream.getvalue())
+
+        for x in range(-1, GRID + 1):
+            assert terminal.cell_color(x, -1) == DEFAULT_COLORS.GRID
+
+    def test_moves_write_only_changed_cells(self):
+        """Test a tick costs a small, constant amount of output."""
+        stream = io.StringIO()
+        renderer = TerminalRenderer(stream)
+        state = GameState.create_initial(width=40, height=40)
+        renderer.render(state)
+        first_frame = renderer.bytes_written
+
+        for _ in range(5):
+            before = renderer.bytes_written
+            state = state.move_snake()
+            renderer.render(state)
+            assert renderer.bytes_written - before < 100
+
+        assert first_frame > 40 * 40 * CELL_WIDTH
+
+    def test_unchanged_state_writes_nothing(self):
+        """Test rendering the same state again writes no output."""
+        stream = io.StringIO()
+        renderer = TerminalRenderer(stream)
+        state = GameState.create_initial(width=GRID, height=GRID)
+        renderer.render(state)
+        before = renderer.bytes_written
+
+        renderer.render(state)
+
+        assert renderer.bytes_written == before
+
+    def test_close_restores_cursor(self):
+        """Test closing shows the cursor again below the board."""
+        stream = io.StringIO()
+        renderer = TerminalRenderer(stream)
+        renderer.render(GameState.create_initial(width=GRID, height=GRID))
+
+        renderer.close()
+
+        assert stream.getvalue().endswith(f"\x1b[{GRID + 5};1H\x1b[?25h")
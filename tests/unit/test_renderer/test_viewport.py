@@ -0,0 +1,174 @@
+"""Unit tests for the camera viewport renderer."""
+
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+import random
+
+import pygame
+import pytest
+from src.config.colors import DEFAULT_COLORS
+from src.engine.game_loop import GameLoop
+from src.engine.input_handler import InputAction
+from src.models.direction import Direction
+from src.models.position import Position
+from src.models.snake_body import SnakeBody
+from src.renderer.renderer import Renderer
+from src.renderer.viewport import Camera, ChunkIndex, ViewportRenderer
+
+GRID = 40
+VIEW_CELLS = 10
+
+
+def _play(ticks, seed, size=GRID):
+    """Yield the states of games played by chasing the food."""
+    random.seed(seed)
+    loop = GameLoop(width=size, height=size)
+    yield loop.state
+    for _ in range(ticks):
+        if loop.state.is_over():
+            loop.handle_input(InputAction.RESTART)
+        head = loop.state.snake.head
+        food = loop.state.food.position
+        if random.random() < 0.1:
+            loop.pending_direction = random.choice(list(Direction))
+        elif food.x != head.x:
+            loop.pending_direction = (
+                Direction.RIGHT if food.x > head.x else Direction.LEFT
+            )
+        else:
+            loop.pending_direction = Direction.DOWN if food.y > head.y else Direction.UP
+        loop.update()
+        yield loop.state
+
+
+class TestCamera:
+    """Test the camera follows its target."""
+
+    def test_stays_while_target_inside_margin(self):
+        """Test the view does not move for targets away from its edges."""
+        camera = Camera(10, 10, margin=2)
+
+        assert not camera.follow(Position(x=5, y=5), 100, 100)
+        assert (camera.left, camera.top) == (0, 0)
+
+    def test_recenters_near_edge(self):
+        """Test the view recenters when the target nears its edge."""
+        camera = Camera(10, 10, margin=2)
+
+        assert camera.follow(Position(x=8, y=5), 100, 100)
+        assert (camera.left, camera.top) == (3, 0)
+
+    def test_clamps_to_board(self):
+        """Test the view never leaves the board."""
+        camera = Camera(10, 10, margin=2)
+
+        camera.follow(Position(x=99, y=99), 100, 100)
+        assert (camera.left, camera.top) == (90, 90)
+
+        camera.follow(Position(x=-1, y=0), 100, 100)
+        assert (camera.left, camera.top) == (0, 0)
+
+
+class TestChunkIndex:
+    """Test the spatial index of snake segments."""
+
+    def test_index_matches_body_through_a_game(self):
+        """Test segment ids and chunks track the body at every tick."""
+        index = ChunkIndex(chunk_size=8)
+
+        for state in _play(ticks=300, seed=4):
+            body = state.snake.body
+            index.update(body)
+
+            ids = range(index.tail_id, index.head_id + 1)
+            assert tuple(index.position(i) for i in reversed(ids)) == tuple(body)
+            found = sorted(index.segments_in(-1, -1, GRID + 2, GRID + 2))
+            assert [cell for _, cell in found] == list(reversed(tuple(body)))
+
+    def test_segments_in_visits_only_nearby_chunks(self):
+        """Test a query returns only the segments inside the rectangle."""
+        body = SnakeBody.from_positions([Position(x=x, y=0) for x in range(1000)])
+        index = ChunkIndex(chunk_size=16)
+        index.update(body)
+
+        found = list(index.segments_in(100, 0, 10, 10))
+
+        assert sorted(cell.x for _, cell in found) == list(range(100, 110))
+
+    def test_take_toggled_reports_occupancy_changes(self):
+        """Test chunks are reported when they become occupied or empty."""
+        body = SnakeBody.from_positions([Position(x=1, y=0), Position(x=0, y=0)])
+        index = ChunkIndex(chunk_size=2)
+        index.update(body)
+        assert index.take_toggled() == {(0, 0)}
+
+        body = body.advance(Position(x=2, y=0))
+        index.update(body)
+        assert index.take_toggled() == {(1, 0)}
+
+        body = body.advance(Position(x=3, y=0))
+        index.update(body)
+        assert index.take_toggled() == {(0, 0)}
+        assert not index.is_occupied((0, 0))
+
+
+class TestViewportRenderer:
+    """Test drawing the view around the head."""
+
+    @pytest.mark.parametrize("cell_size", [4, 12])
+    def test_view_matches_cropped_full_board(self, cell_size):
+        """Test every frame equals the same region of a full-board render."""
+        pygame.init()
+        view = pygame.Surface((VIEW_CELLS * cell_size, VIEW_CELLS * cell_size))
+        viewport = ViewportRenderer(view, cell_size, present=False, minimap_size=0)
+        board = Renderer(
+            pygame.Surface((GRID * cell_size, GRID * cell_size)),
+            cell_size,
+            present=False,
+            layered=False,
+        )
+        for renderer in (viewport, board):
+            renderer.font = None
+            renderer.large_font = None
+
+        moves = 0
+        for state in _play(ticks=300, seed=5):
+            viewport.render(state)
+            board.render(state)
+            camera = viewport.camera
+            region = board.screen.subsurface(
+                (
+                    camera.left * cell_size,
+                    camera.top * cell_size,
+                    view.get_width(),
+                    view.get_height(),
+                )
+            )
+            assert pygame.image.tobytes(view, "RGB") == pygame.image.tobytes(
+                region, "RGB"
+            )
+            moves += (camera.left, camera.top) != (0, 0)
+
+        assert moves > 0
+        pygame.quit()
+
+    def test_minimap_marks_occupied_chunks(self):
+        """Test the minimap shows the snake in the corner of the screen."""
+        pygame.init()
+        screen = pygame.Surface((200, 200))
+        renderer = ViewportRenderer(
+            screen, 12, present=False, chunk_size=10, minimap_size=50
+        )
+        state = next(_play(ticks=0, seed=1, size=100))
+
+        renderer.render(state)
+
+        rect = renderer._minimap_rect
+        assert rect.size == (50, 50)
+        assert rect.bottomright == (190, 190)
+        chunk = renderer.index.chunk_of(state.snake.body.tail)
+        pixel = (rect.x + chunk[0] * 5 + 2, rect.y + chunk[1] * 5 + 2)
+        assert screen.get_at(pixel)[:3] == DEFAULT_COLORS.SNAKE_BODY
+        pygame.quit()
@@ -0,0 +1,98 @@
+"""Unit tests for the replay export command."""
+
+import os
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+import json
+
+import pygame
+import pytest
+from src.engine.replay import Replay
+from src.models.direction import Direction
+from src.renderer.frame_capture import RAW
+from src import replay_export
+
+MOVES = [None, Direction.DOWN, None, Direction.RIGHT] * 3
+
+
+@pytest.fixture
+def replay_dir(tmp_path):
+    """Create a directory with two short replays."""
+    directory = tmp_path / "replays"
+    directory.mkdir()
+    Replay(10, 10, seed=1, moves=MOVES).save(directory / "first.json")
+    Replay(8, 6, seed=2, moves=MOVES[:4]).save(directory / "second.json")
+    return directory
+
+
+class TestExportReplay:
+    """Test exporting a single replay."""
+
+    def test_writes_one_png_per_state(self, replay_dir, tmp_path):
+        """Test every state of the replay becomes a frame."""
+        replay = Replay.load(replay_dir / "first.json")
+        states = len(list(replay.states()))
+
+        result = replay_export.export_replay(
+            replay_dir / "first.json", tmp_path / "out", cell_size=4
+        )
+
+        frames = sorted((tmp_path / "out" / "first").iterdir())
+        assert result.frames == len(frames) == states
+        image = pygame.image.load(str(frames[0]))
+        assert image.get_size() == (40, 40)
+        pygame.quit()
+
+    def test_writes_raw_video(self, replay_dir, tmp_path):
+        """Test raw export writes a video file and its metadata."""
+        replay_export.export_replay(
+            replay_dir / "second.json", tmp_path, format=RAW, cell_size=2
+        )
+
+        metadata = json.loads((tmp_path / "second.rgb.json").read_text())
+        assert (metadata["width"], metadata["height"]) == (16, 12)
+        video = (tmp_path / "second.rgb").read_bytes()
+        assert len(video) == metadata["frames"] * 16 * 12 * 3
+        pygame.quit()
+
+
+class TestWorkerInit:
+    """Test pool processes start only what rendering needs."""
+
+    def test_starts_display_and_fonts_only(self, monkeypatch):
+        """Test the worker does not start audio or joystick support."""
+        monkeypatch.setattr(pygame, "init", pytest.fail)
+
+        replay_export._init_worker()
+
+        assert pygame.display.get_init() and pygame.font.get_init()
+        assert not pygame.mixer.get_init()
+        pygame.quit()
+
+
+class TestExportReplays:
+    """Test exporting a directory of replays across processes."""
+
+    def test_exports_every_replay(self, replay_dir, tmp_path):
+        """Test each replay gets its own output in name order."""
+        results = replay_export.export_replays(
+            replay_dir, tmp_path / "out", cell_size=2, workers=2
+        )
+
+        assert [result.name for result in results] == ["first", "second"]
+        for result in results:
+            frames = list((tmp_path / "out" / result.name).iterdir())
+            assert len(frames) == result.frames > 0
+
+    def test_empty_directory_exports_nothing(self, tmp_path):
+        """Test a directory without replays produces no results."""
+        assert replay_export.export_replays(tmp_path, tmp_path / "out") == []
+
+    def test_main_prints_summary(self, replay_dir, tmp_path, capsys):
+        """Test the command line reports every exported replay."""
+        replay_export.main([str(replay_dir), str(tmp_path / "out"), "--workers", "1"])
+
+        output = capsys.readouterr().out
+        assert "first:" in output
+        assert "Exported 2 replays" in output
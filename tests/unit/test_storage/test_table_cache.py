@@ -0,0 +1,97 @@
+"""Unit tests for the lookup table disk cache."""
+
+from array import array
+
+import pytest
+from src.storage.table_cache import (
+    CACHE_DIR_ENV,
+    DEFAULT_CACHE_DIR,
+    cached_table,
+    default_cache_dir,
+    load_table,
+    save_table,
+)
+
+
+class TestTableFiles:
+    """Test tables round-trip through files."""
+
+    def test_save_and_load(self, tmp_path):
+        """Test a saved table loads back unchanged."""
+        path = tmp_path / "tables" / "squares.bin"
+        table = array("i", [n * n for n in range(10)])
+
+        save_table(path, table)
+
+        assert load_table(path, 10) == table
+        assert [p.name for p in path.parent.iterdir()] == ["squares.bin"]
+
+    def test_load_rejects_wrong_length(self, tmp_path):
+        """Test a table with another number of entries is rejected."""
+        path = tmp_path / "table.bin"
+        save_table(path, array("i", range(5)))
+
+        with pytest.raises(ValueError):
+            load_table(path, 6)
+
+
+class TestDefaultCacheDir:
+    """Test where tables are cached by default."""
+
+    def test_environment_overrides_default(self, monkeypatch, tmp_path):
+        """Test the environment variable replaces the default directory."""
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+        assert default_cache_dir() == tmp_path
+
+        monkeypatch.delenv(CACHE_DIR_ENV)
+        assert default_cache_dir() == DEFAULT_CACHE_DIR
+
+
+class TestCachedTable:
+    """Test tables are built only on a cache miss."""
+
+    def test_builds_once(self, tmp_path):
+        """Test the second lookup reads the table from disk."""
+        path = tmp_path / "table.bin"
+        calls = []
+
+        def build():
+            calls.append(1)
+            return array("i", range(4))
+
+        first = cached_table(path, 4, build)
+        second = cached_table(path, 4, build)
+
+        assert first == second == array("i", range(4))
+        assert len(calls) == 1
+
+    def test_rebuilds_corrupt_file(self, tmp_path):
+        """Test a truncated file is replaced by a fresh build."""
+        path = tmp_path / "table.bin"
+        path.write_bytes(b"\x01\x02")
+
+        table = cached_table(path, 3, lambda: array("i", [7, 8, 9]))
+
+        assert table == array("i", [7, 8, 9])
+        assert load_table(path, 3) == table
+
+    def test_rebuilds_rejected_table(self, tmp_path):
+        """Test a table the validator rejects is replaced by a fresh build."""
+        path = tmp_path / "table.bin"
+        save_table(path, array("i", [0, 0, 0]))
+
+        table = cached_table(
+            path, 3, lambda: array("i", [0, 1, 2]), lambda t: len(set(t)) == 3
+        )
+
+        assert table == array("i", [0, 1, 2])
+        assert load_table(path, 3) == table
+
+    def test_unwritable_directory_still_returns_table(self, tmp_path):
+        """Test a cache that cannot be written does not fail the lookup."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+
+        table = cached_table(blocker / "table.bin", 2, lambda: array("i", [1, 2]))
+
+        assert table == array("i", [1, 2])
@@ -0,0 +1,172 @@
+"""Unit tests for the bot tournament runner."""
+
+import random
+
+import pytest
+from src import tournament
+from src.bots.bfs import BFSAutopilot
+
+
+class RandomAutopilot(BFSAutopilot):
+    """BFS bot that also draws from the global generator every tick."""
+
+    def choose(self, state):
+        """Pick the BFS move after disturbing the global generator."""
+        random.random()
+        return super().choose(state)
+
+
+class TestLoadAgent:
+    """Test creating agents from their specs."""
+
+    def test_factory_name(self):
+        """Test a factory name creates that autopilot."""
+        agent = tournament.load_agent("bfs", tournament.Settings())
+
+        assert isinstance(agent, BFSAutopilot)
+
+    def test_module_path(self):
+        """Test a module:Class spec imports the class."""
+        agent = tournament.load_agent(
+            "src.bots.hamiltonian:HamiltonianAutopilot", tournament.Settings()
+        )
+
+        assert type(agent).__name__ == "HamiltonianAutopilot"
+
+    @pytest.mark.parametrize(
+        "spec", ["nope", "src.bots.bfs:Missing", "src.config.settings:Settings"]
+    )
+    def test_unknown_agent(self, spec):
+        """Test specs that name no autopilot are refused."""
+        with pytest.raises(ValueError):
+            tournament.load_agent(spec, tournament.Settings())
+
+
+class TestPlayGame:
+    """Test playing single headless games."""
+
+    def test_result(self):
+        """Test a game reports its score, ticks and one latency per tick."""
+        result = tournament.play_game("bfs", seed=3, width=8, height=8, max_ticks=50)
+
+        assert result.agent == "bfs"
+        assert result.ticks == len(result.latencies) <= 50
+        assert result.score == (result.length - 3) * 10
+        assert result.seconds > 0
+
+    def test_same_seed_same_game(self):
+        """Test a seed replays the same game."""
+        first = tournament.play_game("bfs", seed=7, width=8, height=8, max_ticks=200)
+        second = tournament.play_game("bfs", seed=7, width=8, height=8, max_ticks=200)
+
+        assert (first.score, first.ticks) == (second.score, second.ticks)
+
+    def test_agent_cannot_move_food(self):
+        """Test an agent drawing from ``random`` sees the same food."""
+        plain = tournament.play_game("bfs", seed=7, width=8, height=8, max_ticks=200)
+        noisy = tournament.play_game(
+            f"{__name__}:RandomAutopilot", seed=7, width=8, height=8, max_ticks=200
+        )
+
+        assert (noisy.score, noisy.ticks) == (plain.score, plain.ticks)
+
+    def test_timed_agent_as_policy(self):
+        """Test the timing wrapper forwards choose and times it too."""
+        state = tournament.GameState.create_initial(8, 8)
+        timed = tournament._TimedAutopilot(BFSAutopilot())
+
+        assert timed(state) == timed.choose(state) == BFSAutopilot().choose(state)
+        assert len(timed.latencies) == 2
+
+    def test_max_ticks(self):
+        """Test a game still going is stopped at the tick limit."""
+        result = tournament.play_game(
+            "hamiltonian", seed=1, width=6, height=6, max_ticks=30
+        )
+
+        assert result.ticks == 30
+
+
+class TestReport:
+    """Test summarizing an agent's games."""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        values = [float(value) for value in range(1, 101)]
+
+        assert tournament.percentile(values, 50) == 50.0
+        assert tournament.percentile(values, 99) == 99.0
+        assert tournament.percentile(values, 100) == 100.0
+        assert tournament.percentile([4.0], 90) == 4.0
+        assert tournament.percentile([], 50) == 0.0
+
+    def test_from_results(self):
+        """Test scores, throughput and latencies are combined."""
+        results = [
+            tournament.GameResult("bfs", 0, 30, 6, 10, 0.5, (0.001,) * 10),
+            tournament.GameResult("bfs", 1, 50, 8, 30, 1.5, (0.002,) * 30),
+        ]
+
+        report = tournament.AgentReport.from_results("bfs", results)
+
+        assert report.scores == (30, 50)
+        assert report.ticks_per_second == 20.0
+        assert report.latencies[50] == 0.002
+        assert report.latencies[100] == 0.002
+        text = report.format()
+        assert "bfs: 2 games, 40 ticks, 20 ticks/s" in text
+        assert "min 30" in text and "max 50" in text
+        assert "p99 2.00" in text
+
+
+class TestRunTournament:
+    """Test tournaments across processes."""
+
+    def test_every_agent_plays_every_seed(self, table_cache_dir):
+        """Test agents get one report each, matching single games."""
+        reports = tournament.run_tournament(
+            ["bfs", "hamiltonian", "bfs"],
+            [1, 2],
+            width=6,
+            height=6,
+            max_ticks=40,
+            workers=2,
+        )
+
+        assert [report.agent for report in reports] == ["bfs", "hamiltonian", "bfs"]
+        single = tournament.play_game("bfs", seed=2, width=6, height=6, max_ticks=40)
+        assert reports[0].scores[1] == single.score
+        assert reports[0].scores == reports[2].scores
+        assert reports[1].ticks == 80
+        # Workers cache their tables in the test directory
+        assert (table_cache_dir / "hamiltonian_6x6.bin").exists()
+
+    def test_rejects_bad_input(self):
+        """Test unknown agents and empty seed sets fail up front."""
+        with pytest.raises(ValueError):
+            tournament.run_tournament(["nope"], [1])
+        with pytest.raises(ValueError):
+            tournament.run_tournament(["bfs"], [])
+
+    def test_main_prints_reports(self, capsys):
+        """Test the command line prints one report per agent."""
+        tournament.main(
+            [
+                "bfs",
+                "--seeds",
+                "2",
+                "--width",
+                "6",
+                "--height",
+                "6",
+                "--max-ticks",
+                "20",
+                "--workers",
+                "1",
+            ]
+        )
+
+        output = capsys.readouterr().out
+        assert "bfs: 2 games" in output
+        assert "decision ms: p50" in output
+        assert "Played 2 games" in output